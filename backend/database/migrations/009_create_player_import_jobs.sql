@@ -0,0 +1,31 @@
+-- Migration: Create player_import_jobs table for background batch imports
+-- Date: 2026-10-19
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS player_import_jobs (
+    id              BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+    status          VARCHAR(20) NOT NULL DEFAULT 'queued',
+    filename        VARCHAR(255) NOT NULL,
+    file_path       VARCHAR(512) NOT NULL,
+    fmt             VARCHAR(10) NOT NULL,
+    chunk_size      INTEGER NOT NULL DEFAULT 500,
+    rows_done       INTEGER NOT NULL DEFAULT 0,
+    rows_inserted   INTEGER NOT NULL DEFAULT 0,
+    rows_failed     INTEGER NOT NULL DEFAULT 0,
+    error_count     INTEGER NOT NULL DEFAULT 0,
+    errors          JSONB NOT NULL DEFAULT '[]'::jsonb,
+    detail          VARCHAR(1000),
+    created_by      INTEGER NOT NULL REFERENCES users(id) ON DELETE RESTRICT,
+    created_at      TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    started_at      TIMESTAMPTZ,
+    updated_at      TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    finished_at     TIMESTAMPTZ,
+
+    CONSTRAINT player_import_jobs_status_chk CHECK (status IN ('queued', 'running', 'completed', 'failed'))
+);
+
+-- Workers look up unfinished jobs on startup
+CREATE INDEX IF NOT EXISTS ix_player_import_jobs_status ON player_import_jobs (status);
+
+COMMIT;
@@ -0,0 +1,40 @@
+-- Migration: Create player_week_stats (one typed row per player and week)
+-- Date: 2026-10-19
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS player_week_stats (
+    week_id              INTEGER NOT NULL REFERENCES weeks(id) ON DELETE CASCADE,
+    player_id            BIGINT  NOT NULL REFERENCES players(id) ON DELETE CASCADE,
+    passing_yards        SMALLINT NOT NULL DEFAULT 0,
+    passing_td           SMALLINT NOT NULL DEFAULT 0,
+    interception         SMALLINT NOT NULL DEFAULT 0,
+    rushing_yards        SMALLINT NOT NULL DEFAULT 0,
+    receptions           SMALLINT NOT NULL DEFAULT 0,
+    receiving_yards      SMALLINT NOT NULL DEFAULT 0,
+    rush_recv_td         SMALLINT NOT NULL DEFAULT 0,
+    sack                 SMALLINT NOT NULL DEFAULT 0,
+    def_interception     SMALLINT NOT NULL DEFAULT 0,
+    fumble_recovered     SMALLINT NOT NULL DEFAULT 0,
+    safety               SMALLINT NOT NULL DEFAULT 0,
+    def_td               SMALLINT NOT NULL DEFAULT 0,
+    team_def_2pt_return  SMALLINT NOT NULL DEFAULT 0,
+    pat_made             SMALLINT NOT NULL DEFAULT 0,
+    fg_made_0_50         SMALLINT NOT NULL DEFAULT 0,
+    fg_made_50_plus      SMALLINT NOT NULL DEFAULT 0,
+    points_allowed       SMALLINT,
+
+    PRIMARY KEY (week_id, player_id)
+);
+
+-- Covering index so scoring/projections read a whole week with one index-only scan
+CREATE INDEX IF NOT EXISTS ix_player_week_stats_week_covering
+  ON player_week_stats (week_id)
+  INCLUDE (player_id, passing_yards, passing_td, interception, rushing_yards, receptions,
+           receiving_yards, rush_recv_td, sack, def_interception, fumble_recovered, safety,
+           def_td, team_def_2pt_return, pat_made, fg_made_0_50, fg_made_50_plus, points_allowed);
+
+-- Player history lookups (projections)
+CREATE INDEX IF NOT EXISTS ix_player_week_stats_player_id ON player_week_stats (player_id);
+
+COMMIT;
@@ -0,0 +1,36 @@
+-- Migration: Fantasy team rosters and materialized weekly team scores
+-- Date: 2026-10-19
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS fantasy_team_players (
+    id               BIGSERIAL PRIMARY KEY,
+    league_id        INTEGER NOT NULL REFERENCES leagues(id) ON DELETE CASCADE,
+    fantasy_team_id  BIGINT  NOT NULL REFERENCES fantasy_teams(id) ON DELETE CASCADE,
+    player_id        BIGINT  NOT NULL REFERENCES players(id) ON DELETE CASCADE,
+    slot             VARCHAR(20) NOT NULL DEFAULT 'BENCH',
+    acquired_via     VARCHAR(20) NOT NULL DEFAULT 'draft',
+    acquired_at      TIMESTAMPTZ DEFAULT NOW(),
+
+    -- A player can be on only one roster per league
+    CONSTRAINT ux_fantasy_team_players_league_player UNIQUE (league_id, player_id)
+);
+
+CREATE INDEX IF NOT EXISTS ix_fantasy_team_players_team ON fantasy_team_players (fantasy_team_id);
+-- Inverted index for live scoring: player -> rosters holding them
+CREATE INDEX IF NOT EXISTS ix_fantasy_team_players_player ON fantasy_team_players (player_id);
+
+CREATE TABLE IF NOT EXISTS fantasy_team_week_scores (
+    fantasy_team_id  BIGINT  NOT NULL REFERENCES fantasy_teams(id) ON DELETE CASCADE,
+    week_id          INTEGER NOT NULL REFERENCES weeks(id) ON DELETE CASCADE,
+    league_id        INTEGER NOT NULL REFERENCES leagues(id) ON DELETE CASCADE,
+    points           NUMERIC(10, 2) NOT NULL DEFAULT 0,
+    updated_at       TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+
+    PRIMARY KEY (fantasy_team_id, week_id)
+);
+
+CREATE INDEX IF NOT EXISTS ix_fantasy_team_week_scores_league_week
+  ON fantasy_team_week_scores (league_id, week_id);
+
+COMMIT;
@@ -0,0 +1,28 @@
+-- Migration: Create matchups (weekly head-to-head schedule and results)
+-- Date: 2026-10-19
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS matchups (
+    id            BIGSERIAL PRIMARY KEY,
+    league_id     INTEGER NOT NULL REFERENCES leagues(id) ON DELETE CASCADE,
+    week_id       INTEGER NOT NULL REFERENCES weeks(id) ON DELETE CASCADE,
+    home_team_id  BIGINT  NOT NULL REFERENCES fantasy_teams(id) ON DELETE CASCADE,
+    away_team_id  BIGINT  REFERENCES fantasy_teams(id) ON DELETE CASCADE,  -- NULL = bye
+    home_points   NUMERIC(10, 2),
+    away_points   NUMERIC(10, 2),
+    home_result   SMALLINT,                                                -- 1 / 0 / -1
+    status        VARCHAR(10) NOT NULL DEFAULT 'scheduled',
+
+    CONSTRAINT ck_matchups_distinct_teams CHECK (home_team_id <> away_team_id)
+);
+
+-- All games of a league week
+CREATE UNIQUE INDEX IF NOT EXISTS ux_matchups_league_week_home ON matchups (league_id, week_id, home_team_id);
+-- Results pass over every league for one week
+CREATE INDEX IF NOT EXISTS ix_matchups_week_status ON matchups (week_id, status);
+-- A team's schedule / standings aggregation
+CREATE INDEX IF NOT EXISTS ix_matchups_home_team ON matchups (home_team_id);
+CREATE INDEX IF NOT EXISTS ix_matchups_away_team ON matchups (away_team_id);
+
+COMMIT;
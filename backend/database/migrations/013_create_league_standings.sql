@@ -0,0 +1,30 @@
+-- Migration: Materialized league standings and season leaderboard
+-- Date: 2026-10-19
+
+BEGIN;
+
+ALTER TABLE leagues
+  ADD COLUMN IF NOT EXISTS standings_version INTEGER NOT NULL DEFAULT 0;
+
+CREATE TABLE IF NOT EXISTS league_standings (
+    fantasy_team_id  BIGINT  PRIMARY KEY REFERENCES fantasy_teams(id) ON DELETE CASCADE,
+    league_id        INTEGER NOT NULL REFERENCES leagues(id) ON DELETE CASCADE,
+    season_id        INTEGER REFERENCES seasons(id) ON DELETE CASCADE,
+    name             VARCHAR(128) NOT NULL,
+    wins             SMALLINT NOT NULL DEFAULT 0,
+    losses           SMALLINT NOT NULL DEFAULT 0,
+    ties             SMALLINT NOT NULL DEFAULT 0,
+    points_for       NUMERIC(10, 2) NOT NULL DEFAULT 0,
+    points_against   NUMERIC(10, 2) NOT NULL DEFAULT 0,
+    win_pct          NUMERIC(5, 4) NOT NULL DEFAULT 0,
+    rank             SMALLINT NOT NULL,
+    updated_at       TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- League standings page, in rank order
+CREATE INDEX IF NOT EXISTS ix_league_standings_league_rank ON league_standings (league_id, rank);
+-- Season leaderboard: top N teams read straight from the index
+CREATE INDEX IF NOT EXISTS ix_league_standings_season_leaderboard
+  ON league_standings (season_id, win_pct DESC, points_for DESC, fantasy_team_id);
+
+COMMIT;
@@ -0,0 +1,41 @@
+-- Migration: Snake drafts, append-only pick log and autopick queues
+-- Date: 2026-10-19
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS drafts (
+    league_id     INTEGER PRIMARY KEY REFERENCES leagues(id) ON DELETE CASCADE,
+    status        VARCHAR(20) NOT NULL DEFAULT 'running',  -- running|complete
+    team_order    JSONB NOT NULL,
+    rounds        SMALLINT NOT NULL,
+    pick_seconds  SMALLINT NOT NULL,
+    started_at    TIMESTAMPTZ DEFAULT NOW(),
+    completed_at  TIMESTAMPTZ
+);
+
+-- Running drafts are replayed on startup
+CREATE INDEX IF NOT EXISTS ix_drafts_running ON drafts (league_id) WHERE status = 'running';
+
+CREATE TABLE IF NOT EXISTS draft_picks (
+    id               BIGSERIAL PRIMARY KEY,
+    league_id        INTEGER NOT NULL REFERENCES drafts(league_id) ON DELETE CASCADE,
+    pick_number      INTEGER NOT NULL,
+    round            SMALLINT NOT NULL,
+    fantasy_team_id  BIGINT NOT NULL REFERENCES fantasy_teams(id) ON DELETE CASCADE,
+    player_id        BIGINT NOT NULL REFERENCES players(id) ON DELETE CASCADE,
+    is_auto          BOOLEAN NOT NULL DEFAULT FALSE,
+    picked_at        TIMESTAMPTZ DEFAULT NOW(),
+    CONSTRAINT ux_draft_picks_league_pick UNIQUE (league_id, pick_number),
+    CONSTRAINT ux_draft_picks_league_player UNIQUE (league_id, player_id)
+);
+
+CREATE TABLE IF NOT EXISTS draft_queue (
+    fantasy_team_id  BIGINT NOT NULL REFERENCES fantasy_teams(id) ON DELETE CASCADE,
+    player_id        BIGINT NOT NULL REFERENCES players(id) ON DELETE CASCADE,
+    rank             INTEGER NOT NULL,
+    PRIMARY KEY (fantasy_team_id, player_id)
+);
+
+CREATE INDEX IF NOT EXISTS ix_draft_queue_team_rank ON draft_queue (fantasy_team_id, rank);
+
+COMMIT;
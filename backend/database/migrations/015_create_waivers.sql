@@ -0,0 +1,38 @@
+-- Migration: Waiver claims, processing runs and rolling waiver order
+-- Date: 2026-10-19
+
+BEGIN;
+
+ALTER TABLE fantasy_teams
+  ADD COLUMN IF NOT EXISTS waiver_priority INTEGER;
+
+CREATE TABLE IF NOT EXISTS waiver_runs (
+    id           BIGSERIAL PRIMARY KEY,
+    status       VARCHAR(20) NOT NULL DEFAULT 'running',  -- running|completed|failed
+    leagues      INTEGER NOT NULL DEFAULT 0,
+    claims       INTEGER NOT NULL DEFAULT 0,
+    awarded      INTEGER NOT NULL DEFAULT 0,
+    started_at   TIMESTAMPTZ DEFAULT NOW(),
+    finished_at  TIMESTAMPTZ
+);
+
+CREATE TABLE IF NOT EXISTS waiver_claims (
+    id               BIGSERIAL PRIMARY KEY,
+    league_id        INTEGER NOT NULL REFERENCES leagues(id) ON DELETE CASCADE,
+    fantasy_team_id  BIGINT NOT NULL REFERENCES fantasy_teams(id) ON DELETE CASCADE,
+    add_player_id    BIGINT NOT NULL REFERENCES players(id) ON DELETE CASCADE,
+    drop_player_id   BIGINT REFERENCES players(id) ON DELETE CASCADE,
+    rank             INTEGER NOT NULL,
+    status           VARCHAR(10) NOT NULL DEFAULT 'pending',  -- pending|won|lost|invalid|cancelled
+    reason           VARCHAR(255),
+    run_id           BIGINT REFERENCES waiver_runs(id) ON DELETE SET NULL,
+    created_at       TIMESTAMPTZ DEFAULT NOW(),
+    processed_at     TIMESTAMPTZ
+);
+
+-- A run only reads the pending claims
+CREATE INDEX IF NOT EXISTS ix_waiver_claims_league_pending ON waiver_claims (league_id) WHERE status = 'pending';
+CREATE INDEX IF NOT EXISTS ix_waiver_claims_team_status ON waiver_claims (fantasy_team_id, status);
+CREATE INDEX IF NOT EXISTS ix_waiver_claims_run ON waiver_claims (run_id);
+
+COMMIT;
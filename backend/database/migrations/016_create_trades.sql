@@ -0,0 +1,33 @@
+-- Migration: Trades between fantasy teams
+-- Date: 2026-10-19
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS trades (
+    id                BIGSERIAL PRIMARY KEY,
+    league_id         INTEGER NOT NULL REFERENCES leagues(id) ON DELETE CASCADE,
+    proposer_team_id  BIGINT NOT NULL REFERENCES fantasy_teams(id) ON DELETE CASCADE,
+    receiver_team_id  BIGINT NOT NULL REFERENCES fantasy_teams(id) ON DELETE CASCADE,
+    status            VARCHAR(10) NOT NULL DEFAULT 'proposed',  -- proposed|executed|rejected|cancelled|vetoed|void
+    message           VARCHAR(500),
+    created_at        TIMESTAMPTZ DEFAULT NOW(),
+    responded_at      TIMESTAMPTZ,
+    CONSTRAINT ck_trades_distinct_teams CHECK (proposer_team_id <> receiver_team_id)
+);
+
+CREATE TABLE IF NOT EXISTS trade_items (
+    id            BIGSERIAL PRIMARY KEY,
+    trade_id      BIGINT NOT NULL REFERENCES trades(id) ON DELETE CASCADE,
+    player_id     BIGINT NOT NULL REFERENCES players(id) ON DELETE CASCADE,
+    from_team_id  BIGINT NOT NULL REFERENCES fantasy_teams(id) ON DELETE CASCADE,
+    CONSTRAINT ux_trade_items_trade_player UNIQUE (trade_id, player_id)
+);
+
+CREATE INDEX IF NOT EXISTS ix_trades_league_status ON trades (league_id, status);
+CREATE INDEX IF NOT EXISTS ix_trades_proposer ON trades (proposer_team_id);
+CREATE INDEX IF NOT EXISTS ix_trades_receiver ON trades (receiver_team_id);
+CREATE INDEX IF NOT EXISTS ix_trade_items_trade ON trade_items (trade_id);
+-- Executing a trade voids the other pending offers for the same players
+CREATE INDEX IF NOT EXISTS ix_trade_items_player ON trade_items (player_id);
+
+COMMIT;
@@ -0,0 +1,34 @@
+-- Migration: Stored weekly player projections
+-- Date: 2026-10-19
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS player_projections (
+    week_id              INTEGER NOT NULL REFERENCES weeks(id) ON DELETE CASCADE,
+    player_id            BIGINT NOT NULL REFERENCES players(id) ON DELETE CASCADE,
+    season_id            INTEGER NOT NULL REFERENCES seasons(id) ON DELETE CASCADE,
+    games                SMALLINT NOT NULL DEFAULT 0,
+    passing_yards        REAL NOT NULL DEFAULT 0,
+    passing_td           REAL NOT NULL DEFAULT 0,
+    interception         REAL NOT NULL DEFAULT 0,
+    rushing_yards        REAL NOT NULL DEFAULT 0,
+    receptions           REAL NOT NULL DEFAULT 0,
+    receiving_yards      REAL NOT NULL DEFAULT 0,
+    rush_recv_td         REAL NOT NULL DEFAULT 0,
+    sack                 REAL NOT NULL DEFAULT 0,
+    def_interception     REAL NOT NULL DEFAULT 0,
+    fumble_recovered     REAL NOT NULL DEFAULT 0,
+    safety               REAL NOT NULL DEFAULT 0,
+    def_td               REAL NOT NULL DEFAULT 0,
+    team_def_2pt_return  REAL NOT NULL DEFAULT 0,
+    pat_made             REAL NOT NULL DEFAULT 0,
+    fg_made_0_50         REAL NOT NULL DEFAULT 0,
+    fg_made_50_plus      REAL NOT NULL DEFAULT 0,
+    points_allowed       REAL,  -- only team defenses
+    computed_at          TIMESTAMPTZ DEFAULT NOW(),
+    PRIMARY KEY (week_id, player_id)
+);
+
+CREATE INDEX IF NOT EXISTS ix_player_projections_season_week ON player_projections (season_id, week_id);
+
+COMMIT;
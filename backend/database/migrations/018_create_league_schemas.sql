@@ -0,0 +1,23 @@
+-- Migration: Interned roster/scoring schemas shared by leagues
+-- Date: 2026-10-19
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS league_schemas (
+    id          SERIAL PRIMARY KEY,
+    kind        VARCHAR(10) NOT NULL,  -- roster|scoring
+    hash        VARCHAR(64) NOT NULL,  -- sha256 of the canonical JSON (see leagues/interning.py)
+    body        JSONB NOT NULL,
+    created_at  TIMESTAMPTZ DEFAULT NOW(),
+    CONSTRAINT ux_league_schemas_kind_hash UNIQUE (kind, hash)
+);
+
+ALTER TABLE leagues
+  ADD COLUMN IF NOT EXISTS roster_schema_id INTEGER REFERENCES league_schemas(id) ON DELETE RESTRICT,
+  ADD COLUMN IF NOT EXISTS scoring_schema_id INTEGER REFERENCES league_schemas(id) ON DELETE RESTRICT;
+
+CREATE INDEX IF NOT EXISTS ix_leagues_scoring_schema_id ON leagues (scoring_schema_id);
+
+COMMIT;
+
+-- Existing leagues are linked by: python -m src.scripts.intern_league_schemas
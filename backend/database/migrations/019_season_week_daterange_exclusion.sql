@@ -0,0 +1,41 @@
+-- Migration: daterange periods with GiST exclusion constraints on seasons and weeks
+-- Date: 2026-10-19
+-- Overlapping seasons (and overlapping weeks of one season) are rejected by the
+-- database, atomically, instead of by a read-then-insert check in Python.
+
+BEGIN;
+
+CREATE EXTENSION IF NOT EXISTS btree_gist;
+
+-- setup_db.sql created the season dates as TIMESTAMPTZ; the range needs DATE
+DO $$
+BEGIN
+    IF (SELECT data_type FROM information_schema.columns
+        WHERE table_name='seasons' AND column_name='start_date') <> 'date' THEN
+        ALTER TABLE seasons ALTER COLUMN start_date TYPE DATE USING start_date::date;
+    END IF;
+    IF (SELECT data_type FROM information_schema.columns
+        WHERE table_name='seasons' AND column_name='end_date') <> 'date' THEN
+        ALTER TABLE seasons ALTER COLUMN end_date TYPE DATE USING end_date::date;
+    END IF;
+END $$;
+
+ALTER TABLE seasons
+  ADD COLUMN IF NOT EXISTS period DATERANGE GENERATED ALWAYS AS (daterange(start_date, end_date, '[]')) STORED;
+ALTER TABLE weeks
+  ADD COLUMN IF NOT EXISTS period DATERANGE GENERATED ALWAYS AS (daterange(start_date, end_date, '[]')) STORED;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'ex_seasons_no_overlap') THEN
+        ALTER TABLE seasons ADD CONSTRAINT ex_seasons_no_overlap EXCLUDE USING gist (period WITH &&);
+    END IF;
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'ex_weeks_no_overlap') THEN
+        ALTER TABLE weeks ADD CONSTRAINT ex_weeks_no_overlap EXCLUDE USING gist (season_id WITH =, period WITH &&);
+    END IF;
+END $$;
+
+-- Overlap lookups now use the exclusion constraints' GiST indexes
+DROP INDEX IF EXISTS idx_seasons_dates;
+
+COMMIT;
@@ -0,0 +1,37 @@
+-- Migration: members_count on leagues and unique indexes for league joins
+-- Date: 2026-10-19
+-- A join reserves its slot with a conditional
+--   UPDATE leagues SET members_count = members_count + 1 WHERE members_count < max_teams
+-- so concurrent joins cannot overfill a league, and duplicate members, aliases
+-- and team names are rejected by unique indexes instead of SELECT-then-INSERT.
+
+BEGIN;
+
+ALTER TABLE leagues ADD COLUMN IF NOT EXISTS members_count INTEGER NOT NULL DEFAULT 0;
+
+UPDATE leagues l
+   SET members_count = c.n
+  FROM (SELECT league_id, count(*) AS n FROM league_members GROUP BY league_id) c
+ WHERE c.league_id = l.id;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'ck_leagues_members_count') THEN
+        ALTER TABLE leagues
+            ADD CONSTRAINT ck_leagues_members_count CHECK (members_count >= 0);
+    END IF;
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'ux_league_members_user_league') THEN
+        ALTER TABLE league_members
+            ADD CONSTRAINT ux_league_members_user_league UNIQUE (league_id, user_id);
+    END IF;
+END $$;
+
+-- Aliases are unique per league regardless of case
+CREATE UNIQUE INDEX IF NOT EXISTS ux_league_members_league_alias_ci
+  ON league_members (league_id, LOWER(user_alias));
+
+-- Already created by 006; repeated for databases built from the ORM models
+CREATE UNIQUE INDEX IF NOT EXISTS ux_fantasy_teams_league_name
+  ON fantasy_teams (league_id, LOWER(name));
+
+COMMIT;
@@ -0,0 +1,22 @@
+-- Migration: background thumbnail queue for fantasy team images
+-- Date: 2026-10-19
+-- Teams are committed with thumbnail_status = 'pending' and the image is
+-- fetched by a worker (fantasy_teams/thumbnails.py) outside the league
+-- create/join transaction. Pending rows with thumbnail_next_at are the retry queue.
+
+BEGIN;
+
+ALTER TABLE fantasy_teams
+  ADD COLUMN IF NOT EXISTS thumbnail_status VARCHAR(10),           -- pending|ready|failed; NULL without image
+  ADD COLUMN IF NOT EXISTS thumbnail_attempts INTEGER NOT NULL DEFAULT 0,
+  ADD COLUMN IF NOT EXISTS thumbnail_next_at TIMESTAMPTZ;
+
+-- Existing images: rendered ones are ready, the rest get another try
+UPDATE fantasy_teams
+   SET thumbnail_status = CASE WHEN thumbnail_url IS NOT NULL THEN 'ready' ELSE 'pending' END
+ WHERE image_url IS NOT NULL AND thumbnail_status IS NULL;
+
+CREATE INDEX IF NOT EXISTS ix_fantasy_teams_thumbnail_pending
+  ON fantasy_teams (thumbnail_next_at) WHERE thumbnail_status = 'pending';
+
+COMMIT;
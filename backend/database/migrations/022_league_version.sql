@@ -0,0 +1,9 @@
+-- Migration: version counter on leagues for the GET /leagues/{id} ETag
+-- Date: 2026-10-19
+-- Bumped by joins, draft status changes and finished team thumbnails.
+
+BEGIN;
+
+ALTER TABLE leagues ADD COLUMN IF NOT EXISTS version INTEGER NOT NULL DEFAULT 0;
+
+COMMIT;
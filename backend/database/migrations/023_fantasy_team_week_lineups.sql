@@ -0,0 +1,25 @@
+-- Migration: lineups frozen per (fantasy team, week)
+-- Date: 2026-10-19
+-- Weekly team totals were computed from the current fantasy_team_players.slot,
+-- so rescoring a past week (stat correction, lineup change) used today's
+-- starters. The first scoring of a week now freezes every team's roster and
+-- slots here, and all later rescoring of that week reads these rows.
+-- Weeks scored before this migration have no frozen lineup; they are frozen
+-- from the current rosters the next time they are rescored.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS fantasy_team_week_lineups (
+    week_id          INTEGER NOT NULL REFERENCES weeks(id) ON DELETE CASCADE,
+    fantasy_team_id  BIGINT  NOT NULL REFERENCES fantasy_teams(id) ON DELETE CASCADE,
+    player_id        BIGINT  NOT NULL REFERENCES players(id) ON DELETE CASCADE,
+    league_id        INTEGER NOT NULL REFERENCES leagues(id) ON DELETE CASCADE,
+    slot             VARCHAR(20) NOT NULL,
+
+    PRIMARY KEY (week_id, fantasy_team_id, player_id)
+);
+
+CREATE INDEX IF NOT EXISTS ix_fantasy_team_week_lineups_week_player
+  ON fantasy_team_week_lineups (week_id, player_id);
+
+COMMIT;
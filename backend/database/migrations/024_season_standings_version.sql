@@ -0,0 +1,31 @@
+-- Migration: monotonic standings version per season
+-- Date: 2026-10-19
+-- The season leaderboard cache was stamped with SUM(leagues.standings_version),
+-- which repeats a value when a league of the season is deleted and another one
+-- is refreshed. seasons.standings_version only ever grows: refresh_standings
+-- bumps it for the seasons it writes rows for, and a statement trigger bumps it
+-- for the seasons of any deleted league_standings rows (refreshes and cascades
+-- from league or team deletes).
+
+BEGIN;
+
+ALTER TABLE seasons ADD COLUMN IF NOT EXISTS standings_version INTEGER NOT NULL DEFAULT 0;
+
+UPDATE seasons s
+   SET standings_version = v.total
+  FROM (SELECT season_id, SUM(standings_version) AS total FROM leagues GROUP BY season_id) v
+ WHERE v.season_id = s.id;
+
+CREATE OR REPLACE FUNCTION bump_season_standings_version() RETURNS trigger AS $$
+BEGIN
+    UPDATE seasons SET standings_version = standings_version + 1
+    WHERE id IN (SELECT DISTINCT season_id FROM old_rows WHERE season_id IS NOT NULL);
+    RETURN NULL;
+END $$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_league_standings_deleted ON league_standings;
+CREATE TRIGGER trg_league_standings_deleted
+    AFTER DELETE ON league_standings REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_season_standings_version();
+
+COMMIT;
@@ -0,0 +1,13 @@
+-- Migration: veto window for accepted trades
+-- Date: 2026-10-19
+-- Accepting a trade no longer executes it: the trade becomes 'accepted' with
+-- execute_after = acceptance + review period, the commissioner can veto it
+-- until then, and POST /trades/run executes the accepted trades that are due.
+
+BEGIN;
+
+ALTER TABLE trades ADD COLUMN IF NOT EXISTS execute_after TIMESTAMPTZ;
+
+CREATE INDEX IF NOT EXISTS ix_trades_due ON trades (execute_after) WHERE status = 'accepted';
+
+COMMIT;
@@ -0,0 +1,37 @@
+-- Migration: roster version per league for the in-process availability pools
+-- Date: 2026-10-19
+-- Each process keeps a bitmap of rostered players per league
+-- (players/availability.py). Roster changes made by another process (the
+-- waiver cron, another uvicorn worker) are detected through
+-- leagues.roster_version, bumped by statement triggers on fantasy_team_players.
+
+BEGIN;
+
+ALTER TABLE leagues ADD COLUMN IF NOT EXISTS roster_version INTEGER NOT NULL DEFAULT 0;
+
+CREATE OR REPLACE FUNCTION bump_league_roster_version() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE leagues SET roster_version = roster_version + 1 WHERE id IN (SELECT DISTINCT league_id FROM new_rows);
+    ELSE
+        UPDATE leagues SET roster_version = roster_version + 1 WHERE id IN (SELECT DISTINCT league_id FROM old_rows);
+    END IF;
+    RETURN NULL;
+END $$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_fantasy_team_players_inserted ON fantasy_team_players;
+CREATE TRIGGER trg_fantasy_team_players_inserted
+    AFTER INSERT ON fantasy_team_players REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_league_roster_version();
+
+DROP TRIGGER IF EXISTS trg_fantasy_team_players_deleted ON fantasy_team_players;
+CREATE TRIGGER trg_fantasy_team_players_deleted
+    AFTER DELETE ON fantasy_team_players REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_league_roster_version();
+
+DROP TRIGGER IF EXISTS trg_fantasy_team_players_moved ON fantasy_team_players;
+CREATE TRIGGER trg_fantasy_team_players_moved
+    AFTER UPDATE OF league_id, player_id ON fantasy_team_players REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_league_roster_version();
+
+COMMIT;
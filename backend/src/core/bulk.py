@@ -0,0 +1,165 @@
+"""
+Set-based bulk writes.
+
+On PostgreSQL with psycopg2, rows are streamed with COPY into a temporary
+staging table and moved into the target with one
+`INSERT ... SELECT ... ON CONFLICT ... RETURNING` statement. Small batches and
+drivers without COPY use a single executemany INSERT (SQLAlchemy batches it
+into multi-row VALUES).
+
+All functions run inside the caller's session transaction and never commit.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import uuid
+from datetime import date, datetime
+from typing import Any, Dict, List, Literal, Mapping, Optional, Sequence
+
+from sqlalchemy import Table, literal_column, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import text
+
+# Below this many rows the COPY + staging table round trips are not worth it
+COPY_THRESHOLD = 500
+
+Method = Literal["auto", "copy", "executemany"]
+OnConflict = Literal["error", "nothing", "update"]
+
+
+def _copy_field(value: Any) -> str:
+    # COPY csv: an unquoted empty field is NULL, a quoted one ("") is an empty string
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        value = "t" if value else "f"
+    elif isinstance(value, (dict, list)):
+        value = json.dumps(value)
+    elif isinstance(value, (date, datetime)):
+        value = value.isoformat()
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def _rows_to_csv(rows: Sequence[Mapping[str, Any]], columns: Sequence[str]) -> io.StringIO:
+    buf = io.StringIO()
+    for row in rows:
+        buf.write(",".join(_copy_field(row.get(c)) for c in columns))
+        buf.write("\n")
+    buf.seek(0)
+    return buf
+
+
+def _supports_copy(db: Session) -> bool:
+    bind = db.get_bind()
+    return bind.dialect.name == "postgresql" and bind.dialect.driver == "psycopg2"
+
+
+def _conflict_elements(conflict: Sequence[str]):
+    # Plain names stay names; expressions such as "lower(name)" are rendered verbatim
+    return [c if c.isidentifier() else literal_column(c) for c in conflict]
+
+
+def bulk_insert(
+    db: Session,
+    table: Table,
+    rows: Sequence[Mapping[str, Any]],
+    *,
+    columns: Optional[Sequence[str]] = None,
+    on_conflict: OnConflict = "error",
+    conflict: Optional[Sequence[str]] = None,
+    update_columns: Optional[Sequence[str]] = None,
+    only_if_changed: bool = False,
+    returning: Sequence[str] = ("id",),
+    method: Method = "auto",
+) -> List[tuple]:
+    """
+    Insert `rows` (dicts keyed by column name) into `table` and return the
+    `returning` columns of the rows actually written.
+
+    - on_conflict="error": violations raise IntegrityError (caller rolls back).
+    - on_conflict="nothing": conflicting rows are skipped; `conflict` may name the
+      unique index columns/expressions (e.g. ["team_id", "lower(name)"]) or be omitted
+      to skip on any unique violation.
+    - on_conflict="update": upsert on `conflict`, overwriting `update_columns`
+      (default: every inserted column not in `conflict`). With `only_if_changed`,
+      rows whose values are identical are left untouched and not returned.
+    """
+    if not rows:
+        return []
+    columns = list(columns or rows[0].keys())
+    if on_conflict == "update":
+        if not conflict:
+            raise ValueError("on_conflict='update' requires conflict columns")
+        update_columns = list(update_columns or [c for c in columns if c not in conflict])
+
+    use_copy = method == "copy" or (method == "auto" and len(rows) >= COPY_THRESHOLD)
+    if use_copy and _supports_copy(db):
+        return _copy_insert(
+            db, table, rows, columns, on_conflict, conflict, update_columns, only_if_changed, returning
+        )
+    return _executemany_insert(
+        db, table, rows, columns, on_conflict, conflict, update_columns, only_if_changed, returning
+    )
+
+
+def _copy_insert(db, table, rows, columns, on_conflict, conflict, update_columns, only_if_changed, returning):
+    quote = db.get_bind().dialect.identifier_preparer.quote
+    target = quote(table.name)
+    stage = quote(f"_stage_{table.name}_{uuid.uuid4().hex[:8]}")
+    col_sql = ", ".join(quote(c) for c in columns)
+
+    # Same connection as the session, so COPY and INSERT share its transaction
+    db.execute(text(f"CREATE TEMP TABLE {stage} ON COMMIT DROP AS SELECT {col_sql} FROM {target} WITH NO DATA"))
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.copy_expert(f"COPY {stage} ({col_sql}) FROM STDIN WITH (FORMAT csv)", _rows_to_csv(rows, columns))
+    finally:
+        cursor.close()
+
+    sql = f"INSERT INTO {target} AS t ({col_sql}) SELECT {col_sql} FROM {stage}"
+    if on_conflict == "nothing":
+        target_sql = f" ({', '.join(conflict)})" if conflict else ""
+        sql += f" ON CONFLICT{target_sql} DO NOTHING"
+    elif on_conflict == "update":
+        sets = ", ".join(f"{quote(c)} = EXCLUDED.{quote(c)}" for c in update_columns)
+        sql += f" ON CONFLICT ({', '.join(conflict)}) DO UPDATE SET {sets}"
+        if only_if_changed:
+            current = ", ".join(f"t.{quote(c)}" for c in update_columns)
+            incoming = ", ".join(f"EXCLUDED.{quote(c)}" for c in update_columns)
+            sql += f" WHERE ({current}) IS DISTINCT FROM ({incoming})"
+    if returning:
+        sql += " RETURNING " + ", ".join(f"t.{quote(c)}" for c in returning)
+
+    result = db.execute(text(sql))
+    out = [tuple(r) for r in result] if returning else []
+    db.execute(text(f"DROP TABLE {stage}"))
+    return out
+
+
+def _executemany_insert(db, table, rows, columns, on_conflict, conflict, update_columns, only_if_changed, returning):
+    stmt = pg_insert(table)
+    if on_conflict != "error":
+        elements = _conflict_elements(conflict) if conflict else None
+        if on_conflict == "nothing":
+            stmt = stmt.on_conflict_do_nothing(index_elements=elements)
+        else:
+            where = None
+            if only_if_changed:
+                where = tuple_(*[table.c[c] for c in update_columns]).is_distinct_from(
+                    tuple_(*[stmt.excluded[c] for c in update_columns])
+                )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=elements,
+                set_={c: stmt.excluded[c] for c in update_columns},
+                where=where,
+            )
+
+    params: List[Dict[str, Any]] = [{c: row.get(c) for c in columns} for row in rows]
+    if returning:
+        result = db.execute(stmt.returning(*[table.c[c] for c in returning]), params)
+        return [tuple(r) for r in result]
+    db.execute(stmt, params)
+    return []
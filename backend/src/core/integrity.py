@@ -0,0 +1,10 @@
+"""Helpers for IntegrityErrors raised by PostgreSQL constraints."""
+from typing import Optional
+
+from sqlalchemy.exc import IntegrityError
+
+
+def constraint_name(exc: IntegrityError) -> Optional[str]:
+    """Name of the violated constraint (unique, exclusion, check, FK), when the driver reports it."""
+    diag = getattr(getattr(exc, "orig", None), "diag", None)
+    return getattr(diag, "constraint_name", None)
@@ -0,0 +1,189 @@
+"""
+In-process pub/sub hub for push channels (SSE).
+
+Publishers call `hub.publish(channel, key, message)` from any thread. The hub
+hands the message to its broker; the broker delivers it to every hub that
+listens on the channel (for `LocalBroker` that is just this process, a
+Redis/Postgres LISTEN broker would fan out across workers) and the hub copies
+it, on its event loop, into the buffer of each local subscription.
+
+Subscriber buffers are bounded and coalescing: messages carry a key (e.g. the
+fantasy team id) and a newer message replaces an undelivered one with the same
+key, so a slow client only ever sees the latest value per key. When a buffer
+still overflows, the oldest key is dropped and the subscription is flagged so
+the client can resync from a snapshot.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Protocol, Set, Tuple
+
+# Distinct keys a subscriber may have pending before the oldest is dropped
+DEFAULT_BUFFER_SIZE = 256
+
+Deliver = Callable[[str, Hashable, Any], None]
+
+
+class Broker(Protocol):
+    """Transport between publishers and hubs. `deliver` is called for every message on a listened channel."""
+
+    def publish(self, channel: str, key: Hashable, message: Any) -> None: ...
+
+    def listen(self, channel: str, deliver: Deliver) -> None: ...
+
+    def unlisten(self, channel: str, deliver: Deliver) -> None: ...
+
+
+class LocalBroker:
+    """Single-process broker: publish delivers synchronously to the listeners of the channel."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._listeners: Dict[str, List[Deliver]] = {}
+        self.published = 0
+
+    def publish(self, channel: str, key: Hashable, message: Any) -> None:
+        with self._lock:
+            listeners = list(self._listeners.get(channel, ()))
+            self.published += 1
+        for deliver in listeners:
+            deliver(channel, key, message)
+
+    def listen(self, channel: str, deliver: Deliver) -> None:
+        with self._lock:
+            self._listeners.setdefault(channel, []).append(deliver)
+
+    def unlisten(self, channel: str, deliver: Deliver) -> None:
+        with self._lock:
+            listeners = self._listeners.get(channel, [])
+            if deliver in listeners:
+                listeners.remove(deliver)
+            if not listeners:
+                self._listeners.pop(channel, None)
+
+
+class Subscription:
+    """One connection's bounded, coalescing buffer. Lives on the hub's event loop."""
+
+    def __init__(self, hub: "Hub", channel: str, maxsize: int) -> None:
+        self.hub = hub
+        self.channel = channel
+        self.maxsize = maxsize
+        self.overflowed = False
+        self._pending: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._ready = asyncio.Event()
+
+    def _offer(self, key: Hashable, message: Any) -> None:
+        if key in self._pending:
+            self._pending[key] = message  # coalesce: keep position, latest value
+        else:
+            if len(self._pending) >= self.maxsize:
+                self._pending.popitem(last=False)
+                self.overflowed = True
+            self._pending[key] = message
+        self._ready.set()
+
+    def drain(self) -> Tuple[List[Any], bool]:
+        """Take every pending message (oldest key first) and the overflow flag."""
+        messages = list(self._pending.values())
+        self._pending.clear()
+        overflowed, self.overflowed = self.overflowed, False
+        self._ready.clear()
+        return messages, overflowed
+
+    async def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait until something is pending. Returns False on timeout."""
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def close(self) -> None:
+        self.hub.unsubscribe(self)
+
+    async def __aenter__(self) -> "Subscription":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self.close()
+
+
+class Hub:
+    """
+    Subscriptions belong to one event loop (the worker's). Deliveries from any
+    thread are collected in an inbox, coalesced by (channel, key), and fanned
+    out to the subscriptions by a single loop callback per burst.
+    """
+
+    def __init__(self, broker: Optional[Broker] = None, *, buffer_size: int = DEFAULT_BUFFER_SIZE) -> None:
+        self.broker: Broker = broker or LocalBroker()
+        self.buffer_size = buffer_size
+        self._lock = threading.Lock()
+        self._subs: Dict[str, Set[Subscription]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._inbox: Dict[Tuple[str, Hashable], Any] = {}
+        self._pump_scheduled = False
+
+    def publish(self, channel: str, key: Hashable, message: Any) -> None:
+        self.broker.publish(channel, key, message)
+
+    def _deliver(self, channel: str, key: Hashable, message: Any) -> None:
+        # Called by the broker from any thread
+        with self._lock:
+            self._inbox[(channel, key)] = message
+            if self._pump_scheduled or self._loop is None:
+                return
+            self._pump_scheduled = True
+            loop = self._loop
+        try:
+            loop.call_soon_threadsafe(self._pump)
+        except RuntimeError:
+            pass  # loop closed: nobody is listening anymore
+
+    def _pump(self) -> None:
+        with self._lock:
+            batch, self._inbox = self._inbox, {}
+            self._pump_scheduled = False
+        by_channel: Dict[str, List[Tuple[Hashable, Any]]] = {}
+        for (channel, key), message in batch.items():
+            by_channel.setdefault(channel, []).append((key, message))
+        for channel, items in by_channel.items():
+            for sub in list(self._subs.get(channel, ())):
+                for key, message in items:
+                    sub._offer(key, message)
+
+    def subscribe(self, channel: str, *, buffer_size: Optional[int] = None) -> Subscription:
+        """Open a subscription; must be called from the event loop that consumes it."""
+        loop = asyncio.get_running_loop()
+        sub = Subscription(self, channel, buffer_size or self.buffer_size)
+        with self._lock:
+            if self._loop is not loop:
+                self._loop = loop
+                self._pump_scheduled = False
+            if channel not in self._subs:
+                self.broker.listen(channel, self._deliver)
+            self._subs.setdefault(channel, set()).add(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        with self._lock:
+            subs = self._subs.get(sub.channel)
+            if subs is None or sub not in subs:
+                return
+            subs.discard(sub)
+            if not subs:
+                del self._subs[sub.channel]
+                self.broker.unlisten(sub.channel, self._deliver)
+
+    def subscriber_count(self, channel: Optional[str] = None) -> int:
+        with self._lock:
+            if channel is not None:
+                return len(self._subs.get(channel, ()))
+            return sum(len(s) for s in self._subs.values())
+
+
+hub = Hub()
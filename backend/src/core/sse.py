@@ -0,0 +1,74 @@
+"""
+Server-sent events plumbing shared by the push endpoints.
+
+A stream is a `core.pubsub` subscription plus a first chunk (usually a
+snapshot). After each wakeup the stream waits `COALESCE_SECONDS` so a burst
+of updates is written at once, and idle streams get a comment line every
+`HEARTBEAT_SECONDS` so proxies keep the connection open.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, Callable, List, Optional
+
+from fastapi import HTTPException, Request, status
+from fastapi.responses import StreamingResponse
+
+from .pubsub import Subscription
+
+HEARTBEAT_SECONDS = 15.0
+COALESCE_SECONDS = 0.1
+
+# (messages, overflowed) -> text to write (may be empty)
+Render = Callable[[List[Any], bool], str]
+
+
+def format_event(event: str, data: Any) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+
+def request_token(request: Request, access_token: Optional[str]) -> str:
+    """Bearer token from the Authorization header, or the query fallback for EventSource clients."""
+    auth = request.headers.get("authorization", "")
+    token = auth[7:] if auth.lower().startswith("bearer ") else access_token
+    if not token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return token
+
+
+def stream(
+    sub: Subscription,
+    first: str,
+    render: Render,
+    *,
+    heartbeat: float = HEARTBEAT_SECONDS,
+    coalesce: float = COALESCE_SECONDS,
+) -> StreamingResponse:
+    """Event stream response that owns `sub` and closes it when the client goes away."""
+
+    async def events():
+        try:
+            yield first
+            while True:
+                if not await sub.wait(heartbeat):
+                    yield ": keep-alive\n\n"
+                    continue
+                await asyncio.sleep(coalesce)
+                messages, overflowed = sub.drain()
+                chunk = render(messages, overflowed)
+                if chunk:
+                    yield chunk
+        finally:
+            sub.close()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,162 @@
+"""
+Incremental readers for large record files (JSON arrays, JSON Lines and CSV).
+
+Every reader takes a text file object and yields one record (dict) at a time,
+so callers can process uploads of any size with bounded memory.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from itertools import islice
+from typing import Any, Dict, IO, Iterable, Iterator, List, TypeVar
+
+T = TypeVar("T")
+
+SUPPORTED_FORMATS = ("json", "jsonl", "csv")
+
+_READ_SIZE = 64 * 1024
+_WS = " \t\r\n"
+_DELIMITERS = _WS + ",]"
+
+
+def detect_format(filename: str) -> str:
+    """Return 'json', 'jsonl' or 'csv' from a file name, or raise ValueError."""
+    lower = (filename or "").lower()
+    if lower.endswith(".jsonl") or lower.endswith(".ndjson"):
+        return "jsonl"
+    if lower.endswith(".json"):
+        return "json"
+    if lower.endswith(".csv"):
+        return "csv"
+    raise ValueError("Formato no soportado: se requiere .json, .jsonl o .csv")
+
+
+def text_stream(binary: IO[bytes]) -> IO[str]:
+    """Wrap a binary file object (e.g. UploadFile.file) as UTF-8 text, tolerating a BOM."""
+    return io.TextIOWrapper(binary, encoding="utf-8-sig", newline="")
+
+
+def iter_json_array(fp: IO[str], *, read_size: int = _READ_SIZE) -> Iterator[Any]:
+    """
+    Yield the elements of a top-level JSON array one by one.
+
+    Only the element being decoded (plus one read buffer) is held in memory.
+    Raises ValueError on malformed input or when the document is not an array.
+    """
+    decoder = json.JSONDecoder()
+    buf = ""
+    pos = 0
+    eof = False
+
+    def fill() -> bool:
+        nonlocal buf, pos, eof
+        if eof:
+            return False
+        data = fp.read(read_size)
+        if not data:
+            eof = True
+            return False
+        buf = buf[pos:] + data
+        pos = 0
+        return True
+
+    def skip_ws() -> None:
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in _WS:
+                pos += 1
+            if pos < len(buf) or not fill():
+                return
+
+    skip_ws()
+    if pos >= len(buf) or buf[pos] != "[":
+        raise ValueError("El archivo debe contener un array JSON.")
+    pos += 1
+
+    expect_value = True
+    first = True
+    while True:
+        skip_ws()
+        if pos >= len(buf):
+            raise ValueError("JSON malformado: array sin cerrar.")
+        ch = buf[pos]
+        if ch == "]" and (first or not expect_value):
+            pos += 1
+            break
+        if not expect_value:
+            if ch != ",":
+                raise ValueError("JSON malformado: se esperaba ',' entre elementos.")
+            pos += 1
+            expect_value = True
+            continue
+
+        # Decode one element, reading more input while it is incomplete.
+        while True:
+            try:
+                value, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if fill():
+                    continue
+                raise ValueError("JSON malformado.")
+            # A number or literal that reaches the end of the buffer may continue
+            # in the next read ("2." + "5", "1.5" + "e10"): only trust it once a
+            # delimiter follows it or the input is exhausted.
+            if not eof and not isinstance(value, (dict, list, str)):
+                rest = end
+                while rest < len(buf) and buf[rest] not in _DELIMITERS:
+                    rest += 1
+                if rest == len(buf) and fill():
+                    continue
+            break
+        pos = end
+        first = False
+        expect_value = False
+        yield value
+
+    skip_ws()
+    if pos < len(buf):
+        raise ValueError("JSON malformado: contenido después del array.")
+
+
+def iter_jsonl(fp: IO[str]) -> Iterator[Any]:
+    """Yield one decoded value per non-empty line."""
+    for lineno, line in enumerate(fp, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError:
+            raise ValueError(f"JSON malformado en la línea {lineno}.")
+
+
+def iter_csv(fp: IO[str]) -> Iterator[Dict[str, Any]]:
+    """Yield one dict per CSV row using the header row as keys; empty cells become None."""
+    reader = csv.DictReader(fp)
+    for row in reader:
+        yield {k.strip(): (v.strip() if v and v.strip() else None) for k, v in row.items() if k}
+
+
+def iter_records(fp: IO[str], fmt: str) -> Iterator[Any]:
+    if fmt == "json":
+        return iter_json_array(fp)
+    if fmt == "jsonl":
+        return iter_jsonl(fp)
+    if fmt == "csv":
+        return iter_csv(fp)
+    raise ValueError(f"Formato no soportado: {fmt}")
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Group an iterable into lists of at most `size` elements."""
+    if size < 1:
+        raise ValueError("chunk size must be >= 1")
+    it = iter(items)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
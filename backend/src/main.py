@@ -10,6 +10,13 @@ from .modules.users import models as user_models
 from .modules.teams import models as team_models
 from .modules.fantasy_teams import models as fantasy_team_models
 from .modules.players import models as player_models
+from .modules.stats import models as stats_models
+from .modules.scoring import models as scoring_models
+from .modules.matchups import models as matchup_models
+from .modules.draft import models as draft_models
+from .modules.waivers import models as waiver_models
+from .modules.trades import models as trade_models
+from .modules.projections import models as projection_models
 from .modules.leagues.router import router as leagues_router
 
 
@@ -18,9 +25,53 @@ user_models.Base.metadata.create_all(bind=engine)
 team_models.Base.metadata.create_all(bind=engine)
 fantasy_team_models.Base.metadata.create_all(bind=engine)
 player_models.Base.metadata.create_all(bind=engine)
+stats_models.Base.metadata.create_all(bind=engine)
+scoring_models.Base.metadata.create_all(bind=engine)
+matchup_models.Base.metadata.create_all(bind=engine)
+draft_models.Base.metadata.create_all(bind=engine)
+waiver_models.Base.metadata.create_all(bind=engine)
+trade_models.Base.metadata.create_all(bind=engine)
+projection_models.Base.metadata.create_all(bind=engine)
 
 app = FastAPI()
 
+
+@app.on_event("startup")
+def resume_background_jobs():
+    # Resume player batch imports interrupted by a restart
+    from .modules.players.jobs import resume_pending_jobs
+    resume_pending_jobs()
+    # Fantasy team thumbnails still pending (including scheduled retries)
+    from .modules.fantasy_teams.thumbnails import resume_pending
+    resume_pending()
+
+
+@app.on_event("startup")
+def wire_live_scoreboard():
+    # Committed live score totals are pushed to the league scoreboard streams
+    from .modules.scoring.live import scorer
+    from .modules.scoring.router import publish_totals
+    scorer.add_listener(publish_totals)
+
+
+@app.on_event("startup")
+def load_player_pool():
+    # Available players per league: catalog and rostered sets, rebuilt with one query
+    from .config.database import SessionLocal
+    from .modules.players.availability import pool
+    db = SessionLocal()
+    try:
+        pool.rebuild(db)
+    finally:
+        db.close()
+
+
+@app.on_event("startup")
+async def resume_drafts():
+    # Replay running drafts from their pick log and restart the pick clocks
+    from .modules.draft.service import drafts
+    await drafts.recover()
+
 # CORS
 app.add_middleware(
     CORSMiddleware,
@@ -43,15 +94,30 @@ app.mount("/media", StaticFiles(directory=str(MEDIA_DIR)), name="media")
 
 from .modules.users.router import router as users_router
 from .modules.teams.router import router as teams_router
-# Fantasy teams will be wired via league flows; expose router later if needed
+from .modules.fantasy_teams.router import router as fantasy_teams_router
+from .modules.matchups.router import router as matchups_router
 from .modules.leagues.routes.season_routes import router as season_router
 from .modules.players.router import router as players_router
+from .modules.stats.router import router as stats_router
+from .modules.scoring.router import router as scoreboard_router
+from .modules.draft.router import router as draft_router
+from .modules.waivers.router import router as waivers_router
+from .modules.trades.router import router as trades_router
+from .modules.projections.router import router as projections_router
 
 app.include_router(users_router, tags=["users"])
 app.include_router(teams_router, prefix="/teams", tags=["teams"])
 app.include_router(leagues_router, tags=["leagues"])
 app.include_router(season_router, prefix="/api", tags=["seasons"])
 app.include_router(players_router, prefix="/players", tags=["players"])
+app.include_router(stats_router, prefix="/stats", tags=["stats"])
+app.include_router(scoreboard_router)
+app.include_router(fantasy_teams_router)
+app.include_router(matchups_router)
+app.include_router(draft_router)
+app.include_router(waivers_router)
+app.include_router(trades_router)
+app.include_router(projections_router)
 
 
 # 422 handler
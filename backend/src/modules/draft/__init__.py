@@ -0,0 +1,3 @@
+"""Real-time snake draft module package."""
+
+__all__ = ["models", "engine", "clock", "repository", "service", "router"]
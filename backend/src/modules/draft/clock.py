@@ -0,0 +1,81 @@
+"""
+Pick clocks for every draft of the worker on a single asyncio task.
+
+Deadlines sit in one heap keyed by loop time. Rescheduling a key (a league)
+just records a new token; older heap entries for the key are skipped when
+they surface, so a pick never has to search the heap.
+"""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ClockScheduler:
+    def __init__(self) -> None:
+        self._heap: List[Tuple[float, int, Hashable, Callable[[], None]]] = []
+        self._current: Dict[Hashable, int] = {}
+        self._seq = itertools.count()
+        self._wake: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def start(self) -> None:
+        """Start the timer task on the running loop (idempotent)."""
+        loop = asyncio.get_running_loop()
+        if self._task is not None and not self._task.done() and self._loop is loop:
+            return
+        self._loop = loop
+        self._wake = asyncio.Event()
+        self._task = loop.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def schedule(self, key: Hashable, delay: float, callback: Callable[[], None]) -> None:
+        """Run `callback` after `delay` seconds unless `key` is rescheduled or cancelled first. Loop thread only."""
+        self.start()
+        token = next(self._seq)
+        when = self._loop.time() + max(delay, 0.0)
+        self._current[key] = token
+        heapq.heappush(self._heap, (when, token, key, callback))
+        if self._heap[0][1] == token:
+            self._wake.set()  # new earliest deadline
+
+    def cancel(self, key: Hashable) -> None:
+        self._current.pop(key, None)
+
+    def pending(self) -> int:
+        return len(self._current)
+
+    async def _run(self) -> None:
+        loop = self._loop
+        while True:
+            now = loop.time()
+            while self._heap and self._heap[0][0] <= now:
+                _when, token, key, callback = heapq.heappop(self._heap)
+                if self._current.get(key) != token:
+                    continue  # rescheduled or cancelled
+                del self._current[key]
+                try:
+                    callback()
+                except Exception:
+                    # One failing draft must not stop the other clocks
+                    logger.exception("Draft clock callback failed for %r", key)
+            timeout = self._heap[0][0] - now if self._heap else None
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
@@ -0,0 +1,179 @@
+"""
+In-memory snake draft state.
+
+`DraftState` is rebuilt from the draft row and its pick log, so the log is
+the only thing that has to be durable. Pick validation against the league's
+`roster_schema` is O(1) per pick thanks to counters kept per team:
+
+- a position may be drafted while the team holds fewer players of it than
+  its dedicated seats + the FLEX seats it is eligible for + BENCH;
+- players beyond the dedicated and eligible FLEX seats sit on the bench, and
+  the bench never overflows;
+- the picks a team has left always cover its still empty dedicated seats.
+
+FLEX seats are counted per eligible position (the exact assignment, when
+several FLEX kinds overlap, is left to the lineup solver).
+"""
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence
+
+from ..fantasy_teams.lineup import SlotPlan, normalize_position, position_seats
+
+
+@dataclass(frozen=True)
+class Pick:
+    pick_number: int
+    round: int
+    fantasy_team_id: int
+    player_id: int
+    is_auto: bool = False
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "pick_number": self.pick_number,
+            "round": self.round,
+            "fantasy_team_id": self.fantasy_team_id,
+            "player_id": self.player_id,
+            "is_auto": self.is_auto,
+        }
+
+
+class DraftState:
+    def __init__(
+        self,
+        league_id: int,
+        order: Sequence[int],
+        plan: SlotPlan,
+        *,
+        pick_seconds: int,
+        owners: Optional[Mapping[int, int]] = None,
+        rounds: Optional[int] = None,
+    ) -> None:
+        if not order:
+            raise ValueError("The draft needs at least one team")
+        self.league_id = league_id
+        self.order: List[int] = [int(t) for t in order]
+        self.pick_seconds = pick_seconds
+        self.owners: Dict[int, int] = dict(owners or {})  # fantasy team -> user
+        self.rounds = rounds if rounds is not None else plan.starters + plan.bench
+        if self.rounds <= 0:
+            raise ValueError("The league's roster_schema has no draftable slots")
+        self.total_picks = self.rounds * len(self.order)
+
+        self.required, self.flex = position_seats(plan)
+        self.bench = plan.bench
+        self.cap: Dict[str, int] = {
+            p: self.required.get(p, 0) + self.flex.get(p, 0) + self.bench
+            for p in set(self.required) | set(self.flex)
+        }
+        missing = sum(self.required.values())
+
+        self.picks: List[Pick] = []
+        self.taken: set = set()
+        self.counts: Dict[int, Dict[str, int]] = {t: {} for t in self.order}
+        self.picked: Dict[int, int] = {t: 0 for t in self.order}
+        self.missing: Dict[int, int] = {t: missing for t in self.order}
+        self.on_bench: Dict[int, int] = {t: 0 for t in self.order}
+        self.queues: Dict[int, List[int]] = {t: [] for t in self.order}
+        self.deadline: Optional[float] = None  # epoch seconds
+
+    # -- order -----------------------------------------------------------
+
+    @property
+    def next_pick(self) -> int:
+        return len(self.picks)
+
+    @property
+    def complete(self) -> bool:
+        return len(self.picks) >= self.total_picks
+
+    def team_at(self, pick_number: int) -> int:
+        rnd, i = divmod(pick_number, len(self.order))
+        return self.order[i] if rnd % 2 == 0 else self.order[-1 - i]
+
+    @property
+    def on_clock(self) -> Optional[int]:
+        return None if self.complete else self.team_at(self.next_pick)
+
+    def start_clock(self, now: Optional[float] = None) -> float:
+        self.deadline = (now if now is not None else time.time()) + self.pick_seconds
+        return self.deadline
+
+    # -- validation ------------------------------------------------------
+
+    def check(self, team_id: int, player_id: int, position: str) -> Optional[str]:
+        """Reason the pick is not allowed, or None. O(1)."""
+        if player_id in self.taken:
+            return "Player already drafted"
+        position = normalize_position(position)
+        cap = self.cap.get(position, 0)
+        if cap == 0:
+            return f"Position {position} has no slot in this league's roster"
+        have = self.counts[team_id].get(position, 0)
+        if have >= cap:
+            return f"Roster limit reached for {position}"
+        starter_seats = self.required.get(position, 0) + self.flex.get(position, 0)
+        if have >= starter_seats and self.on_bench[team_id] >= self.bench:
+            return f"No bench room left for another {position}"
+        missing = self.missing[team_id] - (1 if have < self.required.get(position, 0) else 0)
+        if missing > self.rounds - self.picked[team_id] - 1:
+            return "Remaining picks are needed for required positions"
+        return None
+
+    def validate(self, team_id: int, player_id: int, position: str) -> None:
+        reason = self.check(team_id, player_id, position)
+        if reason is not None:
+            raise ValueError(reason)
+
+    # -- mutation --------------------------------------------------------
+
+    def next_pick_for(self, team_id: int, player_id: int, *, is_auto: bool = False) -> Pick:
+        n = self.next_pick
+        return Pick(n, n // len(self.order) + 1, team_id, player_id, is_auto)
+
+    def apply(self, pick: Pick, position: str) -> None:
+        """Record a validated pick (also used to replay the log)."""
+        if pick.pick_number != self.next_pick:
+            raise ValueError("Pick out of order")
+        team = pick.fantasy_team_id
+        position = normalize_position(position)
+        have = self.counts[team].get(position, 0)
+        if have < self.required.get(position, 0):
+            self.missing[team] -= 1
+        elif have >= self.required.get(position, 0) + self.flex.get(position, 0):
+            self.on_bench[team] += 1
+        self.counts[team][position] = have + 1
+        self.picked[team] += 1
+        self.taken.add(pick.player_id)
+        self.picks.append(pick)
+
+    def choose_auto(
+        self,
+        team_id: int,
+        position_of: Callable[[int], Optional[str]],
+        fallback: Iterable[int],
+    ) -> int:
+        """First valid player of the team's queue, else of `fallback` (best available first)."""
+        for source in (self.queues.get(team_id, ()), fallback):
+            for pid in source:
+                position = position_of(pid)
+                if position is not None and self.check(team_id, pid, position) is None:
+                    return pid
+        raise LookupError("No eligible player left to autopick")
+
+    def snapshot(self) -> Dict[str, object]:
+        return {
+            "league_id": self.league_id,
+            "status": "complete" if self.complete else "running",
+            "order": self.order,
+            "rounds": self.rounds,
+            "pick_seconds": self.pick_seconds,
+            "next_pick": self.next_pick,
+            "round": None if self.complete else self.next_pick // len(self.order) + 1,
+            "on_clock": self.on_clock,
+            "deadline": self.deadline,
+            "picks": [p.to_dict() for p in self.picks],
+        }
@@ -0,0 +1,48 @@
+from sqlalchemy import Column, Integer, BigInteger, SmallInteger, String, Boolean, DateTime, ForeignKey, Index, UniqueConstraint, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import text
+from ...config.database import Base
+
+
+class Draft(Base):
+    """One snake draft per league. The running state lives in memory; this row and the pick log rebuild it."""
+    __tablename__ = "drafts"
+
+    league_id = Column(Integer, ForeignKey("leagues.id", ondelete="CASCADE"), primary_key=True)
+    status = Column(String(20), nullable=False, server_default=text("'running'"))  # running|complete
+    team_order = Column(JSONB, nullable=False)  # fantasy team ids, first round order
+    rounds = Column(SmallInteger, nullable=False)
+    pick_seconds = Column(SmallInteger, nullable=False)
+    started_at = Column(DateTime(timezone=True), server_default=func.now())
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+
+
+class DraftPick(Base):
+    """Append-only pick log."""
+    __tablename__ = "draft_picks"
+
+    id = Column(BigInteger, primary_key=True, index=True)
+    league_id = Column(Integer, ForeignKey("drafts.league_id", ondelete="CASCADE"), nullable=False)
+    pick_number = Column(Integer, nullable=False)  # 0-based overall pick
+    round = Column(SmallInteger, nullable=False)
+    fantasy_team_id = Column(BigInteger, ForeignKey("fantasy_teams.id", ondelete="CASCADE"), nullable=False)
+    player_id = Column(BigInteger, ForeignKey("players.id", ondelete="CASCADE"), nullable=False)
+    is_auto = Column(Boolean, nullable=False, default=False)
+    picked_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        # A pick slot is written once and a player is drafted once per league
+        UniqueConstraint("league_id", "pick_number", name="ux_draft_picks_league_pick"),
+        UniqueConstraint("league_id", "player_id", name="ux_draft_picks_league_player"),
+    )
+
+
+class DraftQueueEntry(Base):
+    """A manager's ranked autopick queue."""
+    __tablename__ = "draft_queue"
+
+    fantasy_team_id = Column(BigInteger, ForeignKey("fantasy_teams.id", ondelete="CASCADE"), primary_key=True)
+    player_id = Column(BigInteger, ForeignKey("players.id", ondelete="CASCADE"), primary_key=True)
+    rank = Column(Integer, nullable=False)
+
+Index("ix_draft_queue_team_rank", DraftQueueEntry.fantasy_team_id, DraftQueueEntry.rank)
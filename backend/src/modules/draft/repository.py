@@ -0,0 +1,136 @@
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.orm import Session
+
+from ..fantasy_teams import models as ft_models
+from ..leagues import models as league_models
+from ..players import models as player_models
+from . import models
+
+
+def get_league(db: Session, league_id: int) -> Optional[league_models.League]:
+    return db.get(league_models.League, league_id)
+
+
+def get_draft(db: Session, league_id: int) -> Optional[models.Draft]:
+    return db.get(models.Draft, league_id)
+
+
+def get_user_team_id(db: Session, league_id: int, user_id: int) -> Optional[int]:
+    FT = ft_models.FantasyTeam
+    return db.execute(
+        select(FT.id).where(FT.league_id == league_id, FT.user_id == user_id, FT.is_active.is_(True))
+    ).scalar_one_or_none()
+
+
+def list_team_owners(db: Session, league_id: int) -> List[Tuple[int, int]]:
+    """(fantasy_team_id, user_id) of the league's active teams."""
+    FT = ft_models.FantasyTeam
+    rows = db.execute(
+        select(FT.id, FT.user_id)
+        .where(FT.league_id == league_id, FT.is_active.is_(True))
+        .order_by(FT.id)
+    ).all()
+    return [(int(t), int(u)) for t, u in rows]
+
+
+def create_draft(db: Session, *, league_id: int, team_order: Sequence[int], rounds: int, pick_seconds: int) -> models.Draft:
+    draft = models.Draft(
+        league_id=league_id,
+        status="running",
+        team_order=[int(t) for t in team_order],
+        rounds=rounds,
+        pick_seconds=pick_seconds,
+    )
+    db.add(draft)
+    db.execute(
+        update(league_models.League)
+        .where(league_models.League.id == league_id)
+        .values(status="draft", version=league_models.League.version + 1)
+    )
+    db.flush()
+    return draft
+
+
+def record_pick(
+    db: Session,
+    *,
+    league_id: int,
+    pick_number: int,
+    round: int,
+    fantasy_team_id: int,
+    player_id: int,
+    is_auto: bool,
+) -> None:
+    """Append to the pick log and put the player on the team's bench, in the caller's transaction."""
+    db.execute(
+        insert(models.DraftPick).values(
+            league_id=league_id,
+            pick_number=pick_number,
+            round=round,
+            fantasy_team_id=fantasy_team_id,
+            player_id=player_id,
+            is_auto=is_auto,
+        )
+    )
+    db.execute(
+        insert(ft_models.FantasyTeamPlayer).values(
+            league_id=league_id,
+            fantasy_team_id=fantasy_team_id,
+            player_id=player_id,
+            slot="BENCH",
+            acquired_via="draft",
+        )
+    )
+
+
+def complete_draft(db: Session, league_id: int) -> None:
+    db.execute(
+        update(models.Draft)
+        .where(models.Draft.league_id == league_id)
+        .values(status="complete", completed_at=datetime.now(timezone.utc))
+    )
+    db.execute(
+        update(league_models.League)
+        .where(league_models.League.id == league_id)
+        .values(status="in_season", version=league_models.League.version + 1)
+    )
+
+
+def list_running_drafts(db: Session) -> List[models.Draft]:
+    return db.execute(select(models.Draft).where(models.Draft.status == "running")).scalars().all()
+
+
+def list_picks(db: Session, league_id: int) -> List[Tuple[models.DraftPick, str]]:
+    """The pick log in order, each with the drafted player's position."""
+    DP = models.DraftPick
+    P = player_models.Player
+    rows = db.execute(
+        select(DP, P.position).join(P, P.id == DP.player_id).where(DP.league_id == league_id).order_by(DP.pick_number)
+    ).all()
+    return [(pick, position) for pick, position in rows]
+
+
+def load_queues(db: Session, team_ids: Sequence[int]) -> Dict[int, List[int]]:
+    Q = models.DraftQueueEntry
+    queues: Dict[int, List[int]] = {int(t): [] for t in team_ids}
+    if not team_ids:
+        return queues
+    rows = db.execute(
+        select(Q.fantasy_team_id, Q.player_id).where(Q.fantasy_team_id.in_(list(team_ids))).order_by(Q.fantasy_team_id, Q.rank)
+    ).all()
+    for team_id, pid in rows:
+        queues[int(team_id)].append(int(pid))
+    return queues
+
+
+def replace_queue(db: Session, fantasy_team_id: int, player_ids: Sequence[int]) -> None:
+    Q = models.DraftQueueEntry
+    db.execute(delete(Q).where(Q.fantasy_team_id == fantasy_team_id))
+    if player_ids:
+        db.execute(
+            insert(Q),
+            [{"fantasy_team_id": fantasy_team_id, "player_id": pid, "rank": i} for i, pid in enumerate(player_ids)],
+        )
@@ -0,0 +1,113 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi import status
+from starlette.concurrency import run_in_threadpool
+
+from ...config.database import SessionLocal
+from ...core import sse
+from ...core.pubsub import hub
+from ..users.router import get_current_user
+from . import schemas
+from .service import channel_for, drafts
+
+router = APIRouter(prefix="/leagues", tags=["draft"])
+
+
+@router.post("/{league_id}/draft", status_code=201)
+async def start_draft(
+    league_id: int,
+    payload: Optional[schemas.DraftStart] = None,
+    current_user = Depends(get_current_user),
+):
+    """Inicia el draft (solo el comisionado): orden snake y reloj de la primera selección."""
+    payload = payload or schemas.DraftStart()
+    try:
+        return await drafts.start(
+            league_id,
+            user=current_user,
+            pick_seconds=payload.pick_seconds,
+            randomize_order=payload.randomize_order,
+        )
+    except LookupError as le:
+        raise HTTPException(status_code=404, detail=str(le))
+    except PermissionError as pe:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(pe))
+    except ValueError as ve:
+        raise HTTPException(status_code=409, detail=str(ve))
+
+
+@router.get("/{league_id}/draft")
+async def get_draft(league_id: int, current_user = Depends(get_current_user)):
+    try:
+        state = await drafts.get(league_id)
+    except LookupError as le:
+        raise HTTPException(status_code=404, detail=str(le))
+    return state.snapshot()
+
+
+@router.post("/{league_id}/draft/picks", status_code=201)
+async def make_pick(
+    league_id: int,
+    payload: schemas.PickRequest,
+    current_user = Depends(get_current_user),
+):
+    try:
+        return await drafts.pick(league_id, payload.player_id, user_id=current_user.id)
+    except LookupError as le:
+        raise HTTPException(status_code=404, detail=str(le))
+    except PermissionError as pe:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(pe))
+    except ValueError as ve:
+        raise HTTPException(status_code=409, detail=str(ve))
+
+
+@router.put("/{league_id}/draft/queue")
+async def set_queue(
+    league_id: int,
+    payload: schemas.QueueUpdate,
+    current_user = Depends(get_current_user),
+):
+    """Cola de autoselección del usuario, en orden de preferencia."""
+    try:
+        return await drafts.set_queue(league_id, user_id=current_user.id, player_ids=payload.player_ids)
+    except LookupError as le:
+        raise HTTPException(status_code=404, detail=str(le))
+
+
+def _authenticate(token: str) -> None:
+    db = SessionLocal()
+    try:
+        get_current_user(token, db)
+    finally:
+        db.close()
+
+
+@router.get("/{league_id}/draft/stream")
+async def stream_draft(
+    league_id: int,
+    request: Request,
+    access_token: Optional[str] = Query(None, description="For EventSource clients that cannot send headers"),
+):
+    """
+    Server-sent events: a `snapshot` event with the full draft, then `pick`
+    and `clock` events as they happen. On `resync`, fetch the snapshot again.
+    """
+    token = sse.request_token(request, access_token)
+    # Subscribe before reading the snapshot so no pick falls in between
+    sub = hub.subscribe(channel_for(league_id))
+    try:
+        await run_in_threadpool(_authenticate, token)
+        state = await drafts.get(league_id)
+    except LookupError as le:
+        sub.close()
+        raise HTTPException(status_code=404, detail=str(le))
+    except BaseException:
+        sub.close()
+        raise
+
+    def render(messages, overflowed) -> str:
+        chunk = sse.format_event("resync", {"league_id": league_id}) if overflowed else ""
+        return chunk + "".join(sse.format_event(m["type"], m) for m in messages)
+
+    return sse.stream(sub, sse.format_event("snapshot", state.snapshot()), render)
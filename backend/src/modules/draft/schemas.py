@@ -0,0 +1,18 @@
+from typing import List
+
+from pydantic import BaseModel, Field
+
+from .service import DEFAULT_PICK_SECONDS
+
+
+class DraftStart(BaseModel):
+    pick_seconds: int = Field(DEFAULT_PICK_SECONDS, ge=10, le=600)
+    randomize_order: bool = True
+
+
+class PickRequest(BaseModel):
+    player_id: int
+
+
+class QueueUpdate(BaseModel):
+    player_ids: List[int] = Field(default_factory=list, max_length=500)
@@ -0,0 +1,326 @@
+"""
+Snake drafts.
+
+`drafts` (one DraftManager per worker) owns the in-memory `DraftState` of
+every running draft and drives all pick clocks from one asyncio task
+(`ClockScheduler`). Picks are serialized per draft with an asyncio lock,
+written to the append-only pick log (together with the roster row) before
+they touch memory, then broadcast on the `league:{id}:draft` channel. On
+startup the running drafts are replayed from the log. Starting (or
+replaying) a draft points the league's autopick ranking at the projections
+of its current week.
+
+Drafts are owned by the worker that runs them: deploy the draft endpoints
+on a single worker (the broadcast already goes through the pub/sub broker).
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from ...config.database import SessionLocal
+from ...core.pubsub import hub
+from ..fantasy_teams.service import projection_ranking, resolve_week_id
+from ..leagues import models as league_models
+from ..leagues.config import invalidate_league_config
+from ..leagues.interning import roster_plan
+from ..players.availability import pool
+from . import repository
+from .clock import ClockScheduler
+from .engine import DraftState, Pick
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PICK_SECONDS = 90
+# Delay before retrying an autopick that could not be written
+AUTOPICK_RETRY_SECONDS = 5.0
+
+
+def channel_for(league_id: int) -> str:
+    return f"league:{league_id}:draft"
+
+
+def _with_session(fn, *args, **kwargs):
+    # Short-lived session per call: the async draft paths must not hold a pooled connection
+    db = SessionLocal()
+    try:
+        result = fn(db, *args, **kwargs)
+        db.commit()
+        return result
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def _use_draft_ranking(db: Session, league: league_models.League) -> None:
+    """Autopick by projected points of the league's current (or next) week; the default ranking without one."""
+    try:
+        week_id = resolve_week_id(db, league_id=league.id)
+    except LookupError:
+        return
+    week = db.get(league_models.Week, week_id)
+    key, _projected = projection_ranking(db, league, week)
+    pool.use_ranking(league.id, key)
+
+
+class DraftManager:
+    def __init__(self, clock: Optional[ClockScheduler] = None) -> None:
+        self.clock = clock or ClockScheduler()
+        self._drafts: Dict[int, DraftState] = {}
+        self._locks: Dict[int, asyncio.Lock] = {}
+        self._tasks: set = set()
+
+    # -- state -------------------------------------------------------------
+
+    def _restore(self, db: Session, league_id: int) -> Optional[DraftState]:
+        """Rebuild a draft from its row and pick log."""
+        draft = repository.get_draft(db, league_id)
+        league = repository.get_league(db, league_id)
+        if draft is None or league is None:
+            return None
+        state = DraftState(
+            league_id,
+            draft.team_order,
+            roster_plan(league.roster_schema or {}),
+            pick_seconds=draft.pick_seconds,
+            owners=dict(repository.list_team_owners(db, league_id)),
+            rounds=draft.rounds,
+        )
+        for row, position in repository.list_picks(db, league_id):
+            state.apply(
+                Pick(row.pick_number, row.round, int(row.fantasy_team_id), int(row.player_id), bool(row.is_auto)),
+                position,
+            )
+        state.queues.update(repository.load_queues(db, state.order))
+        return state
+
+    def _restore_running(self, db: Session) -> List[DraftState]:
+        pool.ensure(db)
+        states = []
+        for draft in repository.list_running_drafts(db):
+            state = self._restore(db, draft.league_id)
+            if state is not None:
+                _use_draft_ranking(db, repository.get_league(db, draft.league_id))
+                states.append(state)
+        return states
+
+    def _install(self, state: DraftState) -> None:
+        self._drafts[state.league_id] = state
+        self._locks.setdefault(state.league_id, asyncio.Lock())
+        if state.complete:
+            return
+        state.start_clock()
+        self._schedule(state)
+        self._broadcast_clock(state)
+
+    async def recover(self) -> int:
+        """Reload every running draft from the pick log and restart its clock (full time)."""
+        self.clock.start()
+        states = await run_in_threadpool(_with_session, self._restore_running)
+        for state in states:
+            self._install(state)
+        return len(states)
+
+    async def get(self, league_id: int) -> DraftState:
+        state = self._drafts.get(league_id)
+        if state is None:
+            # Finished drafts are not kept across restarts; rebuild for reads
+            state = await run_in_threadpool(_with_session, self._restore, league_id)
+            if state is None:
+                raise LookupError("This league has no draft")
+            self._drafts.setdefault(league_id, state)
+            self._locks.setdefault(league_id, asyncio.Lock())
+        return self._drafts[league_id]
+
+    # -- start -------------------------------------------------------------
+
+    def _prepare(self, db: Session, league_id: int, user, pick_seconds: int, randomize_order: bool) -> DraftState:
+        league = repository.get_league(db, league_id)
+        if league is None:
+            raise LookupError("League not found")
+        if getattr(user, "role", None) != "admin" and league.created_by != user.id:
+            raise PermissionError("Only the commissioner can start the draft")
+        if league.status != "pre_draft" or repository.get_draft(db, league_id) is not None:
+            raise ValueError("The draft has already started")
+        owners = repository.list_team_owners(db, league_id)
+        if len(owners) < 2:
+            raise ValueError("At least two teams are needed to draft")
+        order = [team_id for team_id, _user in owners]
+        if randomize_order:
+            random.shuffle(order)
+        state = DraftState(
+            league_id,
+            order,
+            roster_plan(league.roster_schema or {}),
+            pick_seconds=pick_seconds,
+            owners=dict(owners),
+        )
+        repository.create_draft(
+            db, league_id=league_id, team_order=order, rounds=state.rounds, pick_seconds=pick_seconds
+        )
+        state.queues.update(repository.load_queues(db, order))
+        pool.ensure(db, league_id)
+        _use_draft_ranking(db, league)
+        return state
+
+    async def start(
+        self,
+        league_id: int,
+        *,
+        user,
+        pick_seconds: int = DEFAULT_PICK_SECONDS,
+        randomize_order: bool = True,
+    ) -> Dict[str, Any]:
+        try:
+            state = await run_in_threadpool(
+                _with_session, self._prepare, league_id, user, pick_seconds, randomize_order
+            )
+        except IntegrityError:
+            raise ValueError("The draft has already started")
+        invalidate_league_config(league_id)
+        self._install(state)
+        return state.snapshot()
+
+    # -- picks -------------------------------------------------------------
+
+    @staticmethod
+    def _persist(db: Session, pick: Pick, league_id: int, done: bool) -> None:
+        repository.record_pick(
+            db,
+            league_id=league_id,
+            pick_number=pick.pick_number,
+            round=pick.round,
+            fantasy_team_id=pick.fantasy_team_id,
+            player_id=pick.player_id,
+            is_auto=pick.is_auto,
+        )
+        if done:
+            repository.complete_draft(db, league_id)
+
+    async def pick(
+        self,
+        league_id: int,
+        player_id: int,
+        *,
+        user_id: Optional[int] = None,
+        is_auto: bool = False,
+        expected_pick: Optional[int] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Make the pick of the team on the clock. `user_id` must own that team
+        (None for autopicks). With `expected_pick`, a pick that was already made
+        is a no-op (returns None) instead of an error.
+        """
+        state = self._drafts.get(league_id)
+        if state is None:
+            raise LookupError("No draft in progress for this league")
+        async with self._locks[league_id]:
+            if expected_pick is not None and state.next_pick != expected_pick:
+                return None
+            team_id = state.on_clock
+            if team_id is None:
+                raise ValueError("The draft is complete")
+            if user_id is not None and state.owners.get(team_id) != user_id:
+                raise PermissionError("It is not your turn to pick")
+            position = pool.position_of(player_id)
+            if position is None:
+                raise LookupError("Player not found or inactive")
+            state.validate(team_id, player_id, position)
+
+            pick = state.next_pick_for(team_id, player_id, is_auto=is_auto)
+            done = pick.pick_number + 1 >= state.total_picks
+            try:
+                await run_in_threadpool(_with_session, self._persist, pick, league_id, done)
+            except IntegrityError:
+                raise ValueError("Player is already on a roster in this league")
+            state.apply(pick, position)
+            pool.roster_added(league_id, [player_id])
+            if done:
+                invalidate_league_config(league_id)
+                self.clock.cancel(league_id)
+                state.deadline = None
+            else:
+                state.start_clock()
+                self._schedule(state)
+        hub.publish(channel_for(league_id), ("pick", pick.pick_number), {"type": "pick", **pick.to_dict()})
+        self._broadcast_clock(state)
+        return pick.to_dict()
+
+    # -- clocks ------------------------------------------------------------
+
+    def _schedule(self, state: DraftState, delay: Optional[float] = None) -> None:
+        league_id, pick_number = state.league_id, state.next_pick
+        self.clock.schedule(
+            league_id,
+            state.pick_seconds if delay is None else delay,
+            lambda: self._spawn(self._expire(league_id, pick_number)),
+        )
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.get_running_loop().create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _expire(self, league_id: int, pick_number: int) -> None:
+        """Clock ran out: autopick from the team's queue, else the best available player."""
+        state = self._drafts.get(league_id)
+        if state is None or state.next_pick != pick_number or state.complete:
+            return
+        try:
+            player_id = state.choose_auto(
+                state.team_at(pick_number), pool.position_of, pool.iter_available(league_id)
+            )
+        except LookupError:
+            logger.warning("No eligible player to autopick for league %d pick %d", league_id, pick_number)
+            return
+        try:
+            await self.pick(league_id, player_id, is_auto=True, expected_pick=pick_number)
+        except Exception:
+            logger.exception("Autopick failed for league %d pick %d", league_id, pick_number)
+            if state.next_pick == pick_number:
+                self._schedule(state, AUTOPICK_RETRY_SECONDS)
+
+    def _broadcast_clock(self, state: DraftState) -> None:
+        hub.publish(
+            channel_for(state.league_id),
+            "clock",
+            {
+                "type": "clock",
+                "status": "complete" if state.complete else "running",
+                "next_pick": state.next_pick,
+                "on_clock": state.on_clock,
+                "deadline": state.deadline,
+            },
+        )
+
+    # -- queues ------------------------------------------------------------
+
+    def _save_queue(self, db: Session, league_id: int, user_id: int, player_ids: Sequence[int]) -> int:
+        team_id = repository.get_user_team_id(db, league_id, user_id)
+        if team_id is None:
+            raise LookupError("You have no team in this league")
+        repository.replace_queue(db, team_id, player_ids)
+        return int(team_id)
+
+    async def set_queue(self, league_id: int, *, user_id: int, player_ids: Sequence[int]) -> Dict[str, Any]:
+        """Replace the manager's ranked autopick queue (duplicates keep their first rank)."""
+        ranked = list(dict.fromkeys(int(p) for p in player_ids))
+        try:
+            team_id = await run_in_threadpool(_with_session, self._save_queue, league_id, user_id, ranked)
+        except IntegrityError:
+            raise LookupError("Unknown player in queue")
+        state = self._drafts.get(league_id)
+        if state is not None:
+            state.queues[team_id] = ranked
+        return {"fantasy_team_id": team_id, "player_ids": ranked}
+
+
+drafts = DraftManager()
@@ -0,0 +1,236 @@
+"""
+Optimal lineups for a league's `roster_schema`.
+
+Slots are either dedicated (`QB`, `RB`, ... one position) or FLEX
+(`FLEX_RB_WR`: any of the listed positions); `BENCH` and `IR` do not start.
+
+The solver is exact:
+1. Dedicated slots take the top-k projected players of their position. This is
+   always part of some optimal lineup: swapping a higher projected player of the
+   same position into a started seat never lowers the total, and players of one
+   position are interchangeable between a dedicated seat and a FLEX seat.
+2. The remaining FLEX seats are a bipartite assignment between leftover players
+   and seats (weight = projection when eligible). With a single FLEX kind it is
+   again a top-k per team; several overlapping FLEX kinds are solved with the
+   Hungarian algorithm.
+
+Every team of a league is solved in one call: the per-position ranking is one
+lexsort over all rostered players of the league.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+BENCH = "BENCH"
+IR = "IR"
+
+# Player positions stored under another name in roster_schema
+POSITION_ALIASES = {"DST": "DEF"}
+
+# Forbidden assignment in the Hungarian cost matrix
+_BIG = 1e9
+# Bonus for filling a FLEX seat, so a seat is never left empty when someone eligible is available
+_FILL = 1e6
+
+
+@dataclass(frozen=True)
+class SlotPlan:
+    """A roster_schema split into dedicated seats per position and FLEX seats."""
+    dedicated: Tuple[Tuple[str, int], ...]                 # (position, seats)
+    flex: Tuple[Tuple[str, FrozenSet[str]], ...]           # one entry per FLEX seat
+    bench: int
+
+    @property
+    def starters(self) -> int:
+        return sum(n for _p, n in self.dedicated) + len(self.flex)
+
+
+def normalize_position(position: str) -> str:
+    position = (position or "").strip().upper()
+    return POSITION_ALIASES.get(position, position)
+
+
+def compile_roster(roster_schema: Mapping[str, int]) -> SlotPlan:
+    dedicated: List[Tuple[str, int]] = []
+    flex: List[Tuple[str, FrozenSet[str]]] = []
+    bench = 0
+    for slot, count in roster_schema.items():
+        count = int(count or 0)
+        key = slot.strip().upper()
+        if count <= 0 or key == IR:
+            continue
+        if key == BENCH:
+            bench = count
+        elif key.startswith("FLEX_"):
+            eligible = frozenset(normalize_position(p) for p in key[len("FLEX_"):].split("_") if p)
+            flex.extend([(slot, eligible)] * count)
+        else:
+            dedicated.append((normalize_position(key), count))
+    return SlotPlan(dedicated=tuple(dedicated), flex=tuple(flex), bench=bench)
+
+
+def position_seats(plan: SlotPlan) -> Tuple[Dict[str, int], Dict[str, int]]:
+    """Dedicated seats per position, and FLEX seats each position is eligible for."""
+    dedicated: Dict[str, int] = {}
+    flex: Dict[str, int] = {}
+    for position, seats in plan.dedicated:
+        dedicated[position] = dedicated.get(position, 0) + seats
+    for _slot, eligible in plan.flex:
+        for position in eligible:
+            flex[position] = flex.get(position, 0) + 1
+    return dedicated, flex
+
+
+def roster_violation(plan: SlotPlan, positions: Iterable[str]) -> Optional[str]:
+    """Why a roster (positions of its players not on IR) does not fit the plan, or None."""
+    counts: Dict[str, int] = {}
+    for position in positions:
+        position = normalize_position(position)
+        counts[position] = counts.get(position, 0) + 1
+    if sum(counts.values()) > plan.starters + plan.bench:
+        return "Roster is full"
+    dedicated, flex = position_seats(plan)
+    for position, n in counts.items():
+        cap = dedicated.get(position, 0) + flex.get(position, 0)
+        if cap == 0:
+            return f"Position {position} has no slot in this league's roster"
+        if n > cap + plan.bench:
+            return f"Roster limit reached for {position}"
+    return None
+
+
+def hungarian(cost: np.ndarray) -> np.ndarray:
+    """
+    Minimum-cost assignment for an (n_rows <= n_cols) cost matrix.
+    Returns `col[i]` assigned to each row i (O(n_rows^2 * n_cols)).
+    """
+    n, m = cost.shape
+    u = np.zeros(n + 1)
+    v = np.zeros(m + 1)
+    p = np.zeros(m + 1, dtype=np.int64)   # p[j]: row (1-based) matched to column j
+    way = np.zeros(m + 1, dtype=np.int64)
+    for i in range(1, n + 1):
+        p[0] = i
+        j0 = 0
+        minv = np.full(m + 1, np.inf)
+        used = np.zeros(m + 1, dtype=bool)
+        while True:
+            used[j0] = True
+            i0 = p[j0]
+            free = ~used[1:]
+            cur = cost[i0 - 1] - u[i0] - v[1:]
+            better = free & (cur < minv[1:])
+            minv[1:][better] = cur[better]
+            way[1:][better] = j0
+            candidates = np.where(free, minv[1:], np.inf)
+            j1 = int(np.argmin(candidates)) + 1
+            delta = candidates[j1 - 1]
+            u[p[used]] += delta
+            v[used] -= delta
+            minv[1:][free] -= delta
+            j0 = j1
+            if p[j0] == 0:
+                break
+        while j0:
+            j1 = way[j0]
+            p[j0] = p[j1]
+            j0 = j1
+    col = np.zeros(n, dtype=np.int64)
+    for j in range(1, m + 1):
+        if p[j]:
+            col[p[j] - 1] = j - 1
+    return col
+
+
+def _rank_within(groups: np.ndarray, order: np.ndarray) -> np.ndarray:
+    """Rank (0-based) of each element inside its group, for elements already sorted by `order`."""
+    ranks = np.empty(len(order), dtype=np.int64)
+    if len(order) == 0:
+        return ranks
+    g = groups[order]
+    starts = np.r_[0, np.flatnonzero(g[1:] != g[:-1]) + 1]
+    run = np.arange(len(order)) - np.repeat(starts, np.diff(np.r_[starts, len(order)]))
+    ranks[order] = run
+    return ranks
+
+
+def solve_league(
+    plan: SlotPlan,
+    team_ids: Sequence[int],
+    player_ids: Sequence[int],
+    positions: Sequence[str],
+    points: Sequence[float],
+    on_ir: Sequence[bool],
+) -> Dict[int, Dict[str, List[int]]]:
+    """
+    Best lineup for every team of a league.
+
+    Inputs are parallel arrays with one entry per rostered player. Players on IR
+    stay on IR. Returns {team_id: {slot: [player_id, ...]}} including BENCH and IR;
+    seats nobody can fill are left out.
+    """
+    teams = np.asarray(team_ids, dtype=np.int64)
+    pids = np.asarray(player_ids, dtype=np.int64)
+    pts = np.nan_to_num(np.asarray(points, dtype=np.float64), nan=0.0)
+    ir = np.asarray(on_ir, dtype=bool)
+    pos = np.array([normalize_position(p) for p in positions], dtype=object)
+
+    lineups: Dict[int, Dict[str, List[int]]] = {int(t): {} for t in np.unique(teams)}
+    for t, pid in zip(teams[ir], pids[ir]):
+        lineups[int(t)].setdefault(IR, []).append(int(pid))
+
+    active = np.flatnonzero(~ir)
+    started = np.zeros(len(pids), dtype=bool)
+
+    # 1) dedicated seats: top-k per (team, position) in one lexsort
+    seats = dict(plan.dedicated)
+    if len(active):
+        pos_codes = {p: i for i, p in enumerate(sorted(set(pos[active])))}
+        code = np.array([pos_codes[p] for p in pos[active]], dtype=np.int64)
+        group = teams[active] * (len(pos_codes) + 1) + code
+        order = np.lexsort((pids[active], -pts[active], group))
+        rank = _rank_within(group, order)
+        need = np.array([seats.get(p, 0) for p in pos[active]], dtype=np.int64)
+        chosen = active[rank < need]
+        started[chosen] = True
+        slot_order = np.lexsort((pids[chosen], -pts[chosen]))
+        for i in chosen[slot_order]:
+            lineups[int(teams[i])].setdefault(str(pos[i]), []).append(int(pids[i]))
+
+    # 2) FLEX seats over the leftovers
+    if plan.flex:
+        left = np.flatnonzero(~ir & ~started)
+        kinds = {eligible for _slot, eligible in plan.flex}
+        if len(kinds) == 1:
+            slot, eligible = plan.flex[0]
+            cand = left[np.isin(pos[left], list(eligible))]
+            order = np.lexsort((pids[cand], -pts[cand], teams[cand]))
+            rank = _rank_within(teams[cand], order)
+            chosen = cand[rank < len(plan.flex)]
+            started[chosen] = True
+            for i in chosen[np.lexsort((pids[chosen], -pts[chosen]))]:
+                lineups[int(teams[i])].setdefault(slot, []).append(int(pids[i]))
+        else:
+            for team in np.unique(teams[left]):
+                cand = left[(teams[left] == team) & np.isin(pos[left], list(set().union(*kinds)))]
+                if not len(cand):
+                    continue
+                # rows = seats, cols = candidates plus one "empty" column per seat
+                n_seats = len(plan.flex)
+                cost = np.full((n_seats, len(cand) + n_seats), 0.0)
+                for r, (_slot, eligible) in enumerate(plan.flex):
+                    ok = np.isin(pos[cand], list(eligible))
+                    cost[r, : len(cand)] = np.where(ok, -pts[cand] - _FILL, _BIG)
+                assignment = hungarian(cost)
+                for r, c in enumerate(assignment):
+                    if c < len(cand) and cost[r, c] < _BIG:
+                        i = cand[c]
+                        started[i] = True
+                        lineups[int(team)].setdefault(plan.flex[r][0], []).append(int(pids[i]))
+
+    for i in np.flatnonzero(~ir & ~started):
+        lineups[int(teams[i])].setdefault(BENCH, []).append(int(pids[i]))
+    return lineups
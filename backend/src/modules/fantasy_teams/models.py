@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, BigInteger, String, Boolean, DateTime, func, ForeignKey
+from sqlalchemy import Column, Integer, BigInteger, String, Boolean, DateTime, DDL, event, func, ForeignKey, Index, UniqueConstraint
+from sqlalchemy.sql import text
 from ...config.database import Base
 
 class FantasyTeam(Base):
@@ -8,7 +9,90 @@ class FantasyTeam(Base):
     name = Column(String(128), nullable=False)
     image_url = Column(String(512), nullable=True)
     thumbnail_url = Column(String(512), nullable=True)
+    # pending|ready|failed (NULL without image); pending rows are rendered by `thumbnails`
+    thumbnail_status = Column(String(10), nullable=True)
+    thumbnail_attempts = Column(Integer, nullable=False, server_default=text("0"))
+    # When a pending thumbnail is next due (retry backoff / worker lease)
+    thumbnail_next_at = Column(DateTime(timezone=True), nullable=True)
     is_active = Column(Boolean, nullable=False, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     user_id = Column(Integer, ForeignKey("users.id", ondelete="RESTRICT"), nullable=False)
     league_id = Column(Integer, ForeignKey("leagues.id", ondelete="CASCADE"), nullable=False)
+    # Position in the league's rolling waiver order (1 = first); NULL until the first run
+    waiver_priority = Column(Integer, nullable=True)
+
+
+# Team names are unique within a league, case-insensitively
+Index("ux_fantasy_teams_league_name", FantasyTeam.league_id, func.lower(FantasyTeam.name), unique=True)
+Index(
+    "ix_fantasy_teams_thumbnail_pending",
+    FantasyTeam.thumbnail_next_at,
+    postgresql_where=text("thumbnail_status = 'pending'"),
+)
+
+
+# Slots that do not score
+NON_SCORING_SLOTS = ("BENCH", "IR")
+
+
+class FantasyTeamPlayer(Base):
+    """A player on a fantasy team's roster. `slot` is a roster_schema key (QB, FLEX_RB_WR, BENCH, IR, ...)."""
+    __tablename__ = "fantasy_team_players"
+
+    id = Column(BigInteger, primary_key=True, index=True)
+    league_id = Column(Integer, ForeignKey("leagues.id", ondelete="CASCADE"), nullable=False)
+    fantasy_team_id = Column(BigInteger, ForeignKey("fantasy_teams.id", ondelete="CASCADE"), nullable=False)
+    player_id = Column(BigInteger, ForeignKey("players.id", ondelete="CASCADE"), nullable=False)
+    slot = Column(String(20), nullable=False, default="BENCH")
+    acquired_via = Column(String(20), nullable=False, default="draft")  # draft|waiver|trade|free_agent
+    acquired_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        # A player can be on only one roster per league
+        UniqueConstraint("league_id", "player_id", name="ux_fantasy_team_players_league_player"),
+    )
+
+
+# leagues.roster_version follows every roster membership change (see players.availability)
+event.listen(FantasyTeamPlayer.__table__, "after_create", DDL("""
+CREATE OR REPLACE FUNCTION bump_league_roster_version() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE leagues SET roster_version = roster_version + 1 WHERE id IN (SELECT DISTINCT league_id FROM new_rows);
+    ELSE
+        UPDATE leagues SET roster_version = roster_version + 1 WHERE id IN (SELECT DISTINCT league_id FROM old_rows);
+    END IF;
+    RETURN NULL;
+END $$ LANGUAGE plpgsql;
+CREATE TRIGGER trg_fantasy_team_players_inserted
+    AFTER INSERT ON fantasy_team_players REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_league_roster_version();
+CREATE TRIGGER trg_fantasy_team_players_deleted
+    AFTER DELETE ON fantasy_team_players REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_league_roster_version();
+CREATE TRIGGER trg_fantasy_team_players_moved
+    AFTER UPDATE OF league_id, player_id ON fantasy_team_players REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_league_roster_version();
+"""))
+
+Index("ix_fantasy_team_players_team", FantasyTeamPlayer.fantasy_team_id)
+Index("ix_fantasy_team_players_player", FantasyTeamPlayer.player_id)
+
+
+
+class FantasyTeamWeekLineup(Base):
+    """
+    A team's roster and slots frozen for one week. Written once, when the week
+    is first scored (see repository.lock_week_lineups); weekly totals are
+    always computed from these rows, never from the current slots.
+    """
+    __tablename__ = "fantasy_team_week_lineups"
+
+    week_id = Column(Integer, ForeignKey("weeks.id", ondelete="CASCADE"), primary_key=True)
+    fantasy_team_id = Column(BigInteger, ForeignKey("fantasy_teams.id", ondelete="CASCADE"), primary_key=True)
+    player_id = Column(BigInteger, ForeignKey("players.id", ondelete="CASCADE"), primary_key=True)
+    league_id = Column(Integer, ForeignKey("leagues.id", ondelete="CASCADE"), nullable=False)
+    slot = Column(String(20), nullable=False)
+
+# Week inverted index for live scoring: (week, player) -> rosters starting them
+Index("ix_fantasy_team_week_lineups_week_player", FantasyTeamWeekLineup.week_id, FantasyTeamWeekLineup.player_id)
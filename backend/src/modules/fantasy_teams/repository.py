@@ -1,6 +1,8 @@
-from typing import Optional, List
+from typing import Optional, List, Dict, Any, Iterable
 from sqlalchemy.orm import Session
-from sqlalchemy import select, func
+from sqlalchemy import select, func, text, update, bindparam
+from ...core.bulk import bulk_insert
+from ..players import models as player_models
 from . import models
 
 
@@ -17,6 +19,16 @@ def get_by_name_in_league_ci(db: Session, *, league_id: int, name: str) -> Optio
     ).scalar_one_or_none()
 
 
+def get_user_team_in_league(db: Session, *, league_id: int, user_id: int) -> Optional[models.FantasyTeam]:
+    return db.execute(
+        select(models.FantasyTeam).where(
+            models.FantasyTeam.league_id == league_id,
+            models.FantasyTeam.user_id == user_id,
+            models.FantasyTeam.is_active.is_(True),
+        )
+    ).scalar_one_or_none()
+
+
 def list_by_league(db: Session, league_id: int) -> List[models.FantasyTeam]:
     stmt = (
         select(models.FantasyTeam)
@@ -34,16 +46,125 @@ def create_fantasy_team(
     thumbnail_url: Optional[str],
     user_id: int,
     league_id: int,
+    thumbnail_status: Optional[str] = None,
 ) -> models.FantasyTeam:
+    """No commit: the team is created in the caller's transaction (league creation)."""
     team = models.FantasyTeam(
         name=name,
         image_url=image_url,
         thumbnail_url=thumbnail_url,
+        thumbnail_status=thumbnail_status,
         is_active=True,
         user_id=user_id,
         league_id=league_id,
     )
     db.add(team)
-    db.commit()
-    db.refresh(team)
+    db.flush()
     return team
+
+
+def bulk_create_fantasy_teams(db: Session, rows: List[Dict[str, Any]], *, skip_existing: bool = False) -> List[int]:
+    """Insert many fantasy teams in one set-based statement (COPY on PostgreSQL). Returns new ids; no commit."""
+    rows = [{"is_active": True, **r, "name": r["name"].strip()} for r in rows]
+    written = bulk_insert(
+        db,
+        models.FantasyTeam.__table__,
+        rows,
+        on_conflict="nothing" if skip_existing else "error",
+    )
+    return [r[0] for r in written]
+
+
+def list_roster(db: Session, fantasy_team_id: int) -> List[models.FantasyTeamPlayer]:
+    return db.execute(
+        select(models.FantasyTeamPlayer)
+        .where(models.FantasyTeamPlayer.fantasy_team_id == fantasy_team_id)
+        .order_by(models.FantasyTeamPlayer.id)
+    ).scalars().all()
+
+
+_LOCK_WEEK_LINEUPS = text("""
+    INSERT INTO fantasy_team_week_lineups (week_id, fantasy_team_id, player_id, league_id, slot)
+    SELECT w.id, ftp.fantasy_team_id, ftp.player_id, ftp.league_id, ftp.slot
+    FROM weeks w
+    JOIN leagues l ON l.season_id = w.season_id
+    JOIN fantasy_team_players ftp ON ftp.league_id = l.id
+    WHERE w.id = :week_id
+      AND NOT EXISTS (
+          SELECT 1 FROM fantasy_team_week_lineups x
+          WHERE x.week_id = w.id AND x.fantasy_team_id = ftp.fantasy_team_id
+      )
+    ON CONFLICT DO NOTHING
+""")
+
+
+def lock_week_lineups(db: Session, week_id: int) -> int:
+    """
+    Freeze the current roster and slots of every team of the week's season
+    that has no lineup for the week yet; frozen teams are left untouched.
+    Returns the rows written. No commit.
+    """
+    return db.execute(_LOCK_WEEK_LINEUPS, {"week_id": week_id}).rowcount
+
+
+def week_lineups_locked(db: Session, week_id: int, fantasy_team_ids: Iterable[int]) -> bool:
+    """True if any of the teams already has a frozen lineup for the week."""
+    WL = models.FantasyTeamWeekLineup
+    return db.execute(
+        select(WL.fantasy_team_id)
+        .where(WL.week_id == week_id, WL.fantasy_team_id.in_(list(fantasy_team_ids)))
+        .limit(1)
+    ).first() is not None
+
+
+def list_week_starter_entries(
+    db: Session,
+    week_id: int,
+    *,
+    player_ids: Optional[Iterable[int]] = None,
+    fantasy_team_ids: Optional[Iterable[int]] = None,
+) -> List[tuple]:
+    """(player_id, league_id, fantasy_team_id) for every player in a scoring slot of the week's frozen lineups."""
+    WL = models.FantasyTeamWeekLineup
+    stmt = select(WL.player_id, WL.league_id, WL.fantasy_team_id).where(
+        WL.week_id == week_id, WL.slot.not_in(models.NON_SCORING_SLOTS)
+    )
+    if player_ids is not None:
+        stmt = stmt.where(WL.player_id.in_(list(player_ids)))
+    if fantasy_team_ids is not None:
+        stmt = stmt.where(WL.fantasy_team_id.in_(list(fantasy_team_ids)))
+    return [tuple(r) for r in db.execute(stmt).all()]
+
+
+def list_league_roster(db: Session, league_id: int, fantasy_team_ids: Optional[Iterable[int]] = None) -> List[tuple]:
+    """(fantasy_team_id, player_id, position, slot) for a league's rosters, one query."""
+    stmt = (
+        select(
+            models.FantasyTeamPlayer.fantasy_team_id,
+            models.FantasyTeamPlayer.player_id,
+            player_models.Player.position,
+            models.FantasyTeamPlayer.slot,
+        )
+        .join(player_models.Player, player_models.Player.id == models.FantasyTeamPlayer.player_id)
+        .where(models.FantasyTeamPlayer.league_id == league_id)
+        .order_by(models.FantasyTeamPlayer.fantasy_team_id, models.FantasyTeamPlayer.player_id)
+    )
+    if fantasy_team_ids is not None:
+        stmt = stmt.where(models.FantasyTeamPlayer.fantasy_team_id.in_(list(fantasy_team_ids)))
+    return [tuple(r) for r in db.execute(stmt).all()]
+
+
+def set_slots(db: Session, assignments: List[Dict[str, Any]]) -> None:
+    """Bulk update roster slots from dicts with fantasy_team_id, player_id and slot. No commit."""
+    if not assignments:
+        return
+    table = models.FantasyTeamPlayer.__table__
+    db.execute(
+        update(table)
+        .where(
+            table.c.fantasy_team_id == bindparam("b_team"),
+            table.c.player_id == bindparam("b_player"),
+        )
+        .values(slot=bindparam("b_slot")),
+        [{"b_team": a["fantasy_team_id"], "b_player": a["player_id"], "b_slot": a["slot"]} for a in assignments],
+    )
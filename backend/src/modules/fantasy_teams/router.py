@@ -0,0 +1,89 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import status
+from sqlalchemy.orm import Session
+
+from ...config.database import get_db
+from ..leagues import models as league_models
+from ..users.router import get_current_user
+from . import repository, service
+
+router = APIRouter(tags=["fantasy_teams"])
+
+
+@router.get("/fantasy-teams/{fantasy_team_id}/lineup/best")
+def get_best_lineup(
+    fantasy_team_id: int,
+    week_id: int = Query(...),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    """Propuesta de alineación óptima (no la guarda)."""
+    team = repository.get_by_id(db, fantasy_team_id)
+    if team is None:
+        raise HTTPException(status_code=404, detail="Fantasy team not found")
+    try:
+        result = service.best_lineups(db, league_id=team.league_id, week_id=week_id, fantasy_team_ids=[team.id])
+    except LookupError as le:
+        raise HTTPException(status_code=404, detail=str(le))
+    return {"fantasy_team_id": team.id, "week_id": week_id, "lineup": result.get(team.id, {})}
+
+
+@router.post("/fantasy-teams/{fantasy_team_id}/lineup/best")
+def set_best_lineup(
+    fantasy_team_id: int,
+    week_id: int = Query(...),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    """Aplica la alineación óptima al equipo del usuario."""
+    try:
+        result = service.set_best_lineup(db, fantasy_team_id=fantasy_team_id, week_id=week_id, user_id=current_user.id)
+    except LookupError as le:
+        raise HTTPException(status_code=404, detail=str(le))
+    except PermissionError as pe:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(pe))
+    except ValueError as ve:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(ve))
+    return {"fantasy_team_id": fantasy_team_id, "week_id": week_id, "lineup": result}
+
+
+@router.post("/leagues/{league_id}/lineups/auto-start")
+def auto_start_lineups(
+    league_id: int,
+    week_id: int = Query(...),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    """Alinea automáticamente a los equipos con managers inactivos (admin o comisionado)."""
+    league = db.get(league_models.League, league_id)
+    if league is None:
+        raise HTTPException(status_code=404, detail="League not found")
+    if getattr(current_user, "role", None) != "admin" and league.created_by != current_user.id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin or commissioner required")
+    try:
+        team_ids = service.auto_start_inactive(db, league_id=league_id, week_id=week_id)
+    except LookupError as le:
+        raise HTTPException(status_code=404, detail=str(le))
+    except ValueError as ve:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(ve))
+    return {"league_id": league_id, "week_id": week_id, "updated_teams": team_ids}
+
+
+@router.get("/leagues/{league_id}/players/available")
+def get_available_players(
+    league_id: int,
+    week_id: Optional[int] = Query(None, description="Semana actual de la temporada si se omite"),
+    position: Optional[str] = Query(None),
+    limit: int = Query(25, ge=1, le=200),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    """Mejores jugadores libres de la liga por proyección (opcionalmente por posición)."""
+    try:
+        week_id = service.resolve_week_id(db, league_id=league_id, week_id=week_id)
+        players = service.available_players(db, league_id=league_id, week_id=week_id, position=position, limit=limit)
+    except LookupError as le:
+        raise HTTPException(status_code=404, detail=str(le))
+    return {"league_id": league_id, "week_id": week_id, "position": position, "players": players}
@@ -0,0 +1,171 @@
+"""
+Lineup management for fantasy teams: best lineup per team and auto-start for
+inactive managers, both built on fantasy_teams.lineup.solve_league, and the
+league's best available players read from players.availability. Lineups can
+only be changed for weeks that have not started; scoring reads each week's
+frozen lineup.
+"""
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ..leagues import models as league_models
+from ..leagues.config import get_league_config
+from ..leagues.interning import roster_plan
+from ..leagues.services.season_calendar import calendars
+from ..players.availability import pool
+from ..projections.service import projections
+from ..users import models as user_models
+from . import lineup, models, repository
+
+# Managers without activity for this long get their lineup set automatically
+INACTIVE_AFTER = timedelta(days=7)
+
+Lineup = Dict[str, List[int]]
+
+
+def project_points(db: Session, league: league_models.League, week: league_models.Week, player_ids: Iterable[int]) -> Dict[int, float]:
+    """Projected points per player for `week` under the league's scoring (see projections.service)."""
+    return projections.project_points(db, league, week, player_ids)
+
+
+def projection_ranking(
+    db: Session, league: league_models.League, week: league_models.Week
+) -> Tuple[Hashable, Dict[int, float]]:
+    """
+    (pool ranking key, projected points) of `week` under the league's scoring,
+    registering the ranking in the availability pool if needed. Leagues with
+    the same scoring share the ranking. Does not change the league's default.
+    """
+    scoring, projected = projections.points(db, week, league.scoring_schema, bool(league.allow_decimal_scoring))
+    key = ("projection", week.id, scoring)
+    if not pool.has_ranking(key):
+        pool.set_ranking(key, projected)
+    return key, projected
+
+
+def resolve_week_id(db: Session, *, league_id: int, week_id: Optional[int] = None) -> int:
+    """`week_id`, or the league's current week (the next one between weeks) from the season calendar."""
+    if week_id is not None:
+        return week_id
+    config = get_league_config(db, league_id)
+    if config.season_id is None:
+        raise LookupError("League has no season")
+    calendar = calendars.get(db, config.season_id)
+    today = date.today()
+    week = calendar.week_at(today) or calendar.next_week(today)
+    if week is None:
+        raise LookupError("The league's season has no current or upcoming week")
+    return week.week_id
+
+
+def _load(db: Session, league_id: int, week_id: int):
+    league = db.get(league_models.League, league_id)
+    if league is None:
+        raise LookupError("League not found")
+    week = db.get(league_models.Week, week_id)
+    if week is None or week.season_id != league.season_id:
+        raise LookupError("Week not found for this league's season")
+    return league, week
+
+
+def best_lineups(
+    db: Session,
+    *,
+    league_id: int,
+    week_id: int,
+    fantasy_team_ids: Optional[Iterable[int]] = None,
+) -> Dict[int, Lineup]:
+    """Optimal lineup of every team in the league (or of the given teams), solved in one batch."""
+    league, week = _load(db, league_id, week_id)
+    rows = repository.list_league_roster(db, league_id, fantasy_team_ids)
+    if not rows:
+        return {}
+    team_ids, player_ids, positions, slots = zip(*rows)
+    projected = project_points(db, league, week, player_ids)
+    plan = roster_plan(league.roster_schema or {})
+    return lineup.solve_league(
+        plan,
+        team_ids,
+        player_ids,
+        positions,
+        [projected[pid] for pid in player_ids],
+        [slot == lineup.IR for slot in slots],
+    )
+
+
+def apply_lineups(db: Session, *, week_id: int, lineups: Dict[int, Lineup]) -> None:
+    """
+    Persist lineups for `week_id`. Commits. A week's lineup is locked once the
+    week has started or been scored (its lineups are frozen then, see
+    repository.lock_week_lineups): changing it would rewrite that week's
+    totals with other starters, so it raises ValueError.
+    """
+    week = db.get(league_models.Week, week_id)
+    if week is None:
+        raise LookupError("Week not found")
+    if week.start_date <= date.today() or repository.week_lineups_locked(db, week_id, lineups.keys()):
+        raise ValueError(f"Lineups for week {week.week_number} are locked")
+    assignments = [
+        {"fantasy_team_id": team_id, "player_id": pid, "slot": slot}
+        for team_id, slots in lineups.items()
+        for slot, pids in slots.items()
+        for pid in pids
+    ]
+    try:
+        repository.set_slots(db, assignments)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+
+def set_best_lineup(db: Session, *, fantasy_team_id: int, week_id: int, user_id: int) -> Lineup:
+    team = repository.get_by_id(db, fantasy_team_id)
+    if team is None:
+        raise LookupError("Fantasy team not found")
+    if team.user_id != user_id:
+        raise PermissionError("Only the team owner can change its lineup")
+    result = best_lineups(db, league_id=team.league_id, week_id=week_id, fantasy_team_ids=[team.id])
+    apply_lineups(db, week_id=week_id, lineups=result)
+    return result.get(team.id, {})
+
+
+def auto_start_inactive(db: Session, *, league_id: int, week_id: int) -> List[int]:
+    """Set the best lineup for every team whose manager has been inactive. Returns the team ids."""
+    cutoff = datetime.now(timezone.utc) - INACTIVE_AFTER
+    team_ids = db.execute(
+        select(models.FantasyTeam.id)
+        .join(user_models.User, user_models.User.id == models.FantasyTeam.user_id)
+        .where(
+            models.FantasyTeam.league_id == league_id,
+            models.FantasyTeam.is_active.is_(True),
+            (user_models.User.last_activity.is_(None)) | (user_models.User.last_activity < cutoff),
+        )
+    ).scalars().all()
+    if not team_ids:
+        return []
+    result = best_lineups(db, league_id=league_id, week_id=week_id, fantasy_team_ids=team_ids)
+    apply_lineups(db, week_id=week_id, lineups=result)
+    return sorted(result)
+
+
+def available_players(
+    db: Session,
+    *,
+    league_id: int,
+    week_id: int,
+    position: Optional[str] = None,
+    limit: int = 25,
+) -> List[Dict[str, object]]:
+    """Best players not rostered in the league, ranked by projected points for `week`."""
+    league, week = _load(db, league_id, week_id)
+    pool.ensure(db, league.id)
+    key, projected = projection_ranking(db, league, week)
+    ids = pool.top_available(league.id, position, limit, ranking=key)
+    return [
+        {"player_id": pid, "position": pool.position_of(pid), "projected_points": projected.get(pid, 0.0)}
+        for pid in ids
+    ]
@@ -0,0 +1,121 @@
+"""
+Background thumbnails for fantasy team images.
+
+League creation and joins store the team with `thumbnail_status='pending'`
+and commit right away; after the commit they hand the team id to a small
+worker pool. A worker claims the row (pushing `thumbnail_next_at` forward as
+a lease, so two workers never fetch the same image), downloads the image and
+renders the thumbnail outside any transaction, then writes
+`thumbnail_url` with status 'ready'. A failed fetch is retried after
+RETRY_DELAYS (the pending rows with their `thumbnail_next_at` are the retry
+queue, so retries survive a restart) and the team ends as 'failed' after the
+last one. Images already under /media/ (the upload route renders their
+thumbnail) never go through the queue.
+"""
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+
+from sqlalchemy import func, or_, select, update
+
+from ...config.database import SessionLocal
+from ...core.media import try_download_and_thumb
+from ..leagues import repository as league_repository
+from . import models
+
+THUMB_WORKERS = 2
+# Seconds before each retry; the attempt after the last delay is final
+RETRY_DELAYS = (30, 120, 600, 3600)
+# A claimed row is not picked again before this, even if its worker died
+LEASE = timedelta(minutes=2)
+
+FT = models.FantasyTeam
+
+_executor = ThreadPoolExecutor(max_workers=THUMB_WORKERS, thread_name_prefix="team-thumbs")
+
+
+def initial_thumbnail(image_url: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    """(thumbnail_url, thumbnail_status) to store with a new team, without any I/O."""
+    if not image_url:
+        return None, None
+    if image_url.startswith("/media/"):
+        base, _dot, _ext = image_url.rpartition(".")
+        return f"{base}_thumb.png", "ready"
+    return None, "pending"
+
+
+def submit(fantasy_team_id: int, delay: float = 0) -> None:
+    """Queue a team's thumbnail; call after the team row is committed."""
+    if delay > 0:
+        # One second of slack so the row is due by the database clock too
+        timer = threading.Timer(delay + 1, submit, args=(fantasy_team_id,))
+        timer.daemon = True
+        timer.start()
+        return
+    _executor.submit(_run, fantasy_team_id)
+
+
+def resume_pending() -> List[int]:
+    """Queue every pending thumbnail, each at its scheduled retry time. Called on startup."""
+    db = SessionLocal()
+    try:
+        rows = db.execute(
+            select(FT.id, FT.thumbnail_next_at).where(FT.thumbnail_status == "pending").order_by(FT.id)
+        ).all()
+    finally:
+        db.close()
+    now = datetime.now(timezone.utc)
+    for team_id, next_at in rows:
+        submit(team_id, delay=max((next_at - now).total_seconds(), 0) if next_at else 0)
+    return [team_id for team_id, _next_at in rows]
+
+
+def _claim(db, fantasy_team_id: int) -> Optional[Tuple[str, int]]:
+    """Take the lease on a due pending row. Returns (image_url, attempt number)."""
+    row = db.execute(
+        update(FT)
+        .where(
+            FT.id == fantasy_team_id,
+            FT.thumbnail_status == "pending",
+            or_(FT.thumbnail_next_at.is_(None), FT.thumbnail_next_at <= func.now()),
+        )
+        .values(thumbnail_attempts=FT.thumbnail_attempts + 1, thumbnail_next_at=func.now() + LEASE)
+        .returning(FT.image_url, FT.thumbnail_attempts)
+    ).one_or_none()
+    db.commit()
+    return (row.image_url, int(row.thumbnail_attempts)) if row is not None else None
+
+
+def _run(fantasy_team_id: int) -> None:
+    db = SessionLocal()
+    try:
+        claimed = _claim(db, fantasy_team_id)
+        if claimed is None:
+            return
+        image_url, attempt = claimed
+        thumb_url = try_download_and_thumb(image_url, subdir="fantasy_teams") if image_url else None
+
+        # Only if the image was not changed meanwhile
+        owned = (FT.id == fantasy_team_id) & (FT.thumbnail_status == "pending") & (FT.image_url == image_url)
+        if thumb_url is not None or attempt > len(RETRY_DELAYS):
+            values = {"thumbnail_url": thumb_url, "thumbnail_status": "ready"} if thumb_url else {"thumbnail_status": "failed"}
+            league_id = db.execute(
+                update(FT).where(owned).values(thumbnail_next_at=None, **values).returning(FT.league_id)
+            ).scalar_one_or_none()
+            if league_id is not None:
+                league_repository.bump_version(db, [league_id])
+            db.commit()
+            return
+        delay = RETRY_DELAYS[attempt - 1]
+        db.execute(update(FT).where(owned).values(thumbnail_next_at=func.now() + timedelta(seconds=delay)))
+        db.commit()
+        submit(fantasy_team_id, delay=delay)
+    except Exception:
+        # Try again once the lease has expired
+        db.rollback()
+        submit(fantasy_team_id, delay=LEASE.total_seconds())
+    finally:
+        db.close()
@@ -0,0 +1,88 @@
+"""
+Cached, read-only view of a league's settings.
+
+Trades, waivers and lineups check the same handful of league settings on
+every request (status, trade deadline and limits, roster plan, scoring).
+`get_league_config` serves them from a per-process cache instead of loading
+the league row each time. Entries expire after `CONFIG_TTL` so changes made
+by other workers are picked up; code that changes a league in this process
+calls `invalidate_league_config` after committing.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from ..fantasy_teams.lineup import SlotPlan
+from . import models
+from .interning import roster_plan
+
+CONFIG_TTL = 300.0
+
+
+@dataclass(frozen=True)
+class LeagueConfig:
+    id: int
+    season_id: Optional[int]
+    status: str
+    created_by: Optional[int]
+    trade_deadline: Optional[datetime]
+    max_trades_per_team: Optional[int]
+    max_free_agents_per_team: Optional[int]
+    playoff_format: int
+    allow_decimal_scoring: bool
+    roster_schema: Mapping[str, int]
+    scoring_schema: Mapping[str, Any]
+    plan: SlotPlan
+
+    def trades_open(self, now: datetime) -> bool:
+        return self.trade_deadline is None or now <= self.trade_deadline
+
+
+_lock = threading.Lock()
+_cache: Dict[int, Tuple[float, LeagueConfig]] = {}
+
+
+def _from_row(league: models.League) -> LeagueConfig:
+    return LeagueConfig(
+        id=league.id,
+        season_id=league.season_id,
+        status=league.status,
+        created_by=league.created_by,
+        trade_deadline=league.trade_deadline,
+        max_trades_per_team=league.max_trades_per_team,
+        max_free_agents_per_team=league.max_free_agents_per_team,
+        playoff_format=league.playoff_format,
+        allow_decimal_scoring=bool(league.allow_decimal_scoring),
+        roster_schema=dict(league.roster_schema or {}),
+        scoring_schema=dict(league.scoring_schema or {}),
+        plan=roster_plan(league.roster_schema or {}),
+    )
+
+
+def get_league_config(db: Session, league_id: int) -> LeagueConfig:
+    now = time.monotonic()
+    with _lock:
+        entry = _cache.get(league_id)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+    league = db.get(models.League, league_id)
+    if league is None:
+        raise LookupError("League not found")
+    config = _from_row(league)
+    with _lock:
+        _cache[league_id] = (now + CONFIG_TTL, config)
+    return config
+
+
+def invalidate_league_config(league_id: Optional[int] = None) -> None:
+    with _lock:
+        if league_id is None:
+            _cache.clear()
+        else:
+            _cache.pop(league_id, None)
@@ -0,0 +1,150 @@
+"""
+Interned league schemas.
+
+Nearly every league stores the same DEFAULT_ROSTER / DEFAULT_SCORING. A
+schema is canonicalized (sorted keys, integral numbers as ints) and hashed;
+`league_schemas` keeps each distinct schema once and leagues reference it,
+and the compiled forms (scoring.engine.CompiledRule, lineup.SlotPlan) are
+memoized per hash, so a schema is compiled once per process no matter how
+many leagues use it. Batch scoring (scoring.service, scoring.live) resolves
+leagues through their `scoring_schema_id`, loading each stored body once per
+process (the JSONB is only hashed for leagues not interned yet), and computes
+one column per distinct scoring key.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from ..fantasy_teams.lineup import SlotPlan, compile_roster
+from ..scoring.engine import CompiledRule, compile_schema
+from . import models
+
+# Compiled schemas kept per kind; distinct schemas are few, this only bounds abuse
+MAX_COMPILED = 1024
+
+_lock = threading.Lock()
+_scoring: "OrderedDict[str, CompiledRule]" = OrderedDict()
+_rosters: "OrderedDict[str, SlotPlan]" = OrderedDict()
+# (scoring_schema_id, allow_decimal) -> (scoring key, rule)
+_scoring_ids: "OrderedDict[Tuple[int, bool], Tuple[str, CompiledRule]]" = OrderedDict()
+
+
+def _normalize(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return {str(k): _normalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def canonical_json(schema: Mapping[str, Any]) -> str:
+    return json.dumps(_normalize(schema or {}), sort_keys=True, separators=(",", ":"))
+
+
+def schema_hash(schema: Mapping[str, Any]) -> str:
+    return hashlib.sha256(canonical_json(schema).encode()).hexdigest()
+
+
+def scoring_key(scoring_schema: Mapping[str, Any], allow_decimal: bool = True) -> str:
+    """Identity of a league's scoring: schema hash plus the decimal-scoring flag."""
+    return f"{schema_hash(scoring_schema)[:16]}:{int(bool(allow_decimal))}"
+
+
+def _memo(cache: "OrderedDict[str, Any]", key: str, build):
+    with _lock:
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+            return value
+    value = build()
+    with _lock:
+        cache[key] = value
+        while len(cache) > MAX_COMPILED:
+            cache.popitem(last=False)
+    return value
+
+
+def compiled_scoring(scoring_schema: Mapping[str, Any], allow_decimal: bool = True) -> CompiledRule:
+    return _memo(
+        _scoring,
+        scoring_key(scoring_schema, allow_decimal),
+        lambda: compile_schema(scoring_schema or {}, allow_decimal=bool(allow_decimal)),
+    )
+
+
+def scoring_rules(db: Session, keys: Iterable[Tuple[int, bool]]) -> Dict[Tuple[int, bool], Tuple[str, CompiledRule]]:
+    """(scoring key, compiled rule) per interned (scoring_schema_id, allow_decimal); missing bodies are read in one query."""
+    wanted = {(int(sid), bool(dec)) for sid, dec in keys}
+    with _lock:
+        found = {k: _scoring_ids[k] for k in wanted if k in _scoring_ids}
+    missing = wanted - found.keys()
+    if not missing:
+        return found
+    S = models.LeagueSchema
+    stored = {
+        int(sid): (digest, body)
+        for sid, digest, body in db.execute(
+            select(S.id, S.hash, S.body).where(S.id.in_({sid for sid, _dec in missing}))
+        ).all()
+    }
+    for sid, dec in missing:
+        digest, body = stored[sid]
+        # Same key as scoring_key(body, dec): the stored hash is of the canonical body
+        key = f"{digest[:16]}:{int(dec)}"
+        found[(sid, dec)] = (key, _memo(_scoring, key, lambda: compile_schema(body or {}, allow_decimal=dec)))
+    with _lock:
+        for k in missing:
+            _scoring_ids[k] = found[k]
+        while len(_scoring_ids) > MAX_COMPILED:
+            _scoring_ids.popitem(last=False)
+    return found
+
+
+def league_scoring_rules(
+    db: Session, scorings: Mapping[int, Tuple[Optional[int], Optional[Mapping[str, Any]], bool]]
+) -> Dict[int, Tuple[str, CompiledRule]]:
+    """
+    league_id -> (scoring key, rule) from league_id -> (scoring_schema_id,
+    scoring_schema, allow_decimal). The schema is only used (and hashed) for
+    leagues without a scoring_schema_id.
+    """
+    by_id = scoring_rules(db, [(sid, dec) for sid, _schema, dec in scorings.values() if sid is not None])
+    rules = {}
+    for league_id, (sid, schema, dec) in scorings.items():
+        if sid is not None:
+            rules[league_id] = by_id[(int(sid), bool(dec))]
+        else:
+            rules[league_id] = (scoring_key(schema or {}, dec), compiled_scoring(schema or {}, dec))
+    return rules
+
+
+def roster_plan(roster_schema: Mapping[str, Any]) -> SlotPlan:
+    return _memo(_rosters, schema_hash(roster_schema), lambda: compile_roster(roster_schema or {}))
+
+
+def intern_schema(db: Session, kind: str, schema: Mapping[str, Any]) -> int:
+    """Id of the stored schema, inserting it the first time it is seen. No commit."""
+    digest = schema_hash(schema)
+    S = models.LeagueSchema
+    db.execute(
+        pg_insert(S.__table__)
+        .values(kind=kind, hash=digest, body=json.loads(canonical_json(schema)))
+        .on_conflict_do_nothing(index_elements=["kind", "hash"])
+    )
+    return db.execute(select(S.id).where(S.kind == kind, S.hash == digest)).scalar_one()
+
+
+def intern_league(db: Session, league: models.League) -> None:
+    """Point a league at the interned copies of its schemas. No commit."""
+    league.roster_schema_id = intern_schema(db, "roster", league.roster_schema)
+    league.scoring_schema_id = intern_schema(db, "scoring", league.scoring_schema)
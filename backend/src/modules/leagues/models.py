@@ -1,5 +1,5 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Date, func, ForeignKey
-from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy import CheckConstraint, Column, Computed, DDL, Index, Integer, String, Boolean, DateTime, Date, event, func, ForeignKey, UniqueConstraint
+from sqlalchemy.dialects.postgresql import DATERANGE, ExcludeConstraint, JSONB, UUID
 from sqlalchemy.sql import text
 from sqlalchemy.orm import relationship
 from ...config.database import Base
@@ -16,6 +16,14 @@ class Season(Base):
     created_by = Column(Integer, ForeignKey("users.id", ondelete="RESTRICT"), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     cached_weeks = Column(JSONB, nullable=False, server_default=text("'[]'::jsonb"))
+    # Bumped whenever league_standings rows of the season change; season leaderboard cache stamp
+    standings_version = Column(Integer, nullable=False, server_default=text("0"))
+    # [start_date, end_date]; seasons may not overlap (ex_seasons_no_overlap)
+    period = Column(DATERANGE, Computed("daterange(start_date, end_date, '[]')", persisted=True))
+
+    __table_args__ = (
+        ExcludeConstraint(("period", "&&"), name="ex_seasons_no_overlap", using="gist"),
+    )
     
     weeks = relationship("Week", back_populates="season", cascade="all, delete-orphan")
     leagues = relationship("League", back_populates="season")
@@ -28,9 +36,31 @@ class Week(Base):
     week_number = Column(Integer, nullable=False)
     start_date = Column(Date, nullable=False)
     end_date = Column(Date, nullable=False)
+    # Weeks of a season may not overlap (ex_weeks_no_overlap, needs btree_gist)
+    period = Column(DATERANGE, Computed("daterange(start_date, end_date, '[]')", persisted=True))
+
+    __table_args__ = (
+        ExcludeConstraint(("season_id", "="), ("period", "&&"), name="ex_weeks_no_overlap", using="gist"),
+    )
     
     season = relationship("Season", back_populates="weeks")
 
+
+event.listen(Week.__table__, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS btree_gist"))
+
+class LeagueSchema(Base):
+    """A distinct roster or scoring schema, stored once and keyed by the hash of its canonical JSON."""
+    __tablename__ = "league_schemas"
+
+    id = Column(Integer, primary_key=True)
+    kind = Column(String(10), nullable=False)  # roster|scoring
+    hash = Column(String(64), nullable=False)
+    body = Column(JSONB, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (UniqueConstraint("kind", "hash", name="ux_league_schemas_kind_hash"),)
+
+
 class League(Base):
     __tablename__ = "leagues"
     id = Column(Integer, primary_key=True)
@@ -49,7 +79,21 @@ class League(Base):
     max_free_agents_per_team = Column(Integer)
     roster_schema = Column(JSONB, nullable=False)
     scoring_schema = Column(JSONB, nullable=False)
+    # Interned copies (league_schemas); leagues with identical schemas share one row
+    roster_schema_id = Column(Integer, ForeignKey("league_schemas.id", ondelete="RESTRICT"), nullable=True)
+    scoring_schema_id = Column(Integer, ForeignKey("league_schemas.id", ondelete="RESTRICT"), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Bumped whenever league_standings is refreshed; used as cache version stamp
+    standings_version = Column(Integer, nullable=False, server_default=text("0"))
+    # Maintained by the join statement (members_count < max_teams is checked in the same UPDATE)
+    members_count = Column(Integer, nullable=False, server_default=text("0"))
+    # Bumped on every change shown by GET /leagues/{id} (members, teams, status); its ETag
+    version = Column(Integer, nullable=False, server_default=text("0"))
+    # Bumped by a trigger on fantasy_team_players whenever a player joins or leaves a roster
+    # of the league; other processes resync their availability bitmap when it moves
+    roster_version = Column(Integer, nullable=False, server_default=text("0"))
+
+    __table_args__ = (CheckConstraint("members_count >= 0", name="ck_leagues_members_count"),)
     
     season = relationship("Season", back_populates="leagues")
     members = relationship("LeagueMember", back_populates="league")
@@ -69,7 +113,13 @@ class LeagueMember(Base):
     
     __table_args__ = (
         # Un usuario solo puede estar una vez en una liga
+        UniqueConstraint("league_id", "user_id", name="ux_league_members_user_league"),
         # Un equipo solo puede estar en una liga (para compatibilidad)
+        UniqueConstraint("team_id", name="ux_league_members_team"),
         # Un fantasy_team solo puede estar una vez en una liga
-        # El alias debe ser único dentro de la liga
+        UniqueConstraint("fantasy_team_id", name="ux_league_members_fantasy_team"),
     )
+
+
+# El alias debe ser único dentro de la liga (sin distinguir mayúsculas)
+Index("ux_league_members_league_alias_ci", LeagueMember.league_id, func.lower(LeagueMember.user_alias), unique=True)
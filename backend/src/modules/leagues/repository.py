@@ -1,6 +1,11 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import select, func
+from datetime import date
+from typing import Any, Dict, List
+
+from sqlalchemy.orm import Session, defer, joinedload
+from sqlalchemy import bindparam, select, func, text, update
+from sqlalchemy.dialects.postgresql import JSONB
 from ...config import auth as security
+from ..fantasy_teams import models as ft_models
 from ..teams import models as team_models
 from . import models, schemas
 
@@ -291,3 +296,153 @@ def join_league(
         db.rollback()
         raise
 
+
+
+_INSERT_SEASONS = text("""
+    WITH s AS (
+        INSERT INTO seasons (name, year, week_count, start_date, end_date, is_current, created_by, cached_weeks)
+        SELECT x.name, x.year, x.week_count, x.start_date, x.end_date, x.is_current, x.created_by, x.cached_weeks
+        FROM jsonb_to_recordset(:seasons) AS x(
+            name text, year int, week_count int, start_date date, end_date date,
+            is_current boolean, created_by int, cached_weeks jsonb
+        )
+        RETURNING id, name
+    ), w AS (
+        INSERT INTO weeks (season_id, week_number, start_date, end_date)
+        SELECT s.id, y.week_number, y.start_date, y.end_date
+        FROM s
+        JOIN jsonb_to_recordset(:weeks) AS y(season_name text, week_number int, start_date date, end_date date)
+          ON y.season_name = s.name
+    )
+    SELECT id, name FROM s
+""").bindparams(bindparam("seasons", type_=JSONB), bindparam("weeks", type_=JSONB))
+
+
+def insert_seasons(db: Session, seasons: List[Dict[str, Any]], *, created_by: int) -> Dict[str, int]:
+    """
+    Insert seasons with their weeks in one statement; returns name -> season id.
+    Each season is a dict with name, year, week_count, start_date, end_date,
+    is_current and `weeks` ([{week_number, start_date, end_date}]). Overlaps and
+    duplicates are rejected by the table constraints (IntegrityError). No commit.
+    """
+    season_rows, week_rows = [], []
+    for season in seasons:
+        weeks = sorted(season.get("weeks") or [], key=lambda w: w["week_number"])
+        cached = [
+            {"week_number": w["week_number"], "start_date": w["start_date"].isoformat(), "end_date": w["end_date"].isoformat()}
+            for w in weeks
+        ]
+        season_rows.append({
+            "name": season["name"],
+            "year": season["year"],
+            "week_count": season["week_count"],
+            "start_date": season["start_date"].isoformat(),
+            "end_date": season["end_date"].isoformat(),
+            "is_current": bool(season.get("is_current")),
+            "created_by": created_by,
+            "cached_weeks": cached,
+        })
+        week_rows.extend({"season_name": season["name"], **w} for w in cached)
+    if not season_rows:
+        return {}
+    rows = db.execute(_INSERT_SEASONS, {"seasons": season_rows, "weeks": week_rows}).all()
+    return {name: int(season_id) for season_id, name in rows}
+
+
+def find_overlapping_season(db: Session, start_date: date, end_date: date) -> models.Season | None:
+    """Season whose period overlaps [start_date, end_date] (served by the GiST exclusion index)."""
+    return db.execute(
+        select(models.Season)
+        .where(models.Season.period.op("&&")(func.daterange(start_date, end_date, "[]")))
+        .limit(1)
+    ).scalar_one_or_none()
+
+
+_ADD_MEMBER = text("""
+    WITH l AS (
+        UPDATE leagues SET members_count = members_count + 1, version = version + 1
+        WHERE id = :league_id AND status <> 'completed' AND members_count < max_teams
+        RETURNING id
+    ), ft AS (
+        INSERT INTO fantasy_teams (name, image_url, thumbnail_url, thumbnail_status, is_active, user_id, league_id)
+        SELECT :team_name, :image_url, :thumbnail_url, :thumbnail_status, TRUE, :user_id, l.id FROM l
+        RETURNING id, league_id
+    )
+    INSERT INTO league_members (league_id, user_id, fantasy_team_id, user_alias)
+    SELECT ft.league_id, :user_id, ft.id, :user_alias FROM ft
+    RETURNING id, league_id, user_id, team_id, fantasy_team_id, user_alias, joined_at
+""")
+
+
+def add_member(
+    db: Session,
+    *,
+    league_id: int,
+    user_id: int,
+    user_alias: str,
+    team_name: str,
+    image_url: str | None,
+    thumbnail_url: str | None,
+    thumbnail_status: str | None,
+) -> models.LeagueMember | None:
+    """
+    Take a slot of the league and create the member with its fantasy team, in
+    one statement. The slot is reserved by a conditional UPDATE of
+    leagues.members_count, so concurrent joins cannot overfill the league
+    (the row lock is held only until the caller commits). Returns None when
+    the league is full or completed; duplicate user, alias or team name raise
+    IntegrityError from the unique indexes. No commit.
+    """
+    stmt = select(models.LeagueMember).from_statement(_ADD_MEMBER)
+    return db.execute(stmt, {
+        "league_id": league_id,
+        "user_id": user_id,
+        "user_alias": user_alias,
+        "team_name": team_name,
+        "image_url": image_url,
+        "thumbnail_url": thumbnail_url,
+        "thumbnail_status": thumbnail_status,
+    }).scalar_one_or_none()
+
+
+def get_league_with_season(db: Session, league_id: int) -> models.League | None:
+    """The league with its season, in one query."""
+    return db.execute(
+        select(models.League)
+        .options(
+            defer(models.League.roster_schema),
+            defer(models.League.scoring_schema),
+            joinedload(models.League.season).defer(models.Season.cached_weeks),
+        )
+        .where(models.League.id == league_id)
+    ).scalar_one_or_none()
+
+
+def list_members_with_teams(db: Session, league_id: int):
+    """[(LeagueMember, FantasyTeam | None)] of the league in join order, in one query."""
+    return db.execute(
+        select(models.LeagueMember, ft_models.FantasyTeam)
+        .outerjoin(ft_models.FantasyTeam, ft_models.FantasyTeam.id == models.LeagueMember.fantasy_team_id)
+        .where(models.LeagueMember.league_id == league_id)
+        .order_by(models.LeagueMember.joined_at, models.LeagueMember.id)
+    ).all()
+
+
+def bump_version(db: Session, league_ids) -> None:
+    """Invalidate the detail ETag of the leagues. No commit."""
+    db.execute(
+        update(models.League)
+        .where(models.League.id.in_(list(league_ids)))
+        .values(version=models.League.version + 1)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def bump_season_leagues_version(db: Session, season_ids) -> None:
+    """Invalidate the detail ETag of every league of the seasons (the detail embeds the season). No commit."""
+    db.execute(
+        update(models.League)
+        .where(models.League.season_id.in_(list(season_ids)))
+        .values(version=models.League.version + 1)
+        .execution_options(synchronize_session=False)
+    )
@@ -1,11 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Request, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response, UploadFile, File
 from sqlalchemy.orm import Session
 
 from ...config.database import get_db
 from ...core import audit
 from ..users.router import get_current_user
 from . import schemas
-from .services.league_service import create_league_with_commissioner_team, search_leagues as svc_search_leagues, join_league as svc_join_league
+from .services.league_service import create_league_with_commissioner_team, search_leagues as svc_search_leagues, join_league as svc_join_league, get_league_detail as svc_get_league_detail
 from ...core.media import ensure_subdir, make_thumb_from_path, public_url
 
 router = APIRouter(prefix="/leagues", tags=["leagues"])
@@ -109,6 +109,31 @@ def search_leagues(
     return results
 
 
+@router.get("/{league_id}", response_model=schemas.LeagueDetail)
+def get_league_detail(
+    league_id: int,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    """
+    Detalle de una liga: temporada, miembros (alias, fecha de unión) y sus
+    equipos de fantasía con thumbnail. Responde con ETag (versión de la liga);
+    si el cliente envía If-None-Match con la misma versión devuelve 304.
+    """
+    try:
+        etag, detail = svc_get_league_detail(
+            db, league_id=league_id, if_none_match=request.headers.get("if-none-match")
+        )
+    except LookupError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    if detail is None:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return detail
+
+
 @router.post("/{league_id}/join", response_model=schemas.JoinLeagueResponse, status_code=201)
 def join_league(
     league_id: int,
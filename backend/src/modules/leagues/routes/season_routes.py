@@ -1,10 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
 from sqlalchemy.orm import Session
-from typing import List
+from datetime import date
+from typing import List, Optional
 from ....config.database import get_db
+from ....core.streaming import detect_format, text_stream
 from ...users.router import get_current_user
 from ...users.models import User
 from ..schemas import SeasonCreate, SeasonUpdate, SeasonResponse
+from ..services.season_import import import_seasons
 from ..services.season_service import SeasonService
 
 router = APIRouter(prefix="/seasons", tags=["seasons"])
@@ -39,6 +42,24 @@ def create_season(
     season = SeasonService.create_season(db, season_data, current_user.id)
     return season
 
+@router.post("/import", status_code=status.HTTP_200_OK)
+def import_seasons_file(
+    file: UploadFile = File(...),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(verify_admin)
+):
+    """
+    Importa muchas temporadas con sus semanas desde un .json, .jsonl o .csv (solo administradores).
+    
+    Todas se validan en memoria y las válidas se insertan en una sola transacción;
+    la respuesta trae el resultado de cada temporada.
+    """
+    try:
+        fmt = detect_format(file.filename or "")
+        return import_seasons(db, fileobj=text_stream(file.file), fmt=fmt, user_id=current_user.id)
+    except ValueError as ve:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(ve))
+
 @router.get("/", response_model=List[SeasonResponse])
 def get_seasons(
     skip: int = 0,
@@ -60,6 +81,16 @@ def get_season(
     season = SeasonService.get_season(db, season_id)
     return season
 
+@router.get("/{season_id}/week-at")
+def get_week_at(
+    season_id: int,
+    day: Optional[date] = Query(None, alias="date", description="Fecha (YYYY-MM-DD); hoy por defecto"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Semana de la temporada que contiene la fecha (`week` es null entre semanas o fuera de la temporada)"""
+    return SeasonService.get_week_at(db, season_id, day)
+
 @router.patch("/{season_id}", response_model=SeasonResponse)
 def update_season(
     season_id: int,
@@ -184,3 +184,52 @@ class JoinLeagueResponse(BaseModel):
     
     model_config = ConfigDict(from_attributes=True)
 
+
+
+class LeagueDetailSeason(BaseModel):
+    id: int
+    name: str
+    year: int
+    start_date: date
+    end_date: date
+    is_current: bool
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class LeagueDetailTeam(BaseModel):
+    id: int
+    name: str
+    image_url: Optional[str] = None
+    thumbnail_url: Optional[str] = None
+    thumbnail_status: Optional[str] = None
+    is_active: bool
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class LeagueDetailMember(BaseModel):
+    user_id: int
+    user_alias: str
+    joined_at: datetime
+    is_commissioner: bool
+    fantasy_team: Optional[LeagueDetailTeam] = None
+
+
+class LeagueDetail(BaseModel):
+    id: int
+    uuid: Optional[str] = None
+    name: str
+    description: Optional[str] = None
+    status: str
+    max_teams: int
+    members_count: int
+    slots_available: int
+    playoff_format: int
+    allow_decimal_scoring: bool
+    trade_deadline: Optional[datetime] = None
+    created_by: Optional[int] = None
+    created_at: datetime
+    version: int
+    season: Optional[LeagueDetailSeason] = None
+    members: List[LeagueDetailMember] = []
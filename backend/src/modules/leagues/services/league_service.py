@@ -1,10 +1,13 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, contains_eager
 from sqlalchemy import select, func
 from ....config import auth as security
-from ....core.media import try_download_and_thumb
+from ....core.integrity import constraint_name
 from ...fantasy_teams import repository as ftrepo
 from ...fantasy_teams import models as ft_models
-from .. import models, schemas
+from ...fantasy_teams import thumbnails
+from .. import models, repository, schemas
+from ..interning import intern_league
 
 # Default roster & scoring pulled from the user story
 DEFAULT_ROSTER = {
@@ -81,32 +84,24 @@ def create_league_with_commissioner_team(
         max_free_agents_per_team=None,
         roster_schema=DEFAULT_ROSTER,
         scoring_schema=DEFAULT_SCORING,
+        members_count=1,
     )
 
     try:
         db.add(lg)
         db.flush()
+        intern_league(db, lg)
 
-        # Unique fantasy team name within league (case-insensitive)
-        existing_ft = ftrepo.get_by_name_in_league_ci(db, league_id=lg.id, name=ft_payload.name)
-        if existing_ft:
-            raise ValueError("Ya existe un equipo con ese nombre en esta liga.")
-
-        # Thumbnail if provided
-        thumb_url = None
-        if getattr(ft_payload, "image_url", None):
-            img = str(ft_payload.image_url)
-            if img.startswith("/media/"):
-                base, _dot, _ext = img.rpartition(".")
-                thumb_url = f"{base}_thumb.png"
-            else:
-                thumb_url = try_download_and_thumb(img, subdir="fantasy_teams")
+        # Remote images are thumbnailed in the background, after the commit
+        image_url = str(ft_payload.image_url) if getattr(ft_payload, "image_url", None) else None
+        thumb_url, thumb_status = thumbnails.initial_thumbnail(image_url)
 
         fantasy_team = ftrepo.create_fantasy_team(
             db,
             name=ft_payload.name.strip(),
-            image_url=str(ft_payload.image_url) if getattr(ft_payload, "image_url", None) else None,
+            image_url=image_url,
             thumbnail_url=thumb_url,
+            thumbnail_status=thumb_status,
             user_id=creator_user_id,
             league_id=lg.id,
         )
@@ -120,15 +115,21 @@ def create_league_with_commissioner_team(
         db.add(member)
 
         db.commit()
-        db.refresh(lg)
-        return lg, fantasy_team
     except Exception:
         db.rollback()
         raise
+    if thumb_status == "pending":
+        thumbnails.submit(fantasy_team.id)
+    db.refresh(lg)
+    return lg, fantasy_team
 
 
 def search_leagues(db: Session, filters: schemas.LeagueSearchFilters):
-    query = select(models.League).join(models.Season)
+    query = (
+        select(models.League)
+        .join(models.Season)
+        .options(contains_eager(models.League.season))
+    )
 
     # Status filter
     if filters.status:
@@ -152,11 +153,7 @@ def search_leagues(db: Session, filters: schemas.LeagueSearchFilters):
 
     results = []
     for league in leagues:
-        member_count = db.execute(
-            select(func.count(models.LeagueMember.id)).where(models.LeagueMember.league_id == league.id)
-        ).scalar()
-
-        slots_available = league.max_teams - member_count
+        slots_available = max(league.max_teams - league.members_count, 0)
 
         results.append({
             "id": league.id,
@@ -174,6 +171,65 @@ def search_leagues(db: Session, filters: schemas.LeagueSearchFilters):
     return results
 
 
+def league_etag(league_id: int, version: int) -> str:
+    return f'"league-{league_id}-v{version}"'
+
+
+def get_league_detail(db: Session, *, league_id: int, if_none_match: str | None = None):
+    """
+    (etag, detail) of a league with its season, members and fantasy teams:
+    one query for the league and season, one for members joined to their
+    teams. When `if_none_match` already holds the current ETag the second
+    query is skipped and detail is None (304).
+    """
+    league = repository.get_league_with_season(db, league_id)
+    if league is None:
+        raise LookupError("Liga no encontrada.")
+    etag = league_etag(league.id, league.version)
+    if if_none_match:
+        sent = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in sent or "*" in sent:
+            return etag, None
+
+    members = []
+    for member, team in repository.list_members_with_teams(db, league_id):
+        members.append({
+            "user_id": member.user_id,
+            "user_alias": member.user_alias,
+            "joined_at": member.joined_at,
+            "is_commissioner": member.user_id == league.created_by,
+            "fantasy_team": team,
+        })
+    detail = {
+        "id": league.id,
+        "uuid": str(league.uuid) if league.uuid else None,
+        "name": league.name,
+        "description": league.description,
+        "status": league.status,
+        "max_teams": league.max_teams,
+        "members_count": league.members_count,
+        "slots_available": max(league.max_teams - league.members_count, 0),
+        "playoff_format": league.playoff_format,
+        "allow_decimal_scoring": bool(league.allow_decimal_scoring),
+        "trade_deadline": league.trade_deadline,
+        "created_by": league.created_by,
+        "created_at": league.created_at,
+        "version": league.version,
+        "season": league.season,
+        "members": members,
+    }
+    return etag, detail
+
+
+# Unique indexes that reject a join, and the message for each
+_JOIN_CONFLICTS = {
+    "ux_league_members_user_league": "Ya eres miembro de esta liga.",
+    "ux_league_members_alias_league": "El alias '{alias}' ya está en uso en esta liga. Por favor elige otro.",
+    "ux_league_members_league_alias_ci": "El alias '{alias}' ya está en uso en esta liga. Por favor elige otro.",
+    "ux_fantasy_teams_league_name": "Ya existe un equipo con el nombre '{team}' en esta liga. Por favor elige otro.",
+}
+
+
 def join_league(
     db: Session,
     *,
@@ -181,12 +237,29 @@ def join_league(
     user_id: int,
     payload: schemas.JoinLeagueRequest,
 ):
-    # 1) League exists
-    league = db.execute(select(models.League).where(models.League.id == league_id)).scalar_one_or_none()
+    """
+    Two round trips: one read of the league (password, status, capacity) and
+    one statement that takes the slot and inserts the fantasy team and the
+    member (repository.add_member). Capacity is enforced by that conditional
+    UPDATE and uniqueness by the indexes, so the result is correct under
+    concurrent joins.
+    """
+    # 1) Fantasy team payload
+    ft = payload.fantasy_team
+    if not ft or not ft.name:
+        raise ValueError("Debe proporcionar los datos del equipo de fantasía (nombre).")
+
+    # 2) League exists and is open
+    league = db.execute(
+        select(
+            models.League.password_hash,
+            models.League.status,
+            models.League.max_teams,
+            models.League.members_count,
+        ).where(models.League.id == league_id)
+    ).one_or_none()
     if not league:
         raise LookupError("Liga no encontrada.")
-
-    # 2) Not completed
     if league.status == "completed":
         raise ValueError("Esta liga ya ha finalizado y no acepta nuevos miembros.")
 
@@ -194,73 +267,39 @@ def join_league(
     if not security.verify_password(payload.password, league.password_hash):
         raise PermissionError("Credenciales inválidas.")
 
-    # 4) Existing membership
-    existing_member = db.execute(
-        select(models.LeagueMember).where(
-            models.LeagueMember.league_id == league_id,
-            models.LeagueMember.user_id == user_id,
-        )
-    ).scalar_one_or_none()
-    if existing_member:
-        raise ValueError("Ya eres miembro de esta liga.")
-
-    # 5) Capacity
-    member_count = db.execute(
-        select(func.count(models.LeagueMember.id)).where(models.LeagueMember.league_id == league_id)
-    ).scalar()
-    if member_count >= league.max_teams:
+    # 4) Capacity (fast path; add_member re-checks it atomically)
+    if league.members_count >= league.max_teams:
         raise ValueError("Esta liga no tiene cupos disponibles.")
 
-    # 6) Fantasy team payload
-    ft = payload.fantasy_team
-    if not ft or not ft.name:
-        raise ValueError("Debe proporcionar los datos del equipo de fantasía (nombre).")
-
-    # 7) Unique alias
-    alias_exists = db.execute(
-        select(models.LeagueMember.id).where(
-            models.LeagueMember.league_id == league_id,
-            func.lower(models.LeagueMember.user_alias) == func.lower(payload.user_alias.strip()),
-        )
-    ).scalar_one_or_none()
-    if alias_exists:
-        raise ValueError(f"El alias '{payload.user_alias}' ya está en uso en esta liga. Por favor elige otro.")
-
-    # 8) Unique team name in league
-    if ftrepo.get_by_name_in_league_ci(db, league_id=league_id, name=ft.name):
-        raise ValueError(f"Ya existe un equipo con el nombre '{ft.name}' en esta liga. Por favor elige otro.")
-
-    # 9) Create records
+    # 5) Create records (remote images are thumbnailed in the background, after the commit)
+    image_url = str(ft.image_url) if getattr(ft, "image_url", None) else None
+    thumb_url, thumb_status = thumbnails.initial_thumbnail(image_url)
+    alias = payload.user_alias.strip()
     try:
-        thumb_url = None
-        if getattr(ft, "image_url", None):
-            img = str(ft.image_url)
-            if img.startswith("/media/"):
-                base, _dot, _ext = img.rpartition(".")
-                thumb_url = f"{base}_thumb.png"
-            else:
-                thumb_url = try_download_and_thumb(img, subdir="fantasy_teams")
-
-        fantasy_team = ftrepo.create_fantasy_team(
+        member = repository.add_member(
             db,
-            name=ft.name.strip(),
-            image_url=str(ft.image_url) if getattr(ft, "image_url", None) else None,
-            thumbnail_url=thumb_url,
-            user_id=user_id,
-            league_id=league_id,
-        )
-
-        member = models.LeagueMember(
             league_id=league_id,
             user_id=user_id,
-            fantasy_team_id=fantasy_team.id,
-            user_alias=payload.user_alias.strip(),
+            user_alias=alias,
+            team_name=ft.name.strip(),
+            image_url=image_url,
+            thumbnail_url=thumb_url,
+            thumbnail_status=thumb_status,
         )
-        db.add(member)
-
+        if member is None:
+            raise ValueError("Esta liga no tiene cupos disponibles.")
+        # Detached, so the commit does not expire it and the response needs no reload
+        db.expunge(member)
         db.commit()
-        db.refresh(member)
-        return member
+    except IntegrityError as e:
+        db.rollback()
+        message = _JOIN_CONFLICTS.get(constraint_name(e))
+        if message is None:
+            raise
+        raise ValueError(message.format(alias=alias, team=ft.name.strip())) from e
     except Exception:
         db.rollback()
         raise
+    if thumb_status == "pending":
+        thumbnails.submit(member.fantasy_team_id)
+    return member
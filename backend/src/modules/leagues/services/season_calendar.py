@@ -0,0 +1,132 @@
+"""
+Season calendars: which week a date falls in, answered from memory.
+
+Each season's weeks are loaded once (one query) into parallel arrays sorted by
+start date; `week_at` is a bisection over the start dates followed by one
+end-date check, so the "current week" lookups done by scoring, waivers and
+the scoreboard cost O(log n) and no query. Calendars and the current season
+id expire after `CALENDAR_TTL` so changes made by other workers are picked
+up; `SeasonService.create_season` / `update_season` call
+`calendars.invalidate()` after committing.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from .. import models
+
+CALENDAR_TTL = 300.0
+
+
+@dataclass(frozen=True)
+class CalendarWeek:
+    week_id: int
+    week_number: int
+    start_date: date
+    end_date: date
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "id": self.week_id,
+            "week_number": self.week_number,
+            "start_date": self.start_date,
+            "end_date": self.end_date,
+        }
+
+
+class SeasonCalendar:
+    """The weeks of one season as sorted, non-overlapping date intervals."""
+
+    def __init__(self, season_id: int, start_date: date, end_date: date, weeks: List[CalendarWeek]) -> None:
+        self.season_id = season_id
+        self.start_date = start_date
+        self.end_date = end_date
+        self.weeks = sorted(weeks, key=lambda w: w.start_date)
+        self.by_number: Tuple[CalendarWeek, ...] = tuple(sorted(weeks, key=lambda w: w.week_number))
+        self._starts = [w.start_date for w in self.weeks]
+
+    def week_at(self, day: date) -> Optional[CalendarWeek]:
+        """The week containing `day` (bounds inclusive), or None between weeks / outside the season."""
+        i = bisect_right(self._starts, day) - 1
+        if i < 0:
+            return None
+        week = self.weeks[i]
+        return week if day <= week.end_date else None
+
+    def next_week(self, day: date) -> Optional[CalendarWeek]:
+        """The first week starting after `day`."""
+        i = bisect_right(self._starts, day)
+        return self.weeks[i] if i < len(self.weeks) else None
+
+
+_UNSET = object()
+
+
+class CalendarCache:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calendars: Dict[int, Tuple[float, SeasonCalendar]] = {}  # season_id -> (expires, calendar)
+        self._current = _UNSET  # id of the is_current season (None: no current season)
+        self._current_expires = 0.0
+
+    def invalidate(self, season_id: Optional[int] = None) -> None:
+        with self._lock:
+            if season_id is None:
+                self._calendars.clear()
+            else:
+                self._calendars.pop(season_id, None)
+            self._current = _UNSET
+
+    def get(self, db: Session, season_id: int) -> SeasonCalendar:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._calendars.get(season_id)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+        season = db.get(models.Season, season_id)
+        if season is None:
+            raise LookupError("Temporada no encontrada")
+        W = models.Week
+        rows = db.execute(
+            select(W.id, W.week_number, W.start_date, W.end_date).where(W.season_id == season_id)
+        ).all()
+        calendar = SeasonCalendar(
+            season.id, season.start_date, season.end_date, [CalendarWeek(*row) for row in rows]
+        )
+        with self._lock:
+            self._calendars[season_id] = (now + CALENDAR_TTL, calendar)
+        return calendar
+
+    def current_season_id(self, db: Session) -> Optional[int]:
+        now = time.monotonic()
+        with self._lock:
+            current = self._current if self._current_expires > now else _UNSET
+        if current is _UNSET:
+            current = db.execute(
+                select(models.Season.id).where(models.Season.is_current.is_(True)).limit(1)
+            ).scalar_one_or_none()
+            with self._lock:
+                self._current = current
+                self._current_expires = now + CALENDAR_TTL
+        return current
+
+    def week_at(self, db: Session, season_id: int, day: Optional[date] = None) -> Optional[CalendarWeek]:
+        return self.get(db, season_id).week_at(day or date.today())
+
+    def current_week(self, db: Session, day: Optional[date] = None) -> Optional[CalendarWeek]:
+        """Week of the current season containing `day` (today by default)."""
+        season_id = self.current_season_id(db)
+        if season_id is None:
+            return None
+        return self.week_at(db, season_id, day)
+
+
+calendars = CalendarCache()
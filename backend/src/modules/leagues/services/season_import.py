@@ -0,0 +1,212 @@
+"""
+Bulk season import (e.g. a decade of past seasons for stat backfill).
+
+The file holds many seasons with their weeks:
+- .json / .jsonl: one object per season
+  {"name", "start_date", "end_date", "week_count", "is_current", "weeks": [{"week_number", "start_date", "end_date"}]};
+  without "weeks", `week_count` consecutive 7-day weeks are generated from start_date.
+- .csv: one row per week with columns
+  name, start_date, end_date, is_current, week_number, week_start_date, week_end_date.
+
+Every season is validated in memory (same rules as POST /seasons, plus
+overlaps within the file and with the stored seasons, found with one query),
+then all valid seasons are inserted with their weeks and cached_weeks in one
+statement and one transaction. Invalid seasons are reported and skipped.
+"""
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import Any, Dict, IO, List, Optional
+
+from pydantic import ValidationError
+from sqlalchemy import func, or_, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ....core.integrity import constraint_name
+from ....core.streaming import iter_records
+from .. import models, repository
+from ..schemas import SeasonCreate
+from .season_calendar import calendars
+from .season_service import SeasonService
+
+MAX_SEASONS = 200
+# week_count bounds of SeasonCreate, checked before generating the weeks
+MIN_WEEKS, MAX_WEEKS = 1, 52
+
+
+def _truthy(value: Any) -> bool:
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes", "si", "sí")
+    return bool(value)
+
+
+def _group(records, fmt: str) -> List[Dict[str, Any]]:
+    """Records -> raw season dicts (CSV week rows are grouped by season name, in file order)."""
+    if fmt != "csv":
+        seasons = []
+        for i, record in enumerate(records, start=1):
+            if not isinstance(record, dict):
+                raise ValueError(f"Registro {i}: se esperaba un objeto de temporada")
+            seasons.append(record)
+        return seasons
+    by_name: Dict[str, Dict[str, Any]] = {}
+    for record in records:
+        name = (record.get("name") or "").strip()
+        season = by_name.setdefault(name, {
+            "name": name,
+            "start_date": record.get("start_date"),
+            "end_date": record.get("end_date"),
+            "is_current": _truthy(record.get("is_current")),
+            "weeks": [],
+        })
+        if record.get("week_number") is not None:
+            season["weeks"].append({
+                "week_number": record.get("week_number"),
+                "start_date": record.get("week_start_date"),
+                "end_date": record.get("week_end_date"),
+            })
+    for season in by_name.values():
+        season["week_count"] = len(season["weeks"])
+    return list(by_name.values())
+
+
+def _with_generated_weeks(raw: Dict[str, Any]) -> Dict[str, Any]:
+    if raw.get("weeks") or not raw.get("start_date") or not raw.get("week_count"):
+        return raw
+    count = int(raw["week_count"])
+    # Out-of-range counts are left for SeasonCreate to report
+    if not MIN_WEEKS <= count <= MAX_WEEKS:
+        return raw
+    start = date.fromisoformat(str(raw["start_date"]))
+    weeks = [
+        {
+            "week_number": n + 1,
+            "start_date": start + timedelta(days=7 * n),
+            "end_date": start + timedelta(days=7 * n + 6),
+        }
+        for n in range(count)
+    ]
+    return {**raw, "weeks": weeks}
+
+
+def _validate(raw: Dict[str, Any]) -> tuple[Optional[SeasonCreate], List[str]]:
+    try:
+        season = SeasonCreate(**_with_generated_weeks(raw))
+    except (ValidationError, ValueError, TypeError) as e:
+        if isinstance(e, ValidationError):
+            return None, [
+                (f"{'.'.join(map(str, err['loc']))}: " if err["loc"] else "") + err["msg"].removeprefix("Value error, ")
+                for err in e.errors()
+            ]
+        return None, [str(e)]
+    errors = []
+    weeks = sorted(season.weeks, key=lambda w: w.start_date)
+    for week in weeks:
+        if week.end_date < week.start_date:
+            errors.append(f"La semana {week.week_number} termina antes de empezar")
+        if week.start_date < season.start_date or week.end_date > season.end_date:
+            errors.append(f"La semana {week.week_number} está fuera del rango de la temporada")
+    for a, b in zip(weeks, weeks[1:]):
+        if a.end_date >= b.start_date:
+            errors.append(f"Las semanas {a.week_number} y {b.week_number} se traslapan")
+    numbers = [w.week_number for w in season.weeks]
+    if len(set(numbers)) != len(numbers):
+        errors.append("Hay números de semana repetidos")
+    return season, errors
+
+
+def import_seasons(db: Session, *, fileobj: IO[str], fmt: str, user_id: int) -> Dict[str, Any]:
+    """
+    Validate and insert every season of the file. Returns per-season results.
+    Raises ValueError for unreadable files and when the stored seasons changed
+    concurrently (the whole import is rolled back).
+    """
+    raws = _group(iter_records(fileobj, fmt), fmt)
+    if not raws:
+        raise ValueError("El archivo no contiene temporadas")
+    if len(raws) > MAX_SEASONS:
+        raise ValueError(f"Máximo {MAX_SEASONS} temporadas por archivo")
+
+    results: List[Dict[str, Any]] = []
+    parsed: List[tuple[Dict[str, Any], SeasonCreate]] = []
+    for raw in raws:
+        season, errors = _validate(raw)
+        result = {"name": (season.name if season else raw.get("name")), "status": "rejected", "errors": errors}
+        results.append(result)
+        if season is not None and not errors:
+            parsed.append((result, season))
+
+    # Names and ranges within the file
+    seen: Dict[str, int] = {}
+    for result, season in parsed:
+        seen[season.name.lower()] = seen.get(season.name.lower(), 0) + 1
+    latest: Optional[SeasonCreate] = None  # season reaching furthest so far, by start date
+    for result, season in sorted(parsed, key=lambda p: p[1].start_date):
+        if latest is not None and latest.end_date >= season.start_date:
+            result["errors"].append(f"Se traslapa con la temporada {latest.name} del archivo")
+        if latest is None or season.end_date > latest.end_date:
+            latest = season
+    if sum(1 for _r, s in parsed if s.is_current) > 1:
+        for result, season in parsed:
+            if season.is_current:
+                result["errors"].append("Solo una temporada del archivo puede ser la actual")
+    for result, season in parsed:
+        if seen[season.name.lower()] > 1:
+            result["errors"].append("Nombre repetido en el archivo")
+
+    # Against the stored seasons: one query for clashing names or ranges
+    if parsed:
+        S = models.Season
+        lo = min(s.start_date for _r, s in parsed)
+        hi = max(s.end_date for _r, s in parsed)
+        stored = db.execute(
+            select(S.name, S.start_date, S.end_date).where(
+                or_(
+                    func.lower(S.name).in_([s.name.lower() for _r, s in parsed]),
+                    S.period.op("&&")(func.daterange(lo, hi, "[]")),
+                )
+            )
+        ).all()
+        names = {name.lower() for name, _s, _e in stored}
+        for result, season in parsed:
+            if season.name.lower() in names:
+                result["errors"].append("Ya existe una temporada con ese nombre")
+            for name, start, end in stored:
+                if start <= season.end_date and season.start_date <= end:
+                    result["errors"].append(f"Se traslapa con la temporada existente {name}")
+                    break
+
+    valid = [(r, s) for r, s in parsed if not r["errors"]]
+    if valid:
+        try:
+            if any(s.is_current for _r, s in valid):
+                SeasonService.unset_current_season(db)
+            ids = repository.insert_seasons(db, [
+                {
+                    "name": s.name,
+                    "year": s.start_date.year,
+                    "week_count": s.week_count,
+                    "start_date": s.start_date,
+                    "end_date": s.end_date,
+                    "is_current": s.is_current,
+                    "weeks": [w.model_dump() for w in s.weeks],
+                }
+                for _r, s in valid
+            ], created_by=user_id)
+            db.commit()
+        except IntegrityError as e:
+            db.rollback()
+            raise ValueError(
+                f"Las temporadas cambiaron durante la importación ({constraint_name(e) or e.orig}); no se importó nada"
+            )
+        calendars.invalidate()
+        for result, season in valid:
+            result.update(status="created", season_id=ids[season.name], weeks=len(season.weeks))
+
+    return {
+        "seasons": len(results),
+        "created": sum(1 for r in results if r["status"] == "created"),
+        "rejected": sum(1 for r in results if r["status"] == "rejected"),
+        "results": results,
+    }
@@ -1,11 +1,14 @@
+from sqlalchemy import update
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from fastapi import HTTPException, status
 from datetime import date
-from typing import List, Optional
-from ..models import Season, Week
+from typing import List, Optional, Tuple
+from ....core.integrity import constraint_name
+from .. import repository
+from ..models import Season
 from ..schemas import SeasonCreate, SeasonUpdate, WeekCreate
+from .season_calendar import CalendarWeek, calendars
 
 class SeasonService:
     
@@ -25,21 +28,6 @@ class SeasonService:
         #         detail="La fecha de inicio no puede estar en el pasado"
         #     )
     
-    @staticmethod
-    def validate_weeks_overlap(weeks: List[WeekCreate]):
-        """Valida que las semanas no se traslapen entre sí"""
-        sorted_weeks = sorted(weeks, key=lambda w: w.start_date)
-        
-        for i in range(len(sorted_weeks) - 1):
-            current_week = sorted_weeks[i]
-            next_week = sorted_weeks[i + 1]
-            
-            if current_week.end_date >= next_week.start_date:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Las semanas {current_week.week_number} y {next_week.week_number} se traslapan"
-                )
-    
     @staticmethod
     def validate_weeks_within_season(weeks: List[WeekCreate], season_start: date, season_end: date):
         """Valida que todas las semanas estén dentro del rango de la temporada"""
@@ -51,68 +39,51 @@ class SeasonService:
                 )
     
     @staticmethod
-    def check_season_overlap(db: Session, start_date: date, end_date: date, exclude_season_id: Optional[int] = None):
-        """Verifica si hay traslape con otra temporada existente"""
-        query = db.query(Season).filter(
-            or_(
-                and_(Season.start_date <= start_date, Season.end_date >= start_date),
-                and_(Season.start_date <= end_date, Season.end_date >= end_date),
-                and_(Season.start_date >= start_date, Season.end_date <= end_date)
-            )
-        )
-        
-        if exclude_season_id:
-            query = query.filter(Season.id != exclude_season_id)
-        
-        overlapping_season = query.first()
-        
-        if overlapping_season:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Las fechas se traslapan con la temporada existente: {overlapping_season.name}"
-            )
-    
-    @staticmethod
-    def check_name_exists(db: Session, name: str, exclude_season_id: Optional[int] = None):
-        """Verifica si el nombre ya existe"""
-        query = db.query(Season).filter(Season.name == name)
-        
-        if exclude_season_id:
-            query = query.filter(Season.id != exclude_season_id)
-        
-        if query.first():
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Ya existe una temporada con el nombre: {name}"
+    def integrity_error(db: Session, e: IntegrityError, season_data=None) -> HTTPException:
+        """Traduce la restricción violada (traslapes, nombres duplicados) a un error HTTP"""
+        constraint = constraint_name(e)
+        if constraint == "ex_seasons_no_overlap" and season_data is not None:
+            overlapping = repository.find_overlapping_season(db, season_data.start_date, season_data.end_date)
+            name = f": {overlapping.name}" if overlapping else ""
+            detail = f"Las fechas se traslapan con la temporada existente{name}"
+        elif constraint == "ex_weeks_no_overlap":
+            detail = "Las semanas de la temporada se traslapan entre sí"
+        elif constraint in ("unique_season_name", "seasons_name_key"):
+            detail = "Ya existe una temporada con ese nombre"
+        elif constraint == "unique_week_per_season":
+            detail = "Hay números de semana repetidos en la temporada"
+        elif constraint == "ux_one_current_season":
+            return HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Otra temporada fue marcada como actual al mismo tiempo; intente de nuevo"
             )
+        else:
+            detail = f"Datos de temporada inválidos: {constraint or e.orig}"
+        return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
     
     @staticmethod
     def unset_current_season(db: Session, exclude_season_id: Optional[int] = None):
-        """Quita el flag is_current de todas las temporadas"""
-        query = db.query(Season).filter(Season.is_current == True)
+        """Quita el flag is_current de todas las temporadas (y versiona las ligas afectadas)"""
+        stmt = update(Season).where(Season.is_current == True)
         
         if exclude_season_id:
-            query = query.filter(Season.id != exclude_season_id)
+            stmt = stmt.where(Season.id != exclude_season_id)
         
-        query.update({"is_current": False})
+        unset = db.execute(
+            stmt.values(is_current=False).returning(Season.id).execution_options(synchronize_session="fetch")
+        ).scalars().all()
+        if unset:
+            repository.bump_season_leagues_version(db, unset)
     
     @staticmethod
     def create_season(db: Session, season_data: SeasonCreate, user_id: int) -> Season:
         """Crea una nueva temporada con todas las validaciones"""
         
         try:
-            # Validaciones de fechas
+            # Validaciones en memoria; traslapes y nombres duplicados los rechaza la BD
+            # (restricciones de exclusión GiST sobre daterange y UNIQUE) de forma atómica
             SeasonService.validate_date_ranges(season_data.start_date, season_data.end_date)
-            
-            # Validar nombre único
-            SeasonService.check_name_exists(db, season_data.name)
-            
-            # Validar traslape con otras temporadas
-            SeasonService.check_season_overlap(db, season_data.start_date, season_data.end_date)
-            
-            # Validar semanas
             if season_data.weeks:
-                SeasonService.validate_weeks_overlap(season_data.weeks)
                 SeasonService.validate_weeks_within_season(
                     season_data.weeks, 
                     season_data.start_date, 
@@ -123,59 +94,24 @@ class SeasonService:
             if season_data.is_current:
                 SeasonService.unset_current_season(db)
             
-<<<<<<< HEAD
-            # Crear array de semanas para el cache
-            cached_weeks = []
-            if season_data.weeks:
-                for week_data in season_data.weeks:
-                    cached_weeks.append({
-                        "week_number": week_data.week_number,
-                        "start_date": week_data.start_date.isoformat(),
-                        "end_date": week_data.end_date.isoformat()
-                    })
-
-            # Crear temporada con semanas cacheadas
-=======
-            # Crear temporada
->>>>>>> main
-            season = Season(
-                name=season_data.name,
-                year=season_data.start_date.year,
-                week_count=season_data.week_count,
-                start_date=season_data.start_date,
-                end_date=season_data.end_date,
-                is_current=season_data.is_current,
-<<<<<<< HEAD
-                created_by=user_id,
-                cached_weeks=cached_weeks
-=======
-                created_by=user_id
->>>>>>> main
-            )
-            
-            db.add(season)
-            db.flush()  # Para obtener el ID
-            
-<<<<<<< HEAD
-            # Crear semanas en la tabla de weeks (para mantener compatibilidad)
-=======
-            # Crear semanas
->>>>>>> main
-            if season_data.weeks:
-                for week_data in season_data.weeks:
-                    week = Week(
-                        season_id=season.id,
-                        week_number=week_data.week_number,
-                        start_date=week_data.start_date,
-                        end_date=week_data.end_date
-                    )
-                    db.add(week)
-            
+            # Temporada, semanas y cached_weeks en una sola sentencia
+            ids = repository.insert_seasons(db, [{
+                "name": season_data.name,
+                "year": season_data.start_date.year,
+                "week_count": season_data.week_count,
+                "start_date": season_data.start_date,
+                "end_date": season_data.end_date,
+                "is_current": season_data.is_current,
+                "weeks": [w.model_dump() for w in season_data.weeks or []],
+            }], created_by=user_id)
             db.commit()
-            db.refresh(season)
+            calendars.invalidate()
             
-            return season
+            return db.get(Season, ids[season_data.name])
             
+        except IntegrityError as e:
+            db.rollback()
+            raise SeasonService.integrity_error(db, e, season_data)
         except HTTPException:
             # Re-lanzar HTTPExceptions tal cual
             db.rollback()
@@ -209,7 +145,6 @@ class SeasonService:
             
             # Si se actualiza el nombre, validar que no exista
             if season_data.name and season_data.name != season.name:
-                SeasonService.check_name_exists(db, season_data.name, season_id)
                 season.name = season_data.name
             
             # Si se marca como actual, quitar flag de otras temporadas
@@ -218,11 +153,17 @@ class SeasonService:
                     SeasonService.unset_current_season(db, season_id)
                 season.is_current = season_data.is_current
             
+            # El detalle de cada liga incluye la temporada
+            repository.bump_season_leagues_version(db, [season_id])
             db.commit()
+            calendars.invalidate()
             db.refresh(season)
             
             return season
             
+        except IntegrityError as e:
+            db.rollback()
+            raise SeasonService.integrity_error(db, e)
         except HTTPException:
             db.rollback()
             raise
@@ -246,11 +187,7 @@ class SeasonService:
     
     @staticmethod
     def get_season(db: Session, season_id: int) -> Season:
-<<<<<<< HEAD
         """Obtiene una temporada por ID usando las semanas cacheadas"""
-=======
-        """Obtiene una temporada por ID"""
->>>>>>> main
         season = db.query(Season).filter(Season.id == season_id).first()
         
         if not season:
@@ -260,19 +197,21 @@ class SeasonService:
             )
         
         return season
-<<<<<<< HEAD
     
     @staticmethod
-    def get_weeks_from_cache(season: Season) -> List[WeekCreate]:
-        """Obtiene las semanas desde el cache"""
-        weeks = []
-        for week_data in season.cached_weeks:
-            weeks.append(WeekCreate(
-                week_number=week_data["week_number"],
-                start_date=date.fromisoformat(week_data["start_date"]),
-                end_date=date.fromisoformat(week_data["end_date"])
-            ))
-        return sorted(weeks, key=lambda w: w.week_number)
+    def get_weeks_from_cache(season: Season, db: Session) -> Tuple[CalendarWeek, ...]:
+        """Obtiene las semanas (por número) desde el calendario en memoria, sin copiarlas"""
+        return calendars.get(db, season.id).by_number
+
+    @staticmethod
+    def get_week_at(db: Session, season_id: int, day: Optional[date] = None) -> dict:
+        """Semana de la temporada que contiene la fecha (hoy por defecto)"""
+        day = day or date.today()
+        try:
+            week = calendars.week_at(db, season_id, day)
+        except LookupError as le:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(le))
+        return {"season_id": season_id, "date": day, "week": week.to_dict() if week else None}
     
     @staticmethod
     def update_cached_weeks(season: Season, weeks: List[WeekCreate], db: Session):
@@ -286,5 +225,4 @@ class SeasonService:
             })
         season.cached_weeks = cached_weeks
         db.commit()
-=======
->>>>>>> main
+        calendars.invalidate(season.id)
@@ -0,0 +1,3 @@
+"""Weekly head-to-head matchups and standings module package."""
+
+__all__ = ["models", "schedule", "playoffs", "repository", "service", "router"]
@@ -0,0 +1,75 @@
+from sqlalchemy import Column, Integer, BigInteger, SmallInteger, Numeric, String, DateTime, ForeignKey, Index, CheckConstraint, DDL, event, func
+from sqlalchemy.sql import text
+from ...config.database import Base
+
+
+class Matchup(Base):
+    """One head-to-head game of a league week. `away_team_id` NULL means a bye for the home team."""
+    __tablename__ = "matchups"
+
+    id = Column(BigInteger, primary_key=True, index=True)
+    league_id = Column(Integer, ForeignKey("leagues.id", ondelete="CASCADE"), nullable=False)
+    week_id = Column(Integer, ForeignKey("weeks.id", ondelete="CASCADE"), nullable=False)
+    home_team_id = Column(BigInteger, ForeignKey("fantasy_teams.id", ondelete="CASCADE"), nullable=False)
+    away_team_id = Column(BigInteger, ForeignKey("fantasy_teams.id", ondelete="CASCADE"), nullable=True)
+    home_points = Column(Numeric(10, 2), nullable=True)
+    away_points = Column(Numeric(10, 2), nullable=True)
+    # 1 home win, -1 away win, 0 tie; NULL until the week is final or for byes
+    home_result = Column(SmallInteger, nullable=True)
+    status = Column(String(10), nullable=False, server_default=text("'scheduled'"))  # scheduled|final
+
+    __table_args__ = (
+        CheckConstraint("home_team_id <> away_team_id", name="ck_matchups_distinct_teams"),
+    )
+
+
+# Week pages (all games of a league week) and the results pass (all games of a week)
+Index("ux_matchups_league_week_home", Matchup.league_id, Matchup.week_id, Matchup.home_team_id, unique=True)
+Index("ix_matchups_week_status", Matchup.week_id, Matchup.status)
+# A team's schedule and standings aggregation
+Index("ix_matchups_home_team", Matchup.home_team_id)
+Index("ix_matchups_away_team", Matchup.away_team_id)
+
+
+class LeagueStanding(Base):
+    """Materialized standings row per team, refreshed by the results pass (see repository.refresh_standings)."""
+    __tablename__ = "league_standings"
+
+    fantasy_team_id = Column(BigInteger, ForeignKey("fantasy_teams.id", ondelete="CASCADE"), primary_key=True)
+    league_id = Column(Integer, ForeignKey("leagues.id", ondelete="CASCADE"), nullable=False)
+    season_id = Column(Integer, ForeignKey("seasons.id", ondelete="CASCADE"), nullable=True)
+    name = Column(String(128), nullable=False)
+    wins = Column(SmallInteger, nullable=False, default=0)
+    losses = Column(SmallInteger, nullable=False, default=0)
+    ties = Column(SmallInteger, nullable=False, default=0)
+    points_for = Column(Numeric(10, 2), nullable=False, default=0)
+    points_against = Column(Numeric(10, 2), nullable=False, default=0)
+    win_pct = Column(Numeric(5, 4), nullable=False, default=0)
+    rank = Column(SmallInteger, nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+
+# League standings page, in rank order
+Index("ix_league_standings_league_rank", LeagueStanding.league_id, LeagueStanding.rank)
+# Season-wide leaderboard ("top 100 teams this season")
+Index(
+    "ix_league_standings_season_leaderboard",
+    LeagueStanding.season_id,
+    LeagueStanding.win_pct.desc(),
+    LeagueStanding.points_for.desc(),
+    LeagueStanding.fantasy_team_id,
+)
+
+
+# Deleted standings rows (refreshes and cascades from league/team deletes) bump their season's version
+event.listen(LeagueStanding.__table__, "after_create", DDL("""
+CREATE OR REPLACE FUNCTION bump_season_standings_version() RETURNS trigger AS $$
+BEGIN
+    UPDATE seasons SET standings_version = standings_version + 1
+    WHERE id IN (SELECT DISTINCT season_id FROM old_rows WHERE season_id IS NOT NULL);
+    RETURN NULL;
+END $$ LANGUAGE plpgsql;
+CREATE TRIGGER trg_league_standings_deleted
+    AFTER DELETE ON league_standings REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_season_standings_version();
+"""))
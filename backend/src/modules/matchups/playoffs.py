@@ -0,0 +1,164 @@
+"""
+Monte Carlo playoff odds.
+
+For one league the inputs are the current records, the remaining regular
+season games and a normal weekly score model per team (mean / std of its final
+weekly totals, shrunk towards the league average while the sample is small).
+Each of the N simulated seasons draws every remaining game at once:
+
+    W[s, t]  += (home wins) @ H + (away wins) @ A       # H/A: game -> team one-hot
+
+Seeding uses the standings tiebreakers (win pct, points for, points against,
+team id) via one lexsort over the (sims, teams) matrix, and the playoff
+bracket (`playoff_format` teams, top seeds get byes up to the next power of
+two, re-seeded every round) is played out with the same score model.
+"""
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+DEFAULT_SIMULATIONS = 10_000
+# Pseudo-games of the league average mixed into each team's score model
+SHRINK_GAMES = 3.0
+MIN_SIGMA = 1.0
+
+
+@dataclass(frozen=True)
+class LeagueSim:
+    league_id: int
+    team_ids: np.ndarray          # (T,)
+    wins: np.ndarray              # (T,) current record
+    losses: np.ndarray
+    ties: np.ndarray
+    points_for: np.ndarray
+    points_against: np.ndarray
+    home: np.ndarray              # (G,) team index of each remaining game
+    away: np.ndarray
+    mu: np.ndarray                # (T,) weekly score model
+    sigma: np.ndarray
+    playoff_teams: int
+
+
+def score_model(history: Sequence[Sequence[float]]) -> tuple[np.ndarray, np.ndarray]:
+    """Per-team (mu, sigma) from each team's final weekly scores, shrunk towards the league."""
+    everything = np.array([p for h in history for p in h], dtype=np.float64)
+    if everything.size == 0:
+        n = len(history)
+        return np.zeros(n), np.ones(n)  # no data yet: every game is a coin flip
+    league_mu = float(everything.mean())
+    league_sigma = max(float(everything.std()), MIN_SIGMA)
+    mu = np.empty(len(history))
+    sigma = np.empty(len(history))
+    for t, h in enumerate(history):
+        x = np.asarray(h, dtype=np.float64)
+        n = x.size
+        mu[t] = (x.sum() + SHRINK_GAMES * league_mu) / (n + SHRINK_GAMES)
+        var = ((x - x.mean()) ** 2).sum() if n else 0.0
+        sigma[t] = max(np.sqrt((var + SHRINK_GAMES * league_sigma ** 2) / (n + SHRINK_GAMES)), MIN_SIGMA)
+    return mu, sigma
+
+
+def _draw(rng: np.random.Generator, mu: np.ndarray, sigma: np.ndarray, teams: np.ndarray) -> np.ndarray:
+    return mu[teams] + sigma[teams] * rng.standard_normal(teams.shape)
+
+
+def _bracket(rng, seeds: np.ndarray, mu: np.ndarray, sigma: np.ndarray) -> np.ndarray:
+    """Play out single elimination for every sim; `seeds[s]` are team indexes, best seed first."""
+    alive = np.broadcast_to(np.arange(seeds.shape[1]), seeds.shape).copy()  # seed positions
+    while alive.shape[1] > 1:
+        k = alive.shape[1]
+        pow2 = 1 << (k.bit_length() - 1)
+        play = k if pow2 == k else 2 * (k - pow2)
+        byes, rest = alive[:, : k - play], alive[:, k - play:]
+        a, b = rest[:, : play // 2], rest[:, ::-1][:, : play // 2]  # best remaining vs worst remaining
+        ta = np.take_along_axis(seeds, a, axis=1)
+        tb = np.take_along_axis(seeds, b, axis=1)
+        winners = np.where(_draw(rng, mu, sigma, ta) >= _draw(rng, mu, sigma, tb), a, b)
+        alive = np.sort(np.concatenate([byes, winners], axis=1), axis=1)  # re-seed
+    return np.take_along_axis(seeds, alive, axis=1)[:, 0]
+
+
+def simulate(sim: LeagueSim, n_sims: int = DEFAULT_SIMULATIONS, seed: int = 0) -> Dict[str, object]:
+    """Playoff, bye and championship probability per team."""
+    rng = np.random.default_rng([seed, sim.league_id])
+    T = len(sim.team_ids)
+    P = min(sim.playoff_teams, T)
+
+    wins = np.broadcast_to(sim.wins.astype(np.float64), (n_sims, T)).copy()
+    ties = np.broadcast_to(sim.ties.astype(np.float64), (n_sims, T)).copy()
+    pf = np.broadcast_to(sim.points_for.astype(np.float64), (n_sims, T)).copy()
+    pa = np.broadcast_to(sim.points_against.astype(np.float64), (n_sims, T)).copy()
+    games = (sim.wins + sim.losses + sim.ties).astype(np.float64)
+
+    G = len(sim.home)
+    if G:
+        H = np.zeros((G, T))
+        A = np.zeros((G, T))
+        H[np.arange(G), sim.home] = 1.0
+        A[np.arange(G), sim.away] = 1.0
+        hs = _draw(rng, sim.mu, sim.sigma, np.broadcast_to(sim.home, (n_sims, G)))
+        aw = _draw(rng, sim.mu, sim.sigma, np.broadcast_to(sim.away, (n_sims, G)))
+        home_win = (hs > aw).astype(np.float64)
+        away_win = (aw > hs).astype(np.float64)
+        tie = 1.0 - home_win - away_win
+        wins += home_win @ H + away_win @ A
+        ties += tie @ (H + A)
+        pf += hs @ H + aw @ A
+        pa += aw @ H + hs @ A
+        games = games + H.sum(axis=0) + A.sum(axis=0)
+
+    win_pct = np.divide(wins + 0.5 * ties, games, out=np.zeros_like(wins), where=games > 0)
+    team_order = np.broadcast_to(np.arange(T), (n_sims, T))
+    # lexsort: last key is primary -> win pct desc, points for desc, points against asc, team id
+    order = np.lexsort((team_order, pa, -pf, -win_pct), axis=-1)
+
+    made = np.zeros(T)
+    bye = np.zeros(T)
+    champion = np.zeros(T)
+    if P >= 1:
+        seeds = order[:, :P]
+        np.add.at(made, seeds.ravel(), 1.0)
+        pow2 = 1 << (P.bit_length() - 1)
+        n_byes = 0 if pow2 == P else P - 2 * (P - pow2)
+        if n_byes:
+            np.add.at(bye, seeds[:, :n_byes].ravel(), 1.0)
+        np.add.at(champion, _bracket(rng, seeds, sim.mu, sim.sigma), 1.0)
+
+    return {
+        "league_id": sim.league_id,
+        "simulations": n_sims,
+        "teams": [
+            {
+                "fantasy_team_id": int(tid),
+                "playoff": round(float(made[t]) / n_sims, 4),
+                "bye": round(float(bye[t]) / n_sims, 4),
+                "championship": round(float(champion[t]) / n_sims, 4),
+            }
+            for t, tid in enumerate(sim.team_ids)
+        ],
+    }
+
+
+def _simulate_args(args) -> Dict[str, object]:
+    return simulate(*args)
+
+
+def simulate_many(
+    sims: List[LeagueSim],
+    n_sims: int = DEFAULT_SIMULATIONS,
+    seed: int = 0,
+    *,
+    workers: Optional[int] = None,
+) -> Dict[int, Dict[str, object]]:
+    """Simulate many leagues, spread over a process pool (in-process for a single league or CPU)."""
+    workers = workers or os.cpu_count() or 1
+    if len(sims) <= 1 or workers == 1:
+        return {s.league_id: simulate(s, n_sims, seed) for s in sims}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(_simulate_args, [(s, n_sims, seed) for s in sims], chunksize=max(1, len(sims) // 32))
+        return {r["league_id"]: r for r in results}
@@ -0,0 +1,300 @@
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import and_, case, delete, exists, func, literal, select, union_all, update
+from sqlalchemy.orm import Session
+
+from ...core.bulk import bulk_insert
+from ..fantasy_teams import models as ft_models
+from ..leagues import models as league_models
+from ..scoring import models as scoring_models
+from . import models
+
+M = models.Matchup
+
+
+def list_season_week_ids(db: Session, season_id: int) -> List[int]:
+    return db.execute(
+        select(league_models.Week.id)
+        .where(league_models.Week.season_id == season_id)
+        .order_by(league_models.Week.week_number)
+    ).scalars().all()
+
+
+def list_active_team_ids(db: Session, league_id: int) -> List[int]:
+    return db.execute(
+        select(ft_models.FantasyTeam.id)
+        .where(ft_models.FantasyTeam.league_id == league_id, ft_models.FantasyTeam.is_active.is_(True))
+        .order_by(ft_models.FantasyTeam.id)
+    ).scalars().all()
+
+
+def has_schedule(db: Session, league_id: int) -> bool:
+    return db.execute(select(exists().where(M.league_id == league_id))).scalar()
+
+
+def has_final_matchups(db: Session, league_id: int) -> bool:
+    return db.execute(select(exists().where(M.league_id == league_id, M.status == "final"))).scalar()
+
+
+def delete_schedule(db: Session, league_id: int) -> None:
+    db.execute(delete(M).where(M.league_id == league_id))
+
+
+def insert_matchups(db: Session, rows: List[Dict[str, Any]]) -> int:
+    return len(bulk_insert(db, M.__table__, rows))
+
+
+def list_matchups(db: Session, league_id: int, week_id: Optional[int] = None) -> List[models.Matchup]:
+    stmt = select(M).where(M.league_id == league_id)
+    if week_id is not None:
+        stmt = stmt.where(M.week_id == week_id)
+    return db.execute(stmt.order_by(M.week_id, M.id)).scalars().all()
+
+
+def finalize_week(db: Session, week_id: int, league_ids: Optional[Iterable[int]] = None) -> int:
+    """
+    Set-based results pass: copy the materialized team totals into every matchup
+    of the week (all leagues at once) and derive the outcome. Returns the matchups updated. No commit.
+    """
+    S = scoring_models.FantasyTeamWeekScore
+
+    def team_points(team_col):
+        return func.coalesce(
+            select(S.points).where(S.fantasy_team_id == team_col, S.week_id == M.week_id).scalar_subquery(),
+            0,
+        )
+
+    scope = [M.week_id == week_id]
+    if league_ids is not None:
+        scope.append(M.league_id.in_(list(league_ids)))
+
+    updated = db.execute(
+        update(M)
+        .where(*scope)
+        .values(
+            home_points=team_points(M.home_team_id),
+            away_points=case((M.away_team_id.is_(None), None), else_=team_points(M.away_team_id)),
+            status="final",
+        )
+    ).rowcount
+    # Second statement so the outcome reads the points just written
+    db.execute(
+        update(M)
+        .where(*scope)
+        .values(
+            home_result=case(
+                (M.away_team_id.is_(None), None),
+                (M.home_points > M.away_points, 1),
+                (M.home_points < M.away_points, -1),
+                else_=0,
+            )
+        )
+    )
+    return updated
+
+
+def standings(db: Session, league_ids: Iterable[int]) -> List[Dict[str, Any]]:
+    """
+    W/L/T and points for/against of every team in the given leagues from final
+    matchups (byes do not count), ranked per league by win pct, points for,
+    then points against. One query for any number of leagues.
+    """
+    ids = list(league_ids)
+    if not ids:
+        return []
+    played = and_(M.league_id.in_(ids), M.status == "final", M.away_team_id.is_not(None))
+    sides = union_all(
+        select(
+            M.home_team_id.label("team_id"),
+            M.home_points.label("pf"),
+            M.away_points.label("pa"),
+            M.home_result.label("res"),
+        ).where(played),
+        select(
+            M.away_team_id.label("team_id"),
+            M.away_points.label("pf"),
+            M.home_points.label("pa"),
+            (literal(0) - M.home_result).label("res"),
+        ).where(played),
+    ).subquery()
+    agg = (
+        select(
+            sides.c.team_id,
+            func.count().filter(sides.c.res == 1).label("wins"),
+            func.count().filter(sides.c.res == -1).label("losses"),
+            func.count().filter(sides.c.res == 0).label("ties"),
+            func.sum(sides.c.pf).label("points_for"),
+            func.sum(sides.c.pa).label("points_against"),
+        )
+        .group_by(sides.c.team_id)
+        .subquery()
+    )
+
+    FT = ft_models.FantasyTeam
+    wins = func.coalesce(agg.c.wins, 0)
+    losses = func.coalesce(agg.c.losses, 0)
+    ties = func.coalesce(agg.c.ties, 0)
+    pf = func.coalesce(agg.c.points_for, 0)
+    pa = func.coalesce(agg.c.points_against, 0)
+    games = wins + losses + ties
+    win_pct = func.coalesce((wins + ties * 0.5) / func.nullif(games, 0), 0)
+    rank = func.row_number().over(
+        partition_by=FT.league_id,
+        order_by=(win_pct.desc(), pf.desc(), pa.asc(), FT.id.asc()),
+    )
+    rows = db.execute(
+        select(
+            FT.league_id,
+            FT.id.label("fantasy_team_id"),
+            FT.name,
+            wins.label("wins"),
+            losses.label("losses"),
+            ties.label("ties"),
+            pf.label("points_for"),
+            pa.label("points_against"),
+            win_pct.label("win_pct"),
+            rank.label("rank"),
+        )
+        .outerjoin(agg, agg.c.team_id == FT.id)
+        .where(FT.league_id.in_(ids), FT.is_active.is_(True))
+        .order_by(FT.league_id, rank)
+    ).mappings().all()
+    return [
+        {
+            **row,
+            "points_for": float(row["points_for"]),
+            "points_against": float(row["points_against"]),
+            "win_pct": round(float(row["win_pct"]), 4),
+        }
+        for row in rows
+    ]
+
+
+def refresh_standings(db: Session, league_ids: Iterable[int]) -> int:
+    """
+    Recompute the materialized standings of the given leagues (one aggregate
+    query) and bump their and their seasons' standings_version. Returns the rows written. No commit.
+    """
+    ids = list(set(league_ids))
+    if not ids:
+        return 0
+    season_of = dict(db.execute(
+        select(league_models.League.id, league_models.League.season_id).where(league_models.League.id.in_(ids))
+    ).all())
+    rows = [
+        {
+            "fantasy_team_id": r["fantasy_team_id"],
+            "league_id": r["league_id"],
+            "season_id": season_of.get(r["league_id"]),
+            "name": r["name"],
+            "wins": r["wins"],
+            "losses": r["losses"],
+            "ties": r["ties"],
+            "points_for": r["points_for"],
+            "points_against": r["points_against"],
+            "win_pct": r["win_pct"],
+            "rank": r["rank"],
+        }
+        for r in standings(db, ids)
+    ]
+    LS = models.LeagueStanding
+    db.execute(delete(LS).where(LS.league_id.in_(ids)))
+    written = len(bulk_insert(db, LS.__table__, rows, returning=("fantasy_team_id",))) if rows else 0
+    db.execute(
+        update(league_models.League)
+        .where(league_models.League.id.in_(ids))
+        .values(standings_version=league_models.League.standings_version + 1)
+    )
+    # Seasons of the deleted rows are bumped by trg_league_standings_deleted; these are the new rows'
+    seasons = {sid for sid in season_of.values() if sid is not None}
+    if seasons:
+        db.execute(
+            update(league_models.Season)
+            .where(league_models.Season.id.in_(seasons))
+            .values(standings_version=league_models.Season.standings_version + 1)
+        )
+    return written
+
+
+def get_standings_version(db: Session, league_id: int) -> Optional[int]:
+    return db.execute(
+        select(league_models.League.standings_version).where(league_models.League.id == league_id)
+    ).scalar_one_or_none()
+
+
+def get_season_standings_version(db: Session, season_id: int) -> Optional[int]:
+    """Monotonic counter of the season's standings changes (None for an unknown season)."""
+    return db.execute(
+        select(league_models.Season.standings_version).where(league_models.Season.id == season_id)
+    ).scalar_one_or_none()
+
+
+def _standing_dict(row: models.LeagueStanding) -> Dict[str, Any]:
+    return {
+        "league_id": row.league_id,
+        "fantasy_team_id": row.fantasy_team_id,
+        "name": row.name,
+        "wins": row.wins,
+        "losses": row.losses,
+        "ties": row.ties,
+        "points_for": float(row.points_for),
+        "points_against": float(row.points_against),
+        "win_pct": float(row.win_pct),
+        "rank": row.rank,
+    }
+
+
+def read_standings(db: Session, league_id: int) -> List[Dict[str, Any]]:
+    LS = models.LeagueStanding
+    rows = db.execute(select(LS).where(LS.league_id == league_id).order_by(LS.rank)).scalars().all()
+    return [_standing_dict(r) for r in rows]
+
+
+def read_leaderboard(db: Session, season_id: int, limit: int = 100) -> List[Dict[str, Any]]:
+    """Top teams of a season across all leagues, read in index order."""
+    LS = models.LeagueStanding
+    rows = db.execute(
+        select(LS)
+        .where(LS.season_id == season_id)
+        .order_by(LS.win_pct.desc(), LS.points_for.desc(), LS.fantasy_team_id)
+        .limit(limit)
+    ).scalars().all()
+    return [{**_standing_dict(r), "season_rank": i} for i, r in enumerate(rows, start=1)]
+
+
+def league_ids_for_week(db: Session, week_id: int) -> List[int]:
+    return db.execute(select(M.league_id).where(M.week_id == week_id).distinct()).scalars().all()
+
+
+def results_version(db: Session, league_id: int) -> tuple:
+    """Stamp that changes whenever the league's schedule or recorded results change."""
+    row = db.execute(
+        select(
+            func.count(),
+            func.count().filter(M.status == "final"),
+            func.coalesce(func.sum(M.home_points), 0) + func.coalesce(func.sum(M.away_points), 0),
+        ).where(M.league_id == league_id)
+    ).one()
+    return (int(row[0]), int(row[1]), str(row[2]))
+
+
+def list_remaining_games(db: Session, league_id: int) -> List[tuple]:
+    """(home_team_id, away_team_id) of the league's unplayed games (byes excluded)."""
+    rows = db.execute(
+        select(M.home_team_id, M.away_team_id).where(
+            M.league_id == league_id, M.status != "final", M.away_team_id.is_not(None)
+        ).order_by(M.week_id, M.id)
+    ).all()
+    return [tuple(r) for r in rows]
+
+
+def list_final_scores(db: Session, league_id: int) -> List[tuple]:
+    """(fantasy_team_id, points) for every side of the league's final games, byes included."""
+    played = and_(M.league_id == league_id, M.status == "final")
+    rows = db.execute(
+        union_all(
+            select(M.home_team_id, M.home_points).where(played),
+            select(M.away_team_id, M.away_points).where(played, M.away_team_id.is_not(None)),
+        )
+    ).all()
+    return [(int(t), float(p)) for t, p in rows if p is not None]
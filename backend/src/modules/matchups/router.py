@@ -0,0 +1,96 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import status
+from sqlalchemy.orm import Session
+
+from ...config.database import get_db
+from ..users.router import get_current_user
+from . import service
+
+router = APIRouter(tags=["matchups"])
+
+
+@router.post("/leagues/{league_id}/schedule", status_code=201)
+def generate_schedule(
+    league_id: int,
+    force: bool = Query(False),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    try:
+        return service.generate_schedule(db, league_id=league_id, user=current_user, force=force)
+    except LookupError as le:
+        raise HTTPException(status_code=404, detail=str(le))
+    except PermissionError as pe:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(pe))
+    except ValueError as ve:
+        raise HTTPException(status_code=409, detail=str(ve))
+
+
+@router.get("/leagues/{league_id}/schedule")
+def get_schedule(
+    league_id: int,
+    week_id: Optional[int] = Query(None),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    try:
+        return service.get_schedule(db, league_id=league_id, week_id=week_id)
+    except LookupError as le:
+        raise HTTPException(status_code=404, detail=str(le))
+
+
+@router.get("/leagues/{league_id}/standings")
+def get_standings(
+    league_id: int,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    try:
+        return service.get_standings(db, league_id=league_id)
+    except LookupError as le:
+        raise HTTPException(status_code=404, detail=str(le))
+
+
+@router.get("/seasons/{season_id}/leaderboard")
+def get_leaderboard(
+    season_id: int,
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    """Mejores equipos de la temporada entre todas las ligas."""
+    try:
+        return service.get_leaderboard(db, season_id=season_id, limit=limit)
+    except LookupError as le:
+        raise HTTPException(status_code=404, detail=str(le))
+
+
+@router.get("/leagues/{league_id}/playoff-odds")
+def get_playoff_odds(
+    league_id: int,
+    simulations: int = Query(10_000, ge=100, le=100_000),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    """Probabilidades de playoffs, bye y campeonato por equipo (Monte Carlo)."""
+    try:
+        return service.playoff_odds(db, league_id=league_id, simulations=simulations)
+    except LookupError as le:
+        raise HTTPException(status_code=404, detail=str(le))
+
+
+@router.post("/matchups/weeks/{week_id}/finalize")
+def finalize_week(
+    week_id: int,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    """Cierra la semana: resultados de todas las ligas en una sola pasada (solo admin)."""
+    if getattr(current_user, "role", None) != "admin":
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin role required")
+    try:
+        return service.finalize_week(db, week_id=week_id)
+    except LookupError as le:
+        raise HTTPException(status_code=404, detail=str(le))
@@ -0,0 +1,59 @@
+"""
+Round-robin schedule generation (circle method).
+
+With n teams (a phantom "bye" team is added when n is odd) one cycle has n - 1
+rounds and every team meets every other team exactly once. A season longer
+than one cycle repeats it with home/away flipped, so opponents stay as evenly
+spread as the number of weeks allows and byes rotate through every team.
+"""
+import random
+from typing import List, Optional, Sequence, Tuple
+
+Pair = Tuple[int, Optional[int]]  # (home, away); away None = bye
+
+# Rounds used by each playoff_format (4 teams: semis + final; 6 teams: + wildcard round)
+PLAYOFF_ROUNDS = {4: 2, 6: 3}
+
+
+def round_robin(team_ids: Sequence[int]) -> List[List[Pair]]:
+    """One full cycle of rounds; every team plays (or has a bye) once per round."""
+    teams: List[Optional[int]] = list(team_ids)
+    if len(teams) < 2:
+        return []
+    if len(teams) % 2:
+        teams.append(None)
+    n = len(teams)
+    rounds: List[List[Pair]] = []
+    for r in range(n - 1):
+        pairs: List[Pair] = []
+        for i in range(n // 2):
+            a, b = teams[i], teams[n - 1 - i]
+            if i == 0 and r % 2:  # the fixed team alternates; rotation balances the rest
+                a, b = b, a
+            if a is None:
+                a, b = b, None
+            pairs.append((a, b))
+        rounds.append(pairs)
+        teams = [teams[0], teams[-1], *teams[1:-1]]  # rotate everyone but the first
+    return rounds
+
+
+def season_schedule(team_ids: Sequence[int], weeks: int, *, seed: int = 0) -> List[List[Pair]]:
+    """`weeks` rounds: cycles of round_robin, home/away flipped on every other cycle."""
+    order = list(team_ids)
+    random.Random(seed).shuffle(order)
+    cycle = round_robin(order)
+    if not cycle:
+        return []
+    schedule: List[List[Pair]] = []
+    for w in range(weeks):
+        pairs = cycle[w % len(cycle)]
+        if (w // len(cycle)) % 2:
+            pairs = [(b, a) if b is not None else (a, b) for a, b in pairs]
+        schedule.append(pairs)
+    return schedule
+
+
+def regular_season_weeks(week_count: int, playoff_format: int) -> int:
+    """Weeks left for the regular season once the playoff rounds are reserved (at least one)."""
+    return max(1, week_count - PLAYOFF_ROUNDS.get(playoff_format, 2))
@@ -0,0 +1,178 @@
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ...core.cache import VersionedLRU
+from ..leagues import models as league_models
+from . import playoffs, repository, schedule
+
+# Playoff odds per (league, simulations), valid while the league's results version is unchanged
+_odds_cache = VersionedLRU(maxsize=2048)
+# Standings per league and leaderboards per (season, limit), stamped with standings versions
+_standings_cache = VersionedLRU(maxsize=4096)
+_leaderboard_cache = VersionedLRU(maxsize=256)
+
+
+def _league_for_commissioner(db: Session, league_id: int, user) -> league_models.League:
+    league = db.get(league_models.League, league_id)
+    if league is None:
+        raise LookupError("League not found")
+    if getattr(user, "role", None) != "admin" and league.created_by != user.id:
+        raise PermissionError("Admin or commissioner required")
+    return league
+
+
+def generate_schedule(db: Session, *, league_id: int, user, force: bool = False) -> Dict[str, Any]:
+    """
+    Create the regular-season round robin over the season's weeks (playoff
+    weeks at the end are left free). With `force` an existing schedule is
+    replaced, unless results have already been recorded.
+    """
+    league = _league_for_commissioner(db, league_id, user)
+    if league.season_id is None:
+        raise ValueError("League has no season")
+    team_ids = repository.list_active_team_ids(db, league_id)
+    if len(team_ids) < 2:
+        raise ValueError("At least two teams are required to build a schedule")
+    week_ids = repository.list_season_week_ids(db, league.season_id)
+    if not week_ids:
+        raise ValueError("The league's season has no weeks")
+    if repository.has_schedule(db, league_id):
+        if not force:
+            raise ValueError("League already has a schedule")
+        if repository.has_final_matchups(db, league_id):
+            raise ValueError("Schedule cannot be regenerated once results exist")
+
+    n_weeks = min(len(week_ids), schedule.regular_season_weeks(len(week_ids), league.playoff_format))
+    rounds = schedule.season_schedule(team_ids, n_weeks, seed=league.id)
+    rows: List[Dict[str, Any]] = [
+        {"league_id": league_id, "week_id": week_id, "home_team_id": home, "away_team_id": away}
+        for week_id, pairs in zip(week_ids, rounds)
+        for home, away in pairs
+    ]
+    try:
+        repository.delete_schedule(db, league_id)
+        created = repository.insert_matchups(db, rows)
+        repository.refresh_standings(db, [league_id])
+        db.commit()
+    except IntegrityError as ie:
+        db.rollback()
+        raise ValueError(f"Integrity error: {str(ie.orig)}")
+    except Exception:
+        db.rollback()
+        raise
+    return {"league_id": league_id, "weeks": len(rounds), "matchups": created, "teams": len(team_ids)}
+
+
+def finalize_week(db: Session, *, week_id: int) -> Dict[str, Any]:
+    """Record the results of every league's matchups for the week and refresh only those leagues' standings."""
+    if db.get(league_models.Week, week_id) is None:
+        raise LookupError("Week not found")
+    try:
+        updated = repository.finalize_week(db, week_id)
+        league_ids = repository.league_ids_for_week(db, week_id)
+        repository.refresh_standings(db, league_ids)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return {"week_id": week_id, "matchups": updated, "leagues": len(league_ids)}
+
+
+def get_schedule(db: Session, *, league_id: int, week_id: Optional[int] = None) -> List[Dict[str, Any]]:
+    if db.get(league_models.League, league_id) is None:
+        raise LookupError("League not found")
+    return [
+        {
+            "id": m.id,
+            "week_id": m.week_id,
+            "home_team_id": m.home_team_id,
+            "away_team_id": m.away_team_id,
+            "home_points": float(m.home_points) if m.home_points is not None else None,
+            "away_points": float(m.away_points) if m.away_points is not None else None,
+            "home_result": m.home_result,
+            "status": m.status,
+        }
+        for m in repository.list_matchups(db, league_id, week_id)
+    ]
+
+
+def get_standings(db: Session, *, league_id: int) -> List[Dict[str, Any]]:
+    """Materialized standings, served from the in-process cache while the league's version is unchanged."""
+    version = repository.get_standings_version(db, league_id)
+    if version is None:
+        raise LookupError("League not found")
+    return _standings_cache.get_or_compute(league_id, version, lambda: repository.read_standings(db, league_id))
+
+
+def get_leaderboard(db: Session, *, season_id: int, limit: int = 100) -> List[Dict[str, Any]]:
+    """Top `limit` teams of the season across every league."""
+    version = repository.get_season_standings_version(db, season_id)
+    if version is None:
+        raise LookupError("Season not found")
+    return _leaderboard_cache.get_or_compute(
+        (season_id, limit), version, lambda: repository.read_leaderboard(db, season_id, limit)
+    )
+
+
+def _league_sim(db: Session, league: league_models.League) -> playoffs.LeagueSim:
+    table = repository.standings(db, [league.id])
+    team_ids = [row["fantasy_team_id"] for row in table]
+    index = {tid: i for i, tid in enumerate(team_ids)}
+
+    history: List[List[float]] = [[] for _ in team_ids]
+    for team_id, points in repository.list_final_scores(db, league.id):
+        if team_id in index:
+            history[index[team_id]].append(points)
+    mu, sigma = playoffs.score_model(history)
+
+    games = [(index[h], index[a]) for h, a in repository.list_remaining_games(db, league.id) if h in index and a in index]
+    return playoffs.LeagueSim(
+        league_id=league.id,
+        team_ids=np.array(team_ids, dtype=np.int64),
+        wins=np.array([r["wins"] for r in table], dtype=np.int64),
+        losses=np.array([r["losses"] for r in table], dtype=np.int64),
+        ties=np.array([r["ties"] for r in table], dtype=np.int64),
+        points_for=np.array([r["points_for"] for r in table], dtype=np.float64),
+        points_against=np.array([r["points_against"] for r in table], dtype=np.float64),
+        home=np.array([g[0] for g in games], dtype=np.int64),
+        away=np.array([g[1] for g in games], dtype=np.int64),
+        mu=mu,
+        sigma=sigma,
+        playoff_teams=int(league.playoff_format),
+    )
+
+
+def playoff_odds_for_leagues(
+    db: Session,
+    *,
+    league_ids: List[int],
+    simulations: int = playoffs.DEFAULT_SIMULATIONS,
+    workers: Optional[int] = None,
+) -> Dict[int, Dict[str, Any]]:
+    """Playoff/bye/championship odds per league; cache misses are simulated in one process pool."""
+    results: Dict[int, Dict[str, Any]] = {}
+    pending: List[playoffs.LeagueSim] = []
+    versions: Dict[int, tuple] = {}
+    for league_id in league_ids:
+        league = db.get(league_models.League, league_id)
+        if league is None:
+            continue
+        versions[league_id] = repository.results_version(db, league_id)
+        cached = _odds_cache.get((league_id, simulations), versions[league_id])
+        if cached is not None:
+            results[league_id] = cached
+        else:
+            pending.append(_league_sim(db, league))
+    for league_id, odds in playoffs.simulate_many(pending, simulations, workers=workers).items():
+        _odds_cache.put((league_id, simulations), versions[league_id], odds)
+        results[league_id] = odds
+    return results
+
+
+def playoff_odds(db: Session, *, league_id: int, simulations: int = playoffs.DEFAULT_SIMULATIONS) -> Dict[str, Any]:
+    if db.get(league_models.League, league_id) is None:
+        raise LookupError("League not found")
+    return playoff_odds_for_leagues(db, league_ids=[league_id], simulations=simulations)[league_id]
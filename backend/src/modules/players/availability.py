@@ -0,0 +1,263 @@
+"""
+Available-player pool per league.
+
+The catalog of active players is held as dense arrays (player id, position
+code). Each league with rostered players gets a bitmap over the catalog
+(`rostered[league][i]` is True when catalog player i is on one of its
+rosters), and each ranking (a projection per player) is kept as one
+pre-sorted index array per position. "Top N available RBs" is then a walk
+down the RB array skipping set bits, a few chunked numpy lookups instead of
+a query.
+
+The pool is rebuilt with a single query (`rebuild`) at startup or when the
+player catalog changed (`mark_stale`), and updated incrementally on every
+roster change (`roster_added` / `roster_removed`) by the code that commits it.
+Roster changes made by other processes (e.g. the waiver cron) are caught by
+`ensure(db, league_id)`: each bitmap is stamped with the league's
+`roster_version` (bumped by a trigger on fantasy_team_players) and reloaded
+with one query when the stored version moved.
+"""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, Iterable, Iterator, List, Mapping, Optional
+
+import numpy as np
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from ..fantasy_teams import models as ft_models
+from ..fantasy_teams.lineup import normalize_position
+from ..leagues import models as league_models
+from . import models
+
+# Ranking used when none was set: catalog (player id) order
+DEFAULT_RANKING: Hashable = None
+# Rankings kept besides the default one; the least recently set is dropped
+MAX_RANKINGS = 256
+
+
+class AvailabilityPool:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stale = True
+        self._ids = np.zeros(0, dtype=np.int64)
+        self._codes = np.zeros(0, dtype=np.int16)
+        self._position_codes: Dict[str, int] = {}
+        self._position_names: List[str] = []
+        self._index: Dict[int, int] = {}
+        self._rostered: Dict[int, np.ndarray] = {}
+        self._roster_versions: Dict[int, int] = {}  # league_id -> roster_version of its bitmap
+        # ranking key -> position (None = all) -> catalog indexes, best first
+        self._rankings: "OrderedDict[Hashable, Dict[Optional[str], np.ndarray]]" = OrderedDict()
+        self._league_ranking: Dict[int, Hashable] = {}
+
+    # -- building ----------------------------------------------------------
+
+    def rebuild(self, db: Session) -> int:
+        """Reload the catalog and every league's rostered set in one query. Returns the catalog size."""
+        P = models.Player
+        R = ft_models.FantasyTeamPlayer
+        # Versions first: a roster change committed in between only causes one more reload
+        versions = dict(db.execute(select(league_models.League.id, league_models.League.roster_version)).all())
+        rows = db.execute(
+            select(P.id, P.position, func.array_remove(func.array_agg(R.league_id), None))
+            .outerjoin(R, R.player_id == P.id)
+            .where(P.is_active.is_(True))
+            .group_by(P.id, P.position)
+            .order_by(P.id)
+        ).all()
+        return self.load(rows, versions)
+
+    def load(self, rows, roster_versions: Optional[Mapping[int, int]] = None) -> int:
+        """Build from (player_id, position, [league_id, ...]) rows in player id order."""
+        ids = np.fromiter((r[0] for r in rows), dtype=np.int64, count=len(rows))
+        position_codes: Dict[str, int] = {}
+        codes = np.fromiter(
+            (position_codes.setdefault(normalize_position(r[1]), len(position_codes)) for r in rows),
+            dtype=np.int16,
+            count=len(rows),
+        )
+        rostered: Dict[int, np.ndarray] = {}
+        for i, (_pid, _pos, league_ids) in enumerate(rows):
+            for league_id in league_ids or ():
+                bits = rostered.get(league_id)
+                if bits is None:
+                    bits = rostered[league_id] = np.zeros(len(rows), dtype=bool)
+                bits[i] = True
+
+        with self._lock:
+            self._ids = ids
+            self._codes = codes
+            self._position_codes = position_codes
+            self._position_names = list(position_codes)  # insertion order == code
+            self._index = {int(pid): i for i, pid in enumerate(ids)}
+            self._rostered = rostered
+            self._roster_versions = dict(roster_versions or {})
+            self._rankings = OrderedDict()
+            self._rankings[DEFAULT_RANKING] = self._rank(np.arange(len(ids)))
+            self._stale = False
+        return len(ids)
+
+    def mark_stale(self) -> None:
+        """The player catalog changed; the next `ensure` rebuilds."""
+        self._stale = True
+
+    def ensure(self, db: Session, league_id: Optional[int] = None) -> None:
+        """Rebuild if stale; with `league_id`, also resync that league's bitmap if its roster_version moved."""
+        if self._stale:
+            self.rebuild(db)
+        if league_id is not None:
+            self._sync_league(db, league_id)
+
+    def _sync_league(self, db: Session, league_id: int) -> None:
+        version = db.execute(
+            select(league_models.League.roster_version).where(league_models.League.id == league_id)
+        ).scalar_one_or_none()
+        if version is None or self._roster_versions.get(league_id) == version:
+            return
+        R = ft_models.FantasyTeamPlayer
+        player_ids = db.execute(select(R.player_id).where(R.league_id == league_id)).scalars().all()
+        with self._lock:
+            bits = np.zeros(len(self._ids), dtype=bool)
+            idx = [i for i in (self._index.get(int(p)) for p in player_ids) if i is not None]
+            bits[idx] = True
+            self._rostered[league_id] = bits
+            self._roster_versions[league_id] = int(version)
+
+    def _rank(self, order: np.ndarray) -> Dict[Optional[str], np.ndarray]:
+        ranked: Dict[Optional[str], np.ndarray] = {None: order}
+        by_code = self._codes[order]
+        for position, code in self._position_codes.items():
+            ranked[position] = order[by_code == code]
+        return ranked
+
+    def set_ranking(self, key: Hashable, scores: Mapping[int, float]) -> None:
+        """Register a ranking (e.g. projections under one scoring schema). Unscored players go last."""
+        with self._lock:
+            s = np.full(len(self._ids), -np.inf)
+            for pid, value in scores.items():
+                i = self._index.get(int(pid))
+                if i is not None:
+                    s[i] = value
+            order = np.lexsort((np.arange(len(s)), -s))  # score desc, then player id
+            self._rankings[key] = self._rank(order)
+            self._rankings.move_to_end(key)
+            while len(self._rankings) > MAX_RANKINGS + 1:
+                oldest = next(k for k in self._rankings if k != DEFAULT_RANKING)
+                del self._rankings[oldest]
+
+    def has_ranking(self, key: Hashable) -> bool:
+        return key in self._rankings
+
+    def use_ranking(self, league_id: int, key: Hashable) -> None:
+        self._league_ranking[league_id] = key
+
+    # -- incremental updates ----------------------------------------------
+
+    def _set(self, league_id: int, player_ids: Iterable[int], value: bool) -> None:
+        with self._lock:
+            idx = [i for i in (self._index.get(int(p)) for p in player_ids) if i is not None]
+            if not idx:
+                return
+            bits = self._rostered.get(league_id)
+            if bits is None:
+                if not value:
+                    return
+                bits = self._rostered[league_id] = np.zeros(len(self._ids), dtype=bool)
+            bits[idx] = value
+
+    def roster_added(self, league_id: int, player_ids: Iterable[int]) -> None:
+        self._set(league_id, player_ids, True)
+
+    def roster_removed(self, league_id: int, player_ids: Iterable[int]) -> None:
+        self._set(league_id, player_ids, False)
+
+    def forget_league(self, league_id: int) -> None:
+        with self._lock:
+            self._rostered.pop(league_id, None)
+            self._roster_versions.pop(league_id, None)
+            self._league_ranking.pop(league_id, None)
+
+    # -- reads -------------------------------------------------------------
+
+    def _order(self, league_id: int, position: Optional[str], ranking: Hashable) -> np.ndarray:
+        key = ranking if ranking is not None else self._league_ranking.get(league_id, DEFAULT_RANKING)
+        ranked = self._rankings.get(key) or self._rankings.get(DEFAULT_RANKING, {})
+        if position is not None:
+            position = normalize_position(position)
+        return ranked.get(position, np.zeros(0, dtype=np.int64))
+
+    def is_available(self, league_id: int, player_id: int) -> bool:
+        i = self._index.get(int(player_id))
+        if i is None:
+            return False
+        bits = self._rostered.get(league_id)
+        return bits is None or not bits[i]
+
+    def iter_available(
+        self,
+        league_id: int,
+        position: Optional[str] = None,
+        *,
+        ranking: Hashable = None,
+        chunk: int = 64,
+    ) -> Iterator[int]:
+        """Available player ids of the league, best first (by the league's ranking unless one is given)."""
+        order = self._order(league_id, position, ranking)
+        ids = self._ids
+        bits = self._rostered.get(league_id)
+        if bits is None:
+            for i in order:
+                yield int(ids[i])
+            return
+        for start in range(0, len(order), chunk):
+            part = order[start:start + chunk]
+            for i in part[~bits[part]]:
+                yield int(ids[i])
+
+    def top_available(
+        self,
+        league_id: int,
+        position: Optional[str] = None,
+        n: int = 10,
+        *,
+        ranking: Hashable = None,
+    ) -> List[int]:
+        order = self._order(league_id, position, ranking)
+        bits = self._rostered.get(league_id)
+        if bits is None:
+            return self._ids[order[:n]].tolist()
+        picked: List[np.ndarray] = []
+        found = 0
+        step = max(2 * n, 32)
+        for start in range(0, len(order), step):
+            part = order[start:start + step]
+            free = part[~bits[part]][: n - found]
+            picked.append(free)
+            found += len(free)
+            if found >= n:
+                break
+        if not picked:
+            return []
+        return self._ids[np.concatenate(picked)].tolist()
+
+    def position_of(self, player_id: int) -> Optional[str]:
+        i = self._index.get(int(player_id))
+        if i is None:
+            return None
+        return self._position_names[int(self._codes[i])]
+
+    def player_ids(self) -> List[int]:
+        return self._ids.tolist()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "players": len(self._ids),
+            "leagues": len(self._rostered),
+            "rankings": len(self._rankings),
+        }
+
+
+pool = AvailabilityPool()
@@ -0,0 +1,274 @@
+"""
+Background batch import jobs for players.
+
+The upload route stores the file under media/players/incoming, creates a
+`PlayerImportJob` row and hands the job id to a small worker pool. Workers run
+`service.import_players_stream` in partial-commit mode and persist progress in
+the same transaction as every chunk, so after a restart a job resumes from the
+last committed chunk. Finished files are moved to media/players/processed with
+the usual `__processed` / `__failed` suffix.
+
+A running job holds a lease: its worker bumps `updated_at` every HEARTBEAT
+(and with every chunk). Another worker or process only takes over a 'running'
+row once it has gone LEASE without a bump, so several workers and rolling
+restarts never import the same file twice, and a job whose worker died is
+picked up again.
+"""
+from __future__ import annotations
+
+import shutil
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import and_, cast, func, or_, select, update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Session
+
+from ...config.database import SessionLocal
+from ...core.streaming import text_stream
+from . import models, service
+
+BASE_DIR = Path(__file__).resolve().parents[3]  # backend/
+INCOMING_DIR = BASE_DIR / "media" / "players" / "incoming"
+PROCESSED_DIR = BASE_DIR / "media" / "players" / "processed"
+
+JOB_WORKERS = 2
+MAX_STORED_ERRORS = 1000
+# A running job is taken over once its worker has not bumped updated_at for this long
+LEASE = timedelta(minutes=2)
+HEARTBEAT = timedelta(seconds=30)
+
+JOB = models.PlayerImportJob
+
+_executor = ThreadPoolExecutor(max_workers=JOB_WORKERS, thread_name_prefix="player-import")
+
+
+def save_incoming(upload_file, filename: str) -> Path:
+    """Copy an upload into the incoming directory under a unique name."""
+    INCOMING_DIR.mkdir(parents=True, exist_ok=True)
+    path = INCOMING_DIR / f"{uuid.uuid4().hex}__{filename}"
+    with open(path, "wb") as f:
+        shutil.copyfileobj(upload_file.file, f)
+    return path
+
+
+def create_job(db: Session, *, filename: str, file_path: Path, fmt: str, chunk_size: int, created_by: int) -> models.PlayerImportJob:
+    job = models.PlayerImportJob(
+        status="queued",
+        filename=filename,
+        file_path=str(file_path),
+        fmt=fmt,
+        chunk_size=chunk_size,
+        created_by=created_by,
+    )
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+    return job
+
+
+def get_job(db: Session, job_id: int) -> Optional[models.PlayerImportJob]:
+    return db.get(models.PlayerImportJob, job_id)
+
+
+def submit(job_id: int, delay: float = 0) -> None:
+    if delay > 0:
+        # One second of slack so the lease has expired by the database clock too
+        timer = threading.Timer(delay + 1, submit, args=(job_id,))
+        timer.daemon = True
+        timer.start()
+        return
+    _executor.submit(_run_job, job_id)
+
+
+def _claimable():
+    """Queued jobs, and running ones whose lease expired (their worker died)."""
+    return or_(
+        JOB.status == "queued",
+        and_(JOB.status == "running", JOB.updated_at < func.now() - LEASE),
+    )
+
+
+def resume_pending_jobs() -> List[int]:
+    """
+    Queue every unfinished job. Called on startup. Jobs still leased by a live
+    worker (e.g. another uvicorn worker) are only checked again once their
+    lease could have expired.
+    """
+    db = SessionLocal()
+    try:
+        rows = db.execute(
+            select(JOB.id, _claimable().label("due"))
+            .where(JOB.status.in_(("queued", "running")))
+            .order_by(JOB.id)
+        ).all()
+    finally:
+        db.close()
+    for job_id, due in rows:
+        submit(job_id, delay=0 if due else LEASE.total_seconds())
+    return [job_id for job_id, _due in rows]
+
+
+def _claim(db: Session, job_id: int) -> Optional[models.PlayerImportJob]:
+    """Atomically take a job (queued, or running with an expired lease) so two workers never process the same file."""
+    claimed = db.execute(
+        update(JOB)
+        .where(JOB.id == job_id, _claimable())
+        .values(
+            status="running",
+            started_at=func.coalesce(JOB.started_at, func.now()),
+            updated_at=func.now(),
+        )
+        .returning(JOB.id)
+    ).scalar_one_or_none()
+    db.commit()
+    if claimed is None:
+        return None
+    return db.get(JOB, job_id)
+
+
+class _Heartbeat(threading.Thread):
+    """Keeps the lease of a claimed job while its worker streams the file."""
+
+    def __init__(self, job_id: int) -> None:
+        super().__init__(name=f"player-import-{job_id}-lease", daemon=True)
+        self.job_id = job_id
+        self._done = threading.Event()
+
+    def run(self) -> None:
+        while not self._done.wait(HEARTBEAT.total_seconds()):
+            db = SessionLocal()
+            try:
+                db.execute(
+                    update(JOB).where(JOB.id == self.job_id, JOB.status == "running").values(updated_at=func.now())
+                )
+                db.commit()
+            except Exception:
+                db.rollback()
+            finally:
+                db.close()
+
+    def stop(self) -> None:
+        self._done.set()
+
+
+def _finish(db: Session, job: models.PlayerImportJob, *, status: str, detail: Optional[str] = None) -> None:
+    src = Path(job.file_path)
+    suffix = "__processed" if status == "completed" else "__failed"
+    if src.exists():
+        PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
+        stem, dot, ext = src.name.rpartition(".")
+        target = PROCESSED_DIR / (f"{stem}{suffix}.{ext}" if dot else f"{src.name}{suffix}")
+        target.unlink(missing_ok=True)
+        shutil.move(str(src), str(target))
+        job.file_path = str(target)
+    job.status = status
+    job.detail = detail
+    job.finished_at = datetime.now(timezone.utc)
+    job.updated_at = job.finished_at
+    db.commit()
+
+
+def _run_job(job_id: int) -> None:
+    db = SessionLocal()
+    heartbeat: Optional[_Heartbeat] = None
+    try:
+        job = _claim(db, job_id)
+        if job is None:
+            if db.execute(select(JOB.status).where(JOB.id == job_id)).scalar_one_or_none() == "running":
+                # Leased by another worker: take over only if it dies
+                submit(job_id, delay=LEASE.total_seconds())
+            return
+        heartbeat = _Heartbeat(job_id)
+        heartbeat.start()
+
+        base_inserted = job.rows_inserted
+        base_failed = job.rows_failed
+        base_errors = job.error_count
+        stored_errors = len(job.errors or [])
+
+        def on_chunk(progress: Dict[str, Any]) -> None:
+            nonlocal stored_errors
+            new_errors = progress["chunk_errors"][: max(0, MAX_STORED_ERRORS - stored_errors)]
+            stored_errors += len(new_errors)
+            values: Dict[str, Any] = {
+                "rows_done": progress["rows_read"],
+                "rows_inserted": base_inserted + progress["rows_inserted"],
+                "rows_failed": base_failed + progress["rows_failed"],
+                "error_count": base_errors + progress["error_count"],
+                "updated_at": func.now(),
+            }
+            if new_errors:
+                values["errors"] = models.PlayerImportJob.errors.op("||")(cast(new_errors, JSONB))
+            # Same transaction as the chunk: committed together by the importer
+            db.execute(
+                update(models.PlayerImportJob).where(models.PlayerImportJob.id == job_id).values(**values)
+            )
+
+        path = Path(job.file_path)
+        if not path.exists():
+            _finish(db, job, status="failed", detail="Archivo no encontrado.")
+            return
+
+        try:
+            with path.open("rb") as raw:
+                service.import_players_stream(
+                    db,
+                    fileobj=text_stream(raw),
+                    fmt=job.fmt,
+                    created_by=job.created_by,
+                    mode="partial",
+                    chunk_size=job.chunk_size,
+                    start_row=job.rows_done,
+                    on_chunk=on_chunk,
+                )
+        except ValueError as ve:
+            db.rollback()
+            db.refresh(job)
+            _finish(db, job, status="failed", detail=str(ve)[:1000])
+            return
+
+        db.refresh(job)
+        _finish(db, job, status="completed")
+    except Exception as e:
+        db.rollback()
+        job = db.get(models.PlayerImportJob, job_id)
+        if job is not None:
+            # Leave the file in incoming so the job can be retried by hand
+            job.status = "failed"
+            job.detail = f"Error interno: {str(e)}"[:1000]
+            job.finished_at = datetime.now(timezone.utc)
+            db.commit()
+    finally:
+        if heartbeat is not None:
+            heartbeat.stop()
+        db.close()
+
+
+def job_status(job: models.PlayerImportJob) -> Dict[str, Any]:
+    """Serializable view of a job including throughput in rows/second."""
+    throughput = None
+    if job.started_at:
+        end = job.finished_at or job.updated_at or datetime.now(timezone.utc)
+        seconds = (end - job.started_at).total_seconds()
+        if seconds > 0:
+            throughput = round(job.rows_done / seconds, 2)
+    return {
+        "id": job.id,
+        "status": job.status,
+        "filename": job.filename,
+        "rows_done": job.rows_done,
+        "rows_inserted": job.rows_inserted,
+        "rows_failed": job.rows_failed,
+        "error_count": job.error_count,
+        "errors": job.errors or [],
+        "detail": job.detail,
+        "throughput_rows_per_sec": throughput,
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "finished_at": job.finished_at,
+    }
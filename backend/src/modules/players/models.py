@@ -1,4 +1,5 @@
 from sqlalchemy import Column, Integer, BigInteger, String, Boolean, DateTime, func, ForeignKey, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
 from ...config.database import Base
 
 class Player(Base):
@@ -23,3 +24,29 @@ Index(
 )
 
 Index("ix_players_team_id", "team_id")
+
+
+class PlayerImportJob(Base):
+    """Background batch import; progress is committed together with each chunk so a restart can resume."""
+    __tablename__ = "player_import_jobs"
+
+    id = Column(BigInteger, primary_key=True, index=True)
+    status = Column(String(20), nullable=False, server_default=text("'queued'"))  # queued|running|completed|failed
+    filename = Column(String(255), nullable=False)
+    file_path = Column(String(512), nullable=False)
+    fmt = Column(String(10), nullable=False)
+    chunk_size = Column(Integer, nullable=False, server_default=text("500"))
+    rows_done = Column(Integer, nullable=False, server_default=text("0"))
+    rows_inserted = Column(Integer, nullable=False, server_default=text("0"))
+    rows_failed = Column(Integer, nullable=False, server_default=text("0"))
+    error_count = Column(Integer, nullable=False, server_default=text("0"))
+    errors = Column(JSONB, nullable=False, server_default=text("'[]'::jsonb"))
+    detail = Column(String(1000), nullable=True)
+    created_by = Column(Integer, ForeignKey("users.id", ondelete="RESTRICT"), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now())
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+Index("ix_player_import_jobs_status", "status")
+
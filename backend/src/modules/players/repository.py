@@ -1,6 +1,7 @@
-from typing import Optional
+from typing import Optional, Iterable, Set, Tuple, List, Dict, Any
 from sqlalchemy.orm import Session
-from sqlalchemy import func, select
+from sqlalchemy import func, select, update
+from ...core.bulk import bulk_insert
 from . import models
 
 
@@ -17,6 +18,69 @@ def get_by_name_ci_for_team(db: Session, *, team_id: int, name: str) -> Optional
     ).scalar_one_or_none()
 
 
+def get_existing_name_keys(db: Session, team_ids: Iterable[int]) -> Set[Tuple[int, str]]:
+    """Return every (team_id, lower(name)) already stored for the given teams, in one query."""
+    ids = set(team_ids)
+    if not ids:
+        return set()
+    rows = db.execute(
+        select(models.Player.team_id, func.lower(models.Player.name))
+        .where(models.Player.team_id.in_(ids))
+    ).all()
+    return {(int(team_id), lname) for team_id, lname in rows}
+
+
+def get_existing_ids(db: Session, player_ids: Iterable[int]) -> Set[int]:
+    ids = set(player_ids)
+    if not ids:
+        return set()
+    rows = db.execute(
+        select(models.Player.id).where(models.Player.id.in_(ids))
+    ).scalars().all()
+    return set(rows)
+
+
+def get_sync_state(db: Session) -> Dict[int, Tuple[str, str, int, Optional[str], Optional[str], bool]]:
+    """Snapshot of every player as {id: (name, position, team_id, image_url, thumbnail_url, is_active)}, one query."""
+    rows = db.execute(
+        select(
+            models.Player.id,
+            models.Player.name,
+            models.Player.position,
+            models.Player.team_id,
+            models.Player.image_url,
+            models.Player.thumbnail_url,
+            models.Player.is_active,
+        )
+    ).all()
+    return {int(r[0]): (r[1], r[2], int(r[3]), r[4], r[5], bool(r[6])) for r in rows}
+
+
+def upsert_players(db: Session, rows: List[Dict[str, Any]]) -> List[int]:
+    """Insert or update players keyed by id; rows whose values did not change are not written. No commit."""
+    written = bulk_insert(
+        db,
+        models.Player.__table__,
+        rows,
+        on_conflict="update",
+        conflict=["id"],
+        update_columns=["name", "position", "team_id", "image_url", "thumbnail_url", "is_active"],
+        only_if_changed=True,
+    )
+    return [r[0] for r in written]
+
+
+def deactivate_players(db: Session, player_ids: Iterable[int]) -> int:
+    ids = list(player_ids)
+    if not ids:
+        return 0
+    result = db.execute(
+        update(models.Player)
+        .where(models.Player.id.in_(ids), models.Player.is_active.is_(True))
+        .values(is_active=False)
+    )
+    return result.rowcount
+
 
 def create_player(
     db: Session,
@@ -41,3 +105,25 @@ def create_player(
     db.commit()
     db.refresh(player)
     return player
+
+
+def bulk_create_players(
+    db: Session,
+    rows: List[Dict[str, Any]],
+    *,
+    skip_existing: bool = False,
+    method: str = "auto",
+) -> List[int]:
+    """
+    Insert many players with the COPY/staging-table bulk path and return the new ids.
+    With `skip_existing`, rows that hit a unique constraint are skipped instead of failing.
+    No commit.
+    """
+    written = bulk_insert(
+        db,
+        models.Player.__table__,
+        rows,
+        on_conflict="nothing" if skip_existing else "error",
+        method=method,
+    )
+    return [r[0] for r in written]
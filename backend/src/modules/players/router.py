@@ -9,9 +9,10 @@ import shutil
 from sqlalchemy.orm import Session
 
 from ...config.database import get_db
+from ...core.streaming import detect_format, text_stream
 from ..users.router import get_current_user
-from .schemas import Player as PlayerOut, PlayerCreate
-from . import service
+from .schemas import Player as PlayerOut, PlayerCreate, ImportJob
+from . import service, jobs, sync
 
 router = APIRouter()
 
@@ -122,3 +123,124 @@ def batch_upload_players(
         if incoming_path.exists():
             incoming_path.unlink()
         raise HTTPException(status_code=500, detail=f"Error interno: {str(e)}")
+
+
+@router.post("/batch-import", status_code=200)
+def batch_import_players(
+    file: UploadFile = File(...),
+    mode: str = Form("atomic"),
+    chunk_size: int = Form(500),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    """
+    Importación por streaming para archivos grandes (.json, .jsonl o .csv).
+    Lee la subida directamente, sin copiarla a disco ni cargarla entera en memoria.
+    mode: "atomic" (todo o nada) o "partial" (confirma cada bloque válido).
+    """
+    _require_admin(current_user)
+
+    try:
+        fmt = detect_format(secure_filename(file.filename or ""))
+    except ValueError as ve:
+        raise HTTPException(status_code=400, detail=str(ve))
+    if mode not in ("atomic", "partial"):
+        raise HTTPException(status_code=400, detail="mode debe ser 'atomic' o 'partial'")
+    if chunk_size < 1 or chunk_size > 10_000:
+        raise HTTPException(status_code=400, detail="chunk_size debe estar entre 1 y 10000")
+
+    try:
+        result = service.import_players_stream(
+            db=db,
+            fileobj=text_stream(file.file),
+            fmt=fmt,
+            created_by=current_user.id,
+            mode=mode,
+            chunk_size=chunk_size,
+        )
+    except ValueError as ve:
+        raise HTTPException(status_code=422, detail=str(ve))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error interno: {str(e)}")
+
+    if mode == "atomic" and result["error_count"]:
+        raise HTTPException(
+            status_code=422,
+            detail={"message": "Errores de validación, no se creó ningún jugador.", **result},
+        )
+    return {
+        "message": f"{result['rows_inserted']} jugadores creados correctamente.",
+        **result,
+    }
+
+
+@router.post("/batch-jobs", response_model=ImportJob, status_code=status.HTTP_202_ACCEPTED)
+def create_batch_job(
+    file: UploadFile = File(...),
+    chunk_size: int = Form(500),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    """
+    Encola una importación en segundo plano y devuelve el id del trabajo de inmediato.
+    El avance se consulta con GET /players/batch-jobs/{id}.
+    """
+    _require_admin(current_user)
+
+    filename = secure_filename(file.filename or "")
+    try:
+        fmt = detect_format(filename)
+    except ValueError as ve:
+        raise HTTPException(status_code=400, detail=str(ve))
+    if chunk_size < 1 or chunk_size > 10_000:
+        raise HTTPException(status_code=400, detail="chunk_size debe estar entre 1 y 10000")
+
+    path = jobs.save_incoming(file, filename)
+    job = jobs.create_job(db, filename=filename, file_path=path, fmt=fmt, chunk_size=chunk_size, created_by=current_user.id)
+    jobs.submit(job.id)
+    return jobs.job_status(job)
+
+
+@router.get("/batch-jobs/{job_id}", response_model=ImportJob)
+def get_batch_job(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    _require_admin(current_user)
+    job = jobs.get_job(db, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Trabajo de importación no encontrado.")
+    return jobs.job_status(job)
+
+
+@router.post("/sync", status_code=200)
+def sync_players(
+    file: UploadFile = File(...),
+    dry_run: bool = Form(False),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    """
+    Sincroniza la tabla de jugadores con un snapshot completo (.json, .jsonl o .csv), usando el id como clave.
+    Solo aplica las diferencias: nuevos, modificados y retirados (is_active=False).
+    Con dry_run=true devuelve el reporte sin escribir nada.
+    """
+    _require_admin(current_user)
+
+    try:
+        fmt = detect_format(secure_filename(file.filename or ""))
+    except ValueError as ve:
+        raise HTTPException(status_code=400, detail=str(ve))
+
+    try:
+        return sync.sync_players_snapshot(
+            db,
+            fileobj=text_stream(file.file),
+            fmt=fmt,
+            created_by=current_user.id,
+            dry_run=dry_run,
+        )
+    except ValueError as ve:
+        raise HTTPException(status_code=422, detail=str(ve))
+
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field, HttpUrl, field_validator
-from typing import Annotated, Optional, Literal
+from typing import Annotated, Optional, Literal, List
 from datetime import datetime
 
 # Valid positions
@@ -24,3 +24,19 @@ class Player(BaseModel):
 
     class Config:
         from_attributes = True
+
+class ImportJob(BaseModel):
+    id: int
+    status: str
+    filename: str
+    rows_done: int
+    rows_inserted: int
+    rows_failed: int
+    error_count: int
+    errors: List[str] = []
+    detail: Optional[str] = None
+    throughput_rows_per_sec: Optional[float] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
@@ -1,11 +1,12 @@
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, IO, Callable, Literal
 from sqlalchemy.orm import Session
 from ...core.media import try_download_and_thumb, ensure_subdir, public_url, make_thumb_from_path
-from ..teams.repository import get_by_id as get_team_by_id, get_by_name_ci
+from ...core.streaming import iter_records, chunked
+from ..teams.repository import get_by_id as get_team_by_id, get_ids_by_names_ci as get_team_ids_by_names_ci
 from . import models, schemas, repository
+from .availability import pool
 import os
 import uuid
-from .repository import get_by_name_ci_for_team
 import os
 from pathlib import Path
 import json
@@ -56,7 +57,7 @@ def create_player(
         # All fields must be filled, require an image one way or another
         raise ValueError("Image is required.")
 
-    return repository.create_player(
+    player = repository.create_player(
         db,
         name=name,
         position=position,
@@ -65,6 +66,8 @@ def create_player(
         created_by=created_by,
         team_id=team_id,
     )
+    pool.mark_stale()
+    return player
 
 
 def _save_player_upload(upload_file) -> tuple[str, str]:
@@ -86,7 +89,7 @@ def _save_player_upload(upload_file) -> tuple[str, str]:
     return public_url(image_path), public_url(thumb_path)
 
 
-def _validate_item(item: Dict[str, Any], index: int) -> List[str]:
+def validate_item(item: Dict[str, Any], index: int) -> List[str]:
     """Valida un jugador individual, devuelve lista de errores (vacía si ok)."""
     errs = []
     required = ["id", "name", "position", "team", "image"]
@@ -121,7 +124,114 @@ def _process_image_from_url(image_url: str, subdir: str = "players") -> Tuple[st
     # En caso de querer guardar la original en media también, implementá descarga explícita.
     return image_url, thumb
 
-def process_players_batch(db: Session, *, file_path: str, created_by: int) -> Dict[str, Any]:
+def _validate_batch(
+    db: Session,
+    data: List[Dict[str, Any]],
+    *,
+    start_index: int = 0,
+    seen_ids: Optional[Dict[int, int]] = None,
+    seen_names: Optional[Dict[Tuple[int, str], int]] = None,
+) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """
+    Valida todas las filas de un lote con consultas por conjunto:
+    - una consulta para resolver todos los equipos referenciados
+    - una consulta para los pares (team_id, lower(name)) ya existentes
+    - una consulta para los ids ya existentes
+    Además detecta duplicados dentro del mismo archivo. Para validar un archivo
+    por bloques, pasar `seen_ids`/`seen_names` compartidos entre bloques y el
+    `start_index` del bloque para numerar las filas.
+    Devuelve (items_normalizados, errores); cada item lleva su número de fila en "row".
+    """
+    errors: List[str] = []
+    candidates: List[Tuple[int, Dict[str, Any]]] = []
+
+    # Fase 1: validación por fila, sin tocar la BD
+    for idx, item in enumerate(data, start=start_index + 1):
+        if not isinstance(item, dict):
+            errors.append(f"Fila {idx}: se esperaba un objeto")
+            continue
+        item_errors = validate_item(item, idx)
+        if item_errors:
+            errors.extend(item_errors)
+            continue
+        try:
+            int(item["id"])
+        except (TypeError, ValueError):
+            errors.append(f"Fila {idx}: id inválido '{item['id']}'")
+            continue
+        candidates.append((idx, item))
+
+    # Fase 2: precarga de equipos, nombres e ids existentes
+    team_ids = get_team_ids_by_names_ci(db, (str(item["team"]) for _, item in candidates))
+    existing_names = repository.get_existing_name_keys(db, team_ids.values())
+    existing_ids = repository.get_existing_ids(db, (int(item["id"]) for _, item in candidates))
+
+    seen_names = {} if seen_names is None else seen_names
+    seen_ids = {} if seen_ids is None else seen_ids
+    normalized_items: List[Dict[str, Any]] = []
+
+    for idx, item in candidates:
+        team_name = str(item["team"]).strip()
+        team_id = team_ids.get(team_name.lower())
+        if team_id is None:
+            errors.append(f"Fila {idx}: equipo '{team_name}' no encontrado")
+            continue
+
+        player_id = int(item["id"])
+        name = item["name"].strip()
+        key = (int(team_id), name.lower())
+
+        row_errors: List[str] = []
+        if player_id in existing_ids:
+            row_errors.append(f"Fila {idx}: ya existe un jugador con id {player_id}")
+        elif player_id in seen_ids:
+            row_errors.append(f"Fila {idx}: id {player_id} duplicado en el archivo (fila {seen_ids[player_id]})")
+        if key in existing_names:
+            row_errors.append(f"Fila {idx}: jugador '{name}' ya existe en equipo id {team_id}")
+        elif key in seen_names:
+            row_errors.append(f"Fila {idx}: jugador '{name}' duplicado en el archivo (fila {seen_names[key]})")
+
+        seen_ids.setdefault(player_id, idx)
+        seen_names.setdefault(key, idx)
+        if row_errors:
+            errors.extend(row_errors)
+            continue
+
+        normalized_items.append({
+            "row": idx,
+            "id": player_id,
+            "name": name,
+            "position": item["position"],
+            "team_id": int(team_id),
+            "image": item["image"],
+        })
+
+    return normalized_items, errors
+
+def _player_rows(items: List[Dict[str, Any]], *, created_by: int, download_images: bool) -> List[Dict[str, Any]]:
+    rows = []
+    for item in items:
+        thumb_url = try_download_and_thumb(item["image"], subdir="players") if download_images else None
+        rows.append({
+            "id": item["id"],
+            "name": item["name"],
+            "position": item["position"],
+            "image_url": item["image"],
+            "thumbnail_url": thumb_url,
+            "is_active": True,
+            "created_by": created_by,
+            "team_id": item["team_id"],
+        })
+    return rows
+
+
+def process_players_batch(
+    db: Session,
+    *,
+    file_path: str,
+    created_by: int,
+    download_images: bool = True,
+) -> Dict[str, Any]:
     from sqlalchemy.exc import IntegrityError
     from pathlib import Path
     import json
@@ -140,70 +250,22 @@ def process_players_batch(db: Session, *, file_path: str, created_by: int) -> Di
     if not isinstance(data, list):
         raise ValueError("El archivo debe contener un array de jugadores.")
 
-    errors: List[str] = []
-    normalized_items = []
-
-    for idx, item in enumerate(data, start=1):
-        item_errors = _validate_item(item, idx)
-        if item_errors:
-            errors.extend(item_errors)
-            continue
-
-        team_name = item.get("team") or item.get("team_name")
-        if not team_name:
-            errors.append(f"Fila {idx}: campo 'team' faltante")
-            continue
-
-        team = get_by_name_ci(db, team_name.strip())
-        if not team:
-            errors.append(f"Fila {idx}: equipo '{team_name}' no encontrado")
-            continue
-
-        team_id = team.id
-
-
-        existing = get_by_name_ci_for_team(db, team_id=int(team_id), name=item["name"])
-        if existing:
-            errors.append(f"Fila {idx}: jugador '{item['name']}' ya existe en equipo id {team_id}")
-
-        normalized_items.append({
-            "id": item.get("id"),
-            "name": item["name"].strip(),
-            "position": item["position"],
-            "team_id": int(team_id),
-            "image": item["image"],
-        })
+    normalized_items, errors = _validate_batch(db, data)
 
     if errors:
         raise ValueError("Errores de validación:\n" + "\n".join(errors))
 
-    created = []
     try:
-        # sin `with db.begin()`
-        for item in normalized_items:
-            image_url = item["image"]
-            try:
-                thumb_url = try_download_and_thumb(image_url, subdir="players")
-            except Exception as e:
-                raise ValueError(f"Error al procesar imagen para '{item['name']}': {str(e)}")
-
-            player_obj = models.Player(
-                id=int(item["id"]) if item.get("id") not in (None, "") else None,
-                name=item["name"],
-                position=item["position"],
-                image_url=image_url,
-                thumbnail_url=thumb_url,
-                is_active=True,
-                created_by=created_by,
-                team_id=item["team_id"],
-            )
-            db.add(player_obj)
-            created.append(item["name"])
+        try:
+            rows = _player_rows(normalized_items, created_by=created_by, download_images=download_images)
+        except Exception as e:
+            raise ValueError(f"Error al procesar imagen: {str(e)}")
 
-        # opcional: commit explícito (si `get_db` no lo hace automáticamente)
+        repository.bulk_create_players(db, rows)
         db.commit()
+        pool.mark_stale()
 
-        return {"created": created, "errors": []}
+        return {"created": [item["name"] for item in normalized_items], "errors": []}
 
     except IntegrityError as ie:
         db.rollback()
@@ -214,3 +276,116 @@ def process_players_batch(db: Session, *, file_path: str, created_by: int) -> Di
     except Exception as e:
         db.rollback()
         raise
+
+
+# ---------- Importación por streaming (JSON / JSONL / CSV) ----------
+
+ImportMode = Literal["atomic", "partial"]
+
+# Máximo de mensajes de error devueltos; el resto solo se cuenta
+MAX_REPORTED_ERRORS = 1000
+
+
+def import_players_stream(
+    db: Session,
+    *,
+    fileobj: IO[str],
+    fmt: str,
+    created_by: int,
+    mode: ImportMode = "atomic",
+    chunk_size: int = 500,
+    download_images: bool = True,
+    start_row: int = 0,
+    on_chunk: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Importa jugadores leyendo el archivo de forma incremental y procesándolo por bloques
+    de `chunk_size` filas, con memoria acotada (solo el bloque actual y los ids/nombres ya vistos).
+
+    Modos:
+    - "atomic": todo o nada. Se valida el archivo completo; si hay algún error se hace rollback
+      y no se crea ningún jugador.
+    - "partial": cada bloque válido se confirma (commit) por separado; las filas inválidas se
+      reportan y se omiten.
+
+    `start_row` permite reanudar omitiendo las primeras filas ya confirmadas.
+    `on_chunk(progress)` se llama tras cada bloque (con los errores del bloque en "chunk_errors");
+    en modo "partial" se ejecuta dentro de la transacción del bloque, justo antes del commit, así
+    el llamador puede registrar su avance de forma atómica con los datos insertados.
+    """
+    if mode not in ("atomic", "partial"):
+        raise ValueError(f"Modo de importación inválido: {mode}")
+
+    progress: Dict[str, Any] = {
+        "rows_read": start_row,
+        "rows_inserted": 0,
+        "rows_failed": 0,
+        "chunks": 0,
+        "error_count": 0,
+    }
+    errors: List[str] = []
+    chunk_errors: List[str] = []
+    seen_ids: Dict[int, int] = {}
+    seen_names: Dict[Tuple[int, str], int] = {}
+
+    def record_errors(errs: List[str]) -> None:
+        progress["error_count"] += len(errs)
+        chunk_errors.extend(errs)
+        room = MAX_REPORTED_ERRORS - len(errors)
+        if room > 0:
+            errors.extend(errs[:room])
+
+    records = iter_records(fileobj, fmt)
+    for _ in range(start_row):
+        if next(records, None) is None:
+            break
+
+    try:
+        for chunk in chunked(records, chunk_size):
+            chunk_start = progress["rows_read"]
+            chunk_errors.clear()
+            progress["rows_read"] += len(chunk)
+            progress["chunks"] += 1
+
+            items, validation_errors = _validate_batch(
+                db, chunk, start_index=chunk_start, seen_ids=seen_ids, seen_names=seen_names
+            )
+            if validation_errors:
+                record_errors(validation_errors)
+                progress["rows_failed"] += len(chunk) - len(items)
+
+            # En modo atómico, tras el primer error solo se sigue validando
+            if items and (mode == "partial" or not progress["error_count"]):
+                try:
+                    rows = _player_rows(items, created_by=created_by, download_images=download_images)
+                    repository.bulk_create_players(db, rows)
+                    progress["rows_inserted"] += len(rows)
+                except IntegrityError as ie:
+                    if mode == "atomic":
+                        raise ValueError(f"Error de integridad en BD: {str(ie.orig)}")
+                    db.rollback()
+                    progress["rows_failed"] += len(items)
+                    record_errors([
+                        f"Filas {chunk_start + 1}-{progress['rows_read']}: error de integridad en BD: {str(ie.orig)}"
+                    ])
+
+            if on_chunk:
+                on_chunk({**progress, "chunk_errors": list(chunk_errors)})
+            if mode == "partial":
+                db.commit()
+
+        if mode == "atomic":
+            if progress["error_count"]:
+                db.rollback()
+                progress["rows_inserted"] = 0
+            else:
+                db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        if progress["rows_inserted"]:
+            pool.mark_stale()
+
+    return {**progress, "mode": mode, "errors": errors}
+
@@ -0,0 +1,182 @@
+"""
+Idempotent player sync from a full external snapshot.
+
+The weekly data drop lists every player (id, name, position, team, image). The
+sync is keyed on `players.id`: it diffs the snapshot against the table and only
+writes the delta (new players, changed players, players missing from the
+snapshot are retired with is_active=False). Images are only downloaded for new
+players or when the image URL changed. Re-running the same snapshot performs
+no writes at all.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, IO, List, Optional, Tuple
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ...core.media import try_download_and_thumb
+from ...core.streaming import iter_records
+from ..teams.repository import get_ids_by_names_ci as get_team_ids_by_names_ci
+from . import repository
+from .availability import pool
+from .service import validate_item
+
+# How many ids of each kind are echoed back in the report
+SAMPLE_SIZE = 20
+
+
+def _read_snapshot(fileobj: IO[str], fmt: str) -> Tuple[Dict[int, Dict[str, Any]], List[str]]:
+    """Validate the snapshot rows and return ({id: item}, errors). Team names are resolved by the caller."""
+    errors: List[str] = []
+    items: Dict[int, Dict[str, Any]] = {}
+    first_row: Dict[int, int] = {}
+
+    for idx, item in enumerate(iter_records(fileobj, fmt), start=1):
+        if not isinstance(item, dict):
+            errors.append(f"Fila {idx}: se esperaba un objeto")
+            continue
+        item_errors = validate_item(item, idx)
+        if item_errors:
+            errors.extend(item_errors)
+            continue
+        try:
+            player_id = int(item["id"])
+        except (TypeError, ValueError):
+            errors.append(f"Fila {idx}: id inválido '{item['id']}'")
+            continue
+        if player_id in first_row:
+            errors.append(f"Fila {idx}: id {player_id} duplicado en el archivo (fila {first_row[player_id]})")
+            continue
+        first_row[player_id] = idx
+        items[player_id] = {
+            "row": idx,
+            "name": str(item["name"]).strip(),
+            "position": str(item["position"]).strip().upper(),
+            "team": str(item["team"]).strip(),
+            "image": str(item["image"]).strip(),
+        }
+
+    return items, errors
+
+
+def sync_players_snapshot(
+    db: Session,
+    *,
+    fileobj: IO[str],
+    fmt: str,
+    created_by: int,
+    dry_run: bool = False,
+    download_images: bool = True,
+) -> Dict[str, Any]:
+    """
+    Diff a full snapshot against `players` and apply only the changes.
+
+    Returns a report with counts (new, changed, unchanged, retired) and a sample
+    of ids per category. With `dry_run` nothing is written and validation errors
+    are included in the report; otherwise they raise ValueError and nothing is applied.
+    """
+    snapshot, errors = _read_snapshot(fileobj, fmt)
+
+    team_ids = get_team_ids_by_names_ci(db, (i["team"] for i in snapshot.values()))
+    for player_id, item in snapshot.items():
+        team_id = team_ids.get(item["team"].lower())
+        if team_id is None:
+            errors.append(f"Fila {item['row']}: equipo '{item['team']}' no encontrado")
+        item["team_id"] = team_id
+
+    current = repository.get_sync_state(db)
+
+    new_ids: List[int] = []
+    changed_ids: List[int] = []
+    image_changed: set[int] = set()
+    unchanged = 0
+    for player_id, item in snapshot.items():
+        if item["team_id"] is None:
+            continue
+        existing = current.get(player_id)
+        if existing is None:
+            new_ids.append(player_id)
+            continue
+        name, position, team_id, image_url, _thumb, is_active = existing
+        if image_url != item["image"]:
+            image_changed.add(player_id)
+        if (name, position, team_id, image_url, is_active) != (
+            item["name"], item["position"], item["team_id"], item["image"], True
+        ):
+            changed_ids.append(player_id)
+        else:
+            unchanged += 1
+
+    retired_ids = [pid for pid, state in current.items() if state[5] and pid not in snapshot]
+
+    # Unique (team_id, lower(name)) must still hold once the delta is applied
+    final_keys: Dict[Tuple[int, str], int] = {}
+    for player_id, state in current.items():
+        if player_id not in snapshot:
+            final_keys[(state[2], state[0].lower())] = player_id
+    for player_id, item in snapshot.items():
+        if item["team_id"] is None:
+            continue
+        key = (item["team_id"], item["name"].lower())
+        other = final_keys.get(key)
+        if other is not None and other != player_id:
+            errors.append(
+                f"Fila {item['row']}: jugador '{item['name']}' chocaría con el jugador id {other} en equipo id {item['team_id']}"
+            )
+        final_keys[key] = player_id
+
+    report: Dict[str, Any] = {
+        "dry_run": dry_run,
+        "total_in_snapshot": len(snapshot),
+        "new": len(new_ids),
+        "changed": len(changed_ids),
+        "unchanged": unchanged,
+        "retired": len(retired_ids),
+        "images_to_download": len(new_ids) + len(image_changed),
+        "sample": {
+            "new": sorted(new_ids)[:SAMPLE_SIZE],
+            "changed": sorted(changed_ids)[:SAMPLE_SIZE],
+            "retired": sorted(retired_ids)[:SAMPLE_SIZE],
+        },
+    }
+
+    if dry_run:
+        report["errors"] = errors[:1000]
+        return report
+    if errors:
+        raise ValueError("Errores de validación:\n" + "\n".join(errors))
+    if not (new_ids or changed_ids or retired_ids):
+        return report
+
+    rows: List[Dict[str, Any]] = []
+    for player_id in new_ids + changed_ids:
+        item = snapshot[player_id]
+        existing = current.get(player_id)
+        thumb_url: Optional[str] = existing[4] if existing else None
+        if download_images and (existing is None or player_id in image_changed):
+            thumb_url = try_download_and_thumb(item["image"], subdir="players")
+        rows.append({
+            "id": player_id,
+            "name": item["name"],
+            "position": item["position"],
+            "team_id": item["team_id"],
+            "image_url": item["image"],
+            "thumbnail_url": thumb_url,
+            "is_active": True,
+            "created_by": created_by,
+        })
+
+    try:
+        repository.upsert_players(db, rows)
+        repository.deactivate_players(db, retired_ids)
+        db.commit()
+        pool.mark_stale()
+    except IntegrityError as ie:
+        db.rollback()
+        raise ValueError(f"Error de integridad en BD: {str(ie.orig)}")
+    except Exception:
+        db.rollback()
+        raise
+
+    return report
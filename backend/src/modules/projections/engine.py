@@ -0,0 +1,79 @@
+"""
+Weekly stat-line projections.
+
+A player's projected line for week N is an exponentially weighted average of
+their stat lines in the weeks before N (weight halves every `half_life` weeks,
+weeks they did not play are skipped, not counted as zeros), shrunk toward the
+average line of their position with the weight of `prior_games` recent games,
+so a player with one big game is not projected to repeat it.
+
+Everything is one pass over a (weeks, players, stats) array: every player of
+the catalog is projected at once, and the result is a StatTable that the
+scoring engine turns into points for any scoring schema.
+"""
+from __future__ import annotations
+
+from typing import Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..scoring.engine import STAT_COLUMNS, StatTable
+
+HALF_LIFE_WEEKS = 3.0
+# Weeks of history read for one projection
+LOOKBACK_WEEKS = 8
+# Weight of the position average, in "most recent games"
+PRIOR_GAMES = 1.5
+
+
+def project(
+    history: Sequence[StatTable],
+    positions: Optional[Mapping[int, str]] = None,
+    *,
+    half_life: float = HALF_LIFE_WEEKS,
+    prior_games: float = PRIOR_GAMES,
+) -> Tuple[StatTable, np.ndarray]:
+    """
+    `history` holds the previous weeks, oldest first. Returns the projected
+    lines of every player seen in it (ordered by player id) and the number of
+    games each projection is based on. Stats that never applied to a player
+    (NaN, e.g. points_allowed for non-defenses) stay NaN.
+    """
+    tables = [t for t in history if len(t)]
+    if not tables:
+        empty = StatTable(player_ids=np.zeros(0, dtype=np.int64), values=np.zeros((0, len(STAT_COLUMNS))))
+        return empty, np.zeros(0, dtype=np.int64)
+
+    ids = np.unique(np.concatenate([t.player_ids for t in tables]))
+    n_weeks, n_players, n_stats = len(history), len(ids), len(STAT_COLUMNS)
+    values = np.zeros((n_weeks, n_players, n_stats))
+    seen = np.zeros((n_weeks, n_players, n_stats), dtype=bool)
+    played = np.zeros((n_weeks, n_players), dtype=bool)
+    for k, table in enumerate(history):
+        if not len(table):
+            continue
+        idx = np.searchsorted(ids, table.player_ids)
+        present = ~np.isnan(table.values)
+        values[k, idx] = np.where(present, table.values, 0.0)
+        seen[k, idx] = present
+        played[k, idx] = True
+
+    age = np.arange(n_weeks - 1, -1, -1, dtype=np.float64)
+    w = 0.5 ** (age / half_life)
+    num = np.einsum("w,wps->ps", w, values)
+    den = np.einsum("w,wps->ps", w, seen.astype(np.float64))
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = num / den  # NaN where the stat never applied
+        if positions and prior_games > 0:
+            pos = np.array([positions.get(int(p), "") for p in ids], dtype=object)
+            prior = np.full((n_players, n_stats), np.nan)
+            for position in np.unique(pos):
+                rows = pos == position
+                weight = den[rows].sum(axis=0)
+                avg = num[rows].sum(axis=0) / weight
+                prior[rows] = np.where(weight > 0, avg, np.nan)
+            k = np.where(np.isnan(prior) | (den == 0), 0.0, prior_games * w[-1])
+            mean = np.where(den > 0, (num + k * np.nan_to_num(prior)) / (den + k), np.nan)
+
+    return StatTable(player_ids=ids, values=mean), played.sum(axis=0)
@@ -0,0 +1,35 @@
+from sqlalchemy import Column, Integer, BigInteger, SmallInteger, Float, DateTime, ForeignKey, Index, func
+from ...config.database import Base
+
+
+class PlayerProjection(Base):
+    """Projected stat line per (week, player), computed from the season's previous weeks."""
+    __tablename__ = "player_projections"
+
+    week_id = Column(Integer, ForeignKey("weeks.id", ondelete="CASCADE"), primary_key=True)
+    player_id = Column(BigInteger, ForeignKey("players.id", ondelete="CASCADE"), primary_key=True)
+    season_id = Column(Integer, ForeignKey("seasons.id", ondelete="CASCADE"), nullable=False)
+    games = Column(SmallInteger, nullable=False, default=0)  # weeks of history behind the projection
+
+    passing_yards = Column(Float(precision=24), nullable=False, default=0)
+    passing_td = Column(Float(precision=24), nullable=False, default=0)
+    interception = Column(Float(precision=24), nullable=False, default=0)
+    rushing_yards = Column(Float(precision=24), nullable=False, default=0)
+    receptions = Column(Float(precision=24), nullable=False, default=0)
+    receiving_yards = Column(Float(precision=24), nullable=False, default=0)
+    rush_recv_td = Column(Float(precision=24), nullable=False, default=0)
+    sack = Column(Float(precision=24), nullable=False, default=0)
+    def_interception = Column(Float(precision=24), nullable=False, default=0)
+    fumble_recovered = Column(Float(precision=24), nullable=False, default=0)
+    safety = Column(Float(precision=24), nullable=False, default=0)
+    def_td = Column(Float(precision=24), nullable=False, default=0)
+    team_def_2pt_return = Column(Float(precision=24), nullable=False, default=0)
+    pat_made = Column(Float(precision=24), nullable=False, default=0)
+    fg_made_0_50 = Column(Float(precision=24), nullable=False, default=0)
+    fg_made_50_plus = Column(Float(precision=24), nullable=False, default=0)
+    points_allowed = Column(Float(precision=24), nullable=True)  # only team defenses
+
+    computed_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+Index("ix_player_projections_season_week", PlayerProjection.season_id, PlayerProjection.week_id)
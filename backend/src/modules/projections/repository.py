@@ -0,0 +1,57 @@
+from typing import Dict, Iterable, List
+
+import numpy as np
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from ...core.bulk import bulk_insert
+from ..leagues import models as league_models
+from ..players import models as player_models
+from ..scoring.engine import STAT_COLUMNS, StatTable
+from . import models
+
+PP = models.PlayerProjection
+
+
+def previous_week_ids(db: Session, week: league_models.Week, limit: int) -> List[int]:
+    """Ids of the `limit` weeks of the season before `week`, oldest first."""
+    W = league_models.Week
+    ids = db.execute(
+        select(W.id)
+        .where(W.season_id == week.season_id, W.week_number < week.week_number)
+        .order_by(W.week_number.desc())
+        .limit(limit)
+    ).scalars().all()
+    return [int(i) for i in reversed(ids)]
+
+
+def player_positions(db: Session, player_ids: Iterable[int]) -> Dict[int, str]:
+    ids = list(set(int(p) for p in player_ids))
+    if not ids:
+        return {}
+    rows = db.execute(
+        select(player_models.Player.id, player_models.Player.position).where(player_models.Player.id.in_(ids))
+    ).all()
+    return {int(pid): position for pid, position in rows}
+
+
+def load_week(db: Session, week_id: int) -> StatTable:
+    """Stored projections of a week, ordered by player_id."""
+    cols = [getattr(PP, c) for c in STAT_COLUMNS]
+    rows = db.execute(select(PP.player_id, *cols).where(PP.week_id == week_id).order_by(PP.player_id)).all()
+    if not rows:
+        return StatTable(player_ids=np.zeros(0, dtype=np.int64), values=np.zeros((0, len(STAT_COLUMNS))))
+    arr = np.array(rows, dtype=np.float64)
+    return StatTable(player_ids=arr[:, 0].astype(np.int64), values=arr[:, 1:])
+
+
+def replace_week(db: Session, *, season_id: int, week_id: int, lines: StatTable, games: np.ndarray) -> int:
+    """Replace the stored projections of a week. No commit."""
+    db.execute(delete(PP).where(PP.week_id == week_id))
+    rows = []
+    for pid, line, n in zip(lines.player_ids.tolist(), lines.values.tolist(), games.tolist()):
+        row = {"week_id": week_id, "player_id": pid, "season_id": season_id, "games": n}
+        row.update({c: (None if v != v else round(v, 3)) for c, v in zip(STAT_COLUMNS, line)})
+        rows.append(row)
+    bulk_insert(db, PP.__table__, rows, returning=())
+    return len(rows)
@@ -0,0 +1,42 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import status
+from sqlalchemy.orm import Session
+
+from ...config.database import get_db
+from ..users.router import get_current_user
+from . import service
+
+router = APIRouter(prefix="/projections", tags=["projections"])
+
+
+@router.get("/weeks/{week_id}")
+def top_projections(
+    week_id: int,
+    league_id: Optional[int] = Query(None, description="Puntos con el sistema de puntuación de esta liga"),
+    position: Optional[str] = Query(None),
+    limit: int = Query(50, ge=1, le=500),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    """Jugadores con mayor proyección de la semana (puntuación por defecto si no se indica liga)."""
+    try:
+        return service.top_projections(db, week_id=week_id, league_id=league_id, position=position, limit=limit)
+    except LookupError as le:
+        raise HTTPException(status_code=404, detail=str(le))
+
+
+@router.post("/weeks/{week_id}/compute")
+def compute_week(
+    week_id: int,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    """Recalcula y guarda las proyecciones de la semana (solo admin)."""
+    if getattr(current_user, "role", None) != "admin":
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin only")
+    try:
+        return service.compute_week(db, week_id=week_id)
+    except LookupError as le:
+        raise HTTPException(status_code=404, detail=str(le))
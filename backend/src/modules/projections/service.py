@@ -0,0 +1,175 @@
+"""
+Projections service.
+
+`projections` (one per worker) serves projected lines and projected fantasy
+points. Lines of a week are read once from `player_projections` (or, when the
+week was never computed, projected in memory from the stats) and kept for
+`PROJECTION_TTL`. Points are cached per (week, scoring key), where the key is
+the interned scoring identity (leagues.interning.scoring_key): every league on
+DEFAULT_SCORING shares one scored array instead of scoring the catalog again.
+
+`compute_week` stores a week's projections; stat ingestion calls it for the
+following week once that week's stats are committed.
+"""
+from __future__ import annotations
+
+import heapq
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from ..fantasy_teams.lineup import normalize_position
+from ..leagues import models as league_models
+from ..leagues.config import get_league_config
+from ..leagues.interning import compiled_scoring, scoring_key
+from ..leagues.services.league_service import DEFAULT_SCORING
+from ..players.availability import pool
+from ..scoring import engine as scoring_engine
+from ..stats import repository as stats_repository
+from . import engine, repository
+
+logger = logging.getLogger(__name__)
+
+PROJECTION_TTL = 300.0
+# (week, scoring key) point arrays kept; the least recently used is dropped
+MAX_POINT_SETS = 512
+
+
+def _project(db: Session, week: league_models.Week) -> Tuple[scoring_engine.StatTable, np.ndarray]:
+    week_ids = repository.previous_week_ids(db, week, engine.LOOKBACK_WEEKS)
+    history = stats_repository.load_weeks(db, week_ids)
+    tables = [history[w] for w in week_ids]
+    ids = np.unique(np.concatenate([t.player_ids for t in tables])) if tables else []
+    return engine.project(tables, repository.player_positions(db, ids))
+
+
+class ProjectionStore:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._lines: Dict[int, Tuple[float, scoring_engine.StatTable]] = {}
+        self._points: "OrderedDict[Tuple[int, str], Dict[int, float]]" = OrderedDict()
+
+    def invalidate(self, week_id: Optional[int] = None) -> None:
+        with self._lock:
+            if week_id is None:
+                self._lines.clear()
+                self._points.clear()
+                return
+            self._lines.pop(week_id, None)
+            for key in [k for k in self._points if k[0] == week_id]:
+                del self._points[key]
+
+    def compute_week(self, db: Session, week: league_models.Week) -> int:
+        """Project every player for `week` from the season's previous weeks and store it. Commits."""
+        lines, games = _project(db, week)
+        try:
+            n = repository.replace_week(db, season_id=week.season_id, week_id=week.id, lines=lines, games=games)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        self.invalidate(week.id)
+        return n
+
+    def compute_next_week(self, db: Session, *, season_id: int, week_number: int) -> None:
+        """After a week's stats changed, refresh the stored projections of the week after it."""
+        week_id = stats_repository.get_week_id(db, season_id=season_id, week_number=week_number + 1)
+        if week_id is None:
+            return
+        try:
+            self.compute_week(db, db.get(league_models.Week, week_id))
+        except Exception:
+            logger.exception("Projection refresh failed for week %d", week_id)
+
+    def lines(self, db: Session, week: league_models.Week) -> scoring_engine.StatTable:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._lines.get(week.id)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+        table = repository.load_week(db, week.id)
+        if not len(table):
+            table, _games = _project(db, week)
+        with self._lock:
+            if week.id in self._lines:
+                # Expired: the scored points were computed from the old lines
+                for key in [k for k in self._points if k[0] == week.id]:
+                    del self._points[key]
+            self._lines[week.id] = (now + PROJECTION_TTL, table)
+        return table
+
+    def points(
+        self, db: Session, week: league_models.Week, scoring_schema: Mapping[str, Any], allow_decimal: bool = True
+    ) -> Tuple[str, Dict[int, float]]:
+        """(scoring key, projected points of every projected player) for `week` under a scoring schema."""
+        skey = scoring_key(scoring_schema, allow_decimal)
+        table = self.lines(db, week)
+        with self._lock:
+            cached = self._points.get((week.id, skey))
+            if cached is not None:
+                self._points.move_to_end((week.id, skey))
+                return skey, cached
+        plan = scoring_engine.build_plan([compiled_scoring(scoring_schema, allow_decimal)])
+        scored = scoring_engine.score(table, plan)[:, 0]
+        points = dict(zip(table.player_ids.tolist(), scored.tolist()))
+        with self._lock:
+            self._points[(week.id, skey)] = points
+            while len(self._points) > MAX_POINT_SETS:
+                self._points.popitem(last=False)
+        return skey, points
+
+    def project_points(self, db: Session, league, week: league_models.Week, player_ids: Iterable[int]) -> Dict[int, float]:
+        """Projected points of some players under the league's scoring (0 without history)."""
+        _key, points = self.points(db, week, league.scoring_schema, bool(league.allow_decimal_scoring))
+        return {int(pid): points.get(int(pid), 0.0) for pid in player_ids}
+
+
+projections = ProjectionStore()
+
+
+def _week(db: Session, week_id: int) -> league_models.Week:
+    week = db.get(league_models.Week, week_id)
+    if week is None:
+        raise LookupError("Week not found")
+    return week
+
+
+def compute_week(db: Session, *, week_id: int) -> Dict[str, Any]:
+    week = _week(db, week_id)
+    return {"week_id": week.id, "season_id": week.season_id, "players": projections.compute_week(db, week)}
+
+
+def top_projections(
+    db: Session,
+    *,
+    week_id: int,
+    league_id: Optional[int] = None,
+    position: Optional[str] = None,
+    limit: int = 50,
+) -> List[Dict[str, Any]]:
+    """Best projected players of a week, under a league's scoring (DEFAULT_SCORING without league)."""
+    week = _week(db, week_id)
+    if league_id is not None:
+        config = get_league_config(db, league_id)
+        if config.season_id != week.season_id:
+            raise LookupError("Week not found for this league's season")
+        schema, allow_decimal = config.scoring_schema, config.allow_decimal_scoring
+    else:
+        schema, allow_decimal = DEFAULT_SCORING, True
+    _key, points = projections.points(db, week, schema, allow_decimal)
+    pool.ensure(db)
+    wanted = normalize_position(position) if position else None
+    candidates = (
+        (pid, pts) for pid, pts in points.items()
+        if wanted is None or pool.position_of(pid) == wanted
+    )
+    best = heapq.nlargest(limit, candidates, key=lambda item: (item[1], -item[0]))
+    return [
+        {"player_id": pid, "position": pool.position_of(pid), "projected_points": round(pts, 2)}
+        for pid, pts in best
+    ]
@@ -0,0 +1,3 @@
+"""Scoring module package."""
+
+__all__ = ["engine", "models", "repository", "service", "live"]
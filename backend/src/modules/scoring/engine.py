@@ -0,0 +1,205 @@
+"""
+Vectorized fantasy scoring.
+
+A league's `scoring_schema` (see DEFAULT_SCORING in leagues/services/league_service.py)
+is compiled into a column of a weight matrix over a shared feature space. A week's
+stat table (one row per player, one column per stat in STAT_COLUMNS) is expanded
+into that feature space once, and a single matrix product scores every player for
+every league in the batch:
+
+    points[player, league] = features[player, :] @ weights[:, league]
+
+Rule kinds:
+- `<stat>_per_point` (e.g. passing_yards_per_point=25): one point per N yards.
+  With `allow_decimal_scoring` the stat is weighted by 1/N; without it the
+  feature is floor(yards / N) so only whole points are awarded.
+- `<stat>_le_<n>` / `<stat>_gt_<n>` (e.g. points_allowed_le_10): tiered bonuses.
+  `le` thresholds of the same stat form consecutive bands (le_10 = [.., 10],
+  le_20 = (10, 20], ...) and `gt_<n>` covers (n, ..). Players whose stat is
+  missing (NaN, e.g. points_allowed for non-defenses) match no band.
+- anything else: points per unit of the mapped stat (e.g. passing_td=4).
+"""
+from __future__ import annotations
+
+import math
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Per-player weekly stat columns, in storage order
+STAT_COLUMNS: Tuple[str, ...] = (
+    "passing_yards",
+    "passing_td",
+    "interception",
+    "rushing_yards",
+    "receptions",
+    "receiving_yards",
+    "rush_recv_td",
+    "sack",
+    "def_interception",
+    "fumble_recovered",
+    "safety",
+    "def_td",
+    "team_def_2pt_return",
+    "pat_made",
+    "fg_made_0_50",
+    "fg_made_50_plus",
+    "points_allowed",
+)
+STAT_INDEX: Dict[str, int] = {name: i for i, name in enumerate(STAT_COLUMNS)}
+
+# Stats where "no value" is meaningful (NaN) instead of zero
+NULLABLE_STATS = frozenset({"points_allowed"})
+
+# Scoring rule -> stat column for rules whose name differs from the stat
+RULE_STATS: Dict[str, str] = {
+    "reception": "receptions",
+    "any_td": "def_td",
+}
+
+_PER_POINT = re.compile(r"^(?P<stat>[a-z0-9_]+)_per_point$")
+_TIER = re.compile(r"^(?P<stat>[a-z0-9_]+?)_(?P<op>le|gt)_(?P<n>\d+)$")
+
+# Feature kinds: ("stat", col) | ("floor", col, divisor) | ("band", col, lo, hi)
+Feature = Tuple
+
+
+@dataclass(frozen=True)
+class StatTable:
+    """A week of stat lines: `values[i]` is the stat row of `player_ids[i]` (NaN = not applicable)."""
+    player_ids: np.ndarray
+    values: np.ndarray
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Mapping]) -> "StatTable":
+        """Build from dicts with a `player_id` key plus any STAT_COLUMNS (missing stats are 0 / NaN)."""
+        ids: List[int] = []
+        data: List[List[float]] = []
+        for row in rows:
+            ids.append(int(row["player_id"]))
+            line = []
+            for name in STAT_COLUMNS:
+                v = row.get(name)
+                line.append(float(v) if v is not None else (math.nan if name in NULLABLE_STATS else 0.0))
+            data.append(line)
+        values = np.array(data, dtype=np.float64).reshape(len(ids), len(STAT_COLUMNS))
+        return cls(player_ids=np.array(ids, dtype=np.int64), values=values)
+
+    def __len__(self) -> int:
+        return int(self.player_ids.shape[0])
+
+
+@dataclass(frozen=True)
+class CompiledRule:
+    """One scoring schema reduced to (feature, weight) terms."""
+    terms: Tuple[Tuple[Feature, float], ...]
+
+
+@dataclass(frozen=True)
+class ScoringPlan:
+    """Shared feature space plus one weight column per compiled schema."""
+    features: Tuple[Feature, ...]
+    weights: np.ndarray  # (n_features, n_schemas)
+
+
+def _stat_for_rule(rule: str) -> str:
+    stat = RULE_STATS.get(rule, rule)
+    if stat not in STAT_INDEX:
+        raise ValueError(f"Unknown scoring rule '{rule}'")
+    return stat
+
+
+def compile_schema(schema: Mapping[str, float], *, allow_decimal: bool = True) -> CompiledRule:
+    """Translate a scoring schema into (feature, weight) terms."""
+    terms: List[Tuple[Feature, float]] = []
+    tiers: Dict[str, Dict[str, List[Tuple[int, float]]]] = {}
+
+    for rule, value in schema.items():
+        value = float(value)
+        m = _PER_POINT.match(rule)
+        if m:
+            stat = _stat_for_rule(m.group("stat"))
+            if value <= 0:
+                continue
+            if allow_decimal:
+                terms.append((("stat", STAT_INDEX[stat]), 1.0 / value))
+            else:
+                terms.append((("floor", STAT_INDEX[stat], value), 1.0))
+            continue
+        m = _TIER.match(rule)
+        if m and m.group("stat") in STAT_INDEX:
+            tiers.setdefault(m.group("stat"), {"le": [], "gt": []})[m.group("op")].append((int(m.group("n")), value))
+            continue
+        if value:
+            terms.append((("stat", STAT_INDEX[_stat_for_rule(rule)]), value))
+
+    for stat, ops in tiers.items():
+        col = STAT_INDEX[stat]
+        lo = -math.inf
+        for n, value in sorted(ops["le"]):
+            if value:
+                terms.append((("band", col, lo, float(n)), value))
+            lo = float(n)
+        for n, value in ops["gt"]:
+            if value:
+                terms.append((("band", col, float(n), math.inf), value))
+
+    return CompiledRule(terms=tuple(terms))
+
+
+def build_plan(compiled: Sequence[CompiledRule], *, dtype=np.float64) -> ScoringPlan:
+    """Stack compiled schemas into one weight matrix over the union of their features."""
+    index: Dict[Feature, int] = {}
+    for rule in compiled:
+        for feature, _w in rule.terms:
+            index.setdefault(feature, len(index))
+    weights = np.zeros((len(index), len(compiled)), dtype=dtype)
+    for j, rule in enumerate(compiled):
+        for feature, w in rule.terms:
+            weights[index[feature], j] += w
+    return ScoringPlan(features=tuple(index), weights=weights)
+
+
+def compile_plan(
+    schemas: Sequence[Mapping[str, float]],
+    allow_decimal: Optional[Sequence[bool]] = None,
+    *,
+    dtype=np.float64,
+) -> ScoringPlan:
+    if allow_decimal is None:
+        allow_decimal = [True] * len(schemas)
+    return build_plan(
+        [compile_schema(s, allow_decimal=bool(d)) for s, d in zip(schemas, allow_decimal)],
+        dtype=dtype,
+    )
+
+
+def feature_matrix(stats: StatTable, features: Sequence[Feature], *, dtype=np.float64) -> np.ndarray:
+    """Expand the stat table into the plan's feature space, shape (n_players, n_features)."""
+    x = np.empty((len(stats), len(features)), dtype=dtype)
+    values = stats.values
+    for k, feature in enumerate(features):
+        kind, col = feature[0], feature[1]
+        column = values[:, col]
+        if kind == "stat":
+            x[:, k] = np.nan_to_num(column, nan=0.0)
+        elif kind == "floor":
+            x[:, k] = np.floor(np.nan_to_num(column, nan=0.0) / feature[2])
+        else:  # band: lo < v <= hi; NaN compares False so it matches no band
+            with np.errstate(invalid="ignore"):
+                x[:, k] = (column > feature[2]) & (column <= feature[3])
+    return x
+
+
+def score(stats: StatTable, plan: ScoringPlan) -> np.ndarray:
+    """Points for every player under every schema in the plan, shape (n_players, n_schemas), rounded to 2 decimals."""
+    x = feature_matrix(stats, plan.features, dtype=plan.weights.dtype)
+    return np.round(x @ plan.weights, 2)
+
+
+def score_league(stats: StatTable, schema: Mapping[str, float], *, allow_decimal: bool = True) -> np.ndarray:
+    """Convenience wrapper for a single league: points per player, shape (n_players,)."""
+    plan = build_plan([compile_schema(schema, allow_decimal=allow_decimal)])
+    return score(stats, plan)[:, 0]
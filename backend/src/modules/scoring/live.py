@@ -0,0 +1,324 @@
+"""
+Incremental live scoring.
+
+`fantasy_team_week_scores` holds one materialized total per (fantasy team, week):
+the sum of the week points of the team's starters under its league's schema.
+Starters come from the lineups frozen for that week
+(`fantasy_team_week_lineups`): the first time a week is scored every team's
+current roster and slots are frozen for it, so a stat correction or re-ingest
+of a past week is rescored with that week's starters, not today's.
+When a stat line changes only the rosters holding that player are touched:
+
+- an in-memory inverted index per week maps player_id -> [(league_id,
+  fantasy_team_id)] for every starter slot of the week's frozen lineups (one
+  query to build, see fantasy_teams.repository);
+- for each of those entries the delta is score(new line) - score(old line)
+  under that league's compiled schema (scoring.engine; leagues sharing a
+  schema share one compiled column, see leagues.interning), and is added to the
+  team total with one `INSERT ... ON CONFLICT DO UPDATE SET points = points + delta`.
+
+Live updates are submitted per player and coalesced for `window` seconds: a
+burst of updates for the same player collapses to the latest line (feeds send
+cumulative lines), and the whole burst is flushed in one transaction.
+
+Every writer of a week's lines and totals (apply_lines, recompute_teams and
+stats ingest_week through `lock_week_stats`) first takes a transaction-level
+advisory lock on the week, so a delta is always computed from the line the
+previous writer committed, whatever process wrote it; flushes within one
+process are also serialized so they do not queue on pooled connections.
+
+The indexes live in process memory (the last MAX_INDEXED_WEEKS weeks). Code
+that changes rosters calls `scorer.refresh_players(...)` so teams without a
+frozen lineup for an indexed week get one; leagues whose scoring schema
+changes call `scorer.invalidate_league(...)`. Listeners registered
+with `scorer.add_listener(...)` receive the new totals once they are committed.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict, defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from ...config.database import SessionLocal
+from ..fantasy_teams import repository as ft_repository
+from ..leagues.interning import league_scoring_rules
+from ..stats import repository as stats_repository
+from . import engine, repository
+from .repository import TeamPoints
+
+logger = logging.getLogger(__name__)
+
+# Default coalescing window for live updates, in seconds
+DEFAULT_WINDOW = 0.25
+# Weeks whose player -> starters index is kept in memory
+MAX_INDEXED_WEEKS = 4
+
+Entry = Tuple[int, int]  # (league_id, fantasy_team_id)
+Listener = Callable[[int, TeamPoints], None]
+
+
+def _entry_points(
+    stats: engine.StatTable,
+    rows: np.ndarray,
+    plan: engine.ScoringPlan,
+    cols: np.ndarray,
+) -> np.ndarray:
+    """Points of player row `rows[e]` under plan column `cols[e]`, for every entry e."""
+    x = engine.feature_matrix(stats, plan.features, dtype=plan.weights.dtype)
+    return np.round(np.einsum("ef,ef->e", x[rows], plan.weights.T[cols]), 2)
+
+
+def _aligned(stats: engine.StatTable, player_ids: List[int]) -> engine.StatTable:
+    """Reorder `stats` to `player_ids`; players without a line get an empty (all-zero) line."""
+    empty = engine.StatTable.from_rows([{"player_id": 0}]).values[0]
+    by_id = {int(pid): i for i, pid in enumerate(stats.player_ids)}
+    values = np.array(
+        [stats.values[by_id[pid]] if pid in by_id else empty for pid in player_ids],
+        dtype=np.float64,
+    ).reshape(len(player_ids), len(engine.STAT_COLUMNS))
+    return engine.StatTable(player_ids=np.array(player_ids, dtype=np.int64), values=values)
+
+
+class LiveScorer:
+    def __init__(self, *, window: float = DEFAULT_WINDOW, session_factory=SessionLocal):
+        self.window = window
+        self._session_factory = session_factory
+        self._lock = threading.RLock()
+        self._indexes: "OrderedDict[int, Dict[int, List[Entry]]]" = OrderedDict()  # week_id -> index
+        self._rules: Dict[int, Tuple[str, engine.CompiledRule]] = {}  # league_id -> (scoring key, rule)
+        self._pending: Dict[Tuple[int, int], Dict[str, Any]] = {}
+        self._timer: Optional[threading.Timer] = None
+        self._flush_lock = threading.Lock()
+        self._listeners: List[Listener] = []
+
+    # ---- inverted index
+
+    def _lock_week(self, week_id: int) -> None:
+        # Own short transaction: the freeze is idempotent and must not depend
+        # on the caller's transaction committing
+        db = self._session_factory()
+        try:
+            ft_repository.lock_week_lineups(db, week_id)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def _ensure_index(self, db: Session, week_id: int) -> Dict[int, List[Entry]]:
+        with self._lock:
+            index = self._indexes.get(week_id)
+            if index is not None:
+                self._indexes.move_to_end(week_id)
+                return index
+        self._lock_week(week_id)
+        index = defaultdict(list)
+        for player_id, league_id, team_id in ft_repository.list_week_starter_entries(db, week_id):
+            index[int(player_id)].append((int(league_id), int(team_id)))
+        with self._lock:
+            self._indexes[week_id] = index
+            while len(self._indexes) > MAX_INDEXED_WEEKS:
+                self._indexes.popitem(last=False)
+        return index
+
+    def rebuild_index(self, db: Session, week_id: int) -> int:
+        """Reload a week's player -> starters index. Returns the number of indexed players."""
+        with self._lock:
+            self._indexes.pop(week_id, None)
+        return len(self._ensure_index(db, week_id))
+
+    def refresh_players(self, db: Session, player_ids: Iterable[int]) -> None:
+        """
+        After a roster change. Frozen week lineups keep their players; the
+        week indexes are dropped so that teams with no lineup yet for those
+        weeks (e.g. drafted or joined meanwhile) are frozen on next use.
+        """
+        if not any(True for _ in player_ids):
+            return
+        with self._lock:
+            self._indexes.clear()
+
+    def invalidate_league(self, league_id: int) -> None:
+        """Forget a league's compiled schema (call after its scoring_schema changes)."""
+        with self._lock:
+            self._rules.pop(league_id, None)
+
+    def entries_for(self, db: Session, week_id: int, player_ids: Iterable[int]) -> Dict[int, List[Entry]]:
+        index = self._ensure_index(db, week_id)
+        with self._lock:
+            return {int(pid): list(index[pid]) for pid in player_ids if pid in index}
+
+    def _plan(self, db: Session, league_ids: List[int]) -> Tuple[engine.ScoringPlan, Dict[int, int]]:
+        """One plan column per distinct scoring schema, and the column of each league."""
+        with self._lock:
+            missing = [lid for lid in league_ids if lid not in self._rules]
+        if missing:
+            loaded = league_scoring_rules(db, repository.get_league_scoring(db, missing))
+            with self._lock:
+                self._rules.update(loaded)
+        with self._lock:
+            rules = {lid: self._rules[lid] for lid in league_ids}
+        distinct = dict(rules.values())
+        col_of_key = {key: j for j, key in enumerate(distinct)}
+        plan = engine.build_plan(list(distinct.values()))
+        return plan, {lid: col_of_key[key] for lid, (key, _rule) in rules.items()}
+
+    # ---- scoring
+
+    def _points(
+        self,
+        db: Session,
+        stats: engine.StatTable,
+        entries: Mapping[int, List[Entry]],
+    ) -> Tuple[List[Entry], np.ndarray]:
+        """Per roster entry of the players in `stats`: the entry and the player's points."""
+        row_of = {int(pid): i for i, pid in enumerate(stats.player_ids)}
+        flat: List[Entry] = []
+        rows: List[int] = []
+        for pid, player_entries in entries.items():
+            if pid in row_of:
+                flat.extend(player_entries)
+                rows.extend([row_of[pid]] * len(player_entries))
+        if not flat:
+            return [], np.zeros(0)
+        league_ids = sorted({lid for lid, _ in flat})
+        plan, col_of = self._plan(db, league_ids)
+        cols = np.array([col_of[lid] for lid, _ in flat], dtype=np.int64)
+        return flat, _entry_points(stats, np.array(rows, dtype=np.int64), plan, cols)
+
+    def apply_lines(self, db: Session, week_id: int, lines: List[Dict[str, Any]]) -> TeamPoints:
+        """
+        Write new stat lines for one week and propagate the point deltas to the
+        materialized team totals, in the caller's transaction (no commit).
+        Returns the new totals of the teams whose total changed.
+        """
+        if not lines:
+            return {}
+        self.lock_week_stats(db, week_id)
+        player_ids = sorted({int(line["player_id"]) for line in lines})
+        old = _aligned(stats_repository.load_lines(db, week_id=week_id, player_ids=player_ids), player_ids)
+
+        written = set(stats_repository.upsert_week(db, [{**line, "week_id": week_id} for line in lines]))
+        entries = self.entries_for(db, week_id, written)
+        if not entries:
+            return {}
+
+        new = _aligned(engine.StatTable.from_rows(lines), player_ids)
+        flat, before = self._points(db, old, entries)
+        _flat, after = self._points(db, new, entries)
+
+        deltas: TeamPoints = defaultdict(float)
+        for entry, delta in zip(flat, after - before):
+            if delta:
+                deltas[entry] += float(delta)
+        deltas = {k: round(v, 2) for k, v in deltas.items() if round(v, 2)}
+        return repository.apply_deltas(db, week_id, deltas)
+
+    @staticmethod
+    def lock_week_stats(db: Session, week_id: int) -> None:
+        """Hold the week's stat write lock until the caller's transaction ends (see scoring.repository)."""
+        repository.lock_week_stats(db, week_id)
+
+    def recompute_teams(self, db: Session, week_id: int, fantasy_team_ids: Iterable[int]) -> TeamPoints:
+        """Recompute the totals of some teams from their lineup frozen for the week and its stat lines. No commit."""
+        team_ids = {int(t) for t in fantasy_team_ids}
+        if not team_ids:
+            return {}
+        self._lock_week(week_id)
+        self.lock_week_stats(db, week_id)
+        rows = ft_repository.list_week_starter_entries(db, week_id, fantasy_team_ids=team_ids)
+        entries: Dict[int, List[Entry]] = defaultdict(list)
+        league_of: Dict[int, int] = {}
+        for player_id, league_id, team_id in rows:
+            entries[int(player_id)].append((int(league_id), int(team_id)))
+            league_of[int(team_id)] = int(league_id)
+
+        stats = stats_repository.load_lines(db, week_id=week_id, player_ids=entries.keys())
+        flat, points = self._points(db, stats, entries)
+        totals: TeamPoints = defaultdict(float)
+        for team_id, league_id in league_of.items():
+            totals[(league_id, team_id)] = 0.0
+        for entry, value in zip(flat, points):
+            totals[entry] += float(value)
+        totals = {k: round(v, 2) for k, v in totals.items()}
+        return repository.replace_totals(db, week_id, totals)
+
+    def recompute_for_players(self, db: Session, week_id: int, player_ids: Iterable[int]) -> TeamPoints:
+        """Recompute every team that starts one of `player_ids` (after a bulk stat load). No commit."""
+        team_ids = {team_id for es in self.entries_for(db, week_id, player_ids).values() for _lid, team_id in es}
+        if not team_ids:
+            return {}
+        return self.recompute_teams(db, week_id, team_ids)
+
+    # ---- coalesced live updates
+
+    def submit(self, week_id: int, line: Dict[str, Any]) -> None:
+        """Queue a player's current stat line; flushed together with the rest of the burst."""
+        with self._lock:
+            self._pending[(week_id, int(line["player_id"]))] = line
+            if self._timer is None:
+                self._timer = threading.Timer(self.window, self.flush_pending)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush_pending(self) -> Dict[int, TeamPoints]:
+        """Apply every queued line in one transaction and notify listeners. Returns the new totals per week."""
+        with self._lock:
+            batch, self._pending = self._pending, {}
+            self._timer = None
+        if not batch:
+            return {}
+
+        by_week: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+        for (week_id, _pid), line in batch.items():
+            by_week[week_id].append(line)
+
+        # A burst queued while this flush runs waits for it (its lines are newer)
+        with self._flush_lock:
+            db = self._session_factory()
+            try:
+                # Weeks in id order, so concurrent flushes take the week locks in the same order
+                result = {week_id: self.apply_lines(db, week_id, by_week[week_id]) for week_id in sorted(by_week)}
+                db.commit()
+            except Exception:
+                db.rollback()
+                logger.exception("Live scoring flush failed for %d lines", len(batch))
+                with self._lock:
+                    # Keep newer lines queued meanwhile; retry the failed ones on the next burst
+                    for key, line in batch.items():
+                        self._pending.setdefault(key, line)
+                return {}
+            finally:
+                db.close()
+
+        for week_id, totals in result.items():
+            self.notify(week_id, totals)
+        return result
+
+    # ---- listeners
+
+    def add_listener(self, listener: Listener) -> None:
+        """Register `listener(week_id, totals)`, called after totals are committed."""
+        with self._lock:
+            if listener not in self._listeners:
+                self._listeners.append(listener)
+
+    def notify(self, week_id: int, totals: TeamPoints) -> None:
+        """Tell listeners about committed totals (call after commit when using apply_lines/recompute_* directly)."""
+        if not totals:
+            return
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(week_id, totals)
+            except Exception:
+                logger.exception("Live scoring listener failed")
+
+
+scorer = LiveScorer()
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, Integer, BigInteger, Numeric, DateTime, ForeignKey, Index, func
+from ...config.database import Base
+
+
+class FantasyTeamWeekScore(Base):
+    """Materialized weekly total of a fantasy team's starters, maintained by scoring.live."""
+    __tablename__ = "fantasy_team_week_scores"
+
+    fantasy_team_id = Column(BigInteger, ForeignKey("fantasy_teams.id", ondelete="CASCADE"), primary_key=True)
+    week_id = Column(Integer, ForeignKey("weeks.id", ondelete="CASCADE"), primary_key=True)
+    league_id = Column(Integer, ForeignKey("leagues.id", ondelete="CASCADE"), nullable=False)
+    points = Column(Numeric(10, 2), nullable=False, default=0)  # exact decimal: deltas never drift
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+
+# League scoreboard for a week
+Index("ix_fantasy_team_week_scores_league_week", FantasyTeamWeekScore.league_id, FantasyTeamWeekScore.week_id)
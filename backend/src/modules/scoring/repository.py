@@ -0,0 +1,84 @@
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import case, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+
+from ..leagues import models as league_models
+from . import models
+
+# (league_id, fantasy_team_id) -> points
+TeamPoints = Dict[Tuple[int, int], float]
+
+# Advisory lock namespace of the per-week stat writes (pg_advisory_xact_lock(namespace, week_id))
+WEEK_STATS_LOCK = 7301
+
+
+def get_league_scoring(
+    db: Session, league_ids: Optional[Iterable[int]] = None
+) -> Dict[int, Tuple[Optional[int], Optional[dict], bool]]:
+    """
+    league_id -> (scoring_schema_id, scoring_schema, allow_decimal_scoring).
+    The JSONB is only read for leagues not interned yet (scoring_schema_id NULL).
+    """
+    L = league_models.League
+    stmt = select(
+        L.id,
+        L.scoring_schema_id,
+        case((L.scoring_schema_id.is_(None), L.scoring_schema), else_=None),
+        L.allow_decimal_scoring,
+    )
+    if league_ids is not None:
+        stmt = stmt.where(L.id.in_(list(league_ids)))
+    return {
+        int(lid): (int(sid) if sid is not None else None, schema, bool(dec))
+        for lid, sid, schema, dec in db.execute(stmt).all()
+    }
+
+
+def lock_week_stats(db: Session, week_id: int) -> None:
+    """
+    Serialize the writers of one week's stat lines and team totals until the
+    transaction ends, across sessions and processes. Take it before reading
+    the old lines a delta is computed from.
+    """
+    db.execute(select(func.pg_advisory_xact_lock(WEEK_STATS_LOCK, week_id)))
+
+
+def _upsert(db: Session, week_id: int, points: TeamPoints, *, accumulate: bool) -> TeamPoints:
+    if not points:
+        return {}
+    table = models.FantasyTeamWeekScore.__table__
+    stmt = pg_insert(table)
+    new_points = table.c.points + stmt.excluded.points if accumulate else stmt.excluded.points
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["fantasy_team_id", "week_id"],
+        set_={"points": new_points, "updated_at": func.now()},
+    )
+    stmt = stmt.returning(table.c.league_id, table.c.fantasy_team_id, table.c.points)
+    result = db.execute(stmt, [
+        {"fantasy_team_id": team_id, "week_id": week_id, "league_id": league_id, "points": value}
+        for (league_id, team_id), value in points.items()
+    ])
+    return {(int(lid), int(tid)): float(p) for lid, tid, p in result}
+
+
+def apply_deltas(db: Session, week_id: int, deltas: TeamPoints) -> TeamPoints:
+    """Add point deltas to the materialized totals (rows are created at the delta). Returns the new totals. No commit."""
+    return _upsert(db, week_id, deltas, accumulate=True)
+
+
+def replace_totals(db: Session, week_id: int, totals: TeamPoints) -> TeamPoints:
+    """Overwrite the materialized totals of the given teams. No commit."""
+    return _upsert(db, week_id, totals, accumulate=False)
+
+
+def get_week_totals(db: Session, *, league_id: int, week_id: int) -> Dict[int, float]:
+    rows = db.execute(
+        select(models.FantasyTeamWeekScore.fantasy_team_id, models.FantasyTeamWeekScore.points).where(
+            models.FantasyTeamWeekScore.league_id == league_id,
+            models.FantasyTeamWeekScore.week_id == week_id,
+        )
+    ).all()
+    return {int(tid): float(p) for tid, p in rows}
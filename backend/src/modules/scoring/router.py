@@ -0,0 +1,94 @@
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from ...config.database import SessionLocal, get_db
+from ...core import sse
+from ...core.pubsub import hub
+from ..leagues import models as league_models
+from ..users.router import get_current_user
+from . import repository
+from .repository import TeamPoints
+
+router = APIRouter(prefix="/leagues", tags=["scoreboard"])
+
+
+def channel_for(league_id: int) -> str:
+    return f"league:{league_id}:scores"
+
+
+def publish_totals(week_id: int, totals: TeamPoints) -> None:
+    """LiveScorer listener: fan committed team totals out to the league channels."""
+    for (league_id, team_id), points in totals.items():
+        hub.publish(
+            channel_for(league_id),
+            (week_id, team_id),
+            {"week_id": week_id, "fantasy_team_id": team_id, "points": points},
+        )
+
+
+def _snapshot(db: Session, league_id: int, week_id: int) -> Dict[str, Any]:
+    if db.get(league_models.League, league_id) is None:
+        raise LookupError("League not found")
+    totals = repository.get_week_totals(db, league_id=league_id, week_id=week_id)
+    return {
+        "league_id": league_id,
+        "week_id": week_id,
+        "teams": [{"fantasy_team_id": tid, "points": p} for tid, p in sorted(totals.items())],
+    }
+
+
+def _authorized_snapshot(token: str, league_id: int, week_id: int) -> Dict[str, Any]:
+    # Short-lived session: a stream must not hold a pooled connection while idle
+    db = SessionLocal()
+    try:
+        get_current_user(token, db)
+        return _snapshot(db, league_id, week_id)
+    finally:
+        db.close()
+
+
+@router.get("/{league_id}/scoreboard")
+def get_scoreboard(
+    league_id: int,
+    week_id: int = Query(...),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    try:
+        return _snapshot(db, league_id, week_id)
+    except LookupError as le:
+        raise HTTPException(status_code=404, detail=str(le))
+
+
+@router.get("/{league_id}/scoreboard/stream")
+async def stream_scoreboard(
+    league_id: int,
+    request: Request,
+    week_id: int = Query(...),
+    access_token: Optional[str] = Query(None, description="For EventSource clients that cannot send headers"),
+):
+    """
+    Server-sent events: a `snapshot` event with the current totals, then one
+    `score` event per changed team total. A `resync` event means updates were
+    dropped for a slow client and the snapshot should be fetched again.
+    """
+    token = sse.request_token(request, access_token)
+    # Subscribe before reading the snapshot so no update falls in between
+    sub = hub.subscribe(channel_for(league_id))
+    try:
+        snapshot = await run_in_threadpool(_authorized_snapshot, token, league_id, week_id)
+    except LookupError as le:
+        sub.close()
+        raise HTTPException(status_code=404, detail=str(le))
+    except BaseException:
+        sub.close()
+        raise
+
+    def render(messages, overflowed) -> str:
+        chunk = sse.format_event("resync", {"league_id": league_id, "week_id": week_id}) if overflowed else ""
+        return chunk + "".join(sse.format_event("score", m) for m in messages if m["week_id"] == week_id)
+
+    return sse.stream(sub, sse.format_event("snapshot", snapshot), render)
@@ -0,0 +1,42 @@
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from ..leagues import models as league_models
+from ..leagues.interning import league_scoring_rules
+from . import engine
+
+
+def score_week_for_leagues(
+    db: Session,
+    stats: engine.StatTable,
+    leagues: Sequence[league_models.League],
+) -> Tuple[List[int], np.ndarray]:
+    """
+    Score one week's stat table for many leagues at once.
+    Returns (league_ids, points) where points has shape (n_players, n_leagues),
+    rows in `stats.player_ids` order and columns in `league_ids` order.
+    Leagues are grouped by scoring_schema_id (each stored schema is loaded and
+    compiled once); leagues with the same scoring share one computed column.
+    """
+    rules = league_scoring_rules(
+        db,
+        {
+            lg.id: (
+                lg.scoring_schema_id,
+                lg.scoring_schema if lg.scoring_schema_id is None else None,
+                bool(lg.allow_decimal_scoring),
+            )
+            for lg in leagues
+        },
+    )
+    distinct = dict(rules.values())
+    col_of_key = {key: j for j, key in enumerate(distinct)}
+    points = engine.score(stats, engine.build_plan(list(distinct.values())))
+    return [lg.id for lg in leagues], points[:, [col_of_key[rules[lg.id][0]] for lg in leagues]]
+
+
+def points_by_player(stats: engine.StatTable, points: np.ndarray) -> Dict[int, float]:
+    """Map player_id -> points for a single league column."""
+    return {int(pid): float(p) for pid, p in zip(stats.player_ids, points)}
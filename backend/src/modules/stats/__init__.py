@@ -0,0 +1,3 @@
+"""Player weekly stats module package."""
+
+__all__ = ["models", "repository", "service", "router"]
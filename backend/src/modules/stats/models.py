@@ -0,0 +1,38 @@
+from sqlalchemy import Column, Integer, BigInteger, SmallInteger, ForeignKey, Index
+from ...config.database import Base
+from ..scoring.engine import STAT_COLUMNS
+
+
+class PlayerWeekStat(Base):
+    """One stat line per (week, player). Narrow typed columns keep a whole week in a few pages."""
+    __tablename__ = "player_week_stats"
+
+    week_id = Column(Integer, ForeignKey("weeks.id", ondelete="CASCADE"), primary_key=True)
+    player_id = Column(BigInteger, ForeignKey("players.id", ondelete="CASCADE"), primary_key=True)
+
+    passing_yards = Column(SmallInteger, nullable=False, default=0)
+    passing_td = Column(SmallInteger, nullable=False, default=0)
+    interception = Column(SmallInteger, nullable=False, default=0)
+    rushing_yards = Column(SmallInteger, nullable=False, default=0)
+    receptions = Column(SmallInteger, nullable=False, default=0)
+    receiving_yards = Column(SmallInteger, nullable=False, default=0)
+    rush_recv_td = Column(SmallInteger, nullable=False, default=0)
+    sack = Column(SmallInteger, nullable=False, default=0)
+    def_interception = Column(SmallInteger, nullable=False, default=0)
+    fumble_recovered = Column(SmallInteger, nullable=False, default=0)
+    safety = Column(SmallInteger, nullable=False, default=0)
+    def_td = Column(SmallInteger, nullable=False, default=0)
+    team_def_2pt_return = Column(SmallInteger, nullable=False, default=0)
+    pat_made = Column(SmallInteger, nullable=False, default=0)
+    fg_made_0_50 = Column(SmallInteger, nullable=False, default=0)
+    fg_made_50_plus = Column(SmallInteger, nullable=False, default=0)
+    points_allowed = Column(SmallInteger, nullable=True)  # only team defenses
+
+
+# Covering index: a whole week is read with one index-only scan
+Index(
+    "ix_player_week_stats_week_covering",
+    PlayerWeekStat.week_id,
+    postgresql_include=["player_id", *STAT_COLUMNS],
+)
+Index("ix_player_week_stats_player_id", PlayerWeekStat.player_id)
@@ -0,0 +1,105 @@
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
+
+import numpy as np
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from ...core.bulk import bulk_insert
+from ..leagues import models as league_models
+from ..players import models as player_models
+from ..scoring.engine import STAT_COLUMNS, StatTable
+from . import models
+
+
+def get_week_id(db: Session, *, season_id: int, week_number: int) -> Optional[int]:
+    return db.execute(
+        select(league_models.Week.id).where(
+            league_models.Week.season_id == season_id,
+            league_models.Week.week_number == week_number,
+        ).order_by(league_models.Week.id).limit(1)
+    ).scalar_one_or_none()
+
+
+def get_existing_player_ids(db: Session, player_ids: Iterable[int]) -> Set[int]:
+    ids = set(player_ids)
+    if not ids:
+        return set()
+    return set(db.execute(
+        select(player_models.Player.id).where(player_models.Player.id.in_(ids))
+    ).scalars().all())
+
+
+def upsert_week(db: Session, rows: List[Dict[str, Any]]) -> List[int]:
+    """Insert or update stat lines; unchanged lines are not written. Returns the player ids written. No commit."""
+    written = bulk_insert(
+        db,
+        models.PlayerWeekStat.__table__,
+        rows,
+        on_conflict="update",
+        conflict=["week_id", "player_id"],
+        update_columns=list(STAT_COLUMNS),
+        only_if_changed=True,
+        returning=("player_id",),
+    )
+    return [int(r[0]) for r in written]
+
+
+def delete_missing(db: Session, *, week_id: int, keep_player_ids: Iterable[int]) -> List[int]:
+    """Remove the week's lines for players not in `keep_player_ids`. Returns the removed player ids."""
+    stmt = delete(models.PlayerWeekStat).where(models.PlayerWeekStat.week_id == week_id)
+    keep = list(keep_player_ids)
+    if keep:
+        stmt = stmt.where(models.PlayerWeekStat.player_id.not_in(keep))
+    result = db.execute(stmt.returning(models.PlayerWeekStat.player_id))
+    return [int(pid) for pid in result.scalars().all()]
+
+
+def _to_table(rows: Sequence) -> StatTable:
+    if not rows:
+        return StatTable(
+            player_ids=np.zeros(0, dtype=np.int64),
+            values=np.zeros((0, len(STAT_COLUMNS)), dtype=np.float64),
+        )
+    arr = np.array(rows, dtype=np.float64)  # None (points_allowed) becomes NaN
+    return StatTable(player_ids=arr[:, 0].astype(np.int64), values=arr[:, 1:])
+
+
+def load_week(db: Session, week_id: int) -> StatTable:
+    """The whole week as a StatTable, read with one (index-only) scan, ordered by player_id."""
+    cols = [getattr(models.PlayerWeekStat, c) for c in STAT_COLUMNS]
+    rows = db.execute(
+        select(models.PlayerWeekStat.player_id, *cols)
+        .where(models.PlayerWeekStat.week_id == week_id)
+        .order_by(models.PlayerWeekStat.player_id)
+    ).all()
+    return _to_table(rows)
+
+
+def load_lines(db: Session, *, week_id: int, player_ids: Iterable[int]) -> StatTable:
+    """Stat lines of a few players for one week."""
+    ids = list(set(player_ids))
+    if not ids:
+        return _to_table([])
+    cols = [getattr(models.PlayerWeekStat, c) for c in STAT_COLUMNS]
+    rows = db.execute(
+        select(models.PlayerWeekStat.player_id, *cols)
+        .where(models.PlayerWeekStat.week_id == week_id, models.PlayerWeekStat.player_id.in_(ids))
+        .order_by(models.PlayerWeekStat.player_id)
+    ).all()
+    return _to_table(rows)
+
+
+def load_weeks(db: Session, week_ids: Sequence[int]) -> Dict[int, StatTable]:
+    """Several weeks in one query, split per week."""
+    if not week_ids:
+        return {}
+    cols = [getattr(models.PlayerWeekStat, c) for c in STAT_COLUMNS]
+    rows = db.execute(
+        select(models.PlayerWeekStat.week_id, models.PlayerWeekStat.player_id, *cols)
+        .where(models.PlayerWeekStat.week_id.in_(list(week_ids)))
+        .order_by(models.PlayerWeekStat.week_id, models.PlayerWeekStat.player_id)
+    ).all()
+    by_week: Dict[int, List] = {wid: [] for wid in week_ids}
+    for r in rows:
+        by_week[int(r[0])].append(tuple(r[1:]))
+    return {wid: _to_table(lines) for wid, lines in by_week.items()}
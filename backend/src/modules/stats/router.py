@@ -0,0 +1,73 @@
+from typing import Any, Dict, List
+
+from fastapi import APIRouter, Body, Depends, HTTPException, UploadFile, File
+from fastapi import status
+from sqlalchemy.orm import Session
+from werkzeug.utils import secure_filename
+
+from ...config.database import get_db
+from ...core.streaming import detect_format, text_stream
+from ..users.router import get_current_user
+from . import service
+
+router = APIRouter()
+
+
+def _require_admin(user) -> None:
+    if getattr(user, "role", None) != "admin":
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin role required")
+
+
+@router.post("/ingest", status_code=200)
+def ingest_drop_directory(
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    """Procesa todos los archivos pendientes en media/stats/incoming."""
+    _require_admin(current_user)
+    return {"results": service.ingest_drop_directory(db)}
+
+
+@router.post("/seasons/{season_id}/weeks/{week_number}", status_code=200)
+def upload_week_stats(
+    season_id: int,
+    week_number: int,
+    file: UploadFile = File(...),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    """Carga (o corrige) las estadísticas completas de una semana desde un .csv o .jsonl."""
+    _require_admin(current_user)
+    try:
+        fmt = detect_format(secure_filename(file.filename or ""))
+    except ValueError as ve:
+        raise HTTPException(status_code=400, detail=str(ve))
+    if fmt == "json":
+        raise HTTPException(status_code=400, detail="Se requiere un archivo .csv o .jsonl")
+
+    try:
+        return service.ingest_week(
+            db, fileobj=text_stream(file.file), fmt=fmt, season_id=season_id, week_number=week_number
+        )
+    except LookupError as le:
+        raise HTTPException(status_code=404, detail=str(le))
+    except ValueError as ve:
+        raise HTTPException(status_code=422, detail=str(ve))
+
+
+@router.post("/seasons/{season_id}/weeks/{week_number}/live", status_code=202)
+def push_live_stats(
+    season_id: int,
+    week_number: int,
+    lines: List[Dict[str, Any]] = Body(...),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    """Recibe líneas en vivo (acumuladas por jugador); los puntajes de los equipos se actualizan por delta."""
+    _require_admin(current_user)
+    try:
+        return service.queue_live_lines(db, season_id=season_id, week_number=week_number, items=lines)
+    except LookupError as le:
+        raise HTTPException(status_code=404, detail=str(le))
+    except ValueError as ve:
+        raise HTTPException(status_code=422, detail=str(ve))
@@ -0,0 +1,206 @@
+"""
+Weekly stat ingestion.
+
+Stat files (CSV or JSON Lines, one line per player keyed by `player_id`) are
+dropped into media/stats/incoming named `season<season_id>_week<week_number>.<ext>`,
+e.g. `season3_week05.csv`. Each file is the complete stat sheet for that week:
+re-ingesting a corrected file only writes the lines that changed and removes
+lines for players no longer listed.
+"""
+import math
+import re
+import shutil
+from pathlib import Path
+from typing import Any, Dict, IO, List, Optional
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ...core.streaming import detect_format, iter_records
+from ..scoring.engine import NULLABLE_STATS, STAT_COLUMNS
+from ..projections.service import projections
+from ..scoring.live import scorer
+from . import repository
+
+BASE_DIR = Path(__file__).resolve().parents[3]  # backend/
+INCOMING_DIR = BASE_DIR / "media" / "stats" / "incoming"
+PROCESSED_DIR = BASE_DIR / "media" / "stats" / "processed"
+
+_FILE_NAME = re.compile(r"^season(?P<season>\d+)_week(?P<week>\d+)\.(csv|jsonl|ndjson)$", re.IGNORECASE)
+
+# SMALLINT storage range
+_MIN, _MAX = -32768, 32767
+
+
+def _as_int(raw: Any) -> int:
+    """Integer value of a cell ("12", 12, "12.0"); ValueError for non-integral, non-finite or invalid values."""
+    if isinstance(raw, int):
+        return int(raw)
+    if isinstance(raw, str):
+        try:
+            return int(raw.strip())
+        except ValueError:
+            pass
+    try:
+        number = float(raw)
+    except (TypeError, ValueError, OverflowError):
+        raise ValueError(raw)
+    if not math.isfinite(number) or not number.is_integer():
+        raise ValueError(raw)
+    return int(number)
+
+
+def _normalize_line(item: Any, idx: int, errors: List[str]) -> Optional[Dict[str, Any]]:
+    if not isinstance(item, dict):
+        errors.append(f"Fila {idx}: se esperaba un objeto")
+        return None
+    try:
+        player_id = _as_int(item.get("player_id"))
+    except ValueError:
+        errors.append(f"Fila {idx}: player_id inválido '{item.get('player_id')}'")
+        return None
+
+    line: Dict[str, Any] = {"player_id": player_id}
+    for name in STAT_COLUMNS:
+        raw = item.get(name)
+        if raw in (None, ""):
+            line[name] = None if name in NULLABLE_STATS else 0
+            continue
+        try:
+            value = _as_int(raw)
+        except ValueError:
+            errors.append(f"Fila {idx}: valor inválido para '{name}' (se espera un entero): '{raw}'")
+            return None
+        if value < _MIN or value > _MAX:
+            errors.append(f"Fila {idx}: valor fuera de rango para '{name}': {value}")
+            return None
+        line[name] = value
+    return line
+
+
+def ingest_week(
+    db: Session,
+    *,
+    fileobj: IO[str],
+    fmt: str,
+    season_id: int,
+    week_number: int,
+) -> Dict[str, Any]:
+    """
+    Load a complete week stat file and apply it incrementally.
+    Returns counts plus `changed_player_ids` (written or removed lines), which
+    downstream scoring can use to recompute only what changed.
+    Raises LookupError for an unknown week and ValueError for invalid files.
+    """
+    week_id = repository.get_week_id(db, season_id=season_id, week_number=week_number)
+    if week_id is None:
+        raise LookupError(f"La semana {week_number} de la temporada {season_id} no existe.")
+
+    errors: List[str] = []
+    lines: Dict[int, Dict[str, Any]] = {}
+    for idx, item in enumerate(iter_records(fileobj, fmt), start=1):
+        line = _normalize_line(item, idx, errors)
+        if line is None:
+            continue
+        if line["player_id"] in lines:
+            errors.append(f"Fila {idx}: player_id {line['player_id']} duplicado en el archivo")
+            continue
+        line["week_id"] = week_id
+        lines[line["player_id"]] = line
+
+    unknown = set(lines) - repository.get_existing_player_ids(db, lines.keys())
+    for player_id in sorted(unknown):
+        errors.append(f"Jugador id {player_id} no existe")
+    if errors:
+        raise ValueError("Errores de validación:\n" + "\n".join(errors[:1000]))
+
+    try:
+        # Live flushes of the same week wait until this load commits
+        scorer.lock_week_stats(db, week_id)
+        written = repository.upsert_week(db, list(lines.values()))
+        removed = repository.delete_missing(db, week_id=week_id, keep_player_ids=lines.keys())
+        # Only teams starting a changed player need their weekly total recomputed
+        totals = scorer.recompute_for_players(db, week_id, set(written) | set(removed))
+        db.commit()
+    except IntegrityError as ie:
+        db.rollback()
+        raise ValueError(f"Error de integridad en BD: {str(ie.orig)}")
+    except Exception:
+        db.rollback()
+        raise
+    scorer.notify(week_id, totals)
+    if written or removed:
+        projections.compute_next_week(db, season_id=season_id, week_number=week_number)
+
+    return {
+        "season_id": season_id,
+        "week_number": week_number,
+        "week_id": week_id,
+        "lines": len(lines),
+        "written": len(written),
+        "unchanged": len(lines) - len(written),
+        "removed": len(removed),
+        "changed_player_ids": sorted(set(written) | set(removed)),
+    }
+
+
+def queue_live_lines(
+    db: Session,
+    *,
+    season_id: int,
+    week_number: int,
+    items: List[Any],
+) -> Dict[str, Any]:
+    """
+    Validate live stat lines (each the player's current cumulative line) and
+    hand them to the live scorer, which coalesces bursts before writing.
+    Raises LookupError for an unknown week and ValueError for invalid lines.
+    """
+    week_id = repository.get_week_id(db, season_id=season_id, week_number=week_number)
+    if week_id is None:
+        raise LookupError(f"La semana {week_number} de la temporada {season_id} no existe.")
+
+    errors: List[str] = []
+    lines: Dict[int, Dict[str, Any]] = {}
+    for idx, item in enumerate(items, start=1):
+        line = _normalize_line(item, idx, errors)
+        if line is not None:
+            lines[line["player_id"]] = line  # latest line per player wins
+    unknown = set(lines) - repository.get_existing_player_ids(db, lines.keys())
+    for player_id in sorted(unknown):
+        errors.append(f"Jugador id {player_id} no existe")
+    if errors:
+        raise ValueError("Errores de validación:\n" + "\n".join(errors[:1000]))
+
+    for line in lines.values():
+        scorer.submit(week_id, line)
+    return {"week_id": week_id, "queued": len(lines)}
+
+
+def ingest_drop_directory(db: Session) -> List[Dict[str, Any]]:
+    """Ingest every well-named file in the drop directory, moving each to processed/ afterwards."""
+    INCOMING_DIR.mkdir(parents=True, exist_ok=True)
+    PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
+
+    results: List[Dict[str, Any]] = []
+    for path in sorted(INCOMING_DIR.iterdir()):
+        m = _FILE_NAME.match(path.name)
+        if not path.is_file() or not m:
+            continue
+        season_id, week_number = int(m.group("season")), int(m.group("week"))
+        suffix = "__processed"
+        try:
+            with path.open("r", encoding="utf-8-sig", newline="") as f:
+                result = ingest_week(
+                    db, fileobj=f, fmt=detect_format(path.name), season_id=season_id, week_number=week_number
+                )
+            result = {"file": path.name, "status": "ok", **result}
+        except (LookupError, ValueError) as e:
+            suffix = "__failed"
+            result = {"file": path.name, "status": "failed", "detail": str(e)}
+
+        target = PROCESSED_DIR / f"{path.stem}{suffix}{path.suffix}"
+        target.unlink(missing_ok=True)
+        shutil.move(str(path), str(target))
+        results.append(result)
+    return results
@@ -1,6 +1,7 @@
-from typing import Optional, List
+from typing import Optional, List, Dict, Iterable, Any
 from sqlalchemy.orm import Session
 from sqlalchemy import func, select
+from ...core.bulk import bulk_insert
 from . import models
 
 def get_by_id(db: Session, team_id: int) -> Optional[models.Team]:
@@ -11,6 +12,21 @@ def get_by_name_ci(db: Session, name: str) -> Optional[models.Team]:
         select(models.Team).where(func.lower(models.Team.name) == func.lower(name.strip()))
     ).scalar_one_or_none()
 
+def get_ids_by_names_ci(db: Session, names: Iterable[str]) -> Dict[str, int]:
+    """Resolve many team names in one query. Keys are lower-cased names; league-less teams win ties."""
+    keys = {n.strip().lower() for n in names if n and n.strip()}
+    if not keys:
+        return {}
+    rows = db.execute(
+        select(func.lower(models.Team.name), models.Team.id)
+        .where(func.lower(models.Team.name).in_(keys))
+        .order_by(models.Team.league_id.asc().nulls_first(), models.Team.id.asc())
+    ).all()
+    found: Dict[str, int] = {}
+    for lname, team_id in rows:
+        found.setdefault(lname, team_id)
+    return found
+
 def create_team(
     db: Session,
     *,
@@ -33,6 +49,20 @@ def create_team(
     db.refresh(team)
     return team
 
+def bulk_create_teams(db: Session, rows: List[Dict[str, Any]], *, skip_existing: bool = False) -> List[int]:
+    """Insert many teams in one set-based statement (COPY on PostgreSQL). Returns new ids; no commit."""
+    rows = [
+        {"is_active": True, **r, "name": r["name"].strip(), "city": r["city"].strip()}
+        for r in rows
+    ]
+    written = bulk_insert(
+        db,
+        models.Team.__table__,
+        rows,
+        on_conflict="nothing" if skip_existing else "error",
+    )
+    return [r[0] for r in written]
+
 def update_team(
     db: Session,
     team: models.Team,
@@ -0,0 +1,3 @@
+"""Trades module package."""
+
+__all__ = ["models", "evaluator", "repository", "service", "router"]
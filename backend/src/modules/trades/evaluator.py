@@ -0,0 +1,101 @@
+"""
+Trade value for both sides of an offer.
+
+Each side is scored two ways with the week's projections:
+- `projection_delta`: projected points received minus projected points sent;
+- `lineup_delta`: the team's optimal starting lineup after the trade minus
+  before it, which is what the trade actually changes on game day (a great
+  player who would sit on the bench adds nothing).
+
+The four lineups (each team before / after) are solved in one
+`lineup.solve_league` call over the two rosters, and the projections come
+from one batch for every player involved, so an evaluation costs two small
+queries and a few milliseconds: cheap enough to run while the offer is
+being built. `fairness` is 1 when both teams gain the same and goes to 0 as
+the gains diverge.
+"""
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Mapping, Sequence, Tuple
+
+from ..fantasy_teams import lineup
+from ..leagues.config import LeagueConfig
+
+# (fantasy_team_id, player_id, position, slot) rows of the two rosters
+RosterRow = Tuple[int, int, str, str]
+
+
+def _lineup_points(lineups: Mapping[int, Mapping[str, List[int]]], team: int, projected: Mapping[int, float]) -> float:
+    return round(
+        sum(
+            projected.get(pid, 0.0)
+            for slot, pids in lineups.get(team, {}).items()
+            if slot not in (lineup.BENCH, lineup.IR)
+            for pid in pids
+        ),
+        2,
+    )
+
+
+def evaluate(
+    config: LeagueConfig,
+    rows: Sequence[RosterRow],
+    projected: Mapping[int, float],
+    *,
+    proposer_team_id: int,
+    receiver_team_id: int,
+    send_ids: Iterable[int],
+    receive_ids: Iterable[int],
+) -> Dict[str, object]:
+    """
+    `send_ids` move from the proposer to the receiver, `receive_ids` the other
+    way. `rows` must hold both rosters; `projected` every player in them.
+    """
+    send, receive = set(send_ids), set(receive_ids)
+    a, b = proposer_team_id, receiver_team_id
+    # Pseudo teams: 0/1 = proposer/receiver before, 2/3 = after
+    team_ids: List[int] = []
+    player_ids: List[int] = []
+    positions: List[str] = []
+    on_ir: List[bool] = []
+    for team, pid, position, slot in rows:
+        before = 0 if team == a else 1
+        moves = (team == a and pid in send) or (team == b and pid in receive)
+        after = (3 if team == a else 2) if moves else before + 2
+        for pseudo in (before, after):
+            team_ids.append(pseudo)
+            player_ids.append(pid)
+            positions.append(position)
+            # A traded player arrives on the bench, not on IR
+            on_ir.append(slot == lineup.IR and not (pseudo >= 2 and moves))
+    lineups = lineup.solve_league(
+        config.plan, team_ids, player_ids, positions, [projected.get(p, 0.0) for p in player_ids], on_ir
+    )
+
+    def side(team: int, before: int, gives: set, gets: set) -> Dict[str, object]:
+        after = before + 2
+        lineup_before = _lineup_points(lineups, before, projected)
+        lineup_after = _lineup_points(lineups, after, projected)
+        after_positions = [
+            positions[i] for i, t in enumerate(team_ids) if t == after and not on_ir[i]
+        ]
+        return {
+            "fantasy_team_id": team,
+            "sends": sorted(gives),
+            "receives": sorted(gets),
+            "projection_delta": round(sum(projected.get(p, 0.0) for p in gets) - sum(projected.get(p, 0.0) for p in gives), 2),
+            "lineup_before": lineup_before,
+            "lineup_after": lineup_after,
+            "lineup_delta": round(lineup_after - lineup_before, 2),
+            "roster_violation": lineup.roster_violation(config.plan, after_positions),
+        }
+
+    proposer = side(a, 0, send, receive)
+    receiver = side(b, 1, receive, send)
+    ga, gb = proposer["lineup_delta"], receiver["lineup_delta"]
+    scale = max(abs(ga) + abs(gb), 1.0)
+    return {
+        "proposer": proposer,
+        "receiver": receiver,
+        "fairness": round(1.0 - abs(ga - gb) / scale, 3),
+    }
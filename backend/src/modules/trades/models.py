@@ -0,0 +1,45 @@
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, ForeignKey, Index, UniqueConstraint, CheckConstraint, func
+from sqlalchemy.sql import text
+from ...config.database import Base
+
+
+class Trade(Base):
+    """A trade between two teams of a league. Accepting opens the veto window; it executes after `execute_after`."""
+    __tablename__ = "trades"
+
+    id = Column(BigInteger, primary_key=True, index=True)
+    league_id = Column(Integer, ForeignKey("leagues.id", ondelete="CASCADE"), nullable=False)
+    proposer_team_id = Column(BigInteger, ForeignKey("fantasy_teams.id", ondelete="CASCADE"), nullable=False)
+    receiver_team_id = Column(BigInteger, ForeignKey("fantasy_teams.id", ondelete="CASCADE"), nullable=False)
+    # proposed|accepted|executed|rejected|cancelled|vetoed|void (a player moved before execution)
+    status = Column(String(10), nullable=False, server_default=text("'proposed'"))
+    message = Column(String(500), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    responded_at = Column(DateTime(timezone=True), nullable=True)
+    # End of the commissioner's veto window of an accepted trade
+    execute_after = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        CheckConstraint("proposer_team_id <> receiver_team_id", name="ck_trades_distinct_teams"),
+    )
+
+
+class TradeItem(Base):
+    """A player moving away from `from_team_id` in a trade."""
+    __tablename__ = "trade_items"
+
+    id = Column(BigInteger, primary_key=True, index=True)
+    trade_id = Column(BigInteger, ForeignKey("trades.id", ondelete="CASCADE"), nullable=False)
+    player_id = Column(BigInteger, ForeignKey("players.id", ondelete="CASCADE"), nullable=False)
+    from_team_id = Column(BigInteger, ForeignKey("fantasy_teams.id", ondelete="CASCADE"), nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("trade_id", "player_id", name="ux_trade_items_trade_player"),
+    )
+
+Index("ix_trades_league_status", Trade.league_id, Trade.status)
+Index("ix_trades_proposer", Trade.proposer_team_id)
+Index("ix_trades_receiver", Trade.receiver_team_id)
+Index("ix_trades_due", Trade.execute_after, postgresql_where=text("status = 'accepted'"))
+Index("ix_trade_items_trade", TradeItem.trade_id)
+Index("ix_trade_items_player", TradeItem.player_id)
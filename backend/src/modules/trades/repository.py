@@ -0,0 +1,152 @@
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import case, exists, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from ..fantasy_teams import models as ft_models
+from . import models
+
+T = models.Trade
+TI = models.TradeItem
+FTP = ft_models.FantasyTeamPlayer
+
+
+def get_trade(db: Session, trade_id: int, *, for_update: bool = False) -> Optional[models.Trade]:
+    stmt = select(T).where(T.id == trade_id)
+    if for_update:
+        stmt = stmt.with_for_update().execution_options(populate_existing=True)
+    return db.execute(stmt).scalar_one_or_none()
+
+
+def list_items(db: Session, trade_ids: Sequence[int]) -> Dict[int, List[Tuple[int, int]]]:
+    """trade id -> [(player_id, from_team_id)]."""
+    items: Dict[int, List[Tuple[int, int]]] = {int(t): [] for t in trade_ids}
+    if not trade_ids:
+        return items
+    for trade_id, player_id, from_team_id in db.execute(
+        select(TI.trade_id, TI.player_id, TI.from_team_id).where(TI.trade_id.in_(list(trade_ids))).order_by(TI.id)
+    ).all():
+        items[int(trade_id)].append((int(player_id), int(from_team_id)))
+    return items
+
+
+def list_league_trades(db: Session, league_id: int, status: Optional[str] = None) -> List[models.Trade]:
+    stmt = select(T).where(T.league_id == league_id)
+    if status is not None:
+        stmt = stmt.where(T.status == status)
+    return db.execute(stmt.order_by(T.created_at.desc(), T.id.desc())).scalars().all()
+
+
+def create_trade(
+    db: Session,
+    *,
+    league_id: int,
+    proposer_team_id: int,
+    receiver_team_id: int,
+    items: Sequence[Tuple[int, int]],
+    message: Optional[str],
+) -> models.Trade:
+    trade = T(
+        league_id=league_id,
+        proposer_team_id=proposer_team_id,
+        receiver_team_id=receiver_team_id,
+        status="proposed",
+        message=message,
+    )
+    db.add(trade)
+    db.flush()
+    db.execute(insert(TI), [{"trade_id": trade.id, "player_id": p, "from_team_id": t} for p, t in items])
+    return trade
+
+
+def set_status(db: Session, trade: models.Trade, status: str) -> None:
+    trade.status = status
+    trade.responded_at = datetime.now(timezone.utc)
+
+
+def accept(db: Session, trade: models.Trade, review: timedelta) -> None:
+    set_status(db, trade, "accepted")
+    trade.execute_after = trade.responded_at + review
+
+
+def leagues_with_due_trades(db: Session) -> List[int]:
+    return db.execute(
+        select(T.league_id).where(T.status == "accepted", T.execute_after <= func.now()).distinct().order_by(T.league_id)
+    ).scalars().all()
+
+
+def list_due_trades(db: Session, league_id: int) -> List[models.Trade]:
+    """Accepted trades of the league whose veto window is over, oldest first, row-locked."""
+    return db.execute(
+        select(T)
+        .where(T.league_id == league_id, T.status == "accepted", T.execute_after <= func.now())
+        .order_by(T.execute_after, T.id)
+        .with_for_update()
+    ).scalars().all()
+
+
+def lock_roster_rows(db: Session, league_id: int, player_ids: Iterable[int]) -> Dict[int, int]:
+    """Row-lock the roster entries of the players (in player id order) and return player -> team."""
+    rows = db.execute(
+        select(FTP.player_id, FTP.fantasy_team_id)
+        .where(FTP.league_id == league_id, FTP.player_id.in_(sorted(set(player_ids))))
+        .order_by(FTP.player_id)
+        .with_for_update()
+    ).all()
+    return {int(p): int(t) for p, t in rows}
+
+
+def count_executed(db: Session, team_ids: Sequence[int]) -> Dict[int, int]:
+    """Executed trades per team, as proposer or receiver (accepted ones in their veto window included)."""
+    counts = {int(t): 0 for t in team_ids}
+    if not team_ids:
+        return counts
+    ids = list(team_ids)
+    for team_col in (T.proposer_team_id, T.receiver_team_id):
+        for team_id, n in db.execute(
+            select(team_col, func.count())
+            .where(team_col.in_(ids), T.status.in_(("accepted", "executed")))
+            .group_by(team_col)
+        ).all():
+            counts[int(team_id)] += int(n)
+    return counts
+
+
+def swap_players(db: Session, league_id: int, moves: Sequence[Tuple[int, int]]) -> None:
+    """Move (player_id, to_team_id) in one UPDATE; moved players land on the bench."""
+    if not moves:
+        return
+    target = case({p: t for p, t in moves}, value=FTP.player_id)
+    db.execute(
+        update(FTP)
+        .where(FTP.league_id == league_id, FTP.player_id.in_([p for p, _t in moves]))
+        .values(fantasy_team_id=target, slot="BENCH", acquired_via="trade", acquired_at=func.now())
+        .execution_options(synchronize_session=False)
+    )
+
+
+def void_pending_with_players(db: Session, league_id: int, player_ids: Sequence[int], *, exclude_trade_id: int) -> List[int]:
+    """Other proposed or accepted trades that include any of the players can no longer execute."""
+    if not player_ids:
+        return []
+    return db.execute(
+        update(T)
+        .where(
+            T.league_id == league_id,
+            T.status.in_(("proposed", "accepted")),
+            T.id != exclude_trade_id,
+            exists().where(TI.trade_id == T.id, TI.player_id.in_(list(player_ids))),
+        )
+        .values(status="void", responded_at=func.now())
+        .returning(T.id)
+        .execution_options(synchronize_session=False)
+    ).scalars().all()
+
+
+def lock_teams(db: Session, team_ids: Sequence[int]) -> List[ft_models.FantasyTeam]:
+    """Row-lock both teams of a trade (in id order, so concurrent trades cannot deadlock)."""
+    FT = ft_models.FantasyTeam
+    return db.execute(
+        select(FT).where(FT.id.in_(sorted(set(team_ids)))).order_by(FT.id).with_for_update()
+    ).scalars().all()
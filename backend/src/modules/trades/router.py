@@ -0,0 +1,132 @@
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import status
+from sqlalchemy.orm import Session
+
+from ...config.database import get_db
+from ..users.router import get_current_user
+from . import schemas, service
+
+router = APIRouter(tags=["trades"])
+
+
+def _http(exc: Exception) -> HTTPException:
+    if isinstance(exc, LookupError):
+        return HTTPException(status_code=404, detail=str(exc))
+    if isinstance(exc, PermissionError):
+        return HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(exc))
+    return HTTPException(status_code=409, detail=str(exc))
+
+
+@router.post("/leagues/{league_id}/trades/evaluate")
+def evaluate_trade(
+    league_id: int,
+    payload: schemas.TradeOffer,
+    week_id: int = Query(...),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    """Valor de la oferta para ambos equipos (proyección y alineación óptima antes/después), sin guardarla."""
+    try:
+        return service.evaluate_offer(
+            db,
+            league_id=league_id,
+            user_id=current_user.id,
+            receiver_team_id=payload.receiver_team_id,
+            send_ids=payload.send_player_ids,
+            receive_ids=payload.receive_player_ids,
+            week_id=week_id,
+        )
+    except (LookupError, ValueError) as e:
+        raise _http(e)
+
+
+@router.post("/leagues/{league_id}/trades", status_code=201)
+def propose_trade(
+    league_id: int,
+    payload: schemas.TradeCreate,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    """Propone un intercambio al equipo receptor (respetando fecha límite y máximo de intercambios)."""
+    try:
+        return service.propose_trade(
+            db,
+            league_id=league_id,
+            user_id=current_user.id,
+            receiver_team_id=payload.receiver_team_id,
+            send_ids=payload.send_player_ids,
+            receive_ids=payload.receive_player_ids,
+            message=payload.message,
+        )
+    except (LookupError, ValueError) as e:
+        raise _http(e)
+
+
+@router.get("/leagues/{league_id}/trades")
+def list_trades(
+    league_id: int,
+    status_filter: Optional[Literal["proposed", "accepted", "executed", "rejected", "cancelled", "vetoed", "void"]] = Query(None, alias="status"),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    return service.list_trades(db, league_id=league_id, status=status_filter)
+
+
+@router.post("/trades/{trade_id}/accept")
+def accept_trade(
+    trade_id: int,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    """El equipo receptor acepta: el intercambio queda en revisión y se ejecuta al cerrar el periodo de veto."""
+    try:
+        return service.accept_trade(db, trade_id=trade_id, user_id=current_user.id)
+    except (LookupError, PermissionError, ValueError) as e:
+        raise _http(e)
+
+
+@router.post("/trades/{trade_id}/reject")
+def reject_trade(
+    trade_id: int,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    try:
+        return service.reject_trade(db, trade_id=trade_id, user_id=current_user.id)
+    except (LookupError, PermissionError, ValueError) as e:
+        raise _http(e)
+
+
+@router.post("/trades/{trade_id}/cancel")
+def cancel_trade(
+    trade_id: int,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    try:
+        return service.cancel_trade(db, trade_id=trade_id, user_id=current_user.id)
+    except (LookupError, PermissionError, ValueError) as e:
+        raise _http(e)
+
+
+@router.post("/trades/{trade_id}/veto")
+def veto_trade(
+    trade_id: int,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    """Veto del comisionado (o admin) sobre un intercambio aceptado, durante su periodo de revisión."""
+    try:
+        return service.veto_trade(db, trade_id=trade_id, user=current_user)
+    except (LookupError, PermissionError, ValueError) as e:
+        raise _http(e)
+
+
+@router.post("/trades/run")
+def run_trades(current_user = Depends(get_current_user)):
+    """Ejecuta los intercambios aceptados cuyo periodo de veto terminó (solo admin)."""
+    if getattr(current_user, "role", None) != "admin":
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin only")
+    return service.run_trades()
@@ -0,0 +1,13 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class TradeOffer(BaseModel):
+    receiver_team_id: int
+    send_player_ids: List[int] = Field(default_factory=list, max_length=15)
+    receive_player_ids: List[int] = Field(default_factory=list, max_length=15)
+
+
+class TradeCreate(TradeOffer):
+    message: Optional[str] = Field(None, max_length=500)
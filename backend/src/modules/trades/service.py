@@ -0,0 +1,338 @@
+"""
+Trades: proposals between two teams of a league, answered by the receiver
+(accept, reject) or withdrawn by the proposer. An accepted trade waits
+REVIEW_PERIOD, during which the commissioner can veto it; `run_trades` then
+executes the accepted trades that are due.
+
+League settings (status, trade deadline, max_trades_per_team, roster plan)
+come from the cached `leagues.config`. Accepting and executing take the
+league lock shared with waiver runs (waivers.repository.lock_league), then
+lock the trade and the players' roster rows, re-check ownership and roster
+fit under those locks; execution moves every player with one UPDATE. A trade
+whose players moved in the meantime is voided.
+"""
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy.orm import Session
+
+from ...config.database import SessionLocal
+from ..fantasy_teams import repository as ft_repository
+from ..fantasy_teams.lineup import IR, roster_violation
+from ..fantasy_teams.service import project_points
+from ..leagues import models as league_models
+from ..leagues.config import LeagueConfig, get_league_config
+from ..scoring.live import scorer
+from ..waivers import repository as waiver_repository
+from . import evaluator, models, repository
+
+logger = logging.getLogger(__name__)
+
+# Commissioner's veto window between acceptance and execution
+REVIEW_PERIOD = timedelta(days=1)
+
+
+def _trade_dict(trade: models.Trade, items: Sequence[Tuple[int, int]]) -> Dict[str, Any]:
+    return {
+        "id": trade.id,
+        "league_id": trade.league_id,
+        "proposer_team_id": trade.proposer_team_id,
+        "receiver_team_id": trade.receiver_team_id,
+        "status": trade.status,
+        "message": trade.message,
+        "sends": [p for p, t in items if t == trade.proposer_team_id],
+        "receives": [p for p, t in items if t == trade.receiver_team_id],
+        "created_at": trade.created_at,
+        "responded_at": trade.responded_at,
+        "execute_after": trade.execute_after,
+    }
+
+
+def _check_window(config: LeagueConfig) -> None:
+    if config.status != "in_season":
+        raise ValueError("Trades are only allowed during the season")
+    if not config.trades_open(datetime.now(timezone.utc)):
+        raise ValueError("The trade deadline has passed")
+
+
+def _check_trade_limits(db: Session, config: LeagueConfig, team_ids: Sequence[int]) -> None:
+    if config.max_trades_per_team is None:
+        return
+    for team_id, n in repository.count_executed(db, team_ids).items():
+        if n >= config.max_trades_per_team:
+            raise ValueError(f"Team {team_id} reached the league's trade limit")
+
+
+def _offer(
+    db: Session,
+    league_id: int,
+    user_id: int,
+    receiver_team_id: int,
+    send_ids: Iterable[int],
+    receive_ids: Iterable[int],
+):
+    """Validate an offer against both current rosters. Returns (config, proposer, rows, send, receive)."""
+    config = get_league_config(db, league_id)
+    proposer = ft_repository.get_user_team_in_league(db, league_id=league_id, user_id=user_id)
+    if proposer is None:
+        raise LookupError("You have no team in this league")
+    receiver = ft_repository.get_by_id(db, receiver_team_id)
+    if receiver is None or receiver.league_id != league_id or not receiver.is_active:
+        raise LookupError("Receiving team not found in this league")
+    if receiver.id == proposer.id:
+        raise ValueError("A team cannot trade with itself")
+    send, receive = list(dict.fromkeys(send_ids)), list(dict.fromkeys(receive_ids))
+    if not send and not receive:
+        raise ValueError("A trade needs at least one player")
+    rows = ft_repository.list_league_roster(db, league_id, [proposer.id, receiver.id])
+    owner = {int(pid): int(team) for team, pid, _pos, _slot in rows}
+    if any(owner.get(p) != proposer.id for p in send):
+        raise ValueError("Every offered player must be on your roster")
+    if any(owner.get(p) != receiver.id for p in receive):
+        raise ValueError("Every requested player must be on the other team's roster")
+    return config, proposer, receiver, rows, send, receive
+
+
+def evaluate_offer(
+    db: Session,
+    *,
+    league_id: int,
+    user_id: int,
+    receiver_team_id: int,
+    send_ids: Iterable[int],
+    receive_ids: Iterable[int],
+    week_id: int,
+) -> Dict[str, Any]:
+    config, proposer, receiver, rows, send, receive = _offer(db, league_id, user_id, receiver_team_id, send_ids, receive_ids)
+    week = db.get(league_models.Week, week_id)
+    if week is None or week.season_id != config.season_id:
+        raise LookupError("Week not found for this league's season")
+    projected = project_points(db, config, week, [pid for _t, pid, _p, _s in rows])
+    result = evaluator.evaluate(
+        config,
+        rows,
+        projected,
+        proposer_team_id=proposer.id,
+        receiver_team_id=receiver.id,
+        send_ids=send,
+        receive_ids=receive,
+    )
+    return {"league_id": league_id, "week_id": week_id, **result}
+
+
+def propose_trade(
+    db: Session,
+    *,
+    league_id: int,
+    user_id: int,
+    receiver_team_id: int,
+    send_ids: Iterable[int],
+    receive_ids: Iterable[int],
+    message: Optional[str] = None,
+) -> Dict[str, Any]:
+    config, proposer, receiver, _rows, send, receive = _offer(
+        db, league_id, user_id, receiver_team_id, send_ids, receive_ids
+    )
+    _check_window(config)
+    _check_trade_limits(db, config, [proposer.id, receiver.id])
+    items = [(p, proposer.id) for p in send] + [(p, receiver.id) for p in receive]
+    trade = repository.create_trade(
+        db,
+        league_id=league_id,
+        proposer_team_id=proposer.id,
+        receiver_team_id=receiver.id,
+        items=items,
+        message=message,
+    )
+    db.commit()
+    db.refresh(trade)
+    return _trade_dict(trade, items)
+
+
+def list_trades(db: Session, *, league_id: int, status: Optional[str] = None) -> List[Dict[str, Any]]:
+    trades = repository.list_league_trades(db, league_id, status)
+    items = repository.list_items(db, [t.id for t in trades])
+    return [_trade_dict(t, items[t.id]) for t in trades]
+
+
+def _pending(db: Session, trade_id: int, status: str = "proposed") -> models.Trade:
+    trade = repository.get_trade(db, trade_id, for_update=True)
+    if trade is None:
+        raise LookupError("Trade not found")
+    if trade.status != status:
+        raise ValueError(f"Trade is already {trade.status}")
+    return trade
+
+
+def _owner_of(db: Session, team_id: int) -> Optional[int]:
+    team = ft_repository.get_by_id(db, team_id)
+    return team.user_id if team is not None else None
+
+
+def _lock_league_of(db: Session, trade_id: int) -> None:
+    trade = repository.get_trade(db, trade_id)
+    if trade is None:
+        raise LookupError("Trade not found")
+    waiver_repository.lock_league(db, trade.league_id)
+
+
+def _moves(
+    db: Session, config: LeagueConfig, trade: models.Trade, items: Sequence[Tuple[int, int]]
+) -> Optional[List[Tuple[int, int]]]:
+    """
+    Lock the players' roster rows and return the (player_id, to_team_id) moves,
+    or None if a player is no longer on the expected roster. Raises ValueError
+    if a roster would not fit the league's plan afterwards.
+    """
+    owners = repository.lock_roster_rows(db, trade.league_id, [p for p, _t in items])
+    if any(owners.get(p) != from_team for p, from_team in items):
+        return None
+    teams = (trade.proposer_team_id, trade.receiver_team_id)
+    other = {trade.proposer_team_id: trade.receiver_team_id, trade.receiver_team_id: trade.proposer_team_id}
+    moves = [(p, other[from_team]) for p, from_team in items]
+    destination = dict(moves)
+    after: Dict[int, List[str]] = {t: [] for t in teams}
+    for team, pid, position, slot in ft_repository.list_league_roster(db, trade.league_id, teams):
+        if pid in destination:
+            after[destination[pid]].append(position)
+        elif slot != IR:
+            after[team].append(position)
+    for team_id, positions in after.items():
+        reason = roster_violation(config.plan, positions)
+        if reason is not None:
+            raise ValueError(f"Team {team_id}: {reason}")
+    return moves
+
+
+def accept_trade(db: Session, *, trade_id: int, user_id: int) -> Dict[str, Any]:
+    """Accept the trade; it executes once the veto window is over (see run_trades). Commits."""
+    try:
+        _lock_league_of(db, trade_id)
+        trade = _pending(db, trade_id)
+        if _owner_of(db, trade.receiver_team_id) != user_id:
+            raise PermissionError("Only the receiving team can accept this trade")
+        config = get_league_config(db, trade.league_id)
+        _check_window(config)
+        teams = (trade.proposer_team_id, trade.receiver_team_id)
+        repository.lock_teams(db, teams)
+        _check_trade_limits(db, config, teams)
+
+        items = repository.list_items(db, [trade.id])[trade.id]
+        if _moves(db, config, trade, items) is None:
+            repository.set_status(db, trade, "void")
+            db.commit()
+            raise ValueError("A player in this trade is no longer on the expected roster")
+        repository.accept(db, trade, REVIEW_PERIOD)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    db.refresh(trade)
+    return _trade_dict(trade, items)
+
+
+def _execute(db: Session, config: LeagueConfig, trade: models.Trade) -> List[int]:
+    """Execute an accepted trade, or void it if it no longer fits. Returns the other trades voided. No commit."""
+    items = repository.list_items(db, [trade.id])[trade.id]
+    try:
+        moves = _moves(db, config, trade, items)
+    except ValueError:
+        moves = None
+    if moves is None:
+        repository.set_status(db, trade, "void")
+        return []
+    players = [p for p, _t in moves]
+    repository.swap_players(db, trade.league_id, moves)
+    repository.set_status(db, trade, "executed")
+    voided = repository.void_pending_with_players(db, trade.league_id, players, exclude_trade_id=trade.id)
+    # Traded starters land on the bench
+    scorer.refresh_players(db, players)
+    return voided
+
+
+def execute_league(db: Session, league_id: int) -> Dict[str, int]:
+    """Execute the league's due trades in acceptance order under the league lock. No commit."""
+    if waiver_repository.lock_league(db, league_id) is None:
+        return {"executed": 0, "void": 0}
+    config = get_league_config(db, league_id)
+    executed = void = 0
+    voided: set = set()
+    for trade in repository.list_due_trades(db, league_id):
+        if trade.id in voided:
+            void += 1
+            continue
+        voided.update(_execute(db, config, trade))
+        if trade.status == "executed":
+            executed += 1
+        else:
+            void += 1
+    return {"executed": executed, "void": void}
+
+
+def _run_league(league_id: int) -> Dict[str, int]:
+    db = SessionLocal()
+    try:
+        result = execute_league(db, league_id)
+        db.commit()
+    except Exception:
+        db.rollback()
+        logger.exception("Trade execution failed for league %d", league_id)
+        return {"league_id": league_id, "executed": 0, "void": 0, "failed": 1}
+    finally:
+        db.close()
+    return {"league_id": league_id, **result, "failed": 0}
+
+
+def run_trades(*, league_ids: Optional[Iterable[int]] = None) -> Dict[str, Any]:
+    """Execute the accepted trades whose veto window is over. Commits per league."""
+    db = SessionLocal()
+    try:
+        ids = list(league_ids) if league_ids is not None else repository.leagues_with_due_trades(db)
+    finally:
+        db.close()
+    per_league = [_run_league(lid) for lid in ids]
+    return {
+        "leagues": len(ids),
+        "executed": sum(r["executed"] for r in per_league),
+        "void": sum(r["void"] for r in per_league),
+        "failed_leagues": [r["league_id"] for r in per_league if r["failed"]],
+    }
+
+
+def _close(db: Session, *, trade_id: int, status: str, allowed, current: str = "proposed") -> Dict[str, Any]:
+    try:
+        trade = _pending(db, trade_id, current)
+        allowed(trade)
+        repository.set_status(db, trade, status)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    db.refresh(trade)
+    return _trade_dict(trade, repository.list_items(db, [trade.id])[trade.id])
+
+
+def reject_trade(db: Session, *, trade_id: int, user_id: int) -> Dict[str, Any]:
+    def allowed(trade):
+        if _owner_of(db, trade.receiver_team_id) != user_id:
+            raise PermissionError("Only the receiving team can reject this trade")
+    return _close(db, trade_id=trade_id, status="rejected", allowed=allowed)
+
+
+def cancel_trade(db: Session, *, trade_id: int, user_id: int) -> Dict[str, Any]:
+    def allowed(trade):
+        if _owner_of(db, trade.proposer_team_id) != user_id:
+            raise PermissionError("Only the proposing team can cancel this trade")
+    return _close(db, trade_id=trade_id, status="cancelled", allowed=allowed)
+
+
+def veto_trade(db: Session, *, trade_id: int, user) -> Dict[str, Any]:
+    """Commissioner veto of an accepted trade during its review window."""
+    def allowed(trade):
+        config = get_league_config(db, trade.league_id)
+        if getattr(user, "role", None) != "admin" and config.created_by != user.id:
+            raise PermissionError("Only the commissioner can veto trades")
+        if trade.execute_after is not None and trade.execute_after <= datetime.now(timezone.utc):
+            raise ValueError("The veto window for this trade is over")
+    return _close(db, trade_id=trade_id, status="vetoed", allowed=allowed, current="accepted")
@@ -0,0 +1,3 @@
+"""Waiver claims module package."""
+
+__all__ = ["models", "engine", "repository", "service", "router"]
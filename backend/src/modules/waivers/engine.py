@@ -0,0 +1,158 @@
+"""
+Waiver resolution for one league, in memory.
+
+Claims are resolved in rolling priority order: the first team of the waiver
+order that still has claims gets its best-ranked claim processed, and a team
+whose claim succeeds drops to the bottom of the order. A claim fails when:
+
+- the player is inactive, already rostered, dropped in this same run, or
+  was just won by a team ahead in the order (`lost`);
+- the drop player is no longer on the team;
+- the team reached the league's `max_free_agents_per_team`;
+- the roster would exceed the `roster_schema` size (IR excluded) or the
+  position limit (dedicated + eligible FLEX seats + BENCH).
+
+Every claim gets exactly one outcome. The caller loads the league once and
+writes the result back set-based.
+"""
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from ..fantasy_teams.lineup import IR, SlotPlan, normalize_position, position_seats
+
+WON = "won"
+LOST = "lost"
+INVALID = "invalid"
+
+
+@dataclass(frozen=True)
+class Claim:
+    id: int
+    fantasy_team_id: int
+    add_player_id: int
+    add_position: Optional[str]  # None when the player is inactive
+    drop_player_id: Optional[int]
+    rank: int
+
+
+@dataclass
+class Resolution:
+    outcomes: List[Tuple[int, str, Optional[str]]] = field(default_factory=list)  # (claim id, status, reason)
+    added: List[Tuple[int, int]] = field(default_factory=list)    # (fantasy team, player)
+    dropped: List[Tuple[int, int]] = field(default_factory=list)
+    priority: List[int] = field(default_factory=list)            # new waiver order, first = 1
+
+    @property
+    def awarded(self) -> int:
+        return len(self.added)
+
+
+def resolve(
+    plan: SlotPlan,
+    claims: Sequence[Claim],
+    rosters: Mapping[int, Mapping[int, Tuple[str, str]]],
+    priority: Sequence[int],
+    *,
+    free_agents_used: Optional[Mapping[int, int]] = None,
+    free_agent_cap: Optional[int] = None,
+) -> Resolution:
+    """
+    `rosters[team][player] = (position, slot)` for every team of the league,
+    `priority` the current waiver order (best first).
+    """
+    dedicated, flex = position_seats(plan)
+    caps = {p: dedicated.get(p, 0) + flex.get(p, 0) + plan.bench for p in set(dedicated) | set(flex)}
+    max_size = plan.starters + plan.bench
+
+    owner: Dict[int, int] = {}
+    where: Dict[int, Tuple[str, str]] = {}
+    counts: Dict[int, Dict[str, int]] = {}
+    size: Dict[int, int] = {}
+    for team_id, players in rosters.items():
+        team_counts = counts.setdefault(team_id, {})
+        size[team_id] = 0
+        for pid, (position, slot) in players.items():
+            owner[pid] = team_id
+            where[pid] = (normalize_position(position), slot)
+            if slot != IR:
+                size[team_id] += 1
+                team_counts[where[pid][0]] = team_counts.get(where[pid][0], 0) + 1
+
+    queues: Dict[int, Deque[Claim]] = {}
+    for claim in sorted(claims, key=lambda c: (c.fantasy_team_id, c.rank, c.id)):
+        queues.setdefault(claim.fantasy_team_id, deque()).append(claim)
+    ranked = set(priority)
+    order = list(priority) + sorted(t for t in queues if t not in ranked)
+    used = dict(free_agents_used or {})
+    won_now: set = set()
+    dropped_now: set = set()
+
+    result = Resolution()
+    while True:
+        team = next((t for t in order if queues.get(t)), None)
+        if team is None:
+            break
+        claim = queues[team].popleft()
+        status, reason = _check(
+            claim, team, owner, where, counts, size, used, won_now, dropped_now, caps, max_size, free_agent_cap
+        )
+        if status == WON:
+            add, drop = claim.add_player_id, claim.drop_player_id
+            position = normalize_position(claim.add_position)
+            team_counts = counts.setdefault(team, {})
+            if drop is not None:
+                drop_position, drop_slot = where.pop(drop)
+                del owner[drop]
+                if drop_slot != IR:
+                    size[team] -= 1
+                    team_counts[drop_position] -= 1
+                dropped_now.add(drop)
+                result.dropped.append((team, drop))
+            owner[add] = team
+            where[add] = (position, "BENCH")
+            size[team] = size.get(team, 0) + 1
+            team_counts[position] = team_counts.get(position, 0) + 1
+            used[team] = used.get(team, 0) + 1
+            won_now.add(add)
+            result.added.append((team, add))
+            order.remove(team)
+            order.append(team)
+        result.outcomes.append((claim.id, status, reason))
+
+    result.priority = order
+    return result
+
+
+def _check(
+    claim, team, owner, where, counts, size, used, won_now, dropped_now, caps, max_size, free_agent_cap
+):
+    add, drop = claim.add_player_id, claim.drop_player_id
+    if claim.add_position is None:
+        return INVALID, "Player not found or inactive"
+    if add in owner:
+        if owner[add] == team:
+            return INVALID, "Player is already on your roster"
+        if add in won_now:
+            return LOST, "Claimed by a team with higher waiver priority"
+        return INVALID, "Player is already rostered in this league"
+    if add in dropped_now:
+        return INVALID, "Player was dropped in this run and is on waivers"
+    if drop is not None and owner.get(drop) != team:
+        return INVALID, "Drop player is not on your roster"
+    if free_agent_cap is not None and used.get(team, 0) >= free_agent_cap:
+        return INVALID, "Free agent limit reached"
+
+    position = normalize_position(claim.add_position)
+    frees_seat = drop is not None and where[drop][1] != IR
+    if size.get(team, 0) + 1 - frees_seat > max_size:
+        return INVALID, "Roster is full"
+    cap = caps.get(position, 0)
+    if cap == 0:
+        return INVALID, f"Position {position} has no slot in this league's roster"
+    same_position_dropped = frees_seat and where[drop][0] == position
+    if counts.get(team, {}).get(position, 0) + 1 - same_position_dropped > cap:
+        return INVALID, f"Roster limit reached for {position}"
+    return WON, None
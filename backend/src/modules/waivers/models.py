@@ -0,0 +1,42 @@
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, ForeignKey, Index, func
+from sqlalchemy.sql import text
+from ...config.database import Base
+
+
+class WaiverRun(Base):
+    """One processing pass over every league with pending claims."""
+    __tablename__ = "waiver_runs"
+
+    id = Column(BigInteger, primary_key=True, index=True)
+    status = Column(String(20), nullable=False, server_default=text("'running'"))  # running|completed|failed
+    leagues = Column(Integer, nullable=False, server_default=text("0"))
+    claims = Column(Integer, nullable=False, server_default=text("0"))
+    awarded = Column(Integer, nullable=False, server_default=text("0"))
+    started_at = Column(DateTime(timezone=True), server_default=func.now())
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+
+class WaiverClaim(Base):
+    """A manager's ranked claim; once processed, the row is the claim's outcome log entry."""
+    __tablename__ = "waiver_claims"
+
+    id = Column(BigInteger, primary_key=True, index=True)
+    league_id = Column(Integer, ForeignKey("leagues.id", ondelete="CASCADE"), nullable=False)
+    fantasy_team_id = Column(BigInteger, ForeignKey("fantasy_teams.id", ondelete="CASCADE"), nullable=False)
+    add_player_id = Column(BigInteger, ForeignKey("players.id", ondelete="CASCADE"), nullable=False)
+    drop_player_id = Column(BigInteger, ForeignKey("players.id", ondelete="CASCADE"), nullable=True)
+    rank = Column(Integer, nullable=False)  # the team's own preference, 1 = first
+    status = Column(String(10), nullable=False, server_default=text("'pending'"))  # pending|won|lost|invalid|cancelled
+    reason = Column(String(255), nullable=True)
+    run_id = Column(BigInteger, ForeignKey("waiver_runs.id", ondelete="SET NULL"), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    processed_at = Column(DateTime(timezone=True), nullable=True)
+
+# A run only reads the pending claims
+Index(
+    "ix_waiver_claims_league_pending",
+    WaiverClaim.league_id,
+    postgresql_where=text("status = 'pending'"),
+)
+Index("ix_waiver_claims_team_status", WaiverClaim.fantasy_team_id, WaiverClaim.status)
+Index("ix_waiver_claims_run", WaiverClaim.run_id)
@@ -0,0 +1,167 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, delete, func, select, tuple_, update
+from sqlalchemy.orm import Session
+
+from ...core.bulk import bulk_insert
+from ..fantasy_teams import models as ft_models
+from ..leagues import models as league_models
+from ..players import models as player_models
+from . import models
+
+WC = models.WaiverClaim
+
+
+def get_user_team(db: Session, league_id: int, user_id: int) -> Optional[ft_models.FantasyTeam]:
+    FT = ft_models.FantasyTeam
+    return db.execute(
+        select(FT).where(FT.league_id == league_id, FT.user_id == user_id, FT.is_active.is_(True))
+    ).scalar_one_or_none()
+
+
+def get_claim(db: Session, claim_id: int) -> Optional[models.WaiverClaim]:
+    return db.get(WC, claim_id)
+
+
+def create_claim(db: Session, **values: Any) -> models.WaiverClaim:
+    claim = WC(**values)
+    db.add(claim)
+    db.flush()
+    return claim
+
+
+def next_rank(db: Session, fantasy_team_id: int) -> int:
+    return int(db.execute(
+        select(func.coalesce(func.max(WC.rank), 0) + 1).where(WC.fantasy_team_id == fantasy_team_id, WC.status == "pending")
+    ).scalar_one())
+
+
+def has_pending_claim(db: Session, fantasy_team_id: int, add_player_id: int, drop_player_id: Optional[int]) -> bool:
+    drop = WC.drop_player_id.is_(None) if drop_player_id is None else WC.drop_player_id == drop_player_id
+    return db.execute(
+        select(WC.id).where(
+            WC.fantasy_team_id == fantasy_team_id, WC.add_player_id == add_player_id, drop, WC.status == "pending"
+        ).limit(1)
+    ).first() is not None
+
+
+def list_claims(db: Session, *, fantasy_team_id: int, status: Optional[str] = None) -> List[models.WaiverClaim]:
+    stmt = select(WC).where(WC.fantasy_team_id == fantasy_team_id)
+    if status is not None:
+        stmt = stmt.where(WC.status == status)
+    return db.execute(stmt.order_by(WC.status, WC.rank, WC.id)).scalars().all()
+
+
+def list_league_log(db: Session, league_id: int, run_id: Optional[int] = None, limit: int = 500) -> List[models.WaiverClaim]:
+    stmt = select(WC).where(WC.league_id == league_id, WC.run_id.is_not(None))
+    if run_id is not None:
+        stmt = stmt.where(WC.run_id == run_id)
+    return db.execute(stmt.order_by(WC.run_id.desc(), WC.processed_at, WC.id).limit(limit)).scalars().all()
+
+
+# ---- processing ----
+
+def leagues_with_pending_claims(db: Session) -> List[int]:
+    return db.execute(select(WC.league_id).where(WC.status == "pending").distinct()).scalars().all()
+
+
+def lock_league(db: Session, league_id: int) -> Optional[league_models.League]:
+    """Row lock that serializes waiver runs (and roster moves that take it) for one league."""
+    return db.execute(
+        select(league_models.League).where(league_models.League.id == league_id).with_for_update()
+    ).scalar_one_or_none()
+
+
+def list_pending_claims(db: Session, league_id: int) -> List[tuple]:
+    """(id, fantasy_team_id, add_player_id, add_position or None if inactive, drop_player_id, rank)."""
+    P = player_models.Player
+    rows = db.execute(
+        select(WC.id, WC.fantasy_team_id, WC.add_player_id, P.position, WC.drop_player_id, WC.rank)
+        .outerjoin(P, and_(P.id == WC.add_player_id, P.is_active.is_(True)))
+        .where(WC.league_id == league_id, WC.status == "pending")
+    ).all()
+    return [tuple(r) for r in rows]
+
+
+def list_waiver_order(db: Session, league_id: int) -> List[int]:
+    """Active teams in waiver order; teams never ranked go last, by id."""
+    FT = ft_models.FantasyTeam
+    return db.execute(
+        select(FT.id)
+        .where(FT.league_id == league_id, FT.is_active.is_(True))
+        .order_by(FT.waiver_priority.asc().nulls_last(), FT.id)
+    ).scalars().all()
+
+
+def free_agent_counts(db: Session, league_id: int) -> Dict[int, int]:
+    rows = db.execute(
+        select(WC.fantasy_team_id, func.count())
+        .where(WC.league_id == league_id, WC.status == "won")
+        .group_by(WC.fantasy_team_id)
+    ).all()
+    return {int(t): int(n) for t, n in rows}
+
+
+def record_outcomes(db: Session, run_id: int, outcomes: Sequence[Tuple[int, str, Optional[str]]]) -> None:
+    if not outcomes:
+        return
+    now = datetime.now(timezone.utc)
+    db.execute(
+        update(WC),
+        [
+            {"id": claim_id, "status": status, "reason": reason, "run_id": run_id, "processed_at": now}
+            for claim_id, status, reason in outcomes
+        ],
+    )
+
+
+def move_players(
+    db: Session,
+    league_id: int,
+    *,
+    added: Sequence[Tuple[int, int]],
+    dropped: Sequence[Tuple[int, int]],
+) -> None:
+    """Remove the dropped (team, player) rows and put the added ones on the bench, set-based."""
+    FTP = ft_models.FantasyTeamPlayer
+    if dropped:
+        db.execute(
+            delete(FTP).where(
+                FTP.league_id == league_id,
+                tuple_(FTP.fantasy_team_id, FTP.player_id).in_([tuple(p) for p in dropped]),
+            )
+        )
+    if added:
+        bulk_insert(
+            db,
+            FTP.__table__,
+            [
+                {"league_id": league_id, "fantasy_team_id": t, "player_id": p, "slot": "BENCH", "acquired_via": "waiver"}
+                for t, p in added
+            ],
+        )
+
+
+def set_waiver_order(db: Session, team_ids: Sequence[int]) -> None:
+    if not team_ids:
+        return
+    db.execute(
+        update(ft_models.FantasyTeam),
+        [{"id": t, "waiver_priority": i} for i, t in enumerate(team_ids, start=1)],
+    )
+
+
+def create_run(db: Session) -> models.WaiverRun:
+    run = models.WaiverRun(status="running")
+    db.add(run)
+    db.flush()
+    return run
+
+
+def finish_run(db: Session, run_id: int, *, status: str, leagues: int, claims: int, awarded: int) -> None:
+    db.execute(
+        update(models.WaiverRun)
+        .where(models.WaiverRun.id == run_id)
+        .values(status=status, leagues=leagues, claims=claims, awarded=awarded, finished_at=datetime.now(timezone.utc))
+    )
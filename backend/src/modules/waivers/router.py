@@ -0,0 +1,82 @@
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import status
+from sqlalchemy.orm import Session
+
+from ...config.database import get_db
+from ..users.router import get_current_user
+from . import schemas, service
+
+router = APIRouter(tags=["waivers"])
+
+
+@router.post("/leagues/{league_id}/waivers/claims", status_code=201)
+def submit_claim(
+    league_id: int,
+    payload: schemas.ClaimCreate,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    """Solicitud de waiver del equipo del usuario (se procesa en la próxima corrida)."""
+    try:
+        return service.submit_claim(
+            db,
+            league_id=league_id,
+            user_id=current_user.id,
+            add_player_id=payload.add_player_id,
+            drop_player_id=payload.drop_player_id,
+            rank=payload.rank,
+        )
+    except LookupError as le:
+        raise HTTPException(status_code=404, detail=str(le))
+    except ValueError as ve:
+        raise HTTPException(status_code=409, detail=str(ve))
+
+
+@router.get("/leagues/{league_id}/waivers/claims")
+def list_my_claims(
+    league_id: int,
+    status_filter: Optional[Literal["pending", "won", "lost", "invalid", "cancelled"]] = Query(None, alias="status"),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    try:
+        return service.list_my_claims(db, league_id=league_id, user_id=current_user.id, status=status_filter)
+    except LookupError as le:
+        raise HTTPException(status_code=404, detail=str(le))
+
+
+@router.delete("/waivers/claims/{claim_id}")
+def cancel_claim(
+    claim_id: int,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    try:
+        return service.cancel_claim(db, claim_id=claim_id, user_id=current_user.id)
+    except LookupError as le:
+        raise HTTPException(status_code=404, detail=str(le))
+    except PermissionError as pe:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(pe))
+    except ValueError as ve:
+        raise HTTPException(status_code=409, detail=str(ve))
+
+
+@router.get("/leagues/{league_id}/waivers/log")
+def waiver_log(
+    league_id: int,
+    run_id: Optional[int] = Query(None),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    """Resultado de cada solicitud procesada en la liga (la más reciente primero)."""
+    return service.league_log(db, league_id=league_id, run_id=run_id)
+
+
+@router.post("/waivers/run")
+def run_waivers(current_user = Depends(get_current_user)):
+    """Procesa las solicitudes pendientes de todas las ligas (solo admin)."""
+    if getattr(current_user, "role", None) != "admin":
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin only")
+    return service.run_waivers()
@@ -0,0 +1,9 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class ClaimCreate(BaseModel):
+    add_player_id: int
+    drop_player_id: Optional[int] = None
+    rank: Optional[int] = Field(None, ge=1)
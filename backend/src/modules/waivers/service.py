@@ -0,0 +1,209 @@
+"""
+Waivers: managers queue ranked claims during the week; `run_waivers`
+processes every league with pending claims.
+
+Each league is one transaction: lock the league row, load its pending claims,
+rosters, waiver order and free-agent usage (a handful of queries), resolve
+in memory (waivers.engine) and write outcomes, roster moves and the new
+waiver order back set-based. Leagues are independent, so they run in
+parallel on a thread pool, each with its own session.
+"""
+from __future__ import annotations
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy.orm import Session
+
+from ...config.database import SessionLocal
+from ..fantasy_teams import repository as ft_repository
+from ..leagues import models as league_models
+from ..leagues.interning import roster_plan
+from ..players import models as player_models
+from ..players.availability import pool
+from ..scoring.live import scorer
+from . import engine, models, repository
+
+logger = logging.getLogger(__name__)
+
+# Leagues processed at once; each holds one pooled connection
+WAIVER_WORKERS = 8
+
+
+def _claim_dict(claim: models.WaiverClaim) -> Dict[str, Any]:
+    return {
+        "id": claim.id,
+        "league_id": claim.league_id,
+        "fantasy_team_id": claim.fantasy_team_id,
+        "add_player_id": claim.add_player_id,
+        "drop_player_id": claim.drop_player_id,
+        "rank": claim.rank,
+        "status": claim.status,
+        "reason": claim.reason,
+        "run_id": claim.run_id,
+        "created_at": claim.created_at,
+        "processed_at": claim.processed_at,
+    }
+
+
+def _team_for(db: Session, league_id: int, user_id: int):
+    team = repository.get_user_team(db, league_id, user_id)
+    if team is None:
+        raise LookupError("You have no team in this league")
+    return team
+
+
+def submit_claim(
+    db: Session,
+    *,
+    league_id: int,
+    user_id: int,
+    add_player_id: int,
+    drop_player_id: Optional[int] = None,
+    rank: Optional[int] = None,
+) -> Dict[str, Any]:
+    league = db.get(league_models.League, league_id)
+    if league is None:
+        raise LookupError("League not found")
+    if league.status != "in_season":
+        raise ValueError("Waiver claims are only accepted during the season")
+    team = _team_for(db, league_id, user_id)
+    player = db.get(player_models.Player, add_player_id)
+    if player is None or not player.is_active:
+        raise LookupError("Player not found or inactive")
+    pool.ensure(db, league_id)
+    if not pool.is_available(league_id, add_player_id):
+        raise ValueError("Player is already rostered in this league")
+    if drop_player_id is not None and drop_player_id not in {
+        p.player_id for p in ft_repository.list_roster(db, team.id)
+    }:
+        raise ValueError("Drop player is not on your roster")
+    if repository.has_pending_claim(db, team.id, add_player_id, drop_player_id):
+        raise ValueError("You already have this claim pending")
+    claim = repository.create_claim(
+        db,
+        league_id=league_id,
+        fantasy_team_id=team.id,
+        add_player_id=add_player_id,
+        drop_player_id=drop_player_id,
+        rank=rank if rank is not None else repository.next_rank(db, team.id),
+        status="pending",
+    )
+    db.commit()
+    db.refresh(claim)
+    return _claim_dict(claim)
+
+
+def list_my_claims(db: Session, *, league_id: int, user_id: int, status: Optional[str] = None) -> List[Dict[str, Any]]:
+    team = _team_for(db, league_id, user_id)
+    return [_claim_dict(c) for c in repository.list_claims(db, fantasy_team_id=team.id, status=status)]
+
+
+def cancel_claim(db: Session, *, claim_id: int, user_id: int) -> Dict[str, Any]:
+    claim = repository.get_claim(db, claim_id)
+    if claim is None:
+        raise LookupError("Claim not found")
+    team = ft_repository.get_by_id(db, claim.fantasy_team_id)
+    if team is None or team.user_id != user_id:
+        raise PermissionError("Only the team owner can cancel its claims")
+    if claim.status != "pending":
+        raise ValueError("Only pending claims can be cancelled")
+    claim.status = "cancelled"
+    db.commit()
+    db.refresh(claim)
+    return _claim_dict(claim)
+
+
+def league_log(db: Session, *, league_id: int, run_id: Optional[int] = None) -> List[Dict[str, Any]]:
+    return [_claim_dict(c) for c in repository.list_league_log(db, league_id, run_id)]
+
+
+# ---- processing ----
+
+def process_league(db: Session, league_id: int, run_id: int) -> engine.Resolution:
+    """Resolve one league's pending claims in the caller's transaction. No commit."""
+    league = repository.lock_league(db, league_id)
+    if league is None:
+        return engine.Resolution()
+    claims = [engine.Claim(*row) for row in repository.list_pending_claims(db, league_id)]
+    if not claims:
+        return engine.Resolution()
+    rosters: Dict[int, Dict[int, tuple]] = {}
+    for team_id, player_id, position, slot in ft_repository.list_league_roster(db, league_id):
+        rosters.setdefault(int(team_id), {})[int(player_id)] = (position, slot)
+    order = repository.list_waiver_order(db, league_id)
+    for team_id in order:
+        rosters.setdefault(team_id, {})
+
+    result = engine.resolve(
+        roster_plan(league.roster_schema or {}),
+        claims,
+        rosters,
+        order,
+        free_agents_used=repository.free_agent_counts(db, league_id),
+        free_agent_cap=league.max_free_agents_per_team,
+    )
+    repository.record_outcomes(db, run_id, result.outcomes)
+    repository.move_players(db, league_id, added=result.added, dropped=result.dropped)
+    if result.awarded:
+        repository.set_waiver_order(db, result.priority)
+        # Dropped starters stop scoring
+        scorer.refresh_players(db, [p for _t, p in result.dropped])
+    return result
+
+
+def _run_league(league_id: int, run_id: int) -> Dict[str, int]:
+    db = SessionLocal()
+    try:
+        result = process_league(db, league_id, run_id)
+        db.commit()
+    except Exception:
+        db.rollback()
+        logger.exception("Waiver run %d failed for league %d", run_id, league_id)
+        return {"league_id": league_id, "claims": 0, "awarded": 0, "failed": 1}
+    finally:
+        db.close()
+    pool.roster_removed(league_id, [p for _t, p in result.dropped])
+    pool.roster_added(league_id, [p for _t, p in result.added])
+    return {"league_id": league_id, "claims": len(result.outcomes), "awarded": result.awarded, "failed": 0}
+
+
+def run_waivers(*, league_ids: Optional[Iterable[int]] = None, workers: int = WAIVER_WORKERS) -> Dict[str, Any]:
+    """Process the pending claims of every league (or of the given ones). Commits per league."""
+    db = SessionLocal()
+    try:
+        ids = list(league_ids) if league_ids is not None else repository.leagues_with_pending_claims(db)
+        run = repository.create_run(db)
+        db.commit()
+        run_id = run.id
+    finally:
+        db.close()
+
+    if workers > 1 and len(ids) > 1:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="waivers") as executor:
+            per_league = list(executor.map(lambda lid: _run_league(lid, run_id), ids))
+    else:
+        per_league = [_run_league(lid, run_id) for lid in ids]
+
+    summary = {
+        "run_id": run_id,
+        "leagues": len(ids),
+        "claims": sum(r["claims"] for r in per_league),
+        "awarded": sum(r["awarded"] for r in per_league),
+        "failed_leagues": [r["league_id"] for r in per_league if r["failed"]],
+    }
+    db = SessionLocal()
+    try:
+        repository.finish_run(
+            db,
+            run_id,
+            status="failed" if summary["failed_leagues"] else "completed",
+            leagues=summary["leagues"],
+            claims=summary["claims"],
+            awarded=summary["awarded"],
+        )
+        db.commit()
+    finally:
+        db.close()
+    return summary
@@ -0,0 +1,69 @@
+"""Benchmark the available-player pool.
+
+Loads a synthetic catalog and N leagues whose rosters hold a share of the
+players, registers one projection ranking, then times "top N available by
+position" reads and single pick/drop updates. No database is needed.
+
+Usage:
+  python -m src.scripts.bench_availability [--players 3000] [--leagues 2000] [--rostered 180]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from ..modules.players.availability import AvailabilityPool
+
+POSITIONS = ["QB", "RB", "WR", "TE", "K", "DEF"]
+WEIGHTS = [0.12, 0.25, 0.33, 0.14, 0.08, 0.08]
+
+
+def run(n_players: int, n_leagues: int, rostered: int, reads: int) -> None:
+    rng = np.random.default_rng(7)
+    ids = np.arange(1, n_players + 1)
+    positions = rng.choice(POSITIONS, size=n_players, p=WEIGHTS)
+    leagues_of = [[] for _ in range(n_players)]
+    for league_id in range(1, n_leagues + 1):
+        taken = rng.choice(n_players, size=rostered, replace=False)
+        for i in taken:
+            leagues_of[i].append(league_id)
+
+    pool = AvailabilityPool()
+    started = time.perf_counter()
+    pool.load([(int(pid), str(pos), leagues) for pid, pos, leagues in zip(ids, positions, leagues_of)])
+    print(f"carga: {n_players:,} jugadores, {n_leagues:,} ligas en {time.perf_counter() - started:.3f}s")
+
+    projections = dict(zip(ids.tolist(), rng.normal(8, 5, n_players).tolist()))
+    started = time.perf_counter()
+    pool.set_ranking("proj", projections)
+    print(f"ranking: {time.perf_counter() - started:.4f}s")
+
+    league_ids = rng.integers(1, n_leagues + 1, size=reads)
+    pos = rng.choice(POSITIONS, size=reads)
+    started = time.perf_counter()
+    for league_id, position in zip(league_ids.tolist(), pos.tolist()):
+        pool.top_available(league_id, position, 10, ranking="proj")
+    elapsed = time.perf_counter() - started
+    print(f"top 10 por posición: {elapsed / reads * 1e6:.1f} us/consulta")
+
+    started = time.perf_counter()
+    for league_id in league_ids.tolist():
+        best = pool.top_available(league_id, None, 1, ranking="proj")
+        pool.roster_added(league_id, best)
+        pool.roster_removed(league_id, best)
+    elapsed = time.perf_counter() - started
+    print(f"mejor disponible + pick + drop: {elapsed / reads * 1e6:.1f} us")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=3000)
+    parser.add_argument("--leagues", type=int, default=2000)
+    parser.add_argument("--rostered", type=int, default=180)
+    parser.add_argument("--reads", type=int, default=20000)
+    args = parser.parse_args()
+    run(args.players, args.leagues, args.rostered, args.reads)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Benchmark the bulk write layer (COPY vs executemany) for players.
+
+Inserts N synthetic players with `players.repository.bulk_create_players`
+inside an outer transaction that is rolled back at the end, once per method,
+and prints the throughput of each.
+
+Usage:
+  python -m src.scripts.bench_bulk_insert [--count 100000] [--method copy|executemany|both]
+"""
+import argparse
+import time
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ..config.database import engine
+from ..modules.leagues import models as league_models  # noqa: F401  (registers FK targets)
+from ..modules.teams.models import Team
+from ..modules.users.models import User
+from ..modules.players.repository import bulk_create_players
+
+POSITIONS = ["QB", "RB", "WR", "TE", "K"]
+
+
+def _rows(count: int, team_ids: list[int], user_id: int) -> list[dict]:
+    return [
+        {
+            "id": 800_000_000 + i,
+            "name": f"Bulk Player {i:07d}",
+            "position": POSITIONS[i % len(POSITIONS)],
+            "image_url": None,
+            "thumbnail_url": None,
+            "is_active": True,
+            "created_by": user_id,
+            "team_id": team_ids[i % len(team_ids)],
+        }
+        for i in range(count)
+    ]
+
+
+def run(count: int, method: str) -> None:
+    conn = engine.connect()
+    outer = conn.begin()
+    try:
+        db = Session(bind=conn, join_transaction_mode="create_savepoint")
+        team_ids = db.execute(select(Team.id).limit(32)).scalars().all()
+        user_id = db.execute(select(User.id).order_by(User.id).limit(1)).scalar_one_or_none()
+        if not team_ids or user_id is None:
+            raise SystemExit("Se necesita al menos un equipo y un usuario en la BD para el benchmark.")
+
+        rows = _rows(count, team_ids, user_id)
+        for m in (["copy", "executemany"] if method == "both" else [method]):
+            savepoint = conn.begin_nested()
+            started = time.perf_counter()
+            ids = bulk_create_players(db, rows, method=m)
+            elapsed = time.perf_counter() - started
+            savepoint.rollback()
+            print(f"{m:12s} {len(ids):>8,} rows  {elapsed:8.3f}s  {len(ids) / elapsed:>12,.0f} rows/s")
+    finally:
+        outer.rollback()
+        conn.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--method", choices=["copy", "executemany", "both"], default="both")
+    args = parser.parse_args()
+    run(args.count, args.method)
@@ -0,0 +1,88 @@
+"""Benchmark the snake draft engine and its single-task pick clocks.
+
+Runs N simultaneous drafts in one event loop with a very short pick clock so
+every pick is an autopick fired by the shared ClockScheduler, then reports the
+pick throughput, the validation cost per pick and the timer lateness.
+No database is needed (the pick log is not written).
+
+Usage:
+  python -m src.scripts.bench_draft [--drafts 500] [--teams 12] [--pick-ms 5]
+"""
+import argparse
+import asyncio
+import random
+import time
+
+from ..modules.leagues.services.league_service import DEFAULT_ROSTER
+from ..modules.draft.clock import ClockScheduler
+from ..modules.draft.engine import DraftState
+from ..modules.fantasy_teams.lineup import compile_roster
+
+POSITION_MIX = ["QB"] * 40 + ["RB"] * 90 + ["WR"] * 110 + ["TE"] * 40 + ["K"] * 32 + ["DEF"] * 32
+
+
+async def run(n_drafts: int, teams: int, pick_ms: float) -> None:
+    rng = random.Random(7)
+    players = list(range(1, len(POSITION_MIX) * 2 + 1))
+    positions = {pid: POSITION_MIX[i % len(POSITION_MIX)] for i, pid in enumerate(players)}
+    plan = compile_roster(DEFAULT_ROSTER)
+    clock = ClockScheduler()
+    delay = pick_ms / 1000.0
+
+    states = []
+    for d in range(n_drafts):
+        state = DraftState(d, [d * 100 + t for t in range(teams)], plan, pick_seconds=delay)
+        for team in state.order:
+            state.queues[team] = rng.sample(players, 20)
+        states.append(state)
+
+    done = asyncio.Event()
+    remaining = [n_drafts]
+    lateness = []
+    check_time = [0.0]
+
+    def expire(state: DraftState, due: float) -> None:
+        lateness.append(loop.time() - due)
+        team = state.on_clock
+        started = time.perf_counter()
+        pid = state.choose_auto(team, positions.get, players)
+        check_time[0] += time.perf_counter() - started
+        state.apply(state.next_pick_for(team, pid, is_auto=True), positions[pid])
+        if state.complete:
+            remaining[0] -= 1
+            if not remaining[0]:
+                done.set()
+        else:
+            arm(state)
+
+    def arm(state: DraftState) -> None:
+        due = loop.time() + delay
+        clock.schedule(state.league_id, delay, lambda: expire(state, due))
+
+    loop = asyncio.get_running_loop()
+    started = time.perf_counter()
+    for state in states:
+        arm(state)
+    await done.wait()
+    elapsed = time.perf_counter() - started
+    await clock.stop()
+
+    picks = sum(len(s.picks) for s in states)
+    lateness.sort()
+    p99 = lateness[int(len(lateness) * 0.99)] * 1000
+    print(f"{n_drafts} drafts x {teams} equipos x {states[0].rounds} rondas: {picks:,} picks en {elapsed:.2f}s")
+    print(f"  autopick + validación: {check_time[0] / picks * 1e6:.1f} us/pick")
+    print(f"  retraso del reloj: p50 {lateness[len(lateness) // 2] * 1000:.2f} ms, p99 {p99:.2f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--drafts", type=int, default=500)
+    parser.add_argument("--teams", type=int, default=12)
+    parser.add_argument("--pick-ms", type=float, default=5.0)
+    args = parser.parse_args()
+    asyncio.run(run(args.drafts, args.teams, args.pick_ms))
+
+
+if __name__ == "__main__":
+    main()
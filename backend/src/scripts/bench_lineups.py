@@ -0,0 +1,47 @@
+"""Benchmark the lineup solver.
+
+Solves the best lineup of every team for N synthetic leagues with the default
+roster (plus an optional second FLEX kind, which uses the Hungarian path) and
+random projections. No database is needed.
+
+Usage:
+  python -m src.scripts.bench_lineups [--leagues 1000] [--teams 12] [--two-flex]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from ..modules.leagues.services.league_service import DEFAULT_ROSTER
+from ..modules.fantasy_teams import lineup
+
+ROSTER = ["QB", "QB", "RB", "RB", "RB", "RB", "RB", "WR", "WR", "WR", "WR", "WR", "TE", "TE", "K", "DEF"]
+
+
+def run(leagues: int, teams: int, two_flex: bool) -> None:
+    schema = dict(DEFAULT_ROSTER)
+    if two_flex:
+        schema["FLEX_WR_TE"] = 1
+    plan = lineup.compile_roster(schema)
+    rng = np.random.default_rng(7)
+    n = teams * len(ROSTER)
+    team_ids = np.repeat(np.arange(teams), len(ROSTER))
+    positions = ROSTER * teams
+
+    started = time.perf_counter()
+    for _ in range(leagues):
+        points = rng.normal(10, 6, n)
+        on_ir = rng.random(n) < 0.03
+        lineup.solve_league(plan, team_ids, np.arange(n), positions, points, on_ir)
+    elapsed = time.perf_counter() - started
+    total = leagues * teams
+    print(f"{leagues:,} ligas x {teams} equipos: {elapsed:.3f}s  ({total / elapsed:,.0f} equipos/s)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--leagues", type=int, default=1000)
+    parser.add_argument("--teams", type=int, default=12)
+    parser.add_argument("--two-flex", action="store_true")
+    args = parser.parse_args()
+    run(args.leagues, args.teams, args.two_flex)
@@ -0,0 +1,86 @@
+"""Benchmark the players batch import against the configured database.
+
+Generates N synthetic players spread over the existing teams, runs
+`process_players_batch` inside an outer transaction that is rolled back at the
+end (the database is left untouched) and reports the number of SQL statements
+issued and the wall time of the run.
+
+Usage:
+  python -m src.scripts.bench_players_batch [--count 10000] [--with-images]
+"""
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from ..config.database import engine
+from ..modules.teams.models import Team
+from ..modules.users.models import User
+from ..modules.leagues import models as league_models  # noqa: F401  (registers FK targets)
+from ..modules.players import models as player_models  # noqa: F401
+from ..modules.players.service import process_players_batch
+
+POSITIONS = ["QB", "RB", "WR", "TE", "K"]
+
+
+def _synthetic_players(count: int, team_names: list[str], id_offset: int) -> list[dict]:
+    return [
+        {
+            "id": id_offset + i,
+            "name": f"Bench Player {i:06d}",
+            "position": POSITIONS[i % len(POSITIONS)],
+            "team": team_names[i % len(team_names)],
+            "image": f"https://example.invalid/players/{i}.png",
+        }
+        for i in range(count)
+    ]
+
+
+def run(count: int, with_images: bool) -> None:
+    conn = engine.connect()
+    outer = conn.begin()
+    statements = {"n": 0}
+
+    def _count(*_args, **_kwargs):
+        statements["n"] += 1
+
+    try:
+        db = Session(bind=conn, join_transaction_mode="create_savepoint")
+        team_names = db.execute(select(Team.name).limit(32)).scalars().all()
+        user_id = db.execute(select(User.id).order_by(User.id).limit(1)).scalar_one_or_none()
+        if not team_names or user_id is None:
+            raise SystemExit("Se necesita al menos un equipo y un usuario en la BD para el benchmark.")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "bench_players.json"
+            path.write_text(json.dumps(_synthetic_players(count, team_names, 900_000_000)), encoding="utf-8")
+
+            event.listen(conn, "before_cursor_execute", _count)
+            started = time.perf_counter()
+            result = process_players_batch(
+                db,
+                file_path=str(path),
+                created_by=user_id,
+                download_images=with_images,
+            )
+            elapsed = time.perf_counter() - started
+            event.remove(conn, "before_cursor_execute", _count)
+
+        print(f"players:    {len(result['created'])}")
+        print(f"statements: {statements['n']}")
+        print(f"wall time:  {elapsed:.3f}s ({len(result['created']) / elapsed:,.0f} players/s)")
+    finally:
+        outer.rollback()
+        conn.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=10_000)
+    parser.add_argument("--with-images", action="store_true", help="download images and build thumbnails")
+    args = parser.parse_args()
+    run(args.count, args.with_images)
@@ -0,0 +1,61 @@
+"""Benchmark the Monte Carlo playoff-odds simulator.
+
+Builds N synthetic 12-team leagues halfway through a 14-week regular season
+and simulates the rest of the season for each, first one league in-process
+and then all leagues over the process pool. No database is needed.
+
+Usage:
+  python -m src.scripts.bench_playoff_odds [--leagues 200] [--simulations 10000] [--workers N]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from ..modules.matchups import playoffs
+from ..modules.matchups.schedule import season_schedule
+
+
+def _league(league_id: int, rng: np.random.Generator, teams: int = 12, played: int = 7, weeks: int = 14) -> playoffs.LeagueSim:
+    history = [list(rng.normal(100 + rng.normal(0, 8), 20, played)) for _ in range(teams)]
+    mu, sigma = playoffs.score_model(history)
+    remaining = season_schedule(list(range(teams)), weeks, seed=league_id)[played:]
+    games = [(a, b) for week in remaining for a, b in week if b is not None]
+    wins = rng.integers(0, played + 1, teams)
+    return playoffs.LeagueSim(
+        league_id=league_id,
+        team_ids=np.arange(teams, dtype=np.int64),
+        wins=wins,
+        losses=played - wins,
+        ties=np.zeros(teams, dtype=np.int64),
+        points_for=np.array([sum(h) for h in history]),
+        points_against=np.full(teams, 100.0 * played),
+        home=np.array([g[0] for g in games], dtype=np.int64),
+        away=np.array([g[1] for g in games], dtype=np.int64),
+        mu=mu,
+        sigma=sigma,
+        playoff_teams=6,
+    )
+
+
+def run(leagues: int, simulations: int, workers) -> None:
+    rng = np.random.default_rng(11)
+    sims = [_league(i, rng) for i in range(leagues)]
+
+    started = time.perf_counter()
+    playoffs.simulate(sims[0], simulations)
+    print(f"1 liga, {simulations:,} simulaciones: {time.perf_counter() - started:.3f}s")
+
+    started = time.perf_counter()
+    playoffs.simulate_many(sims, simulations, workers=workers)
+    elapsed = time.perf_counter() - started
+    print(f"{leagues:,} ligas en pool: {elapsed:.3f}s  ({leagues / elapsed:,.1f} ligas/s)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--leagues", type=int, default=200)
+    parser.add_argument("--simulations", type=int, default=10_000)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+    run(args.leagues, args.simulations, args.workers)
@@ -0,0 +1,60 @@
+"""Benchmark weekly projections.
+
+Projects --players synthetic players from --weeks weeks of stat lines (some
+weeks missed) with projections.engine, then scores the projections under
+--schemas scoring schemas at once. No database is needed.
+
+Usage:
+  python -m src.scripts.bench_projections [--players 2500] [--weeks 8] [--schemas 20]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from ..modules.leagues.services.league_service import DEFAULT_SCORING
+from ..modules.projections import engine
+from ..modules.scoring.engine import STAT_COLUMNS, STAT_INDEX, StatTable, compile_plan, score
+
+POSITIONS = ["QB", "RB", "WR", "TE", "K", "DEF"]
+
+
+def build_history(rng, players: int, weeks: int):
+    ids = np.arange(1, players + 1, dtype=np.int64)
+    positions = {int(p): POSITIONS[int(p) % len(POSITIONS)] for p in ids}
+    history = []
+    for _ in range(weeks):
+        played = ids[rng.random(players) < 0.9]
+        values = rng.poisson(3.0, size=(len(played), len(STAT_COLUMNS))).astype(np.float64)
+        is_def = np.array([positions[int(p)] == "DEF" for p in played])
+        values[~is_def, STAT_INDEX["points_allowed"]] = np.nan
+        history.append(StatTable(player_ids=played, values=values))
+    return history, positions
+
+
+def run(players: int, weeks: int, schemas: int) -> None:
+    rng = np.random.default_rng(7)
+    history, positions = build_history(rng, players, weeks)
+    variants = [dict(DEFAULT_SCORING, reception=0.5 * (i % 3)) for i in range(schemas)]
+
+    started = time.perf_counter()
+    lines, games = engine.project(history, positions)
+    projected = time.perf_counter() - started
+    started = time.perf_counter()
+    points = score(lines, compile_plan(variants))
+    scored = time.perf_counter() - started
+    print(f"{len(lines):,} jugadores x {weeks} semanas proyectados en {projected * 1000:.1f} ms")
+    print(f"{schemas} sistemas de puntuación: {scored * 1000:.1f} ms (media {np.nanmean(points):.2f} pts, {games.mean():.1f} partidos)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=2500)
+    parser.add_argument("--weeks", type=int, default=8)
+    parser.add_argument("--schemas", type=int, default=20)
+    args = parser.parse_args()
+    run(args.players, args.weeks, args.schemas)
+
+
+if __name__ == "__main__":
+    main()
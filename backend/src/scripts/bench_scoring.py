@@ -0,0 +1,67 @@
+"""Benchmark the vectorized scoring engine.
+
+Scores a synthetic week of N players for M leagues with one matrix product.
+League schemas are variations of DEFAULT_SCORING (different yards-per-point
+values, tier bonuses and decimal settings). No database is needed.
+
+Usage:
+  python -m src.scripts.bench_scoring [--players 2000] [--leagues 10000] [--float32]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from ..modules.leagues.services.league_service import DEFAULT_SCORING
+from ..modules.scoring import engine
+
+
+def _synthetic_stats(n: int, rng: np.random.Generator) -> engine.StatTable:
+    values = np.zeros((n, len(engine.STAT_COLUMNS)))
+    col = engine.STAT_INDEX
+    values[:, col["passing_yards"]] = rng.integers(0, 400, n) * (rng.random(n) < 0.1)
+    values[:, col["passing_td"]] = rng.integers(0, 4, n) * (rng.random(n) < 0.1)
+    values[:, col["rushing_yards"]] = rng.integers(0, 150, n)
+    values[:, col["receptions"]] = rng.integers(0, 10, n)
+    values[:, col["receiving_yards"]] = rng.integers(0, 160, n)
+    values[:, col["rush_recv_td"]] = rng.integers(0, 3, n)
+    values[:, col["points_allowed"]] = np.where(rng.random(n) < 0.02, rng.integers(0, 45, n), np.nan)
+    return engine.StatTable(player_ids=np.arange(1, n + 1, dtype=np.int64), values=values)
+
+
+def _synthetic_schemas(m: int, rng: np.random.Generator):
+    schemas, decimals = [], []
+    for _ in range(m):
+        s = dict(DEFAULT_SCORING)
+        s["passing_yards_per_point"] = int(rng.choice([20, 25]))
+        s["reception"] = float(rng.choice([0, 0.5, 1]))
+        s["points_allowed_le_10"] = int(rng.choice([4, 5, 7]))
+        schemas.append(s)
+        decimals.append(bool(rng.random() < 0.8))
+    return schemas, decimals
+
+
+def run(players: int, leagues: int, float32: bool) -> None:
+    rng = np.random.default_rng(2024)
+    stats = _synthetic_stats(players, rng)
+    schemas, decimals = _synthetic_schemas(leagues, rng)
+    dtype = np.float32 if float32 else np.float64
+
+    t0 = time.perf_counter()
+    plan = engine.compile_plan(schemas, decimals, dtype=dtype)
+    t1 = time.perf_counter()
+    points = engine.score(stats, plan)
+    t2 = time.perf_counter()
+
+    print(f"players x leagues: {players:,} x {leagues:,} ({points.size:,} scores, {len(plan.features)} features)")
+    print(f"compile: {t1 - t0:.3f}s")
+    print(f"score:   {t2 - t1:.3f}s ({points.size / (t2 - t1):,.0f} scores/s)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=2000)
+    parser.add_argument("--leagues", type=int, default=10_000)
+    parser.add_argument("--float32", action="store_true")
+    args = parser.parse_args()
+    run(args.players, args.leagues, args.float32)
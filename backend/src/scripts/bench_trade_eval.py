@@ -0,0 +1,64 @@
+"""Benchmark trade evaluation.
+
+Evaluates --offers random offers (1-3 players each way) between two full
+rosters with trades.evaluator, the in-memory part of
+`POST /leagues/{id}/trades/evaluate`. No database is needed; the endpoint adds
+two small queries (rosters, projections).
+
+Usage:
+  python -m src.scripts.bench_trade_eval [--offers 2000]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from ..modules.fantasy_teams.lineup import compile_roster
+from ..modules.leagues.config import LeagueConfig
+from ..modules.leagues.services.league_service import DEFAULT_ROSTER
+from ..modules.trades import evaluator
+
+ROSTER = ["QB", "QB", "RB", "RB", "RB", "RB", "WR", "WR", "WR", "WR", "WR", "TE", "TE", "K", "DEF"]
+
+
+def run(offers: int) -> None:
+    rng = np.random.default_rng(7)
+    config = LeagueConfig(
+        id=1, season_id=1, status="in_season", created_by=1, trade_deadline=None,
+        max_trades_per_team=None, max_free_agents_per_team=None, playoff_format=4,
+        allow_decimal_scoring=True, roster_schema=DEFAULT_ROSTER, scoring_schema={},
+        plan=compile_roster(DEFAULT_ROSTER),
+    )
+    rows = []
+    for team in (1, 2):
+        for i, position in enumerate(ROSTER):
+            rows.append((team, team * 100 + i, position, "BENCH"))
+    projected = {pid: float(rng.uniform(0, 25)) for _t, pid, _p, _s in rows}
+    a_ids = [pid for t, pid, _p, _s in rows if t == 1]
+    b_ids = [pid for t, pid, _p, _s in rows if t == 2]
+    deals = [
+        (rng.choice(a_ids, int(rng.integers(1, 4)), replace=False).tolist(),
+         rng.choice(b_ids, int(rng.integers(1, 4)), replace=False).tolist())
+        for _ in range(offers)
+    ]
+
+    started = time.perf_counter()
+    fairness = 0.0
+    for send, receive in deals:
+        result = evaluator.evaluate(
+            config, rows, projected, proposer_team_id=1, receiver_team_id=2, send_ids=send, receive_ids=receive
+        )
+        fairness += result["fairness"]
+    elapsed = time.perf_counter() - started
+    print(f"{offers:,} ofertas: {elapsed:.3f}s ({elapsed / offers * 1e6:,.0f} µs/oferta), equidad media {fairness / offers:.3f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--offers", type=int, default=2000)
+    args = parser.parse_args()
+    run(args.offers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Benchmark waiver resolution.
+
+Builds N synthetic leagues with full rosters and a total of --claims ranked
+claims (most with a drop, many teams chasing the same players), and resolves
+every league with waivers.engine. No database is needed; this is the
+in-memory part of a run, the rest is a handful of queries per league.
+
+Usage:
+  python -m src.scripts.bench_waivers [--leagues 1000] [--claims 50000] [--teams 12]
+"""
+import argparse
+import time
+from collections import Counter
+
+import numpy as np
+
+from ..modules.fantasy_teams.lineup import compile_roster
+from ..modules.leagues.services.league_service import DEFAULT_ROSTER
+from ..modules.waivers import engine
+
+ROSTER = ["QB", "RB", "RB", "RB", "RB", "RB", "WR", "WR", "WR", "WR", "WR", "TE", "TE", "K", "DEF"]
+POSITIONS = ["QB", "RB", "WR", "TE", "K", "DEF"]
+
+
+def build_league(rng, league_id: int, teams: int, n_claims: int, n_players: int):
+    team_ids = [league_id * 100 + t for t in range(teams)]
+    players = rng.permutation(n_players) + 1
+    positions = {int(p): POSITIONS[int(p) % len(POSITIONS)] for p in players}
+    rosters = {}
+    cursor = 0
+    for team in team_ids:
+        rosters[team] = {int(p): (positions[int(p)], "BENCH") for p in players[cursor:cursor + len(ROSTER)]}
+        cursor += len(ROSTER)
+    free = players[cursor:cursor + 40]  # the hot free agents everyone chases
+    claims = []
+    for i in range(n_claims):
+        team = team_ids[int(rng.integers(teams))]
+        add = int(free[int(rng.integers(len(free)))])
+        drop = int(rng.choice(list(rosters[team]))) if rng.random() < 0.8 else None
+        claims.append(engine.Claim(i + league_id * 100_000, team, add, positions[add], drop, int(rng.integers(1, 10))))
+    return claims, rosters, team_ids
+
+
+def run(leagues: int, total_claims: int, teams: int) -> None:
+    rng = np.random.default_rng(7)
+    plan = compile_roster(DEFAULT_ROSTER)
+    per_league = total_claims // leagues
+    data = [build_league(rng, lid, teams, per_league, 600) for lid in range(1, leagues + 1)]
+
+    outcomes = Counter()
+    started = time.perf_counter()
+    for claims, rosters, order in data:
+        result = engine.resolve(plan, claims, rosters, order, free_agent_cap=25)
+        outcomes.update(status for _id, status, _reason in result.outcomes)
+    elapsed = time.perf_counter() - started
+    n = sum(outcomes.values())
+    print(f"{leagues:,} ligas, {n:,} solicitudes: {elapsed:.3f}s ({n / elapsed:,.0f} solicitudes/s)")
+    print("  " + ", ".join(f"{k}: {v:,}" for k, v in sorted(outcomes.items())))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--leagues", type=int, default=1000)
+    parser.add_argument("--claims", type=int, default=50_000)
+    parser.add_argument("--teams", type=int, default=12)
+    args = parser.parse_args()
+    run(args.leagues, args.claims, args.teams)
+
+
+if __name__ == "__main__":
+    main()
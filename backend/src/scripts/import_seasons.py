@@ -0,0 +1,31 @@
+"""Import many seasons with their weeks from a file (see leagues/services/season_import.py).
+
+Usage:
+  python -m src.scripts.import_seasons seasons.jsonl --user-id 1
+"""
+import argparse
+import json
+from pathlib import Path
+
+from ..config.database import SessionLocal
+from ..core.streaming import detect_format
+from ..modules.leagues.services.season_import import import_seasons
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--user-id", type=int, required=True, help="Admin user recorded as created_by")
+    args = parser.parse_args()
+    fmt = detect_format(args.path.name)
+    db = SessionLocal()
+    try:
+        with args.path.open(encoding="utf-8-sig", newline="") as fp:
+            summary = import_seasons(db, fileobj=fp, fmt=fmt, user_id=args.user_id)
+    finally:
+        db.close()
+    print(json.dumps(summary, indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
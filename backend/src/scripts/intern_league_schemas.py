@@ -0,0 +1,36 @@
+"""Link every league to the interned copies of its roster and scoring schemas.
+
+Run once after migration 018 (new leagues are interned when created), and
+after editing schemas directly in the database. Prints how many leagues
+share each distinct schema.
+
+Usage:
+  python -m src.scripts.intern_league_schemas
+"""
+from collections import Counter
+
+from sqlalchemy import select
+
+from ..config.database import SessionLocal
+from ..modules.leagues import models
+from ..modules.leagues.interning import intern_league
+
+
+def main() -> None:
+    db = SessionLocal()
+    try:
+        leagues = db.execute(select(models.League).order_by(models.League.id)).scalars().all()
+        for league in leagues:
+            intern_league(db, league)
+        db.commit()
+        rosters = Counter(lg.roster_schema_id for lg in leagues)
+        scorings = Counter(lg.scoring_schema_id for lg in leagues)
+    finally:
+        db.close()
+    print(f"{len(leagues)} ligas: {len(rosters)} plantillas distintas, {len(scorings)} sistemas de puntuación distintos")
+    for schema_id, n in scorings.most_common(5):
+        print(f"  puntuación #{schema_id}: {n} ligas")
+
+
+if __name__ == "__main__":
+    main()
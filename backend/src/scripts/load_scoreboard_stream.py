@@ -0,0 +1,147 @@
+"""Load test for the league scoreboard push channel.
+
+Two modes:
+
+  http   Opens N concurrent idle SSE connections against a running worker
+         (GET /leagues/{id}/scoreboard/stream), waits until every one has
+         received its snapshot, holds them for --hold seconds and reports how
+         many stayed open.
+
+  local  No server or database: N subscriptions on an in-process Hub with the
+         LocalBroker, then bursts of score updates are published from a worker
+         thread (like the live scorer does) and the fan-out time is measured.
+
+Usage:
+  python -m src.scripts.load_scoreboard_stream http --token <jwt> --league 1 --week 1 [--connections 10000] [--hold 60]
+  python -m src.scripts.load_scoreboard_stream local [--connections 10000] [--updates 200] [--teams 12]
+"""
+import argparse
+import asyncio
+import resource
+import threading
+import time
+
+from ..core.pubsub import Hub, LocalBroker
+from ..core.sse import COALESCE_SECONDS
+
+
+def _raise_fd_limit(needed: int) -> None:
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < needed:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (min(needed, hard), hard))
+
+
+async def _open_stream(host: str, port: int, path: str, token: str, ready: asyncio.Event, stats: dict) -> None:
+    try:
+        reader, writer = await asyncio.open_connection(host, port)
+    except OSError:
+        stats["failed"] += 1
+        return
+    writer.write(
+        f"GET {path} HTTP/1.1\r\nHost: {host}\r\nAuthorization: Bearer {token}\r\n"
+        f"Accept: text/event-stream\r\n\r\n".encode()
+    )
+    await writer.drain()
+    try:
+        status_line = await reader.readline()
+        if b" 200 " not in status_line:
+            stats["failed"] += 1
+            return
+        while b"event: snapshot" not in await reader.readline():
+            pass
+        stats["open"] += 1
+        await ready.wait()
+        # Hold the connection: keep reading heartbeats until the test ends
+        while not stats["done"]:
+            line = await reader.readline()
+            if not line:
+                stats["dropped"] += 1
+                return
+    except (OSError, asyncio.IncompleteReadError):
+        stats["dropped"] += 1
+    finally:
+        writer.close()
+
+
+async def run_http(host: str, port: int, league: int, week: int, token: str, connections: int, hold: float) -> None:
+    _raise_fd_limit(connections + 100)
+    path = f"/leagues/{league}/scoreboard/stream?week_id={week}"
+    stats = {"open": 0, "failed": 0, "dropped": 0, "done": False}
+    ready = asyncio.Event()
+
+    started = time.perf_counter()
+    tasks = [asyncio.create_task(_open_stream(host, port, path, token, ready, stats)) for _ in range(connections)]
+    while stats["open"] + stats["failed"] < connections and time.perf_counter() - started < 120:
+        await asyncio.sleep(0.5)
+    print(f"abiertas {stats['open']:,} / {connections:,} en {time.perf_counter() - started:.1f}s (fallidas {stats['failed']:,})")
+
+    ready.set()
+    await asyncio.sleep(hold)
+    print(f"tras {hold:.0f}s: {stats['open'] - stats['dropped']:,} siguen abiertas, {stats['dropped']:,} cerradas por el servidor")
+    stats["done"] = True
+    for t in tasks:
+        t.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def run_local(connections: int, updates: int, teams: int) -> None:
+    hub = Hub(LocalBroker())
+    channel = "league:1:scores"
+    subs = [hub.subscribe(channel) for _ in range(connections)]
+    received = 0
+    expected = teams  # updates coalesce to the latest total per team
+
+    async def consume(sub) -> None:
+        nonlocal received
+        while True:
+            await sub.wait()
+            await asyncio.sleep(COALESCE_SECONDS)  # same coalescing as the stream endpoint
+            messages, _overflowed = sub.drain()
+            received += len(messages)
+
+    consumers = [asyncio.create_task(consume(s)) for s in subs]
+
+    def publisher() -> None:
+        for i in range(updates):
+            team_id = i % teams
+            hub.publish(channel, (1, team_id), {"week_id": 1, "fantasy_team_id": team_id, "points": float(i)})
+
+    started = time.perf_counter()
+    thread = threading.Thread(target=publisher)
+    thread.start()
+    await asyncio.to_thread(thread.join)
+    published = time.perf_counter() - started
+    while received < connections * expected and time.perf_counter() - started < 60:
+        await asyncio.sleep(0.01)
+    elapsed = time.perf_counter() - started
+
+    print(f"suscriptores {connections:,}  updates {updates:,}  publicación {published:.3f}s  entrega {elapsed:.3f}s")
+    print(f"mensajes entregados {received:,} (sin coalescer serían {connections * updates:,})")
+    for c in consumers:
+        c.cancel()
+    await asyncio.gather(*consumers, return_exceptions=True)
+    for s in subs:
+        s.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="mode", required=True)
+    http = sub.add_parser("http")
+    http.add_argument("--host", default="127.0.0.1")
+    http.add_argument("--port", type=int, default=8000)
+    http.add_argument("--league", type=int, required=True)
+    http.add_argument("--week", type=int, required=True)
+    http.add_argument("--token", required=True)
+    http.add_argument("--connections", type=int, default=10_000)
+    http.add_argument("--hold", type=float, default=60)
+    local = sub.add_parser("local")
+    local.add_argument("--connections", type=int, default=10_000)
+    local.add_argument("--updates", type=int, default=200)
+    local.add_argument("--teams", type=int, default=12)
+    args = parser.parse_args()
+
+    if args.mode == "http":
+        asyncio.run(run_http(args.host, args.port, args.league, args.week, args.token, args.connections, args.hold))
+    else:
+        asyncio.run(run_local(args.connections, args.updates, args.teams))
@@ -0,0 +1,22 @@
+"""Process pending waiver claims of every league (for cron / a scheduler).
+
+Usage:
+  python -m src.scripts.run_waivers [--league 12 --league 15] [--workers 8]
+"""
+import argparse
+import json
+
+from ..modules.waivers.service import WAIVER_WORKERS, run_waivers
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--league", type=int, action="append", dest="leagues", help="Only these leagues")
+    parser.add_argument("--workers", type=int, default=WAIVER_WORKERS)
+    args = parser.parse_args()
+    summary = run_waivers(league_ids=args.leagues, workers=args.workers)
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+import uuid
+
+import pytest
+from sqlalchemy import delete
+from sqlalchemy.exc import OperationalError
+
+
+@pytest.fixture(scope="session")
+def session_factory():
+    """SessionLocal of the configured database; the test is skipped when it cannot be reached."""
+    try:
+        from src.config.database import SessionLocal, engine
+
+        with engine.connect():
+            pass
+    except (ImportError, OperationalError) as e:
+        pytest.skip(f"database not available ({type(e).__name__})")
+    return SessionLocal
+
+
+@pytest.fixture
+def temp_users(session_factory):
+    """`make(n)` creates n throwaway users and returns their ids; they are deleted afterwards."""
+    from src.modules.users.models import User
+
+    created = []
+
+    def make(n):
+        tag = uuid.uuid4().hex[:6]
+        db = session_factory()
+        try:
+            users = [
+                User(name=f"test {i}", email=f"test-{tag}-{i}@nflfantasy.local", alias=f"test{i}", hashed_password="-")
+                for i in range(n)
+            ]
+            db.add_all(users)
+            db.commit()
+            ids = [u.id for u in users]
+        finally:
+            db.close()
+        created.extend(ids)
+        return ids
+
+    yield make
+    db = session_factory()
+    try:
+        db.execute(delete(User).where(User.id.in_(created)))
+        db.commit()
+    finally:
+        db.close()
@@ -0,0 +1,100 @@
+"""Parallel season creation against the ex_seasons_no_overlap / ex_weeks_no_overlap constraints (needs the database)."""
+import threading
+import uuid
+from datetime import date, timedelta
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import delete
+
+from src.modules.leagues.models import Season
+from src.modules.leagues.schemas import SeasonCreate, WeekCreate
+from src.modules.leagues.services.season_service import SeasonService
+
+WORKERS = 16
+YEAR = 2090  # far from real seasons
+
+OVERLAP = "Las fechas se traslapan con la temporada existente"
+WEEKS_OVERLAP = "Las semanas de la temporada se traslapan entre sí"
+
+
+def _weeks(start: date, n: int, step: int = 7):
+    return [
+        WeekCreate(week_number=i + 1, start_date=start + timedelta(days=step * i), end_date=start + timedelta(days=step * i + 6))
+        for i in range(n)
+    ]
+
+
+def _payload(name: str, start: date, weeks) -> SeasonCreate:
+    return SeasonCreate(
+        name=name,
+        week_count=len(weeks),
+        start_date=start,
+        end_date=start + timedelta(days=7 * len(weeks) + 6),
+        is_current=False,
+        weeks=weeks,
+    )
+
+
+@pytest.fixture
+def tag(session_factory):
+    tag = uuid.uuid4().hex[:6]
+    yield tag
+    db = session_factory()
+    try:
+        db.execute(delete(Season).where(Season.name.like(f"concurrency-{tag}-%")))
+        db.commit()
+    finally:
+        db.close()
+
+
+def _create(session_factory, payload, user_id):
+    """'created', or the HTTPException raised by create_season."""
+    db = session_factory()
+    try:
+        SeasonService.create_season(db, payload, user_id)
+        return "created"
+    except HTTPException as e:
+        return e
+    finally:
+        db.close()
+
+
+def test_only_one_of_overlapping_parallel_creates_wins(session_factory, temp_users, tag):
+    (user_id,) = temp_users(1)
+    barrier = threading.Barrier(WORKERS)
+    outcomes = []
+    lock = threading.Lock()
+
+    def create(i: int) -> None:
+        # Each worker starts a day apart: every pair of ranges overlaps
+        start = date(YEAR, 9, 1) + timedelta(days=i)
+        payload = _payload(f"concurrency-{tag}-{i}", start, _weeks(start, 4))
+        barrier.wait()
+        result = _create(session_factory, payload, user_id)
+        with lock:
+            outcomes.append(result)
+
+    threads = [threading.Thread(target=create, args=(i,)) for i in range(WORKERS)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(outcomes) == WORKERS
+    assert outcomes.count("created") == 1
+    for result in outcomes:
+        if result != "created":
+            assert isinstance(result, HTTPException)
+            assert result.status_code == 400
+            assert result.detail.startswith(OVERLAP), result.detail
+
+
+def test_season_with_overlapping_weeks_is_rejected(session_factory, temp_users, tag):
+    (user_id,) = temp_users(1)
+    start = date(YEAR + 1, 9, 1)
+    # 7-day weeks every 5 days
+    result = _create(session_factory, _payload(f"concurrency-{tag}-weeks", start, _weeks(start, 4, step=5)), user_id)
+    assert isinstance(result, HTTPException)
+    assert result.status_code == 400
+    assert result.detail == WEEKS_OVERLAP
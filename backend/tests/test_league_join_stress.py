@@ -0,0 +1,118 @@
+"""Parallel league joins against members_count and the unique indexes of migration 020 (needs the database)."""
+import threading
+import uuid
+
+import pytest
+from sqlalchemy import delete, func, select
+
+from src.modules.leagues import models
+from src.modules.leagues.schemas import FantasyTeamPayload, JoinLeagueRequest, LeagueCreate
+from src.modules.leagues.services.league_service import create_league_with_commissioner_team, join_league
+
+PASSWORD = "Stress1234"
+WORKERS = 40
+MAX_TEAMS = 10
+
+
+@pytest.fixture
+def make_league(session_factory):
+    """`make(name, creator_id, max_teams)` creates a league (skips without a current season); deleted afterwards."""
+    tag = uuid.uuid4().hex[:6]
+
+    def make(name, creator_id, max_teams):
+        db = session_factory()
+        try:
+            league, _team = create_league_with_commissioner_team(
+                db,
+                creator_user_id=creator_id,
+                payload=LeagueCreate(
+                    name=f"stress-{tag}-{name}",
+                    max_teams=max_teams,
+                    password=PASSWORD,
+                    playoff_format=4,
+                    fantasy_team=FantasyTeamPayload(name=f"commish {name}"),
+                ),
+            )
+            return league.id
+        except RuntimeError as e:
+            pytest.skip(str(e))
+        finally:
+            db.close()
+
+    yield make
+    db = session_factory()
+    try:
+        db.execute(delete(models.League).where(models.League.name.like(f"stress-{tag}-%")))
+        db.commit()
+    finally:
+        db.close()
+
+
+def _join_all(session_factory, league_id, user_ids, alias_of):
+    """Outcome of every join, fired at once: 'joined' or '<ExceptionType>: <message>'."""
+    barrier = threading.Barrier(len(user_ids))
+    outcomes = []
+    lock = threading.Lock()
+
+    def join(i, user_id):
+        payload = JoinLeagueRequest(
+            password=PASSWORD,
+            user_alias=alias_of(i),
+            fantasy_team=FantasyTeamPayload(name=f"team {i}"),
+        )
+        db = session_factory()
+        try:
+            barrier.wait()
+            try:
+                join_league(db, league_id=league_id, user_id=user_id, payload=payload)
+                result = "joined"
+            except (LookupError, PermissionError, ValueError) as e:
+                result = f"{type(e).__name__}: {e}"
+        finally:
+            db.close()
+        with lock:
+            outcomes.append(result)
+
+    threads = [threading.Thread(target=join, args=(i, uid)) for i, uid in enumerate(user_ids)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return outcomes
+
+
+def _counts(session_factory, league_id):
+    """(stored members_count, actual member rows)."""
+    db = session_factory()
+    try:
+        stored = db.execute(select(models.League.members_count).where(models.League.id == league_id)).scalar_one()
+        actual = db.execute(
+            select(func.count()).select_from(models.LeagueMember).where(models.LeagueMember.league_id == league_id)
+        ).scalar_one()
+        return int(stored), int(actual)
+    finally:
+        db.close()
+
+
+def test_parallel_joins_never_overfill_a_league(session_factory, temp_users, make_league):
+    creator, *joiners = temp_users(WORKERS + 1)
+    league_id = make_league("capacity", creator, MAX_TEAMS)
+
+    outcomes = _join_all(session_factory, league_id, joiners, lambda i: f"alias {i}")
+
+    # The commissioner holds the first slot
+    assert outcomes.count("joined") == MAX_TEAMS - 1
+    assert set(outcomes) == {"joined", "ValueError: Esta liga no tiene cupos disponibles."}
+    assert _counts(session_factory, league_id) == (MAX_TEAMS, MAX_TEAMS)
+
+
+def test_parallel_joins_with_the_same_alias_admit_one(session_factory, temp_users, make_league):
+    creator, *joiners = temp_users(20)
+    league_id = make_league("alias", creator, 20)
+
+    # Aliases are unique regardless of case
+    outcomes = _join_all(session_factory, league_id, joiners, lambda i: "mismo alias" if i % 2 else "MISMO ALIAS")
+
+    assert outcomes.count("joined") == 1
+    assert all(result == "joined" or result.startswith("ValueError: El alias") for result in outcomes), set(outcomes)
+    assert _counts(session_factory, league_id) == (2, 2)
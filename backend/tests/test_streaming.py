@@ -0,0 +1,28 @@
+import io
+import json
+
+import pytest
+
+from src.core.streaming import iter_json_array
+
+FIXTURES = [
+    '[1,2.5,true,null,"s"]',
+    "[1.5e10]",
+    '[ -0.25 , 3E-2,false , {"a": [1, 2.75e+3]}, "x,]" ]',
+    "[]",
+    "[123456789, -1e-7, 0]",
+]
+
+
+@pytest.mark.parametrize("doc", FIXTURES)
+def test_iter_json_array_at_every_read_size(doc):
+    expected = json.loads(doc)
+    for read_size in range(1, len(doc) + 2):
+        assert list(iter_json_array(io.StringIO(doc), read_size=read_size)) == expected, read_size
+
+
+@pytest.mark.parametrize("doc", ["[1,,2]", "[1 2]", "[1.]", "[1", '{"a": 1}'])
+def test_iter_json_array_rejects_malformed(doc):
+    for read_size in range(1, len(doc) + 2):
+        with pytest.raises(ValueError):
+            list(iter_json_array(io.StringIO(doc), read_size=read_size))